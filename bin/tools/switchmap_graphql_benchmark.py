@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Switchmap-NG GraphQL device page benchmark script."""
+
+# Standard libraries
+import sys
+import os
+import time
+import argparse
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# PIP3 imports
+import more_itertools as mit
+from sqlalchemy import event as _event
+
+# Import app libraries
+from switchmap.core import general
+from switchmap.dashboard.net.routes.api.api import device_query
+from switchmap.server.db import ENGINE
+from switchmap.server.db import SCOPED_SESSION
+from switchmap.server.db import db
+from switchmap.server.db.schemas import SCHEMA
+from switchmap.server.db.table import event
+from switchmap.server.db.table import zone
+from switchmap.server.db.table import device
+from switchmap.server.db.table import l1interface
+from switchmap.server.db.table import vlan
+from switchmap.server.db.table import vlanport
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import IZone
+from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import IL1Interface
+from switchmap.server.db.table import IVlan
+from switchmap.server.db.table import IVlanPort
+from switchmap.server.db.table import IMac
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMacPort
+from switchmap.server.db.table import IMacIp
+
+
+def main():
+    """Compare device page query times with and without batch loading.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script runs the GraphQL query of the dashboard device page with the \
+relationships of the nodes loaded one at a time and in batches, and prints \
+the number of SQL statements and the fastest time of each. A synthetic \
+device is created in the database and deleted afterwards. Don't run it on \
+a busy production database.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--interfaces",
+        required=False,
+        default=48,
+        type=int,
+        help="Number of interfaces on the device.",
+    )
+    parser.add_argument(
+        "--macs",
+        required=False,
+        default=10,
+        type=int,
+        help="Number of MAC and IP addresses on each interface.",
+    )
+    parser.add_argument(
+        "--repeat",
+        required=False,
+        default=5,
+        type=int,
+        help="Number of times each query is run.",
+    )
+    args = parser.parse_args()
+
+    # Initialize key variables
+    statements = []
+    idx_event, idx_device = _populate(args.interfaces, args.macs)
+    query = device_query(idx_device)
+
+    # Count the statements of each query
+    @_event.listens_for(ENGINE, "before_cursor_execute")
+    def before_cursor_execute(*_):
+        """Count a statement.
+
+        Args:
+            _: Unused event arguments
+
+        Returns:
+            None
+
+        """
+        # Update
+        statements.append(None)
+
+    # Time each method
+    try:
+        for batching in [False, True]:
+            times = []
+            for _ in range(max(1, args.repeat)):
+                # Use a new session for each query, like the API server
+                SCOPED_SESSION.remove()
+                statements.clear()
+                start = time.time()
+                result = SCHEMA.execute(
+                    query, context_value={"batching": batching}
+                )
+                times.append(time.time() - start)
+                if bool(result.errors) is True:
+                    print(result.errors)
+                    sys.exit(1)
+            print(
+                "{:<10} {:>10} statements {:>10.3f} seconds".format(
+                    "batched" if bool(batching) else "unbatched",
+                    len(statements),
+                    min(times),
+                )
+            )
+    finally:
+        SCOPED_SESSION.remove()
+        event.delete(idx_event)
+
+
+def _populate(interfaces, macs):
+    """Create a synthetic event with a single device.
+
+    Args:
+        interfaces: Number of interfaces on the device
+        macs: Number of MAC and IP addresses on each interface
+
+    Returns:
+        result: Tuple of the idx_event of the event and the idx_device of
+            the device
+
+    """
+    # Create the event and zone
+    idx_event = event.create().idx_event
+    name = general.random_hash()
+    zone.insert_row(
+        IZone(idx_event=idx_event, name=name, notes=None, enabled=1)
+    )
+    idx_zone = zone.exists(idx_event, name).idx_zone
+
+    # Create the MAC and IP addresses of the zone
+    count = interfaces * macs
+    addresses = [
+        (
+            "{:012x}".format(_),
+            "10.{}.{}.{}".format((_ >> 16) & 255, (_ >> 8) & 255, _ & 255),
+        )
+        for _ in range(count)
+    ]
+    for chunk in mit.chunked(addresses, db.CHUNK_SIZE):
+        mac.insert_row(
+            [
+                IMac(idx_oui=1, idx_zone=idx_zone, mac=_[0], enabled=1)
+                for _ in chunk
+            ]
+        )
+        ip.insert_row(
+            [
+                IIp(
+                    idx_zone=idx_zone,
+                    address=_[1],
+                    version=4,
+                    hostname=None,
+                    enabled=1,
+                )
+                for _ in chunk
+            ]
+        )
+    idx_macs = sorted(_.idx_mac for _ in mac.macs(idx_zone))
+    idx_ips = sorted(_.idx_ip for _ in ip.ips(idx_zone))
+    for chunk in mit.chunked(list(zip(idx_macs, idx_ips)), db.CHUNK_SIZE):
+        macip.insert_row(
+            [IMacIp(idx_mac=_[0], idx_ip=_[1], enabled=1) for _ in chunk]
+        )
+
+    # Create the device, its VLAN and its interfaces
+    hostname = general.random_hash()
+    device.insert_row(
+        IDevice(
+            idx_zone=idx_zone,
+            sys_name=hostname,
+            hostname=hostname,
+            name=hostname,
+            sys_description=None,
+            sys_objectid=None,
+            sys_uptime=0,
+            last_polled=0,
+            enabled=1,
+        )
+    )
+    idx_device = device.exists(idx_zone, hostname).idx_device
+    vlan.insert_row(
+        IVlan(idx_device=idx_device, vlan=1, name=None, state=1, enabled=1)
+    )
+    idx_vlan = vlan.exists(idx_device, 1).idx_vlan
+    l1interface.insert_row(
+        [
+            IL1Interface(
+                idx_device=idx_device,
+                ifindex=ifindex,
+                duplex=None,
+                ethernet=1,
+                nativevlan=1,
+                trunk=0,
+                ifspeed=1000,
+                iftype=6,
+                ifalias=None,
+                ifdescr=None,
+                ifname="port{}".format(ifindex),
+                ifadminstatus=1,
+                ifoperstatus=1,
+                ts_idle=0,
+                cdpcachedeviceid=None,
+                cdpcachedeviceport=None,
+                cdpcacheplatform=None,
+                lldpremportdesc=None,
+                lldpremsyscapenabled=None,
+                lldpremsysdesc=None,
+                lldpremsysname=None,
+                enabled=1,
+            )
+            for ifindex in range(1, interfaces + 1)
+        ]
+    )
+
+    # Assign the VLAN and MAC addresses to the interfaces
+    vlanports = []
+    macports = []
+    for position, _l1interface in enumerate(
+        sorted(l1interface.ifindexes(idx_device), key=lambda _: _.ifindex)
+    ):
+        vlanports.append(
+            IVlanPort(
+                idx_l1interface=_l1interface.idx_l1interface,
+                idx_vlan=idx_vlan,
+                enabled=1,
+            )
+        )
+        macports.extend(
+            IMacPort(
+                idx_l1interface=_l1interface.idx_l1interface,
+                idx_mac=idx_mac,
+                enabled=1,
+            )
+            for idx_mac in idx_macs[position * macs : (position + 1) * macs]
+        )
+    vlanport.insert_row(vlanports)
+    for chunk in mit.chunked(macports, db.CHUNK_SIZE):
+        macport.insert_row(chunk)
+
+    # Return
+    result = (idx_event, idx_device)
+    return result
+
+
+if __name__ == "__main__":
+    main()
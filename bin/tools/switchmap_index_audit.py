@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""Switchmap-NG database index audit script."""
+
+# Standard libraries
+import sys
+import os
+import argparse
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# PIP3 imports
+from sqlalchemy import select, and_, inspect
+from sqlalchemy import Index, MetaData, UniqueConstraint
+
+# Import app libraries
+from switchmap.server.db import ENGINE
+from switchmap.server.db.models import BASE
+from switchmap.server.db.models import Zone
+from switchmap.server.db.models import Device
+from switchmap.server.db.models import DeviceHash
+from switchmap.server.db.models import L1Interface
+from switchmap.server.db.models import Vlan
+from switchmap.server.db.models import VlanPort
+from switchmap.server.db.models import Mac
+from switchmap.server.db.models import MacPort
+from switchmap.server.db.models import Ip
+from switchmap.server.db.models import IpPort
+from switchmap.server.db.models import MacIp
+from switchmap.server.db.models import InterfaceState
+
+# EXPLAIN access types that read every row of a table or index
+_SCANS = ["ALL", "index"]
+
+# The query shapes of the table modules. Each is the model whose first row
+# provides the values of the query, and a function creating the query from
+# the row.
+_QUERIES = [
+    (
+        "zone.exists",
+        Zone,
+        lambda _: select(Zone).where(
+            and_(Zone.name == _.name, Zone.idx_event == _.idx_event)
+        ),
+    ),
+    (
+        "device.exists",
+        Device,
+        lambda _: select(Device).where(
+            and_(Device.hostname == _.hostname, Device.idx_zone == _.idx_zone)
+        ),
+    ),
+    (
+        "device.devices",
+        Device,
+        lambda _: select(Device).where(Device.idx_zone == _.idx_zone),
+    ),
+    (
+        "devicehash.hashes",
+        DeviceHash,
+        lambda _: select(DeviceHash).where(
+            DeviceHash.idx_device == _.idx_device
+        ),
+    ),
+    (
+        "l1interface.exists",
+        L1Interface,
+        lambda _: select(L1Interface).where(
+            and_(
+                L1Interface.ifindex == _.ifindex,
+                L1Interface.idx_device == _.idx_device,
+            )
+        ),
+    ),
+    (
+        "l1interface.ifindexes",
+        L1Interface,
+        lambda _: select(L1Interface).where(
+            L1Interface.idx_device == _.idx_device
+        ),
+    ),
+    (
+        "vlan.exists",
+        Vlan,
+        lambda _: select(Vlan).where(
+            and_(Vlan.vlan == _.vlan, Vlan.idx_device == _.idx_device)
+        ),
+    ),
+    (
+        "vlanport.findvlan",
+        VlanPort,
+        lambda _: select(VlanPort).where(VlanPort.idx_vlan == _.idx_vlan),
+    ),
+    (
+        "mac.exists",
+        Mac,
+        lambda _: select(Mac).where(
+            and_(Mac.mac == _.mac, Mac.idx_zone == _.idx_zone)
+        ),
+    ),
+    (
+        "mac.findmac",
+        Mac,
+        lambda _: select(Mac).where(
+            and_(Mac.mac.in_([_.mac]), Mac.idx_zone == _.idx_zone)
+        ),
+    ),
+    (
+        "macport.findmac",
+        MacPort,
+        lambda _: select(MacPort).where(MacPort.idx_mac.in_([_.idx_mac])),
+    ),
+    (
+        "macport.exists",
+        MacPort,
+        lambda _: select(MacPort).where(
+            and_(
+                MacPort.idx_mac == _.idx_mac,
+                MacPort.idx_l1interface == _.idx_l1interface,
+            )
+        ),
+    ),
+    (
+        "macport.l1interface",
+        MacPort,
+        lambda _: select(MacPort).where(
+            MacPort.idx_l1interface == _.idx_l1interface
+        ),
+    ),
+    (
+        "ip.exists",
+        Ip,
+        lambda _: select(Ip).where(
+            and_(Ip.address == _.address, Ip.idx_zone == _.idx_zone)
+        ),
+    ),
+    (
+        "ip.findip",
+        Ip,
+        lambda _: select(Ip).where(
+            and_(Ip.address.in_([_.address]), Ip.idx_zone == _.idx_zone)
+        ),
+    ),
+    (
+        "ipport.findip",
+        IpPort,
+        lambda _: select(IpPort).where(IpPort.idx_ip.in_([_.idx_ip])),
+    ),
+    (
+        "macip.findmac",
+        MacIp,
+        lambda _: select(MacIp).where(MacIp.idx_mac.in_([_.idx_mac])),
+    ),
+    (
+        "macip.exists",
+        MacIp,
+        lambda _: select(MacIp).where(
+            and_(MacIp.idx_mac == _.idx_mac, MacIp.idx_ip == _.idx_ip)
+        ),
+    ),
+    (
+        "interfacestate.states",
+        InterfaceState,
+        lambda _: select(InterfaceState).where(
+            and_(
+                InterfaceState.zone == _.zone,
+                InterfaceState.hostname == _.hostname,
+            )
+        ),
+    ),
+]
+
+
+def main():
+    """Check that the queries of the table modules use indexes.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script runs EXPLAIN on the queries used by the ingester and the API \
+with values taken from a populated database. Queries that scan entire \
+tables or indexes are flagged. Indexes and unique keys defined in the \
+application that don't exist in the database are also listed. Unique keys \
+are compared by the order of their columns.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--create",
+        required=False,
+        action="store_true",
+        default=False,
+        help="""\
+Create the indexes and unique keys missing from the database. Existing \
+unique keys with the same columns in another order are dropped, except \
+on SQLite where they can't be.""",
+    )
+    args = parser.parse_args()
+
+    # Audit
+    missing = _missing(create=args.create)
+    scans = _explain()
+
+    # Exit with an error if there are problems
+    if bool(scans) or (bool(missing) and bool(args.create) is False):
+        sys.exit(1)
+
+
+def _missing(create=False):
+    """List the indexes of the models that don't exist in the database.
+
+    Args:
+        create: Create the missing indexes and unique keys if True
+
+    Returns:
+        result: List of missing Index and UniqueConstraint objects
+
+    """
+    # Initialize key variables
+    result = []
+
+    with ENGINE.connect() as connection:
+        inspector = inspect(connection)
+        for table in BASE.metadata.sorted_tables:
+            # Compare indexes by their columns as unique constraints and
+            # foreign keys create indexes with other names
+            existing = [
+                tuple(_["column_names"])
+                for _ in inspector.get_indexes(table.name)
+            ]
+            for index in sorted(table.indexes, key=lambda _: _.name):
+                columns = tuple(_.name for _ in index.columns)
+                if columns in existing:
+                    continue
+                result.append(index)
+                print(
+                    "{:<45} {}".format(
+                        index.name,
+                        "created" if bool(create) else "missing",
+                    )
+                )
+                if bool(create) is True:
+                    index.create(bind=connection)
+
+            # Compare the unique keys
+            result.extend(_unique(connection, inspector, table, create=create))
+        connection.commit()
+
+    # Return
+    return result
+
+
+def _unique(connection, inspector, table, create=False):
+    """List the unique keys of a model that don't exist in the database.
+
+    Databases created with earlier versions may have unique keys with the
+    same columns in another order. These are replaced when creating the
+    missing unique keys. SQLite can't drop the unique keys of a table, so
+    they are kept there and a unique index is added.
+
+    Args:
+        connection: Database connection
+        inspector: Inspector of the connection
+        table: Table of the model
+        create: Create the missing unique keys if True
+
+    Returns:
+        result: List of missing UniqueConstraint objects
+
+    """
+    # Initialize key variables
+    result = []
+    sqlite = connection.dialect.name == "sqlite"
+    existing = {
+        tuple(_["column_names"]): _["name"]
+        for _ in inspector.get_unique_constraints(table.name)
+    }
+    existing.update(
+        {
+            tuple(_["column_names"]): _["name"]
+            for _ in inspector.get_indexes(table.name)
+            if bool(_["unique"]) is True
+        }
+    )
+    existing[
+        tuple(inspector.get_pk_constraint(table.name)["constrained_columns"])
+    ] = "PRIMARY"
+
+    # Create the indexes on a copy of the table to leave the models as is
+    copy = table.to_metadata(MetaData())
+
+    for constraint in sorted(
+        [_ for _ in table.constraints if isinstance(_, UniqueConstraint)],
+        key=lambda _: [column.name for column in _.columns],
+    ):
+        columns = tuple(_.name for _ in constraint.columns)
+        if columns in existing:
+            continue
+        result.append(constraint)
+        name = "uq_{}_{}".format(table.name, "_".join(columns))
+        print(
+            "{:<45} {}".format(name, "created" if bool(create) else "missing")
+        )
+        if bool(create) is False:
+            continue
+
+        # Create the unique key before dropping the old one, as foreign keys
+        # may depend on it
+        Index(name, *[copy.c[_] for _ in columns], unique=True).create(
+            bind=connection
+        )
+        for key, value in sorted(existing.items()):
+            if sorted(key) != sorted(columns):
+                continue
+            if bool(sqlite) is True or bool(value) is False:
+                print("{:<45} {}".format(value or ", ".join(key), "kept"))
+                continue
+            Index(value, *[copy.c[_] for _ in key]).drop(bind=connection)
+            print("{:<45} {}".format(value, "dropped"))
+
+    # Return
+    return result
+
+
+def _explain():
+    """Run EXPLAIN on each query and print the access paths.
+
+    Args:
+        None
+
+    Returns:
+        result: List of the names of the queries with full scans
+
+    """
+    # Initialize key variables
+    result = []
+
+    with ENGINE.connect() as connection:
+        print(
+            "{:<25} {:<20} {:<8} {:<45} {:>10}".format(
+                "Query", "Table", "Type", "Key", "Rows"
+            )
+        )
+        for name, model, query in _QUERIES:
+            # Get the values to query from the first row of the table
+            row = connection.execute(select(model).limit(1)).first()
+            if row is None:
+                print("{:<25} {}".format(name, "skipped, no rows"))
+                continue
+
+            # Explain
+            for plan in _plans(connection, query(row)):
+                scan = plan["type"] in _SCANS
+                print(
+                    "{:<25} {:<20} {:<8} {:<45} {:>10}{}".format(
+                        name,
+                        str(plan["table"]),
+                        str(plan["type"]),
+                        str(plan["key"]),
+                        str(plan["rows"]),
+                        "  FULL SCAN" if bool(scan) else "",
+                    )
+                )
+                if bool(scan) is True:
+                    result.append(name)
+
+    # Return
+    return result
+
+
+def _plans(connection, query):
+    """Get the access paths of a query.
+
+    MySQL and MariaDB report them with EXPLAIN. SQLite only reports a
+    description of each step with EXPLAIN QUERY PLAN. Its full scans are
+    mapped to the "ALL" access type and its index searches to "ref".
+
+    Args:
+        connection: Database connection
+        query: SqlALchemy Select statement
+
+    Returns:
+        result: List of dicts with the table, type, key and rows of each
+            step of the query
+
+    """
+    # Initialize key variables
+    result = []
+    compiled = query.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    parameters = (
+        tuple(compiled.params[_] for _ in compiled.positiontup)
+        if bool(compiled.positional) is True
+        else compiled.params
+    )
+
+    # Explain
+    if connection.dialect.name != "sqlite":
+        result = [
+            dict(_)
+            for _ in connection.exec_driver_sql(
+                "EXPLAIN {}".format(compiled), parameters
+            ).mappings()
+        ]
+        return result
+
+    # Steps are described as "SCAN table [USING ... INDEX index]" or
+    # "SEARCH table USING ... INDEX index (...)"
+    for plan in connection.exec_driver_sql(
+        "EXPLAIN QUERY PLAN {}".format(compiled), parameters
+    ).mappings():
+        words = plan["detail"].split()
+        key = None
+        if "INDEX" in words:
+            key = words[words.index("INDEX") + 1]
+        elif "PRIMARY" in words:
+            key = "PRIMARY"
+        result.append(
+            {
+                "table": words[1] if len(words) > 1 else None,
+                "type": "ALL" if words[0] == "SCAN" else "ref",
+                "key": key,
+                "rows": None,
+            }
+        )
+
+    # Return
+    return result
+
+
+if __name__ == "__main__":
+    main()
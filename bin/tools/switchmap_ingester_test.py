@@ -26,6 +26,7 @@ else:
 from switchmap.server.ingest import ingest
 from switchmap.server import configuration
 from switchmap.core import log
+from switchmap.core import profiler
 
 
 def main():
@@ -58,8 +59,19 @@ database is automatically deleted.""",
         type=str,
         help="Directory where the cache files are located.",
     )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Save CPU and memory profiles of each ingest stage.",
+    )
     args = parser.parse_args()
 
+    # Enable profiling
+    if bool(args.profile) is True:
+        profiler.enable()
+
     # Get the source directory
     cache_directory = args.cache_directory
 
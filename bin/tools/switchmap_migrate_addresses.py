@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Switchmap-NG MAC and IP address column migration script."""
+
+# Standard libraries
+import sys
+import os
+import time
+import argparse
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# PIP3 imports
+from sqlalchemy import inspect, text
+
+# Import app libraries
+from switchmap.server.db import ENGINE
+from switchmap.server.db.models import Mac
+from switchmap.server.db.models import Ip
+
+# Columns to migrate and the SQL expressions converting their text values
+_COLUMNS = [
+    (Mac, "mac", "CAST(CONV(`mac`, 16, 10) AS UNSIGNED)"),
+    (Ip, "address", "INET6_ATON(`address`)"),
+]
+
+
+def main():
+    """Convert the text MAC and IP address columns to their compact types.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script converts the MAC addresses stored as text to unsigned integers \
+and the IP addresses stored as text to packed binary values. The indexes of \
+the columns are rebuilt afterwards. Columns that have already been converted \
+are skipped. Stop the ingester and back up the database before running it.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.parse_args()
+
+    # Migrate each column
+    for model, column, expression in _COLUMNS:
+        start = time.time()
+        migrated = _migrate(model, column, expression)
+        print(
+            "{:<20} {:>10} {:>10.3f} seconds".format(
+                "{}.{}".format(model.__tablename__, column),
+                "migrated" if bool(migrated) else "skipped",
+                time.time() - start,
+            )
+        )
+
+
+def _migrate(model, column, expression):
+    """Convert a text column to the type of the column in the model.
+
+    Args:
+        model: ORM model class of the table
+        column: Name of the column
+        expression: SQL expression converting the text values of the column
+
+    Returns:
+        result: True if the column was migrated
+
+    """
+    # Initialize key variables
+    result = False
+    table = model.__tablename__
+    temporary = "{}_compact".format(column)
+
+    with ENGINE.connect() as connection:
+        # Get the current type of the column
+        inspector = inspect(connection)
+        current = [
+            _["type"]
+            for _ in inspector.get_columns(table)
+            if _["name"] == column
+        ][0]
+        target = model.__table__.c[column].type
+        _type = target.compile(dialect=connection.dialect)
+
+        # Skip columns that have already been migrated
+        if isinstance(current, type(target)) and getattr(
+            current, "length", None
+        ) == getattr(target, "length", None):
+            return result
+
+        # Drop the indexes of the column. They are rebuilt with the same
+        # definitions once the values have been converted.
+        indexes = [
+            _
+            for _ in inspector.get_indexes(table)
+            if column in _["column_names"]
+        ]
+        for index in indexes:
+            connection.execute(
+                text(
+                    "ALTER TABLE `{}` DROP INDEX `{}`".format(
+                        table, index["name"]
+                    )
+                )
+            )
+
+        # Convert the values
+        connection.execute(
+            text(
+                "ALTER TABLE `{}` ADD COLUMN `{}` {} NULL AFTER `{}`".format(
+                    table, temporary, _type, column
+                )
+            )
+        )
+        connection.execute(
+            text(
+                "UPDATE `{}` SET `{}` = {}".format(table, temporary, expression)
+            )
+        )
+        connection.execute(
+            text("ALTER TABLE `{}` DROP COLUMN `{}`".format(table, column))
+        )
+        connection.execute(
+            text(
+                "ALTER TABLE `{}` CHANGE `{}` `{}` {} NULL".format(
+                    table, temporary, column, _type
+                )
+            )
+        )
+
+        # Rebuild the indexes
+        for index in indexes:
+            connection.execute(
+                text(
+                    "CREATE {}INDEX `{}` ON `{}` ({})".format(
+                        "UNIQUE " if bool(index["unique"]) else "",
+                        index["name"],
+                        table,
+                        ", ".join(
+                            "`{}`".format(_) for _ in index["column_names"]
+                        ),
+                    )
+                )
+            )
+        connection.commit()
+
+    # Return
+    result = True
+    return result
+
+
+if __name__ == "__main__":
+    main()
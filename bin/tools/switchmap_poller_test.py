@@ -24,6 +24,7 @@ else:
 
 # Import app libraries
 from switchmap.poller import poll
+from switchmap.core import profiler
 
 
 def main():
@@ -52,8 +53,19 @@ polling data for the host will be displayed on the screen.""",
         type=str,
         help="Hostname to test for pollability.",
     )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Save CPU and memory profiles of each polling stage.",
+    )
     args = parser.parse_args()
 
+    # Enable profiling
+    if bool(args.profile) is True:
+        profiler.enable()
+
     # Poll
     poll.cli_device(args.hostname)
 
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""Switchmap-NG event purge benchmark script."""
+
+# Standard libraries
+import sys
+import os
+import time
+import argparse
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# PIP3 imports
+import more_itertools as mit
+
+# Import app libraries
+from switchmap.core import general
+from switchmap.server.db import db
+from switchmap.server.db.table import event
+from switchmap.server.db.table import zone
+from switchmap.server.db.table import device
+from switchmap.server.db.table import l1interface
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import IZone
+from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import IL1Interface
+from switchmap.server.db.table import IMac
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMacPort
+from switchmap.server.db.table import IMacIp
+
+
+def main():
+    """Compare the time taken by the methods of purging an event.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script compares the time taken to delete an event with a single \
+cascading delete and with the chunked deletes used by the ingester. \
+Synthetic events are created in the database for each method and deleted \
+afterwards. Don't run it on a busy production database.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--devices",
+        required=False,
+        default=10,
+        type=int,
+        help="Number of devices in each event.",
+    )
+    parser.add_argument(
+        "--interfaces",
+        required=False,
+        default=48,
+        type=int,
+        help="Number of interfaces on each device.",
+    )
+    parser.add_argument(
+        "--macs",
+        required=False,
+        default=10,
+        type=int,
+        help="Number of MAC and IP addresses on each interface.",
+    )
+    args = parser.parse_args()
+
+    # Time each method
+    for chunked in [False, True]:
+        idx_event = _populate(args.devices, args.interfaces, args.macs)
+        start = time.time()
+        event.delete(idx_event, chunked=chunked)
+        print(
+            "{:<10} {:>10.3f} seconds".format(
+                "chunked" if bool(chunked) else "cascading",
+                time.time() - start,
+            )
+        )
+
+
+def _populate(devices, interfaces, macs):
+    """Create a synthetic event.
+
+    Args:
+        devices: Number of devices in the event
+        interfaces: Number of interfaces on each device
+        macs: Number of MAC and IP addresses on each interface
+
+    Returns:
+        result: idx_event of the event
+
+    """
+    # Create the event and zone
+    _event = event.create()
+    result = _event.idx_event
+    name = general.random_hash()
+    zone.insert_row(IZone(idx_event=result, name=name, notes=None, enabled=1))
+    idx_zone = zone.exists(result, name).idx_zone
+
+    # Create the MAC and IP addresses of the zone
+    count = devices * interfaces * macs
+    addresses = [
+        ("{:012x}".format(_), "10.{}.{}.{}".format(*_octets(_)))
+        for _ in range(count)
+    ]
+    for chunk in mit.chunked(addresses, db.CHUNK_SIZE):
+        mac.insert_row(
+            [
+                IMac(idx_oui=1, idx_zone=idx_zone, mac=_[0], enabled=1)
+                for _ in chunk
+            ]
+        )
+        ip.insert_row(
+            [
+                IIp(
+                    idx_zone=idx_zone,
+                    address=_[1],
+                    version=4,
+                    hostname=None,
+                    enabled=1,
+                )
+                for _ in chunk
+            ]
+        )
+    idx_macs = sorted(_.idx_mac for _ in mac.macs(idx_zone))
+    idx_ips = sorted(_.idx_ip for _ in ip.ips(idx_zone))
+    for chunk in mit.chunked(list(zip(idx_macs, idx_ips)), db.CHUNK_SIZE):
+        macip.insert_row(
+            [IMacIp(idx_mac=_[0], idx_ip=_[1], enabled=1) for _ in chunk]
+        )
+
+    # Create the devices and their interfaces
+    for index in range(devices):
+        hostname = general.random_hash()
+        device.insert_row(
+            IDevice(
+                idx_zone=idx_zone,
+                sys_name=hostname,
+                hostname=hostname,
+                name=hostname,
+                sys_description=None,
+                sys_objectid=None,
+                sys_uptime=0,
+                last_polled=0,
+                enabled=1,
+            )
+        )
+        idx_device = device.exists(idx_zone, hostname).idx_device
+        l1interface.insert_row(
+            [
+                IL1Interface(
+                    idx_device=idx_device,
+                    ifindex=ifindex,
+                    duplex=None,
+                    ethernet=1,
+                    nativevlan=None,
+                    trunk=0,
+                    ifspeed=1000,
+                    iftype=6,
+                    ifalias=None,
+                    ifdescr=None,
+                    ifname="port{}".format(ifindex),
+                    ifadminstatus=1,
+                    ifoperstatus=1,
+                    ts_idle=0,
+                    cdpcachedeviceid=None,
+                    cdpcachedeviceport=None,
+                    cdpcacheplatform=None,
+                    lldpremportdesc=None,
+                    lldpremsyscapenabled=None,
+                    lldpremsysdesc=None,
+                    lldpremsysname=None,
+                    enabled=1,
+                )
+                for ifindex in range(1, interfaces + 1)
+            ]
+        )
+
+        # Assign the MAC addresses to the interfaces
+        rows = []
+        for position, _l1interface in enumerate(
+            sorted(
+                l1interface.ifindexes(idx_device),
+                key=lambda _: _.ifindex,
+            )
+        ):
+            offset = (index * interfaces + position) * macs
+            rows.extend(
+                IMacPort(
+                    idx_l1interface=_l1interface.idx_l1interface,
+                    idx_mac=idx_mac,
+                    enabled=1,
+                )
+                for idx_mac in idx_macs[offset : offset + macs]
+            )
+        for chunk in mit.chunked(rows, db.CHUNK_SIZE):
+            macport.insert_row(chunk)
+
+    # Return
+    return result
+
+
+def _octets(value):
+    """Convert an integer into the last three octets of an IPv4 address.
+
+    Args:
+        value: Integer
+
+    Returns:
+        result: Tuple of octets
+
+    """
+    # Return
+    result = ((value >> 16) & 255, (value >> 8) & 255, value & 255)
+    return result
+
+
+if __name__ == "__main__":
+    main()
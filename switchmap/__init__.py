@@ -19,6 +19,7 @@ SITE_PREFIX = "/switchmap"
 # API URIs
 API_PREFIX = "{}/api".format(SITE_PREFIX)
 API_POLLER_POST_URI = "/post/poller"
+API_POLLER_DELTA_URI = "/post/poller/delta"
 API_POLLER_SEARCH_URI = "/post/search"
 
 # DASHBOARD related
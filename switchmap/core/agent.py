@@ -25,6 +25,7 @@ from gunicorn.app.base import BaseApplication
 from switchmap.core.daemon import Daemon, GracefulDaemon
 from switchmap.core import files
 from switchmap.core import log
+from switchmap.core import metrics
 from switchmap.core.configuration import ConfigCore
 from switchmap.core.variables import AgentAPIVariable
 
@@ -365,6 +366,7 @@ class AgentAPI(Agent):
             "loglevel": self.config.log_level(),
             "workers": _number_of_workers(),
             "umask": 0o0007,
+            "worker_exit": _worker_exit,
         }
 
         # Log so that user running the script from the CLI knows that something
@@ -449,6 +451,21 @@ class _StandaloneApplication(BaseApplication):
         return self.application
 
 
+def _worker_exit(server, worker):
+    """Save the metrics of a Gunicorn worker before it exits.
+
+    Args:
+        server: Gunicorn Arbiter object
+        worker: Gunicorn Worker object
+
+    Returns:
+        None
+
+    """
+    # Keep the values of the worker without keeping its file
+    metrics.retire()
+
+
 def _number_of_workers():
     """Get the number of CPU cores on this server.
 
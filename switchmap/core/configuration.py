@@ -187,6 +187,36 @@ class ConfigCore(_Config):
         # Return
         return result
 
+    def metrics_directory(self):
+        """Determine the metrics_directory.
+
+        Args:
+            None
+
+        Returns:
+            result: configured metrics_directory
+
+        """
+        # Get result
+        result = self._config_core.get(
+            "metrics_directory", f"{self.system_directory()}{os.sep}metrics"
+        )
+
+        # Create the directory if not found
+        if os.path.isdir(result) is False:
+            files.mkdir(result)
+
+        # Check if value exists
+        if os.path.isdir(result) is False:
+            log_message = (
+                f'metrics_directory: "{result}" '
+                "in the configuration file(s) doesn't exist!"
+            )
+            log.log2die_safe(2014, log_message)
+
+        # Return
+        return result
+
     def multiprocessing(self):
         """Get multiprocessing.
 
@@ -202,6 +232,51 @@ class ConfigCore(_Config):
         result = general.make_bool(result)
         return result
 
+    def profile_directory(self):
+        """Determine the profile_directory.
+
+        Args:
+            None
+
+        Returns:
+            result: configured profile_directory
+
+        """
+        # Get result
+        result = self._config_core.get(
+            "profile_directory", f"{self.log_directory()}{os.sep}profile"
+        )
+
+        # Create the directory if not found
+        if os.path.isdir(result) is False:
+            files.mkdir(result)
+
+        # Check if value exists
+        if os.path.isdir(result) is False:
+            log_message = (
+                f'profile_directory: "{result}" '
+                "in the configuration file(s) doesn't exist!"
+            )
+            log.log2die_safe(2013, log_message)
+
+        # Return
+        return result
+
+    def profiling(self):
+        """Get profiling.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = self._config_core.get("profiling", False)
+        result = general.make_bool(result)
+        return result
+
     def system_directory(self):
         """Determine the system_directory.
 
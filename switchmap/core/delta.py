@@ -0,0 +1,262 @@
+"""Switchmap delta payload library.
+
+Pollers keep a copy of the last payload the server acknowledged for each
+device. Subsequent polls only post the differences between that copy and the
+newly polled data. The server keeps the same copy, so it can reconstruct the
+complete document before caching it for ingestion.
+
+Delta payloads have the following structure:
+
+    {
+        "base": Version ID of the document the delta was created from,
+        "version": Version ID of the document after the delta is applied,
+        "hostname": Hostname of the polled device,
+        "zone": Zone of the polled device,
+        "sections": {
+            SECTION: {
+                "replace": Replacement value for the entire section
+            }
+
+            OR
+
+            SECTION: {
+                "set": {KEY: Replacement value for KEY},
+                "merge": {KEY: {SUBKEY: Replacement value for SUBKEY}},
+                "unset": {KEY: [SUBKEYS to remove]},
+                "remove": [KEYS to remove],
+            }
+        }
+    }
+
+Only sections whose content hash has changed are included. Hashes are created
+from the canonical JSON of each document, so the poller and server compute
+identical version IDs without the poller having to keep a normalized copy of
+the data it has just polled. Only the changed sections are normalized.
+
+"""
+
+# Standard imports
+import hashlib
+from copy import deepcopy
+
+# Application imports
+from switchmap.core import stream
+
+# Sections of the polled data
+SECTIONS = ("misc", "layer1", "layer2", "layer3", "system")
+
+
+def normalize(data):
+    """Convert data to the equivalent of its JSON representation.
+
+    Args:
+        data: Data to normalize
+
+    Returns:
+        result: Normalized data with string keys
+
+    """
+    # Return
+    result = stream.normalize(data)
+    return result
+
+
+def version(data):
+    """Create a version ID for a document.
+
+    Args:
+        data: Document
+
+    Returns:
+        result: Version ID string
+
+    """
+    # Return
+    result = _digest(data)
+    return result
+
+
+def digests(data):
+    """Create content hashes for each section of a document.
+
+    Args:
+        data: Document
+
+    Returns:
+        result: Dict of hashes keyed by section name
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Process data
+    if isinstance(data, dict) is True:
+        for section, value in data.items():
+            result[section] = _digest(value)
+
+    # Return
+    return result
+
+
+def diff(previous, current):
+    """Create a delta payload between two documents.
+
+    Args:
+        previous: Last acknowledged normalized document
+        current: Current document. Only its changed sections are normalized
+
+    Returns:
+        result: Delta payload dict
+
+    """
+    # Initialize key variables
+    sections = {}
+    before = digests(previous)
+    after = digests(current)
+
+    # Process sections that are new or have changed
+    for section, value in current.items():
+        if before.get(section) == after.get(section):
+            continue
+        sections[section] = _section_diff(
+            previous.get(section), normalize(value)
+        )
+
+    # Process sections that no longer exist
+    for section in previous.keys():
+        if section not in current:
+            sections[section] = {"replace": None, "drop": True}
+
+    # Return
+    misc = current.get("misc", {})
+    result = {
+        "base": version(previous),
+        "version": version(current),
+        "hostname": misc.get("host"),
+        "zone": misc.get("zone"),
+        "sections": sections,
+    }
+    return result
+
+
+def apply(previous, delta):
+    """Apply a delta payload to a normalized document.
+
+    Args:
+        previous: Normalized document used to create the delta
+        delta: Delta payload dict
+
+    Returns:
+        result: Reconstructed normalized document
+
+    """
+    # Initialize key variables
+    result = deepcopy(previous)
+
+    # Process sections
+    for section, changes in delta.get("sections", {}).items():
+        # Drop removed sections
+        if bool(changes.get("drop")) is True:
+            result.pop(section, None)
+            continue
+
+        # Replace entire sections
+        if "replace" in changes:
+            result[section] = deepcopy(changes["replace"])
+            continue
+
+        # Update only the changed keys
+        target = result.setdefault(section, {})
+        for key in changes.get("remove", []):
+            target.pop(key, None)
+        for key, value in changes.get("set", {}).items():
+            target[key] = deepcopy(value)
+        for key, fields in changes.get("unset", {}).items():
+            for field in fields:
+                target[key].pop(field, None)
+        for key, fields in changes.get("merge", {}).items():
+            for field, value in fields.items():
+                target[key][field] = deepcopy(value)
+
+    # Return
+    return result
+
+
+def _section_diff(previous, current):
+    """Create the delta for a single section of a document.
+
+    Args:
+        previous: Previous value of the section
+        current: Current value of the section
+
+    Returns:
+        result: Dict of changes
+
+    """
+    # Replace sections that aren't two level dicts
+    if (isinstance(previous, dict) and isinstance(current, dict)) is False:
+        return {"replace": current}
+
+    # Initialize key variables
+    result = {}
+    _set = {}
+    merge = {}
+    unset = {}
+
+    # Find keys that have been removed
+    remove = [_ for _ in previous.keys() if _ not in current]
+
+    # Find keys that have been added or changed
+    for key, value in current.items():
+        before = previous.get(key)
+        if key not in previous:
+            _set[key] = value
+        elif before == value:
+            continue
+        elif (isinstance(before, dict) and isinstance(value, dict)) is False:
+            _set[key] = value
+        else:
+            # Only send the changed subkeys
+            changed = {
+                field: item
+                for field, item in value.items()
+                if field not in before or before[field] != item
+            }
+            removed = [_ for _ in before.keys() if _ not in value]
+            if bool(changed) is True:
+                merge[key] = changed
+            if bool(removed) is True:
+                unset[key] = removed
+
+    # Only report non empty values
+    for name, item in (
+        ("set", _set),
+        ("merge", merge),
+        ("unset", unset),
+        ("remove", remove),
+    ):
+        if bool(item) is True:
+            result[name] = item
+
+    # Return
+    return result
+
+
+def _digest(data):
+    """Create a stable content hash of JSON compatible data.
+
+    Args:
+        data: Data to hash
+
+    Returns:
+        result: SHA256 hex digest
+
+    """
+    # Hash the canonical JSON one fragment at a time
+    digest = hashlib.sha256()
+    for fragment in stream.iterencode(data, canonical=True):
+        digest.update(fragment.encode())
+
+    # Return
+    result = digest.hexdigest()
+    return result
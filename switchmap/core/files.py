@@ -2,6 +2,8 @@
 
 import os
 import sys
+import json
+import hashlib
 import subprocess
 import shutil
 
@@ -11,6 +13,10 @@ import yaml
 # Application libraries
 from switchmap.core import log
 from switchmap.core import general
+from switchmap.core import stream
+
+# Use the faster LibYAML based loader when it is available
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class _Directory:
@@ -72,6 +78,34 @@ class _Directory:
         value = "{}{}snmp".format(self._system_root, os.sep)
         return value
 
+    def snapshot(self):
+        """Define the system snapshot directory.
+
+        Args:
+            None
+
+        Returns:
+            value: snapshot directory
+
+        """
+        # Return
+        value = "{}{}snapshot".format(self._system_root, os.sep)
+        return value
+
+    def dns(self):
+        """Define the system DNS cache directory.
+
+        Args:
+            None
+
+        Returns:
+            value: DNS cache directory
+
+        """
+        # Return
+        value = "{}{}dns".format(self._system_root, os.sep)
+        return value
+
 
 class _File:
     """A class for creating the names of system files."""
@@ -151,6 +185,36 @@ class _File:
         value = "{}{}{}.snmp".format(self._directory.snmp(), os.sep, prefix)
         return value
 
+    def snapshot(self, prefix):
+        """Define the device snapshot file.
+
+        Args:
+            prefix: Prefix of file
+
+        Returns:
+            value: snapshot file
+
+        """
+        # Return
+        mkdir(self._directory.snapshot())
+        value = "{}{}{}.json".format(self._directory.snapshot(), os.sep, prefix)
+        return value
+
+    def dns(self, prefix):
+        """Define the DNS cache file.
+
+        Args:
+            prefix: Prefix of file
+
+        Returns:
+            value: DNS cache file
+
+        """
+        # Return
+        mkdir(self._directory.dns())
+        value = "{}{}{}.json".format(self._directory.dns(), os.sep, prefix)
+        return value
+
 
 def move_yaml_files(src, dst):
     """Move all yaml files from source to destination directory.
@@ -163,11 +227,14 @@ def move_yaml_files(src, dst):
         None
 
     """
-    # Copy files
+    # Copy files together with their cache indexes
     src_files = os.listdir(src)
     for filename in src_files:
         filepath = os.path.join(src, filename)
         if os.path.isfile(filepath) and filepath.lower().endswith(".yaml"):
+            index_filepath = cache_index_file(filepath)
+            if os.path.isfile(index_filepath) is True:
+                shutil.move(index_filepath, dst)
             shutil.move(filepath, dst)
 
 
@@ -392,6 +459,207 @@ def snmp_file(hostname, config):
     return result
 
 
+def snapshot_file(agent_name, hostname, zone, config):
+    """Get the file with the last acknowledged data posted for a device.
+
+    Args:
+        agent_name: Agent name
+        hostname: Hostname of the device
+        zone: Zone of the device
+        config: Config object
+
+    Returns:
+        result: Name of snapshot file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.snapshot(
+        "{}-{}-{}".format(
+            agent_name.lower() if isinstance(agent_name, str) else agent_name,
+            hostname,
+            hashlib.md5(str(zone).encode("utf-8")).hexdigest()[:5],
+        )
+    )
+    return result
+
+
+def dns_cache_file(config):
+    """Get the reverse DNS cache file.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of DNS cache file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.dns("ptr")
+    return result
+
+
+def cache_index_file(filepath):
+    """Get the filepath of the index of a cache file.
+
+    Args:
+        filepath: Cache file
+
+    Returns:
+        result: Filepath of the index
+
+    """
+    # Return
+    result = "{}.json".format(os.path.splitext(filepath)[0])
+    return result
+
+
+def write_cache_file(filepath, data, addresses=None):
+    """Write network device data and its index to a cache file.
+
+    The small JSON index contains the zone, hostname, timestamp, size and
+    hash of the cache file so that the ingester doesn't have to parse the
+    cache file to find out where the data belongs. The index is written
+    first so that it exists whenever the cache file does.
+
+    Args:
+        filepath: Cache file
+        data: Network device data
+        addresses: List of the IP addresses in the ARP and NDP tables of
+            the data to resolve before ingesting them
+
+    Returns:
+        None
+
+    """
+    # Create the file contents
+    content = yaml.dump(data).encode()
+    index = {
+        "zone": data["misc"].get("zone"),
+        "hostname": data["misc"]["host"],
+        "timestamp": data["misc"].get("timestamp"),
+        "size": len(content),
+        "hash": hashlib.md5(content).hexdigest(),
+        "addresses": sorted(addresses) if bool(addresses) else [],
+    }
+
+    # Write the files
+    write_json_file(cache_index_file(filepath), index)
+    with open(filepath, "wb") as f_handle:
+        f_handle.write(content)
+
+
+def read_cache_index(filepath):
+    """Read the index of a cache file.
+
+    Args:
+        filepath: Cache file
+
+    Returns:
+        result: Dict of the index, empty if the index doesn't exist or
+            doesn't match the size of the cache file
+
+    """
+    # Initialize key variables
+    result = {}
+    index_filepath = cache_index_file(filepath)
+
+    # Read the index
+    if os.path.isfile(index_filepath) is True:
+        result = read_json_file(index_filepath, die=False)
+
+    # Ignore indexes of other versions of the cache file
+    if bool(result) is True:
+        if result.get("size") != os.path.getsize(filepath):
+            result = {}
+
+    # Return
+    return result
+
+
+def read_cache_file(filepath):
+    """Read network device data from a cache file.
+
+    Args:
+        filepath: Cache file
+
+    Returns:
+        result: Network device data
+
+    """
+    # Read the file
+    with open(filepath, "rb") as f_handle:
+        content = f_handle.read()
+
+    # Verify the contents
+    index = read_cache_index(filepath)
+    if bool(index) is True:
+        if index.get("hash") != hashlib.md5(content).hexdigest():
+            log_message = "Cache file {} doesn't match its index.".format(
+                filepath
+            )
+            log.log2warning(2066, log_message)
+
+    # Return
+    result = yaml.load(content, Loader=_LOADER)
+    return result
+
+
+def read_json_file(filepath, die=True):
+    """Read the contents of a JSON file.
+
+    Args:
+        filepath: Path to file to be read
+        die: Die if there is an error
+
+    Returns:
+        result: Dict of JSON read
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Read file
+    try:
+        with open(filepath, "r") as file_handle:
+            result = json.load(file_handle)
+    except:
+        log_message = (
+            "Error reading file {}. Check permissions, "
+            "existence and file syntax."
+            "".format(filepath)
+        )
+        if bool(die) is True:
+            log.log2die_safe(2007, log_message)
+        else:
+            log.log2debug(2008, log_message)
+            return {}
+
+    # Return
+    return result
+
+
+def write_json_file(filepath, data):
+    """Atomically write data to a JSON file.
+
+    Args:
+        filepath: Path to file to be written
+        data: Data to write
+
+    Returns:
+        None
+
+    """
+    # Write to a temporary file first, then rename it to prevent other
+    # processes from reading partially written data
+    tmp_filepath = "{}.tmp".format(filepath)
+    with open(tmp_filepath, "w") as file_handle:
+        for fragment in stream.iterencode(data):
+            file_handle.write(fragment)
+    os.replace(tmp_filepath, filepath)
+
+
 def execute(command, die=True):
     """Run the command UNIX CLI command and record output.
 
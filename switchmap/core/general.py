@@ -205,6 +205,76 @@ def ipaddress(_ip):
     return result
 
 
+def mac_2_integer(_mac):
+    """Convert a MAC address to the integer stored in the database.
+
+    Args:
+        _mac: MAC address
+
+    Returns:
+        result: Integer, None if the MAC address is invalid
+
+    """
+    # Convert
+    mactest = mac(_mac)
+    result = int(mactest.mac, 16) if bool(mactest.valid) is True else None
+    return result
+
+
+def integer_2_mac(value):
+    """Convert a MAC address stored in the database to a string.
+
+    Args:
+        value: Integer
+
+    Returns:
+        result: Lowercase MAC address of 12 hex characters, None if value is
+            None
+
+    """
+    # Convert
+    result = None if value is None else "{:012x}".format(value)
+    return result
+
+
+def ip_2_packed(_ip):
+    """Convert an IP address to the bytes stored in the database.
+
+    Args:
+        _ip: IP address
+
+    Returns:
+        result: IP address packed in network byte order, None if the IP
+            address is invalid
+
+    """
+    # Convert
+    try:
+        result = ipaddress_.ip_address(_ip).packed
+    except ValueError:
+        result = None
+    return result
+
+
+def packed_2_ip(value):
+    """Convert an IP address stored in the database to a string.
+
+    Args:
+        value: IP address packed in network byte order
+
+    Returns:
+        result: Exploded lowercase IP address, None if value is empty
+
+    """
+    # Convert
+    result = (
+        None
+        if bool(value) is False
+        else ipaddress_.ip_address(bytes(value)).exploded.lower()
+    )
+    return result
+
+
 def make_bool(result):
     """Create a boolean version of the argument.
 
@@ -0,0 +1,750 @@
+"""Switchmap operational metrics library.
+
+Metrics are exported in the Prometheus text exposition format.
+
+    1) The server exposes them on the /metrics route of the API
+    2) The poller and ingester daemons write them to a
+       "switchmap_<agent>.prom" file in the metrics_directory after every
+       cycle. These files can be read by the textfile collector of the
+       Prometheus node_exporter.
+
+Switchmap daemons do their work in many subprocesses. Each process keeps its
+own values in memory and saves them with flush() to a JSON file in the
+metrics directory of its daemon. The values of all the files are added
+together when the metrics are exported. Gauges are only meaningful when they
+are set by the daemon's parent process. Subprocesses that end while the
+daemon keeps running add their values to an archive file with retire().
+
+Metrics are only saved when setup() has been called by the daemon, so using
+them in scripts and tests has no side effects.
+
+"""
+
+# Standard imports
+import os
+import glob
+import time
+import fcntl
+import random
+from contextlib import contextmanager
+
+# Application imports
+from switchmap.core import files
+from switchmap.core.configuration import ConfigCore
+
+# Environment variable used to share the metrics directory with subprocesses
+_DIRECTORY = "SWITCHMAP_METRICS_DIRECTORY"
+
+# Name of the file containing the values of processes that have ended
+_ARCHIVE = "archive.json"
+
+# Name of the file locked while the archive is updated
+_LOCK = "archive.lock"
+
+# Default histogram buckets in seconds
+BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+)
+
+# All metrics keyed by name
+_METRICS = {}
+
+# Values of this process keyed by (sample name, labels)
+_VALUES = {}
+
+# State of this process
+_STATE = {"pid": None, "token": None, "flushed": 0}
+
+
+class _Child:
+    """A metric with a specific set of label values."""
+
+    def __init__(self, metric, labels):
+        """Initialize the class.
+
+        Args:
+            metric: _Metric object
+            labels: Tuple of (label name, label value) tuples
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._metric = metric
+        self._labels = labels
+
+    def inc(self, amount=1):
+        """Increment a counter or gauge.
+
+        Args:
+            amount: Amount to add
+
+        Returns:
+            None
+
+        """
+        # Update
+        key = (self._metric.name, self._labels)
+        values = _values()
+        values[key] = values.get(key, 0) + amount
+
+    def set(self, value):
+        """Set the value of a gauge.
+
+        Args:
+            value: Value to set
+
+        Returns:
+            None
+
+        """
+        # Update
+        _values()[(self._metric.name, self._labels)] = value
+
+    def observe(self, value):
+        """Add an observation to a histogram.
+
+        Args:
+            value: Value to add
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        name = self._metric.name
+        values = _values()
+
+        # Update the buckets
+        for bucket in self._metric.buckets + (float("inf"),):
+            if value <= bucket:
+                key = (
+                    "{}_bucket".format(name),
+                    self._labels + (("le", _number(bucket)),),
+                )
+                values[key] = values.get(key, 0) + 1
+
+        # Update the sum and count
+        for suffix, amount in (("_sum", value), ("_count", 1)):
+            key = ("{}{}".format(name, suffix), self._labels)
+            values[key] = values.get(key, 0) + amount
+
+    @contextmanager
+    def time(self):
+        """Observe the duration of a block of code.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Time the code
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class _Metric(_Child):
+    """A named metric."""
+
+    def __init__(self, kind, name, documentation, labelnames=(), buckets=None):
+        """Initialize the class.
+
+        Args:
+            kind: Prometheus metric type
+            name: Name of the metric
+            documentation: Description of the metric
+            labelnames: Names of the labels of the metric
+            buckets: Histogram buckets
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets) if bool(buckets) else BUCKETS
+        _Child.__init__(self, self, ())
+
+        # Register the metric
+        _METRICS[name] = self
+
+    def labels(self, **kwargs):
+        """Get the metric for a specific set of label values.
+
+        Args:
+            kwargs: Label values keyed by label name
+
+        Returns:
+            result: _Child object
+
+        """
+        # Return
+        result = _Child(
+            self,
+            tuple((name, str(kwargs[name])) for name in self.labelnames),
+        )
+        return result
+
+
+def counter(name, documentation, labelnames=()):
+    """Create a counter.
+
+    Args:
+        name: Name of the metric
+        documentation: Description of the metric
+        labelnames: Names of the labels of the metric
+
+    Returns:
+        result: _Metric object
+
+    """
+    # Return
+    result = _Metric("counter", name, documentation, labelnames=labelnames)
+    return result
+
+
+def gauge(name, documentation, labelnames=()):
+    """Create a gauge.
+
+    Args:
+        name: Name of the metric
+        documentation: Description of the metric
+        labelnames: Names of the labels of the metric
+
+    Returns:
+        result: _Metric object
+
+    """
+    # Return
+    result = _Metric("gauge", name, documentation, labelnames=labelnames)
+    return result
+
+
+def histogram(name, documentation, labelnames=(), buckets=None):
+    """Create a histogram.
+
+    Args:
+        name: Name of the metric
+        documentation: Description of the metric
+        labelnames: Names of the labels of the metric
+        buckets: Histogram buckets
+
+    Returns:
+        result: _Metric object
+
+    """
+    # Return
+    result = _Metric(
+        "histogram", name, documentation, labelnames=labelnames, buckets=buckets
+    )
+    return result
+
+
+#############################################################################
+# Switchmap metrics
+#############################################################################
+
+POLLER_DEVICES = counter(
+    "switchmap_poller_devices_polled_total",
+    "Devices successfully polled.",
+    labelnames=("zone",),
+)
+POLLER_FAILURES = counter(
+    "switchmap_poller_devices_failed_total",
+    "Devices that returned no SNMP data.",
+    labelnames=("zone",),
+)
+POLLER_QUERY_SECONDS = histogram(
+    "switchmap_poller_mib_query_seconds",
+    "Duration of MIB queries.",
+    labelnames=("query", "layer"),
+)
+POLLER_VARBINDS = counter(
+    "switchmap_poller_varbinds_total",
+    "SNMP variable bindings received.",
+)
+POLLER_POST_SECONDS = histogram(
+    "switchmap_poller_post_seconds",
+    "Duration of posts of polled data to the server.",
+)
+POLLER_POST_FAILURES = counter(
+    "switchmap_poller_post_failures_total",
+    "Posts of polled data that the server did not accept.",
+)
+INGESTER_QUEUE = gauge(
+    "switchmap_ingester_queue_depth",
+    "Cache files waiting to be ingested at the start of the last cycle.",
+)
+INGESTER_STEP_SECONDS = histogram(
+    "switchmap_ingester_step_seconds",
+    "Duration of ingest steps.",
+    labelnames=("step",),
+)
+INGESTER_PURGE_SECONDS = histogram(
+    "switchmap_ingester_purge_seconds",
+    "Duration of event purges.",
+)
+DB_ROWS = counter(
+    "switchmap_db_rows_inserted_total",
+    "Rows inserted into the database.",
+    labelnames=("table",),
+)
+DB_CHECKOUTS = counter(
+    "switchmap_db_pool_checkouts_total",
+    "Connections checked out of the database connection pool.",
+)
+DB_CHECKINS = counter(
+    "switchmap_db_pool_checkins_total",
+    "Connections returned to the database connection pool.",
+)
+DB_READ_FALLBACKS = counter(
+    "switchmap_db_read_fallbacks_total",
+    "Reads made on the primary database while the read replica was behind.",
+)
+DB_STATEMENT_SECONDS = histogram(
+    "switchmap_db_statement_seconds",
+    "Duration of database statements by the error code of their caller.",
+    labelnames=("code",),
+    buckets=(0.0005, 0.001, 0.0025) + BUCKETS,
+)
+SERVER_REQUESTS = counter(
+    "switchmap_server_requests_total",
+    "Requests made to the API server.",
+    labelnames=("endpoint", "status"),
+)
+SERVER_GRAPHQL_CACHE = counter(
+    "switchmap_server_graphql_cache_total",
+    "GraphQL queries by whether they were answered from the response cache.",
+    labelnames=("result",),
+)
+
+
+#############################################################################
+# Saving and exporting metrics
+#############################################################################
+
+
+def setup(agent, reset=False):
+    """Save metrics for a daemon and its subprocesses.
+
+    Args:
+        agent: Name of the daemon
+        reset: Delete previously saved values if True
+
+    Returns:
+        None
+
+    """
+    # Create the directory
+    directory = os.path.join(ConfigCore().metrics_directory(), agent)
+    files.mkdir(directory)
+    os.environ[_DIRECTORY] = directory
+
+    # Delete previously saved values
+    if bool(reset) is True:
+        for filepath in glob.glob(os.path.join(directory, "*.json")):
+            os.remove(filepath)
+
+
+def directory():
+    """Get the directory where metrics are saved.
+
+    Args:
+        None
+
+    Returns:
+        result: Directory, None if metrics are not saved
+
+    """
+    # Return
+    result = os.environ.get(_DIRECTORY)
+    return result
+
+
+def flush(interval=0):
+    """Save the values of this process.
+
+    Args:
+        interval: Only save if this many seconds have passed since the
+            last save
+
+    Returns:
+        None
+
+    """
+    # Do nothing if metrics are not saved
+    if bool(directory()) is False:
+        return
+
+    # Limit the frequency of saves
+    now = time.time()
+    values = _values()
+    if now - _STATE["flushed"] < interval:
+        return
+    _STATE["flushed"] = now
+
+    # Save
+    files.write_json_file(
+        os.path.join(directory(), "{}.json".format(_STATE["token"])),
+        _serialize(values),
+    )
+
+
+def compact():
+    """Merge the saved values of all processes into a single file.
+
+    This must only be called by a daemon's parent process when none of its
+    subprocesses are running. Values of this process are merged as well,
+    except for gauges which are kept in memory.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Do nothing if metrics are not saved
+    if bool(directory()) is False:
+        return
+
+    # Merge everything except gauges
+    flush()
+    archive = os.path.join(directory(), _ARCHIVE)
+    with _locked():
+        merged = _counters(collect())
+        files.write_json_file(archive, _serialize(merged))
+
+        # Delete the merged files
+        for filepath in glob.glob(os.path.join(directory(), "*.json")):
+            if filepath != archive:
+                os.remove(filepath)
+
+    # Only keep gauges in memory
+    values = _values()
+    for key in list(values.keys()):
+        if key in merged:
+            values.pop(key)
+
+
+def retire():
+    """Merge the saved values of this process into the archive and delete them.
+
+    This must be called by subprocesses that end while the rest of the daemon
+    keeps running, such as the workers of the API server. Values of
+    gauges are discarded.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Do nothing if metrics are not saved
+    if bool(directory()) is False:
+        return
+
+    # Initialize key variables
+    archive = os.path.join(directory(), _ARCHIVE)
+    filepath = os.path.join(directory(), "{}.json".format(_STATE["token"]))
+    values = _values()
+
+    # Add the values of this process to those of the archive
+    with _locked():
+        saved = []
+        if os.path.isfile(archive) is True:
+            saved = files.read_json_file(archive, die=False) or []
+        merged = {
+            (name, tuple(tuple(_) for _ in labels)): value
+            for name, labels, value in saved
+        }
+        for key, value in _counters(values).items():
+            merged[key] = merged.get(key, 0) + value
+        files.write_json_file(archive, _serialize(merged))
+
+        # Delete the saved values of this process
+        if os.path.isfile(filepath) is True:
+            os.remove(filepath)
+    values.clear()
+
+
+def collect():
+    """Add together the values of all processes.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of values keyed by (sample name, labels)
+
+    """
+    # Initialize key variables
+    result = {}
+    sources = [_serialize(_values())]
+    token = _STATE["token"]
+
+    # Read the saved values of other processes
+    if bool(directory()) is True:
+        for filepath in glob.glob(os.path.join(directory(), "*.json")):
+            if os.path.basename(filepath) == "{}.json".format(token):
+                continue
+            sources.append(files.read_json_file(filepath, die=False))
+
+    # Add the values
+    for source in sources:
+        for name, labels, value in source or []:
+            key = (name, tuple(tuple(_) for _ in labels))
+            result[key] = result.get(key, 0) + value
+
+    # Return
+    return result
+
+
+def exposition():
+    """Create the Prometheus text exposition of all metrics.
+
+    Args:
+        None
+
+    Returns:
+        result: Exposition string
+
+    """
+    # Initialize key variables
+    lines = []
+    values = collect()
+
+    # Process each metric
+    for name, metric in sorted(_METRICS.items()):
+        samples = sorted(
+            [
+                (key, value)
+                for key, value in values.items()
+                if _metric_name(key[0]) == name
+            ],
+            key=lambda _: (_[0][0], _[0][1]),
+        )
+        if bool(samples) is False:
+            continue
+        lines.append(
+            "# HELP {} {}".format(name, _escape(metric.documentation, False))
+        )
+        lines.append("# TYPE {} {}".format(name, metric.kind))
+        for (sample, labels), value in samples:
+            lines.append(
+                "{}{} {}".format(sample, _labels(labels), _number(value))
+            )
+
+    # Return
+    result = "{}\n".format("\n".join(lines)) if bool(lines) else ""
+    return result
+
+
+def write_textfile(agent):
+    """Write the metrics of a daemon for the node_exporter textfile collector.
+
+    Args:
+        agent: Name of the daemon
+
+    Returns:
+        None
+
+    """
+    # Do nothing if metrics are not saved
+    if bool(directory()) is False:
+        return
+
+    # Write the file atomically
+    compact()
+    filepath = os.path.join(
+        ConfigCore().metrics_directory(), "switchmap_{}.prom".format(agent)
+    )
+    temporary = "{}.tmp".format(filepath)
+    with open(temporary, "w") as f_handle:
+        f_handle.write(exposition())
+    os.replace(temporary, filepath)
+
+
+def _values():
+    """Get the values of this process.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of values keyed by (sample name, labels)
+
+    """
+    # Subprocesses must not report the values inherited from their parent
+    if _STATE["pid"] != os.getpid():
+        _VALUES.clear()
+        _STATE["pid"] = os.getpid()
+        _STATE["token"] = "{}-{:08x}".format(
+            os.getpid(), random.getrandbits(32)
+        )
+        _STATE["flushed"] = 0
+
+    # Return
+    result = _VALUES
+    return result
+
+
+def _counters(values):
+    """Get the values that are not those of gauges.
+
+    Args:
+        values: Dict of values keyed by (sample name, labels)
+
+    Returns:
+        result: Dict of values keyed by (sample name, labels)
+
+    """
+    # Return
+    result = {
+        key: value
+        for key, value in values.items()
+        if _METRICS.get(key[0], None) is None
+        or _METRICS[key[0]].kind != "gauge"
+    }
+    return result
+
+
+@contextmanager
+def _locked():
+    """Lock the archive of the daemon against updates by other processes.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Lock
+    with open(os.path.join(directory(), _LOCK), "a") as f_handle:
+        fcntl.flock(f_handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f_handle, fcntl.LOCK_UN)
+
+
+def _serialize(values):
+    """Convert values to a JSON compatible list.
+
+    Args:
+        values: Dict of values keyed by (sample name, labels)
+
+    Returns:
+        result: List of [sample name, labels, value] lists
+
+    """
+    # Return
+    result = [
+        [name, [list(_) for _ in labels], value]
+        for (name, labels), value in values.items()
+    ]
+    return result
+
+
+def _metric_name(sample):
+    """Get the name of the metric of a sample.
+
+    Args:
+        sample: Sample name
+
+    Returns:
+        result: Metric name
+
+    """
+    # Histograms have samples with suffixes
+    result = sample
+    for suffix in ("_bucket", "_sum", "_count"):
+        if sample.endswith(suffix) and sample not in _METRICS:
+            result = sample[: -len(suffix)]
+            break
+    return result
+
+
+def _labels(labels):
+    """Format labels for the exposition.
+
+    Args:
+        labels: Tuple of (label name, label value) tuples
+
+    Returns:
+        result: Formatted labels
+
+    """
+    # Return
+    if bool(labels) is False:
+        return ""
+    result = "{{{}}}".format(
+        ",".join(
+            '{}="{}"'.format(name, _escape(value, True))
+            for name, value in labels
+        )
+    )
+    return result
+
+
+def _escape(value, quotes):
+    """Escape a string for the exposition.
+
+    Args:
+        value: String to escape
+        quotes: Escape double quotes if True
+
+    Returns:
+        result: Escaped string
+
+    """
+    # Return
+    result = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+    if bool(quotes) is True:
+        result = result.replace('"', '\\"')
+    return result
+
+
+def _number(value):
+    """Format a number for the exposition.
+
+    Args:
+        value: Number to format
+
+    Returns:
+        result: Formatted number
+
+    """
+    # Return
+    if value == float("inf"):
+        result = "+Inf"
+    elif float(value).is_integer() is True:
+        result = str(int(value))
+    else:
+        result = repr(float(value))
+    return result
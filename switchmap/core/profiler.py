@@ -0,0 +1,182 @@
+"""Switchmap opt-in CPU and memory profiling library.
+
+Profiling is enabled by setting "profiling: True" in the "core:" section of
+the configuration, or by the --profile flag of the troubleshooting scripts in
+bin/tools. When enabled, each stage wrapped by stage() creates these files in
+the profile_directory:
+
+    1) A cProfile .pstats file that can be read with the pstats module or
+       converted into flamegraphs with tools such as flameprof or snakeviz
+    2) A .txt file of the top memory allocations made during the stage
+       as reported by tracemalloc
+
+Files are grouped in subdirectories for each polling or ingest cycle.
+
+Stage names are dotted paths that start with the name of the process that
+runs them, such as "poll.HOSTNAME.query" or "ingest.zone.insert_arptable".
+Stages can be nested. The time spent in a nested stage is only recorded in
+the files of the nested stage.
+
+"""
+
+# Standard imports
+import os
+import re
+import time
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+
+# Application imports
+from switchmap.core import log
+from switchmap.core.configuration import ConfigCore
+
+# Environment variables used to share the profiling state with subprocesses
+_ENABLED = "SWITCHMAP_PROFILING"
+_CYCLE = "SWITCHMAP_PROFILING_CYCLE"
+
+# Number of memory allocations to report for each stage
+TOP_N = 25
+
+# (name, profiler) tuples of the stages currently running in this process
+_STACK = []
+
+
+def enable():
+    """Enable profiling for this process and its subprocesses.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Update
+    os.environ[_ENABLED] = "1"
+
+
+def enabled():
+    """Determine whether profiling is enabled.
+
+    Args:
+        None
+
+    Returns:
+        result: True if enabled
+
+    """
+    # Read the configuration only once per process
+    if _ENABLED not in os.environ:
+        os.environ[_ENABLED] = "1" if ConfigCore().profiling() else "0"
+
+    # Return
+    result = os.environ.get(_ENABLED) == "1"
+    return result
+
+
+def cycle(name):
+    """Start a new profiling cycle.
+
+    Args:
+        name: Name of the agent running the cycle
+
+    Returns:
+        None
+
+    """
+    # Update
+    os.environ[_CYCLE] = "{}-{}".format(name, int(time.time()))
+
+
+@contextmanager
+def stage(name):
+    """Profile a stage of processing.
+
+    Args:
+        name: Dotted path name of the stage
+
+    Returns:
+        None
+
+    """
+    # Do nothing if profiling is disabled
+    if enabled() is False:
+        yield
+        return
+
+    # Pause the enclosing stage
+    if bool(_STACK) is True:
+        _STACK[-1][1].disable()
+
+    # Start profiling
+    profiler = cProfile.Profile()
+    tracing = tracemalloc.is_tracing()
+    if tracing is False:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    _STACK.append((name, profiler))
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        # Stop profiling
+        profiler.disable()
+        after = tracemalloc.take_snapshot()
+        if tracing is False:
+            tracemalloc.stop()
+
+        # Save the results
+        _save(name, profiler, after.compare_to(before, "lineno"))
+        _STACK.pop()
+
+        # Resume the enclosing stage
+        if bool(_STACK) is True:
+            _STACK[-1][1].enable()
+
+
+def _save(name, profiler, statistics):
+    """Save the results of a stage.
+
+    Args:
+        name: Name of the stage
+        profiler: cProfile.Profile object
+        statistics: List of tracemalloc.StatisticDiff objects
+
+    Returns:
+        None
+
+    """
+    # Create a filename prefix safe for all stage names
+    directory = os.path.join(
+        ConfigCore().profile_directory(),
+        os.environ.get(_CYCLE, "default"),
+    )
+    prefix = os.path.join(
+        directory,
+        "{}-{}-{}".format(
+            re.sub(r"[^\w.-]", "_", name), os.getpid(), time.time_ns()
+        ),
+    )
+
+    try:
+        # Create the directory for the cycle
+        os.makedirs(directory, mode=0o750, exist_ok=True)
+
+        # Save the CPU profile
+        profiler.dump_stats("{}.pstats".format(prefix))
+
+        # Save the memory profile
+        with open("{}.txt".format(prefix), "w") as fh_:
+            fh_.write(
+                "Top {} memory allocations for stage {}\n\n".format(TOP_N, name)
+            )
+            for statistic in statistics[:TOP_N]:
+                fh_.write("{}\n".format(statistic))
+
+    except OSError as exception_error:
+        log_message = "Cannot save profile for stage {}. Error: {}".format(
+            name, exception_error
+        )
+        log.log2warning(2012, log_message)
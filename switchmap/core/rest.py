@@ -2,15 +2,26 @@
 
 # Standard imports
 import sys
+import json
+import threading
 import requests
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 # Import repository libraries
 # from switchmap.poller.configuration import ConfigAPIClient
 from switchmap.core import log
+from switchmap.core import stream
 from switchmap import API_PREFIX
 from switchmap.core.log import ExceptionWrapper
 
+# Maximum number of GraphQL responses kept for conditional requests
+_ETAG_ENTRIES = 64
+
+# (ETag, response text) tuples of GraphQL queries keyed by (URL, query).
+# Least recently used first.
+_ETAGS = OrderedDict()
+_ETAGS_LOCK = threading.Lock()
+
 
 def post(uri, data, config, server=True):
     """Create URI for datacenter RRD and oid_id data.
@@ -46,8 +57,13 @@ def post(uri, data, config, server=True):
     log_message = "Attempting to post data to {}.".format(url)
     log.log2info(1583, log_message)
 
+    # Serialize the data incrementally to avoid holding another copy of it
+    # in memory as a JSON string
+    body = stream.spool(data)
+    headers = {"Content-Type": "application/json"}
+
     # Post data save to cache if this fails
-    with requests.Session() as session:
+    with requests.Session() as session, body:
 
         # if bool(username) is False or bool(password) is False:
         #     result = session.post(url, json=data)
@@ -58,10 +74,13 @@ def post(uri, data, config, server=True):
         try:
             with requests.Session() as session:
                 if bool(username) is False or bool(password) is False:
-                    result = session.post(url, json=data)
+                    result = session.post(url, data=body, headers=headers)
                 else:
                     result = session.post(
-                        url, json=data, auth=(username, password)
+                        url,
+                        data=body,
+                        headers=headers,
+                        auth=(username, password),
                     )
                 response = True
         except Exception as error:
@@ -144,11 +163,11 @@ def get_graphql(query, config, die=True):
     url = _clean_url("{}/{}/graphql".format(url_root, API_PREFIX))
 
     # Return
-    data = _get_json(url, config, die=die, query=query)
+    data = _get_json(url, config, die=die, query=query, conditional=True)
     return data
 
 
-def _get_json(url, config, die=True, query=None):
+def _get_json(url, config, die=True, query=None, conditional=False):
     """Get data fro URI from API server.
 
     Args:
@@ -156,6 +175,8 @@ def _get_json(url, config, die=True, query=None):
         config: ConfigAPIClient object
         die: Die if the connection fails if True
         query: Query string to use in the HTTP GET
+        conditional: Reuse the previous response to the query if the
+            server reports that it hasn't changed
 
     Returns:
         data: Dict of response
@@ -163,14 +184,26 @@ def _get_json(url, config, die=True, query=None):
     """
     # Initialize key variables
     data = []
+    key = (url, query)
+    headers = None
+
+    # Make a conditional request if there is a previous response
+    with _ETAGS_LOCK:
+        previous = _ETAGS.get(key) if bool(conditional) else None
+    if previous is not None:
+        headers = {"If-None-Match": previous[0]}
 
     # Get data from API server
-    _result = _get(url, config, die=die, query=query)
+    _result = _get(url, config, die=die, query=query, headers=headers)
 
     # Get data
     if _result.success is True:
         try:
-            data = _result.response.json()
+            if previous is not None and _result.response.status_code == 304:
+                text = previous[1]
+            else:
+                text = _result.response.text
+            data = json.loads(text)
         except Exception as exception_error:
             log_message = (
                 "Failed to get JSON data from API server URL {}. Error: {}"
@@ -181,11 +214,45 @@ def _get_json(url, config, die=True, query=None):
             else:
                 log.log2info(1595, log_message)
 
+        # Keep the response for conditional requests
+        if bool(conditional) is True:
+            _remember(key, _result.response, data)
+
     # Return
     return data
 
 
-def _get(url, config, die=True, query=None, stream=False):
+def _remember(key, response, data):
+    """Keep a response for conditional requests.
+
+    Args:
+        key: (URL, query) tuple of the request
+        response: Requests Response object
+        data: Data of the response
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    etag = response.headers.get("ETag")
+
+    with _ETAGS_LOCK:
+        # Mark the previous response as recently used
+        if response.status_code == 304:
+            if key in _ETAGS:
+                _ETAGS.move_to_end(key)
+            return
+
+        # Save responses with data, evicting the least recently used
+        _ETAGS.pop(key, None)
+        if response.status_code == 200 and bool(etag) and bool(data):
+            _ETAGS[key] = (etag, response.text)
+            while len(_ETAGS) > _ETAG_ENTRIES:
+                _ETAGS.popitem(last=False)
+
+
+def _get(url, config, die=True, query=None, stream=False, headers=None):
     """Get data fro URI from API server.
 
     Args:
@@ -194,6 +261,7 @@ def _get(url, config, die=True, query=None, stream=False):
         die: Die if the connection fails if True
         query: Query string to use in the HTTP GET
         stream: True if requesting a file download (Requests stream)
+        headers: Dict of additional HTTP headers
 
     Returns:
         response: ServerResponse object
@@ -213,7 +281,10 @@ def _get(url, config, die=True, query=None, stream=False):
         with requests.Session() as session:
             if bool(query) is False:
                 response = session.get(
-                    url, stream=stream, auth=(username, password)
+                    url,
+                    stream=stream,
+                    auth=(username, password),
+                    headers=headers,
                 )
             else:
                 response = session.get(
@@ -221,6 +292,7 @@ def _get(url, config, die=True, query=None, stream=False):
                     stream=stream,
                     auth=(username, password),
                     params={"query": query},
+                    headers=headers,
                 )
             success = True
     except Exception as exception_error:
@@ -0,0 +1,138 @@
+"""Switchmap incremental JSON serialization library.
+
+Polled data can contain very large tables. Creating a JSON string of the
+entire document would require memory for yet another copy of it, so these
+functions serialize documents one value at a time into a temporary file that
+can be posted or read back directly.
+
+Any collections.abc.Mapping (such as a columnar.MacTable) is serialized as a
+JSON object, so compact tables never have to be expanded into dicts.
+
+"""
+
+# Standard imports
+import json
+import tempfile
+from collections.abc import Mapping
+
+# Values that can be serialized without recursion
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def iterencode(data, canonical=False):
+    """Serialize data into JSON one fragment at a time.
+
+    The result is identical to that of json.dumps(data). Canonical results
+    are identical to those of json.dumps(normalize(data), sort_keys=True,
+    separators=(",", ":")), so they can be hashed without normalizing data.
+
+    Args:
+        data: Data to serialize
+        canonical: Sort keys and omit whitespace if True
+
+    Returns:
+        None: JSON string fragments are yielded one at a time
+
+    """
+    # Initialize key variables
+    separator = "," if bool(canonical) is True else ", "
+    colon = ":" if bool(canonical) is True else ": "
+
+    # Process mappings
+    if isinstance(data, Mapping) is True:
+        items = ((_key(key), value) for key, value in data.items())
+        if bool(canonical) is True:
+            items = sorted(items, key=lambda _: _[0])
+        yield "{"
+        first = True
+        for key, value in items:
+            yield "{}{}{}".format(
+                "" if first else separator, json.dumps(key), colon
+            )
+            yield from iterencode(value, canonical=canonical)
+            first = False
+        yield "}"
+
+    # Process lists
+    elif isinstance(data, (list, tuple)) is True:
+        if all(isinstance(_, _SCALARS) for _ in data) is True:
+            yield json.dumps(data, separators=(separator, colon))
+        else:
+            yield "["
+            for position, value in enumerate(data):
+                if bool(position) is True:
+                    yield separator
+                yield from iterencode(value, canonical=canonical)
+            yield "]"
+
+    # Process everything else
+    else:
+        yield json.dumps(data)
+
+
+def spool(data):
+    """Serialize data into JSON in a temporary file.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        result: Binary file object positioned at the start of the JSON
+
+    """
+    # Write the data
+    result = tempfile.TemporaryFile()
+    for fragment in iterencode(data):
+        result.write(fragment.encode())
+
+    # Return
+    result.seek(0)
+    return result
+
+
+def normalize(data):
+    """Convert data to the equivalent of its JSON representation.
+
+    Args:
+        data: Data to normalize
+
+    Returns:
+        result: Normalized data
+
+    """
+    # Return
+    with spool(data) as body:
+        result = json.load(body)
+    return result
+
+
+def _key(key):
+    """Convert a mapping key to the string used by json.dumps.
+
+    Args:
+        key: Key to convert
+
+    Returns:
+        result: String key
+
+    """
+    # Convert the key
+    if isinstance(key, str) is True:
+        result = key
+    elif key is True:
+        result = "true"
+    elif key is False:
+        result = "false"
+    elif key is None:
+        result = "null"
+    elif isinstance(key, (int, float)) is True:
+        result = json.dumps(key)
+    else:
+        raise TypeError(
+            "keys must be str, int, float, bool or None, not {}".format(
+                key.__class__.__name__
+            )
+        )
+
+    # Return
+    return result
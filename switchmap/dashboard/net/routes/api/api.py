@@ -93,46 +93,7 @@ def devices(idx_device):
     """
     # Initialize key variables
     config = ConfigDashboard()
-    query = """
-{
-  devices(filter: {idxDevice: {eq: IDX_DEVICE}}) {
-    edges {
-      node {
-        hostname
-        sysName
-        sysDescription
-        sysObjectid
-        sysUptime
-        lastPolled
-        device {
-          event {
-            tsCreated
-            roots {
-              edges {
-                node {
-                  idxRoot
-                }
-              }
-            }
-          }
-        }
-        l1interfaces {
-          edges {
-            node {
-              INTERFACE
-            }
-          }
-        }
-      }
-    }
-  }
-}
-""".replace(
-        "IDX_DEVICE", str(idx_device)
-    )
-
-    # Insert the interface snippet
-    updated_query = _insert_interface_snippet(query)
+    updated_query = device_query(idx_device)
 
     # Get the data
     result = rest.get_graphql(updated_query, config)
@@ -273,6 +234,60 @@ def _dashboard(idx_root=1):
         return jsonify({})
 
 
+def device_query(idx_device):
+    """Create the GraphQL query of the device page.
+
+    Args:
+        idx_device: IDX of the DB device table
+
+    Returns:
+        result: GraphQL query string
+
+    """
+    # Initialize key variables
+    query = """
+{
+  devices(filter: {idxDevice: {eq: IDX_DEVICE}}) {
+    edges {
+      node {
+        hostname
+        sysName
+        sysDescription
+        sysObjectid
+        sysUptime
+        lastPolled
+        device {
+          event {
+            tsCreated
+            roots {
+              edges {
+                node {
+                  idxRoot
+                }
+              }
+            }
+          }
+        }
+        l1interfaces {
+          edges {
+            node {
+              INTERFACE
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""".replace(
+        "IDX_DEVICE", str(idx_device)
+    )
+
+    # Insert the interface snippet
+    result = _insert_interface_snippet(query)
+    return result
+
+
 def _insert_interface_snippet(query):
     """Insert the standard interface query string snippet.
 
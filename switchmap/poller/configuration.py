@@ -2,6 +2,7 @@
 
 from switchmap.core.configuration import ConfigAPIClient
 from switchmap.core import log
+from switchmap.core import general
 from switchmap.poller import ZONE, SNMP
 
 
@@ -36,6 +37,21 @@ class ConfigPoller(ConfigAPIClient):
             )
             log.log2die_safe(1007, log_message)
 
+    def delta_posts(self):
+        """Get delta_posts.
+
+        Args:
+            None
+
+        Returns:
+            result: True if only changes since the last post should be sent
+
+        """
+        # Get result
+        result = self._config_poller.get("delta_posts", False)
+        result = general.make_bool(result)
+        return result
+
     def hostnames(self):
         """Get hostnames.
 
@@ -12,12 +12,16 @@ import os
 
 # Import app libraries
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_DELTA_URI
 from switchmap.poller.snmp import poller
 from switchmap.poller.update import device as udevice
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.core import log
 from switchmap.core import rest
 from switchmap.core import files
+from switchmap.core import delta
+from switchmap.core import profiler
+from switchmap.core import metrics
 from switchmap import AGENT_POLLER
 
 _META = namedtuple("_META", "zone hostname config")
@@ -39,6 +43,9 @@ def devices(multiprocessing=False):
     # Get configuration
     config = ConfigPoller()
 
+    # Group profiling data by polling cycle
+    profiler.cycle(AGENT_POLLER)
+
     # Get the number of threads to use in the pool
     pool_size = config.agent_subprocesses()
 
@@ -63,6 +70,9 @@ def devices(multiprocessing=False):
             # Create sub processes from the pool
             pool.map(device, arguments)
 
+    # Export the metrics of the cycle
+    metrics.write_textfile(AGENT_POLLER)
+
 
 def device(poll, post=True):
     """Poll single device for data and create YAML files.
@@ -95,28 +105,116 @@ shutdown request was probably requested""".format(
     if bool(hostname) is True:
         if isinstance(hostname, str) is True:
             if hostname.lower() != "none":
-                poll = poller.Poll(hostname)
-                snmp_data = poll.query()
-
-                # Process if we get valid data
-                if bool(snmp_data) and isinstance(snmp_data, dict):
-                    # Process device data
-                    _device = udevice.Device(snmp_data)
-                    data = _device.process()
-                    data["misc"]["zone"] = zone
-
-                    if bool(post) is True:
-                        # Update the database tables with polled data
-                        rest.post(API_POLLER_POST_URI, data, config)
-                    else:
-                        pprint(data)
-                else:
-                    log_message = """\
+                with profiler.stage("poll.{}".format(hostname)):
+                    _poll(hostname, zone, config, post=post)
+                metrics.flush()
+
+
+def _poll(hostname, zone, config, post=True):
+    """Poll single device for data.
+
+    Args:
+        hostname: Host to poll
+        zone: Zone of the host
+        config: ConfigPoller object
+        post: Post the data if True, else just print it.
+
+    Returns:
+        None
+
+    """
+    # Poll the device
+    poll = poller.Poll(hostname)
+    with profiler.stage("poll.{}.query".format(hostname)):
+        snmp_data = poll.query()
+
+    # Process if we get valid data
+    if bool(snmp_data) and isinstance(snmp_data, dict):
+        # Process device data
+        with profiler.stage("poll.{}.process".format(hostname)):
+            _device = udevice.Device(snmp_data)
+            data = _device.process()
+        data["misc"]["zone"] = zone
+        metrics.POLLER_DEVICES.labels(zone=zone).inc()
+
+        if bool(post) is True:
+            # Update the database tables with polled data
+            stage = "poll.{}.post".format(hostname)
+            with profiler.stage(stage), metrics.POLLER_POST_SECONDS.time():
+                success = _post(data, config)
+            if bool(success) is False:
+                metrics.POLLER_POST_FAILURES.inc()
+        else:
+            pprint(data)
+    else:
+        metrics.POLLER_FAILURES.labels(zone=zone).inc()
+        log_message = """\
 Device {} returns no data. Check your connectivity and/or SNMP configuration\
 """.format(
-                        hostname
-                    )
-                    log.log2debug(1025, log_message)
+            hostname
+        )
+        log.log2debug(1025, log_message)
+
+
+def _post(data, config):
+    """Post polled data to the server.
+
+    Only the changes since the last acknowledged post are sent when delta
+    posts are enabled. A full post is made if there is no previously
+    acknowledged data, or if the server can't apply the changes.
+
+    Args:
+        data: Processed device data
+        config: ConfigPoller object
+
+    Returns:
+        success: True if successful
+
+    """
+    # Initialize key variables
+    success = False
+
+    # Post everything if delta posts are disabled
+    if config.delta_posts() is False:
+        result = rest.post(API_POLLER_POST_URI, data, config)
+        return bool(getattr(result, "success", False))
+
+    # Get the last acknowledged data for the device
+    filepath = files.snapshot_file(
+        AGENT_POLLER, data["misc"]["host"], data["misc"]["zone"], config
+    )
+    previous = (
+        files.read_json_file(filepath, die=False)
+        if os.path.isfile(filepath)
+        else {}
+    )
+
+    # Post only the changes. The data is hashed and posted as it's serialized
+    # so only the changed sections are ever copied
+    if bool(previous) is True:
+        payload = delta.diff(previous, data)
+        result = rest.post(API_POLLER_DELTA_URI, payload, config)
+        success = bool(getattr(result, "success", False))
+        if success is False:
+            log_message = (
+                "Delta post for {} was not accepted. "
+                "Attempting a full resync.".format(data["misc"]["host"])
+            )
+            log.log2debug(2009, log_message)
+
+    # Post everything if there is no history or the server needs a resync
+    if success is False:
+        result = rest.post(API_POLLER_POST_URI, data, config)
+        success = bool(getattr(result, "success", False))
+
+    # Save the acknowledged data for the next poll
+    if success is True:
+        files.write_json_file(filepath, data)
+    elif os.path.isfile(filepath) is True:
+        os.remove(filepath)
+
+    # Return
+    return success
 
 
 def cli_device(hostname):
@@ -135,6 +233,9 @@ def cli_device(hostname):
     # Get configuration
     config = ConfigPoller()
 
+    # Group profiling data by polling cycle
+    profiler.cycle(AGENT_POLLER)
+
     # Create a list of polling objects
     zones = sorted(config.zones())
 
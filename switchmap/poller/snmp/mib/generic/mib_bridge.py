@@ -264,10 +264,10 @@ class BridgeQuery(Query):
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.2"
         for context_name in context_names:
-            results = self._snmp_object.swalk(
+            results = self._snmp_object.iwalk(
                 oid, normalized=False, context_name=context_name
             )
-            for key, value in results.items():
+            for key, value in results:
                 new_key = key[len(oid) :]
                 data_dict[new_key] = value
 
@@ -306,8 +306,8 @@ class BridgeQuery(Query):
             oid = ".1.3.6.1.2.1.17.7.1.2.2.1.2"
             for vlan in vlans:
                 new_oid = "{}.{}".format(oid, vlan)
-                results = self._snmp_object.swalk(new_oid, normalized=False)
-                for key, value in results.items():
+                results = self._snmp_object.iwalk(new_oid, normalized=False)
+                for key, value in results:
                     new_key = key[len(oid) :]
                     data_dict[new_key] = value
 
@@ -333,10 +333,10 @@ class BridgeQuery(Query):
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.1"
         for context_name in context_names:
-            results = self._snmp_object.swalk(
+            results = self._snmp_object.iwalk(
                 oid, normalized=False, context_name=context_name
             )
-            for key, mac_value in results.items():
+            for key, mac_value in results:
                 # Assign the mac address to the dictionary
                 new_key = key[len(oid) :]
                 data_dict[new_key] = general.octetstr_2_string(mac_value)
@@ -3,6 +3,7 @@
 from collections import defaultdict
 
 from switchmap.poller.snmp.base_query import Query
+from switchmap.poller.update.columnar import MacTable
 from switchmap.core import general
 
 
@@ -95,14 +96,10 @@ class IpQuery(Query):
         final = defaultdict(lambda: defaultdict(dict))
 
         # Get interface ipNetToMediaTable data
-        values = self.ipnettomediatable()
-        for key, value in values.items():
-            final["ipNetToMediaTable"][key] = value
+        final["ipNetToMediaTable"] = self.ipnettomediatable()
 
         # Get interface ipNetToPhysicalPhysAddress data
-        values = self.ipnettophysicalphysaddress()
-        for key, value in values.items():
-            final["ipNetToPhysicalPhysAddress"][key] = value
+        final["ipNetToPhysicalPhysAddress"] = self.ipnettophysicalphysaddress()
 
         # Return
         return final
@@ -114,11 +111,11 @@ class IpQuery(Query):
             oidonly: Return OID's value, not results, if True
 
         Returns:
-            data_dict: Dict of MAC addresses keyed by IPv4 address
+            data_dict: MacTable of MAC addresses keyed by IPv4 address
 
         """
         # Initialize key variables
-        data_dict = {}
+        data_dict = MacTable(version=4)
 
         # Process
         oid = ".1.3.6.1.2.1.4.22.1.2"
@@ -127,9 +124,9 @@ class IpQuery(Query):
         if oidonly is True:
             return oid
 
-        # Process results
-        results = self.snmp_object.swalk(oid, normalized=False)
-        for key, value in results.items():
+        # Process results as they arrive
+        results = self.snmp_object.iwalk(oid, normalized=False)
+        for key, value in results:
             # Determine IP address
             nodes = key.split(".")
             octets = nodes[-4:]
@@ -139,7 +136,7 @@ class IpQuery(Query):
             macaddress = general.octetstr_2_string(value)
 
             # Create ARP table entry
-            data_dict[ipaddress] = macaddress
+            data_dict.append(ipaddress, macaddress)
 
         # Return data
         return data_dict
@@ -151,11 +148,11 @@ class IpQuery(Query):
             oidonly: Return OID's value, not results, if True
 
         Returns:
-            data_dict: Dict of MAC addresses keyed by IPv6 Address
+            data_dict: MacTable of MAC addresses keyed by IPv6 Address
 
         """
         # Initialize key variables
-        data_dict = {}
+        data_dict = MacTable(version=6)
         oid = ".1.3.6.1.2.1.4.35.1.4"
 
         # Return OID value. Used for unittests
@@ -163,8 +160,8 @@ class IpQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=False)
-        for key, mac_value in results.items():
+        results = self.snmp_object.iwalk(oid, normalized=False)
+        for key, mac_value in results:
             # Get IP address, first 12 characters
             macaddress = general.octetstr_2_string(mac_value)
 
@@ -196,7 +193,7 @@ class IpQuery(Query):
             ipv6 = ":".join(nodes_final)
 
             # Create ARP entry
-            data_dict[ipv6] = macaddress
+            data_dict.append(ipv6, macaddress)
 
         # Return data
         return data_dict
@@ -5,6 +5,9 @@ from collections import defaultdict
 
 from . import iana_enterprise
 from . import get_queries
+from switchmap.core import profiler
+from switchmap.core import metrics
+from switchmap.poller.update import columnar
 
 
 class Query:
@@ -117,7 +120,7 @@ class Query:
 
         """
         # Initialize key values
-        data = defaultdict(lambda: defaultdict(dict))
+        data = columnar.Table.from_dict({})
         processed = False
 
         # Get information layer1 queries
@@ -146,7 +149,7 @@ class Query:
 
         """
         # Initialize key variables
-        data = defaultdict(lambda: defaultdict(dict))
+        data = columnar.Table.from_dict({})
         processed = False
 
         for item in [
@@ -203,6 +206,20 @@ def _add_data(source, target):
     """
     # Process data
     for primary in source.keys():
+        # Add compact tables as is to avoid expanding them into dicts
+        if (
+            isinstance(source[primary], columnar.MacTable)
+            and primary not in target
+        ):
+            target[primary] = source[primary]
+            continue
+
+        # Add entries to compact tables without expanding them
+        if isinstance(target.get(primary), columnar.MacTable):
+            for secondary, value in source[primary].items():
+                target[primary].append(secondary, value)
+            continue
+
         for secondary, value in source[primary].items():
             target[primary][secondary] = value
 
@@ -215,15 +232,16 @@ def _add_layer1(query, original_data):
 
     Args:
         query: MIB query object
-        original_data: Two keyed dict of data
+        original_data: Table object of data
 
     Returns:
         new_data: Aggregated data
 
     """
     # Process query
-    result = query.layer1()
-    new_data = _add_data(result, original_data)
+    with profiler.stage(_stage(query, "layer1")), _timer(query, "layer1"):
+        result = query.layer1()
+    new_data = original_data.merge(columnar.Table.from_dict(result))
 
     # Return
     return new_data
@@ -234,15 +252,16 @@ def _add_layer2(query, original_data):
 
     Args:
         query: MIB query object
-        original_data: Two keyed dict of data
+        original_data: Table object of data
 
     Returns:
         new_data: Aggregated data
 
     """
     # Process query
-    result = query.layer2()
-    new_data = _add_data(result, original_data)
+    with profiler.stage(_stage(query, "layer2")), _timer(query, "layer2"):
+        result = query.layer2()
+    new_data = original_data.merge(columnar.Table.from_dict(result))
 
     # Return
     return new_data
@@ -260,7 +279,8 @@ def _add_layer3(query, original_data):
 
     """
     # Process query
-    result = query.layer3()
+    with profiler.stage(_stage(query, "layer3")), _timer(query, "layer3"):
+        result = query.layer3()
     new_data = _add_data(result, original_data)
 
     # Return
@@ -279,7 +299,8 @@ def _add_system(query, data):
 
     """
     # Process query
-    result = query.system()
+    with profiler.stage(_stage(query, "system")), _timer(query, "system"):
+        result = query.system()
 
     # Add tag
     for primary in result.keys():
@@ -289,3 +310,39 @@ def _add_system(query, data):
 
     # Return
     return data
+
+
+def _stage(query, layer):
+    """Create the profiling stage name for a MIB query.
+
+    Args:
+        query: MIB query object
+        layer: Name of the layer being queried
+
+    Returns:
+        result: Stage name
+
+    """
+    # Return
+    result = "poll.{}.query.{}.{}".format(
+        query.snmp_object.hostname(), layer, query.__class__.__name__.lower()
+    )
+    return result
+
+
+def _timer(query, layer):
+    """Create the metrics timer for a MIB query.
+
+    Args:
+        query: MIB query object
+        layer: Name of the layer being queried
+
+    Returns:
+        result: Context manager timing the query
+
+    """
+    # Return
+    result = metrics.POLLER_QUERY_SECONDS.labels(
+        query=query.__class__.__name__, layer=layer
+    ).time()
+    return result
@@ -11,6 +11,7 @@ from switchmap.poller.configuration import ConfigPoller
 from switchmap.poller import POLL
 from switchmap.core import log
 from switchmap.core import files
+from switchmap.core import metrics
 from . import iana_enterprise
 
 
@@ -362,6 +363,37 @@ class Interact:
         # Return
         return results
 
+    def iwalk(self, oid_to_get, normalized=False, context_name=""):
+        """Perform a safe SNMPwalk that yields results as they are formatted.
+
+        This avoids creating a dict of the entire walk, which is useful for
+        very large tables such as ARP and MAC address tables.
+
+        Args:
+            oid_to_get: OID to get
+            normalized: If True, then yield results keyed by only the last
+                node of an OID, otherwise yield results keyed by the entire
+                OID string.
+            context_name: Set the contextName used for SNMPv3 messages.
+
+        Returns:
+            results: Generator of (OID, value) tuples
+        """
+        # Process data
+        (_, _, results) = self.query(
+            oid_to_get,
+            get=False,
+            check_reachability=True,
+            check_existence=True,
+            normalized=normalized,
+            context_name=context_name,
+            safe=True,
+            stream=True,
+        )
+
+        # Return
+        return results
+
     def walk(
         self,
         oid_to_get,
@@ -455,6 +487,7 @@ class Interact:
         normalized=False,
         context_name="",
         safe=False,
+        stream=False,
     ):
         """Do an SNMP query.
 
@@ -475,6 +508,8 @@ class Interact:
                 defContext token in the snmp.conf file.
             safe: Safe query if true. If there is an exception, then return\
                 blank values.
+            stream: Return values as a generator of (OID, value) tuples
+                instead of a dict if True
 
         Returns:
             return_value: List of tuples (_contactable, exists, values)
@@ -568,8 +603,16 @@ class Interact:
             else:
                 log.log2die(1003, log_message)
 
+        # Count the variable bindings received
+        metrics.POLLER_VARBINDS.inc(len(results))
+
         # Format results
-        values = _format_results(results, oid_to_get, normalized=normalized)
+        if bool(stream) is True:
+            values = _iterate_results(
+                results, oid_to_get, normalized=normalized
+            )
+        else:
+            values = _format_results(results, oid_to_get, normalized=normalized)
 
         # Return
         return_value = (_contactable, exists, values)
@@ -846,9 +889,27 @@ def _format_results(results, mock_filter, normalized=False):
     Returns:
         dict: Formatted results as OID-value pairs
     """
-    # Initialize key variables
-    return_results = {}
+    # Return
+    return_results = dict(
+        _iterate_results(results, mock_filter, normalized=normalized)
+    )
+    return return_results
+
 
+def _iterate_results(results, mock_filter, normalized=False):
+    """Normalize and format SNMP walk results one at a time.
+
+    Args:
+        results: List of lists of results
+        mock_filter: The original OID to get. Facilitates unittesting by
+            filtering Mock values.
+        normalized: If True, then yield results keyed by only the last
+            node of an OID, otherwise yield results keyed by the entire
+            OID string.
+
+    Returns:
+        None: Formatted (OID, value) tuples are yielded one at a time
+    """
     for result in results:
         # Recreate the OID
         oid = "{}.{}".format(result.oid, result.oid_index)
@@ -859,12 +920,9 @@ def _format_results(results, mock_filter, normalized=False):
 
         # Process the rest
         if normalized is True:
-            return_results[result.oid_index] = _convert(result)
+            yield (result.oid_index, _convert(result))
         else:
-            return_results[oid] = _convert(result)
-
-    # Return
-    return return_results
+            yield (oid, _convert(result))
 
 
 def _convert(result):
@@ -0,0 +1,860 @@
+"""Columnar representation of polled device data.
+
+Polled layer1 and layer2 data is keyed by a primary key (such as ifIndex)
+then by OID name. The poller stores this data in Table objects that keep one
+typed array per OID name, all sharing a single primary key index.
+
+    1) Integer OID values are stored in int64 arrays
+    2) Boolean values are stored in bool arrays
+    3) Everything else (bytes, strings, lists) is stored in object arrays
+
+Each column has a companion boolean array that records whether the OID was
+present for the primary key. This makes the conversion back to the dict
+format lossless, and allows derived values such as trunk status or duplex
+to be calculated for all interfaces at once instead of in Python loops.
+
+Tables behave like read only dicts of rows, so they are serialized into the
+JSON posted to the server without first being converted into dicts.
+
+Very large ARP tables are stored in MacTable objects. These keep MAC
+addresses as 48 bit integers and IP addresses as packed bytes, but behave
+like the read only dicts they replace.
+
+"""
+
+# Standard imports
+from array import array
+from collections.abc import Mapping
+import ipaddress
+
+# PIP imports
+import numpy as np
+
+# Range of values that can be stored in an integer column
+_INT_MIN = np.iinfo(np.int64).min
+_INT_MAX = np.iinfo(np.int64).max
+
+
+class Column:
+    """A single typed column of values with a presence mask."""
+
+    def __init__(self, values, present):
+        """Initialize the class.
+
+        Args:
+            values: numpy array of values
+            present: numpy bool array, True where a value exists
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.values = values
+        self.present = present
+
+    @property
+    def dtype(self):
+        """Provide the value of the 'dtype' property."""
+        return self.values.dtype
+
+    def equals(self, value):
+        """Get the rows where the column is present and equal to a value.
+
+        Args:
+            value: Value to compare
+
+        Returns:
+            result: numpy bool array
+
+        """
+        # Object arrays need an elementwise comparison
+        if self.values.dtype == object:
+            matches = np.array(
+                [_ == value for _ in self.values.tolist()], dtype=bool
+            )
+        else:
+            matches = self.values == value
+
+        # Return
+        result = np.logical_and(self.present, matches)
+        return result
+
+
+class Table(Mapping):
+    """Array backed columnar table keyed by a shared primary key index."""
+
+    def __init__(self, index, columns):
+        """Initialize the class.
+
+        Args:
+            index: List of primary keys (eg. ifIndex values)
+            columns: Dict of Column objects keyed by field name
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.index = np.array(index, dtype=object)
+        self.columns = columns
+        self._positions = {key: _ for _, key in enumerate(index)}
+
+    def __getitem__(self, key):
+        """Get a row of the table.
+
+        Args:
+            key: Primary key
+
+        Returns:
+            result: Dict of the values of the row keyed by field name
+
+        """
+        # Initialize key variables
+        position = self._positions[key]
+        result = {}
+
+        # Get the values that exist
+        for field, column in self.columns.items():
+            if bool(column.present[position]) is True:
+                value = column.values[position]
+                result[field] = (
+                    value.item() if isinstance(value, np.generic) else value
+                )
+
+        # Return
+        return result
+
+    def __iter__(self):
+        """Iterate over the primary keys of the table.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Return
+        yield from self._positions
+
+    def __len__(self):
+        """Get the number of rows in the table.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of rows
+
+        """
+        # Return
+        result = len(self.index)
+        return result
+
+    def __repr__(self):
+        """Get the dict representation of the table.
+
+        Args:
+            None
+
+        Returns:
+            result: String representation
+
+        """
+        # Return
+        result = repr(self.to_dict())
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a Table from a two keyed dict.
+
+        Args:
+            data: Dict of dicts keyed by primary key then field name
+
+        Returns:
+            result: Table object
+
+        """
+        # Initialize key variables
+        data = data if isinstance(data, dict) else {}
+        index = list(data.keys())
+        size = len(index)
+        fields = {}
+        columns = {}
+
+        # Get the names of all fields in the order they were first found
+        for row in data.values():
+            if isinstance(row, dict) is True:
+                for field in row.keys():
+                    fields.setdefault(field, None)
+
+        # Create the columns
+        for field in fields.keys():
+            present = np.zeros(size, dtype=bool)
+            items = [None] * size
+            for position, key in enumerate(index):
+                row = data[key]
+                if isinstance(row, dict) is True and field in row:
+                    present[position] = True
+                    items[position] = row[field]
+            columns[field] = Column(_array(items, present), present)
+
+        # Return
+        result = cls(index, columns)
+        return result
+
+    def to_dict(self):
+        """Convert the Table to its two keyed dict equivalent.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of dicts keyed by primary key then field name
+
+        """
+        # Initialize key variables
+        result = {key: {} for key in self.index.tolist()}
+        keys = self.index.tolist()
+
+        # Process each column
+        for field, column in self.columns.items():
+            values = column.values.tolist()
+            for position in np.flatnonzero(column.present).tolist():
+                result[keys[position]][field] = values[position]
+
+        # Return
+        return result
+
+    def column(self, field):
+        """Get a column by name.
+
+        Args:
+            field: Name of the field
+
+        Returns:
+            result: Column object. An empty column if the field doesn't exist.
+
+        """
+        # Return an empty column if necessary
+        result = self.columns.get(field)
+        if result is None:
+            size = len(self.index)
+            result = Column(
+                np.zeros(size, dtype=np.int64), np.zeros(size, dtype=bool)
+            )
+        return result
+
+    def position(self, key):
+        """Get the row position of a primary key.
+
+        Args:
+            key: Primary key
+
+        Returns:
+            result: Row position, None if not found
+
+        """
+        # Return
+        result = self._positions.get(key)
+        return result
+
+    def merge(self, other):
+        """Combine the rows of the table with those of another table.
+
+        Values in the other table replace those of the same primary key
+        and field in this table.
+
+        Args:
+            other: Table object
+
+        Returns:
+            result: New Table object
+
+        """
+        # Initialize key variables
+        index = self.index.tolist()
+        index.extend(
+            _ for _ in other.index.tolist() if _ not in self._positions
+        )
+        size = len(index)
+        positions = {key: _ for _, key in enumerate(index)}
+        mine = np.arange(len(self), dtype=np.int64)
+        theirs = np.array(
+            [positions[_] for _ in other.index.tolist()], dtype=np.int64
+        )
+        columns = {}
+
+        # Expand the columns of both tables to the new index then combine
+        fields = list(self.columns.keys())
+        fields.extend(_ for _ in other.columns.keys() if _ not in self.columns)
+        for field in fields:
+            columns[field] = _overlay(
+                _expand(self.columns.get(field), mine, size),
+                _expand(other.columns.get(field), theirs, size),
+            )
+
+        # Return
+        result = Table(index, columns)
+        return result
+
+    def assign(self, columns):
+        """Add columns to the table.
+
+        Values in the new columns replace those of existing columns of the
+        same name wherever they are present.
+
+        Args:
+            columns: Dict of Column objects keyed by field name
+
+        Returns:
+            result: New Table object
+
+        """
+        # Initialize key variables
+        _columns = dict(self.columns)
+
+        # Add the columns
+        for field, column in columns.items():
+            _columns[field] = _overlay(_columns.get(field), column)
+
+        # Return
+        result = Table(self.index.tolist(), _columns)
+        return result
+
+
+class MacTable(Mapping):
+    """Compact read only mapping of MAC addresses keyed by IP address."""
+
+    def __init__(self, version=4):
+        """Initialize the class.
+
+        Args:
+            version: IP version of the keys
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.version = version
+        self._width = 4 if version == 4 else 16
+        self._ips = bytearray()
+        self._macs = array("Q")
+
+        # Values that can't be stored compactly
+        self._odd_macs = {}
+        self._odd_ips = {}
+
+        # Positions of the IP addresses, created when first needed
+        self._lookup = None
+
+    def append(self, ip_address, mac_address):
+        """Add an entry to the table.
+
+        Args:
+            ip_address: IP address string
+            mac_address: MAC address hex string
+
+        Returns:
+            None
+
+        """
+        # Keys that aren't valid IP addresses are stored as is
+        try:
+            packed = ipaddress.ip_address(ip_address).packed
+        except ValueError:
+            packed = None
+        if packed is None or len(packed) != self._width:
+            self._odd_ips[ip_address] = mac_address
+            return
+
+        # Values that aren't 48 bit MAC addresses are stored as is
+        position = len(self._macs)
+        try:
+            value = int(mac_address, 16) if len(mac_address) == 12 else None
+        except ValueError:
+            value = None
+        if value is None or "{:012x}".format(value) != mac_address:
+            self._odd_macs[position] = mac_address
+            value = 0
+
+        # Update
+        self._ips.extend(packed)
+        self._macs.append(value)
+        self._lookup = None
+
+    def __getitem__(self, key):
+        """Get the MAC address of an IP address.
+
+        An index of the positions of the IP addresses is created by the
+        first lookup, so use items() if all the entries are needed.
+
+        Args:
+            key: IP address string
+
+        Returns:
+            result: MAC address hex string
+
+        """
+        # Keys that aren't valid IP addresses
+        if key in self._odd_ips:
+            return self._odd_ips[key]
+
+        # Find the last entry for the IP address
+        try:
+            packed = ipaddress.ip_address(key).packed
+        except ValueError:
+            raise KeyError(key)
+        position = self._positions().get(packed)
+        if position is None:
+            raise KeyError(key)
+
+        # Return
+        result = self._odd_macs.get(
+            position, "{:012x}".format(self._macs[position])
+        )
+        return result
+
+    def __iter__(self):
+        """Iterate over the IP addresses in the table.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Return
+        for ip_address, _ in self.items():
+            yield ip_address
+
+    def __len__(self):
+        """Get the number of IP addresses in the table.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of unique IP addresses
+
+        """
+        # Return
+        result = len(self._order()[0]) + len(self._odd_ips)
+        return result
+
+    def __repr__(self):
+        """Get the dict representation of the table.
+
+        Args:
+            None
+
+        Returns:
+            result: String representation
+
+        """
+        # Return
+        result = repr(dict(self.items()))
+        return result
+
+    def items(self):
+        """Iterate over the (IP address, MAC address) pairs of the table.
+
+        Later entries for the same IP address replace earlier ones, as they
+        would in a dict.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        firsts, lasts = self._order()
+        width = self._width
+
+        # Process the compact entries
+        for first, last in zip(firsts, lasts):
+            ip_address = _ip_string(
+                bytes(self._ips[first * width : (first + 1) * width])
+            )
+            if last in self._odd_macs:
+                yield (ip_address, self._odd_macs[last])
+            else:
+                yield (ip_address, "{:012x}".format(self._macs[last]))
+
+        # Process the entries that couldn't be stored compactly
+        for ip_address, mac_address in self._odd_ips.items():
+            yield (ip_address, mac_address)
+
+    def _positions(self):
+        """Get the position of the last entry for each IP address.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of positions keyed by packed IP address
+
+        """
+        # Create the index
+        if self._lookup is None:
+            width = self._width
+            self._lookup = {
+                bytes(self._ips[_ * width : (_ + 1) * width]): _
+                for _ in range(len(self._macs))
+            }
+
+        # Return
+        result = self._lookup
+        return result
+
+    def _order(self):
+        """Get the positions of the first and last entry for each IP address.
+
+        Args:
+            None
+
+        Returns:
+            result: Tuple of (first positions, last positions) ordered by
+                first position
+
+        """
+        # Initialize key variables
+        size = len(self._macs)
+        positions = list(range(size))
+        if bool(size) is False:
+            return ([], [])
+
+        # Find duplicate IP addresses
+        keys = np.frombuffer(bytes(self._ips), dtype="S{}".format(self._width))
+        _, inverse = np.unique(keys, return_inverse=True)
+        if int(inverse.max()) + 1 == size:
+            return (positions, positions)
+
+        # Keep the first position and the last value of each duplicate
+        count = int(inverse.max()) + 1
+        firsts = np.full(count, size, dtype=np.int64)
+        lasts = np.full(count, -1, dtype=np.int64)
+        np.minimum.at(firsts, inverse, np.arange(size))
+        np.maximum.at(lasts, inverse, np.arange(size))
+        order = np.argsort(firsts, kind="stable")
+        result = (firsts[order].tolist(), lasts[order].tolist())
+        return result
+
+
+def trunk(table):
+    """Determine whether each interface is a trunk.
+
+    Args:
+        table: Layer1 Table object
+
+    Returns:
+        result: numpy bool array
+
+    """
+    # Cisco devices
+    cisco = table.column("vlanTrunkPortDynamicStatus").equals(1)
+
+    # Juniper devices
+    juniper = table.column("jnxExVlanPortAccessMode").equals(2)
+
+    # Return
+    result = np.logical_or(cisco, juniper)
+    return result
+
+
+def nativevlan(table):
+    """Determine the native VLAN of each interface.
+
+    Args:
+        table: Layer1 Table object
+
+    Returns:
+        result: numpy object array of native VLANs, None if there is no
+            native VLAN
+
+    """
+    # Initialize key variables
+    result = np.empty(len(table), dtype=object)
+
+    # Cisco devices
+    column = table.column("vlanTrunkPortNativeVlan")
+    result[column.present] = _integers(column.values[column.present])
+
+    # Juniper devices which take precedence
+    column = table.column("dot1qPvid")
+    result[column.present] = column.values[column.present].astype(object)
+
+    # Return
+    return result
+
+
+def vlans(table):
+    """Determine the VLANs of each interface.
+
+    Args:
+        table: Layer1 Table object
+
+    Returns:
+        result: numpy object array of VLAN lists, None if there are no VLANs
+
+    """
+    # Initialize key variables
+    result = np.empty(len(table), dtype=object)
+
+    # Cisco devices (Older models)
+    column = table.column("vmVlan")
+    result[column.present] = _vlan_lists(column.values[column.present])
+
+    # Cisco devices (Newer models)
+    column = table.column("vlanTrunkPortVlansEnabled")
+    result[column.present] = _vlan_lists(column.values[column.present])
+
+    # Cisco devices (Router trunk subinterfaces)
+    column = table.column("cviRoutedVlanIfIndex")
+    result[column.present] = column.values[column.present].astype(object)
+
+    # Juniper devices
+    column = table.column("jnxExVlanTag")
+    tags = np.logical_and(column.present, _truths(column.values))
+    result[tags] = column.values[tags].astype(object)
+
+    # Return
+    return result
+
+
+def ethernet(table):
+    """Determine whether each interface is an Ethernet port.
+
+    Args:
+        table: Layer1 Table object
+
+    Returns:
+        result: numpy bool array
+
+    """
+    # Layer2 VLAN interfaces can have an Ethernet ifType
+    column = table.column("ifName")
+    names = np.char.lower(column.values.astype(str))
+    vlan = np.logical_and(column.present, np.char.startswith(names, "vl"))
+
+    # Return
+    result = np.logical_and(
+        table.column("ifType").equals(6), np.logical_not(vlan)
+    )
+    return result
+
+
+def duplex(table):
+    """Determine the duplex of each interface.
+
+    Args:
+        table: Layer1 Table object
+
+    Returns:
+        result: numpy int64 array of duplex values
+            0) Unknown
+            1) Half
+            2) Full
+            3) Half Auto
+            4) Full Auto
+
+    """
+    # Initialize key variables
+    size = len(table)
+    result = np.zeros(size, dtype=np.int64)
+    done = np.zeros(size, dtype=bool)
+
+    # Process the duplex status OIDs in order of precedence
+    statuses = (
+        ("swPortDuplexStatus", ((1, 2),), 1),
+        ("dot3StatsDuplexStatus", ((2, 1), (3, 2)), 0),
+        ("portDuplex", ((1, 1), (2, 2)), 0),
+    )
+    for field, mapping, default in statuses:
+        column = table.column(field)
+        todo = np.logical_and(column.present, np.logical_not(done))
+        values = np.full(size, default, dtype=np.int64)
+        for value, _duplex in mapping:
+            values[column.equals(value)] = _duplex
+        result[todo] = values[todo]
+        done = np.logical_or(done, todo)
+
+    # Process c2900PortDuplexState
+    # The Cisco 3500XL is known to report incorrect duplex values.
+    linkbeat = table.column("c2900PortLinkbeatStatus")
+    status = table.column("c2900PortDuplexStatus")
+    todo = np.logical_and(result == 0, linkbeat.present)
+    noauto = np.logical_and(todo, linkbeat.equals(3))
+    auto = np.logical_and(todo, np.logical_not(linkbeat.equals(3)))
+    result[np.logical_and(noauto, status.equals(1))] = 2
+    result[np.logical_and(noauto, status.equals(2))] = 1
+    result[np.logical_and(auto, status.equals(1))] = 4
+    result[np.logical_and(auto, status.equals(2))] = 3
+
+    # Return
+    return result
+
+
+def _ip_string(packed):
+    """Convert a packed IP address to the string format used by the MIBs.
+
+    Args:
+        packed: Packed IP address bytes
+
+    Returns:
+        result: IPv4 dotted decimal or exploded IPv6 string
+
+    """
+    # Return
+    value = ipaddress.ip_address(packed)
+    result = value.exploded if value.version == 6 else str(value)
+    return result
+
+
+def _array(items, present):
+    """Create the most compact numpy array for a list of values.
+
+    Args:
+        items: List of values
+        present: numpy bool array, True where a value exists
+
+    Returns:
+        result: numpy array
+
+    """
+    # Get the values that exist
+    values = [_ for _, exists in zip(items, present.tolist()) if exists]
+
+    # Boolean columns
+    if bool(values) and all(isinstance(_, bool) for _ in values):
+        return np.array([bool(_) for _ in items], dtype=bool)
+
+    # Integer columns
+    if bool(values) and all(
+        isinstance(_, int)
+        and isinstance(_, bool) is False
+        and _INT_MIN <= _ <= _INT_MAX
+        for _ in values
+    ):
+        return np.array(
+            [_ if isinstance(_, int) else 0 for _ in items], dtype=np.int64
+        )
+
+    # Everything else
+    result = np.empty(len(items), dtype=object)
+    result[:] = items
+    return result
+
+
+def _expand(column, positions, size):
+    """Place the values of a column at new row positions.
+
+    Args:
+        column: Column object, or None
+        positions: numpy array of the new row position of each value
+        size: Number of rows of the new column
+
+    Returns:
+        result: Column object, None if there is no column
+
+    """
+    # Nothing to do
+    if column is None:
+        return None
+
+    # Create empty arrays then add the values
+    if column.dtype == object:
+        values = np.empty(size, dtype=object)
+    else:
+        values = np.zeros(size, dtype=column.dtype)
+    present = np.zeros(size, dtype=bool)
+    values[positions] = column.values
+    present[positions] = column.present
+
+    # Return
+    result = Column(values, present)
+    return result
+
+
+def _overlay(first, second):
+    """Combine two columns of the same length.
+
+    Args:
+        first: Column object, or None
+        second: Column object, or None. Its values are used wherever they
+            are present.
+
+    Returns:
+        result: Column object
+
+    """
+    # Nothing to combine
+    if first is None or second is None:
+        return second if first is None else first
+
+    # Columns of different types can only be combined as objects
+    _first = first.values
+    _second = second.values
+    if _first.dtype != _second.dtype:
+        _first = _first.astype(object)
+        _second = _second.astype(object)
+
+    # Return
+    result = Column(
+        np.where(second.present, _second, _first),
+        np.logical_or(first.present, second.present),
+    )
+    return result
+
+
+def _integers(values):
+    """Convert an array of values to integers.
+
+    Args:
+        values: numpy array
+
+    Returns:
+        result: numpy object array of integers
+
+    """
+    # Return
+    result = np.frompyfunc(int, 1, 1)(values)
+    return result
+
+
+def _vlan_lists(values):
+    """Convert an array of VLAN values to VLAN lists.
+
+    Args:
+        values: numpy array of VLAN numbers or lists of VLAN numbers
+
+    Returns:
+        result: numpy object array of lists
+
+    """
+    # Return
+    result = np.frompyfunc(
+        lambda _: _ if isinstance(_, list) else [int(_)], 1, 1
+    )(values)
+    return result
+
+
+def _truths(values):
+    """Get the truth value of each value of an array.
+
+    Args:
+        values: numpy array
+
+    Returns:
+        result: numpy bool array
+
+    """
+    # Return
+    result = np.frompyfunc(bool, 1, 1)(values).astype(bool)
+    return result
@@ -3,9 +3,12 @@
 # Standard imports
 from copy import deepcopy
 
+# PIP imports
+import numpy as np
+
 # Application imports
 from switchmap.core import log
-from switchmap import TrunkInterface
+from switchmap.poller.update import columnar
 
 
 class Device:
@@ -39,6 +42,12 @@ class Device:
         self._devicename = data["misc"]["host"]
         self._data = deepcopy(data)
 
+        # Layer1 data is processed as a columnar table
+        if isinstance(self._data["layer1"], columnar.Table) is False:
+            self._data["layer1"] = columnar.Table.from_dict(
+                self._data["layer1"]
+            )
+
     def process(self):
         """Initialize class.
 
@@ -114,85 +123,90 @@ class Device:
 
         """
         # Initialize key variables
-        updated_device_data = deepcopy(self._data)
-        layer1_data = updated_device_data["layer1"]
+        updated_device_data = dict(self._data)
+        table = updated_device_data["layer1"]
+        size = len(table)
+        ifindexes = table.index.tolist()
+        sources = np.full(size, -1, dtype=np.int64)
+        empty = size
 
         # Send log message
         log_message = "Processing data from host {}".format(self._devicename)
         log.log2debug(1048, log_message)
 
-        # Create dict for layer1 Ethernet data
-        for ifindex, _port_data in sorted(layer1_data.items()):
-            # Make a copy of the port data to reduce the risk of corruption
-            port_data = deepcopy(_port_data)
-
-            # Process port_data
-            if _is_ethernet(port_data) is True:
-                # Update Ethernet status
-                port_data["l1_ethernet"] = True
-
-                # Get the ifIndex of the lower layer interface
-                ifstacklowerlayer = ifindex
-
-                #############################################################
-                #
-                # This stuff relies on ifstacklowerlayer / ifstackhigherlayer
-                #
-                #############################################################
-                # Determine the ifIndex for any existing higher
-                # layer subinterfaces whose data could be used
-                # for upper layer2 features such as VLANs and
-                # LAG trunking
-
-                # Some devices don't have this information and this step
-                # must be skipped and logged
-                # github.com/PalisadoesFoundation/switchmap-ng/issues/127
-
-                try:
-                    higherlayers = updated_device_data["system"]["IF-MIB"][
-                        "ifStackStatus"
-                    ][ifindex]
-                except KeyError:
-                    log_message = f"""\
+        # Calculate vendor agnostic values for all interfaces at once. The
+        # values of an interface without any data are appended for higher
+        # layers that are missing from the table
+        ethernets = columnar.ethernet(table)
+        duplexes = columnar.duplex(table)
+        _vlans = np.append(
+            columnar.vlans(table), np.array([None], dtype=object)
+        )
+        _nativevlans = np.append(
+            columnar.nativevlan(table), np.array([None], dtype=object)
+        )
+        _trunks = np.append(columnar.trunk(table), False)
+
+        # Find the interface whose VLAN data applies to each Ethernet port
+        for position in np.flatnonzero(ethernets).tolist():
+            ifindex = ifindexes[position]
+
+            #################################################################
+            #
+            # This stuff relies on ifstacklowerlayer / ifstackhigherlayer
+            #
+            #################################################################
+            # Determine the ifIndex for any existing higher
+            # layer subinterfaces whose data could be used
+            # for upper layer2 features such as VLANs and
+            # LAG trunking
+
+            # Some devices don't have this information and this step
+            # must be skipped and logged
+            # github.com/PalisadoesFoundation/switchmap-ng/issues/127
+
+            try:
+                higherlayers = updated_device_data["system"]["IF-MIB"][
+                    "ifStackStatus"
+                ][ifindex]
+            except KeyError:
+                log_message = f"""\
 Host {self._devicename} is missing ifindex {ifindex} in \
 the IF-MIB::ifStackStatus OID"""
-                    log.log2debug(1071, log_message)
-                    higherlayers = []
-
-                # Update vlan to universal switchmap.port_data value
-                for ifstackhigherlayer in higherlayers:
-                    # This is an Ethernet port with no higher level
-                    # interfaces. Use lower level ifIndex
-                    if bool(ifstackhigherlayer) is False:
-                        (
-                            port_data["l1_vlans"],
-                            port_data["l1_nativevlan"],
-                            port_data["l1_trunk"],
-                        ) = _process_non_trunk(layer1_data[ifstacklowerlayer])
-
-                    else:
-                        meta = _process_trunk(
-                            layer1_data[ifstackhigherlayer], higherlayers
-                        )
-                        port_data["l1_vlans"] = meta.vlan
-                        port_data["l1_nativevlan"] = meta.nativevlan
-                        port_data["l1_trunk"] = meta.trunk
-
-                #############################################################
-                #
-                # This stuff relies on ifindex
-                #
-                #############################################################
-
-                # Update duplex to universal switchmap.port_data value
-                port_data["l1_duplex"] = _duplex(deepcopy(port_data))
-
-            else:
-                # Update Ethernet status
-                port_data["l1_ethernet"] = False
-
-            # Update the data
-            updated_device_data["layer1"][ifindex] = port_data
+                log.log2debug(1071, log_message)
+                higherlayers = []
+
+            # Ethernet ports with no higher level interfaces use their own
+            # values, the others use those of their last higher layer
+            for ifstackhigherlayer in higherlayers:
+                if bool(ifstackhigherlayer) is False:
+                    sources[position] = position
+                elif table.position(ifstackhigherlayer) is not None:
+                    sources[position] = table.position(ifstackhigherlayer)
+                else:
+                    log_message = f"""\
+Host {self._devicename} ifindex {ifindex} has higher layer ifindex \
+{ifstackhigherlayer} in the IF-MIB::ifStackStatus OID that wasn't polled. \
+Its VLAN and trunk values are empty"""
+                    log.log2debug(1076, log_message)
+                    sources[position] = empty
+
+        # Update the layer1 data with the universal switchmap values
+        assigned = sources >= 0
+        sources[np.logical_not(assigned)] = 0
+        updated_device_data["layer1"] = table.assign(
+            {
+                "l1_ethernet": columnar.Column(
+                    ethernets, np.ones(size, dtype=bool)
+                ),
+                "l1_vlans": columnar.Column(_vlans[sources], assigned),
+                "l1_nativevlan": columnar.Column(
+                    _nativevlans[sources], assigned
+                ),
+                "l1_trunk": columnar.Column(_trunks[sources], assigned),
+                "l1_duplex": columnar.Column(duplexes, ethernets),
+            }
+        )
 
         # Send log message
         log_message = "Completed processing data from host {}".format(
@@ -202,304 +216,3 @@ the IF-MIB::ifStackStatus OID"""
 
         # Return
         return updated_device_data
-
-
-def _process_non_trunk(port_data):
-    """Assign trunk values to the non trunk Ethernet port.
-
-    Args:
-        port_data: Data dict related to the port
-
-    Returns:
-        result: Tuple of (vlan, nativevlan, trunk) for the port
-
-    """
-    # Return trunk values for non trunk ports
-    vlan = _vlan(port_data)
-    nativevlan = _nativevlan(port_data)
-    trunk = _trunk(port_data)
-    result = TrunkInterface(vlan=vlan, nativevlan=nativevlan, trunk=trunk)
-    return result
-
-
-def _process_trunk(port_data, higherlayers):
-    """Assign trunk values to the trunk Ethernet port.
-
-    Args:
-        port_data: Data dict related to the port
-        higherlayers: Number of layers above the current port
-
-    Returns:
-        result: Tuple of (vlan, nativevlan, trunk) for the port
-
-    """
-    # Assign native VLAN to higher layer
-    nativevlan = _nativevlan(port_data)
-
-    # Update trunk status to universal port_data value
-    trunk = _trunk(port_data)
-
-    # This is an Ethernet port with a single higher level
-    # interface
-    if len(higherlayers) == 1:
-        vlan = _vlan(port_data)
-
-    # This is an Ethernet port with multiple higher level
-    # interfaces
-    else:
-        vlan = _vlan(port_data)
-        if "l1_vlans" in port_data:
-            vlan.extend(vlan)
-        else:
-            vlan = vlan
-
-    # Return trunk values for non trunk ports
-    result = TrunkInterface(vlan=vlan, nativevlan=nativevlan, trunk=trunk)
-    return result
-
-
-def _juniper_fix(device_data):
-    """Assign layer 1 values to the correct Ethernet port.
-
-    Args:
-        device_data: Data dict related to the device
-
-    Returns:
-        result: Result of assignments
-
-    """
-    # Initialize key variables
-    source = deepcopy(device_data)
-    result = deepcopy(device_data)
-    valid = False
-
-    # Send log message
-    devicename = source["misc"]["host"]
-    log_message = "Starting data fixup of host {}".format(devicename)
-    log.log2debug(1076, log_message)
-
-    # Get ifStackStatus data
-    if "system" in source:
-        if "IF-MIB" in source["system"]:
-            if "ifStackStatus" in source["system"]["IF-MIB"]:
-                valid = True
-
-    # Return if not valid
-    if valid is False:
-        # Send log message
-        devicename = source["misc"]["host"]
-        log_message = "Completed data fixup of host {}".format(devicename)
-        log.log2debug(1146, log_message)
-        return result
-
-    # Get a list of ifIndex values to Process
-    status_values = source["system"]["IF-MIB"]["ifStackStatus"]
-
-    # Get the ones that are non Ethernet and have Ethernet parents
-    for parent, children in status_values.items():
-        for child in children:
-            if bool(child) is False:
-                continue
-            else:
-                # Copy key values from child to parent
-                if source["layer1"][parent]["ifType"] == 6:
-                    for parameter, value in source["layer1"][child].items():
-                        if parameter not in result["layer1"][parent]:
-                            result["layer1"][parent][parameter] = value
-
-    # Send log message
-    devicename = source["misc"]["host"]
-    log_message = "Completed data fixup of host {}".format(devicename)
-    log.log2debug(1147, log_message)
-
-    # Return
-    return result
-
-
-def _is_ethernet(port_data):
-    """Return whether ifIndex port_data belongs to an Ethernet port.
-
-    Args:
-        port_data: Data dict related to the port
-
-    Returns:
-        valid: True if valid ethernet port
-
-    """
-    # Initialize key variables
-    valid = False
-
-    # Process ifType
-    if "ifType" in port_data:
-        # Get port name
-        name = port_data["ifName"].lower()
-
-        # Process ethernet ports
-        if port_data["ifType"] == 6:
-            # VLAN L2 VLAN interfaces passing as Ethernet
-            if name.startswith("vl") is False:
-                valid = True
-
-    # Return
-    return valid
-
-
-def _vlan(port_data):
-    """Return vlan for specific ifIndex.
-
-    Args:
-        port_data: Data dict related to the port port
-
-    Returns:
-        vlans: VLAN number
-
-    """
-    # Initialize key variables
-    vlans = None
-
-    # Determine vlan number for Cisco devices (Older models)
-    if "vmVlan" in port_data:
-        vlans = [int(port_data["vmVlan"])]
-
-    # Determine vlan number for Cisco devices (Newer models)
-    if "vlanTrunkPortVlansEnabled" in port_data:
-        if isinstance(port_data["vlanTrunkPortVlansEnabled"], list) is True:
-            vlans = port_data["vlanTrunkPortVlansEnabled"]
-        else:
-            vlans = [int(port_data["vlanTrunkPortVlansEnabled"])]
-
-    # Determine vlan number for Cisco devices (Router trunk subinterfaces)
-    if "cviRoutedVlanIfIndex" in port_data:
-        vlans = port_data["cviRoutedVlanIfIndex"]
-
-    # Determine vlan number for Juniper devices
-    if "jnxExVlanTag" in port_data:
-        tags = port_data["jnxExVlanTag"]
-        if bool(tags) is True:
-            vlans = tags
-
-    # Return
-    return vlans
-
-
-def _nativevlan(port_data):
-    """Return vlan for specific ifIndex.
-
-    Args:
-        port_data: Data dict related to the port
-
-    Returns:
-        vlan: VLAN number
-
-    """
-    # Initialize key variables
-    vlan = None
-
-    # Determine native VLAN tag number for Cisco devices
-    if "vlanTrunkPortNativeVlan" in port_data:
-        vlan = int(port_data["vlanTrunkPortNativeVlan"])
-
-    # Determine native VLAN tag number for Juniper devices
-    if "dot1qPvid" in port_data:
-        vlan = port_data["dot1qPvid"]
-
-    # Return
-    return vlan
-
-
-def _duplex(port_data):
-    """Return duplex value for port.
-
-    Args:
-        port_data: Data dict related to the port
-
-    Returns:
-        duplex: Duplex value
-            0) Unknown
-            1) Half
-            2) Full
-            3) Half Auto
-            4) Full Auto
-
-    """
-    # Initialize key variables
-    duplex = 0
-
-    value = ""
-
-    statuses = ("swPortDuplexStatus", "dot3StatsDuplexStatus", "portDuplex")
-
-    def get_duplex_value(status, val):
-        """Return duplex value based on port status.
-
-        Args:
-            status: The status of the port
-            val: The value of the port status
-
-        Returns:
-            value: Duplex value
-
-        """
-        cases = {
-            "swPortDuplexStatus": 2 if val == 1 else 1,
-            "dot3StatsDuplexStatus": 1 if val == 2 else (2 if val == 3 else 0),
-            "portDuplex": 1 if val == 1 else (2 if val == 2 else 0),
-        }
-
-        return cases[status]
-
-    for status in statuses:
-        if status in port_data:
-            value = port_data[status]
-            duplex = get_duplex_value(status, value)
-            break
-
-    # Process c2900PortDuplexState
-    # The Cisco 3500XL is known to report incorrect duplex values.
-    # Obsolete device, doesn't make sense supporting it.
-    if not duplex and "c2900PortLinkbeatStatus" in port_data:
-        status_link = port_data["c2900PortLinkbeatStatus"]
-        status_duplex = port_data["c2900PortDuplexStatus"]
-
-        if status_link == 3:
-            # If no link beats (Not AutoNegotiate)
-            if status_duplex == 1:
-                duplex = 2
-            elif status_duplex == 2:
-                duplex = 1
-        else:
-            # If link beats (AutoNegotiate)
-            if status_duplex == 1:
-                duplex = 4
-            elif status_duplex == 2:
-                duplex = 3
-
-    # Return
-    return duplex
-
-
-def _trunk(port_data):
-    """Return trunk for specific ifIndex.
-
-    Args:
-        port_data: Data dict related to the port
-
-    Returns:
-        trunk: True if port is in trunking mode
-
-    """
-    # Initialize key variables
-    trunk = False
-
-    # Determine if trunk for Cisco devices
-    if "vlanTrunkPortDynamicStatus" in port_data:
-        if port_data["vlanTrunkPortDynamicStatus"] == 1:
-            trunk = True
-
-    # Determine if trunk for Juniper devices
-    if "jnxExVlanPortAccessMode" in port_data:
-        if port_data["jnxExVlanPortAccessMode"] == 2:
-            trunk = True
-
-    # Return
-    return trunk
@@ -13,6 +13,8 @@ from collections import namedtuple
 # Important tuples
 ZoneData = namedtuple("ZoneData", "idx_zone data")
 ZoneObjects = namedtuple("ZoneObjects", "ips macs pairmacips")
-ZoneDevice = namedtuple("ZoneDevice", "idx_zone, data, filepath, config")
+ZoneDevice = namedtuple(
+    "ZoneDevice", "idx_zone, filepath, config, hostname, addresses"
+)
 EventObjects = namedtuple("EventObjects", "zones event")
 PairMacIp = namedtuple("PairMacIp", "mac ip ip_version idx_zone")
@@ -10,6 +10,7 @@ from flask import Flask
 # Do remaining switchmap importations
 from switchmap.server.api.routes.graphql import API_GRAPHQL
 from switchmap.server.api.routes.post import API_POST
+from switchmap.server.api.routes.metrics import API_METRICS
 from switchmap import API_PREFIX
 
 # Initializes the Flask Object.
@@ -21,3 +22,4 @@ API = Flask(
 # Register Blueprints
 API.register_blueprint(API_GRAPHQL, url_prefix=API_PREFIX)
 API.register_blueprint(API_POST, url_prefix=API_PREFIX)
+API.register_blueprint(API_METRICS, url_prefix=API_PREFIX)
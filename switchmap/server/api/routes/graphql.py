@@ -1,19 +1,177 @@
 """GraphQL routes."""
 
+# Standard imports
+import json
+
 # Flask imports
-from flask import Blueprint
+from flask import Blueprint, Response, request
+from graphql_server import HttpQueryError, get_graphql_params
 from graphql_server.flask import GraphQLView
 
 # Import GraphQL schema
 from switchmap.server.db.schemas import SCHEMA
+from switchmap.server.db import SCOPED_SESSION
+from switchmap.server.db import db
+from switchmap.server.db import cache
+from switchmap.server.db import limits
+from switchmap.core import metrics
 
 # Define the API_GRAPHQL global variable
 API_GRAPHQL = Blueprint("API_GRAPHQL", __name__)
 
+
+@API_GRAPHQL.before_request
+def before_request():
+    """Make the GraphQL queries of the request on the read engine.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Create the session of the request
+    SCOPED_SESSION.remove()
+    SCOPED_SESSION(bind=db.read_engine())
+
+
+@API_GRAPHQL.teardown_request
+def teardown_request(exception):
+    """Close the GraphQL session of the request.
+
+    Args:
+        exception: Exception raised by the request, if any
+
+    Returns:
+        None
+
+    """
+    # Close the session
+    SCOPED_SESSION.remove()
+
+
+class LimitedGraphQLView(GraphQLView):
+    """GraphQL view that rejects queries that are too deep or costly."""
+
+    def get_validation_rules(self):
+        """Get the validation rules of queries.
+
+        Args:
+            None
+
+        Returns:
+            result: List of ValidationRule classes
+
+        """
+        # Return
+        result = limits.rules()
+        return result
+
+
+class CachedGraphQLView(LimitedGraphQLView):
+    """GraphQL view that reuses the responses to earlier queries."""
+
+    def dispatch_request(self):
+        """Answer a GraphQL query from the response cache if possible.
+
+        Responses have strong ETags. GET requests with a matching
+        If-None-Match header get an empty 304 response.
+
+        Args:
+            None
+
+        Returns:
+            result: Response object
+
+        """
+        # Initialize key variables
+        store = cache.store()
+        digest = _digest(self.parse_body()) if bool(store) else None
+
+        # Don't cache this query
+        if digest is None:
+            result = LimitedGraphQLView.dispatch_request(self)
+            return result
+
+        # Get the response from the cache
+        cached = store.lookup(digest)
+        metrics.SERVER_GRAPHQL_CACHE.labels(
+            result="miss" if cached is None else "hit"
+        ).inc()
+        if cached is None:
+            result = LimitedGraphQLView.dispatch_request(self)
+            if _cacheable(result) is False:
+                return result
+            cached = store.save(digest, result.get_data())
+
+        # Return
+        result = Response(
+            cached.body, status=200, content_type="application/json"
+        )
+        result.set_etag(cached.etag)
+        result = result.make_conditional(request)
+        return result
+
+
+def _digest(data):
+    """Create the cache key of the GraphQL query of a request.
+
+    Args:
+        data: Parsed body of the request
+
+    Returns:
+        result: Key string, None if the query can't be cached
+
+    """
+    # Batches of queries and pretty printed responses aren't cached
+    if isinstance(data, list) is True or bool(request.args.get("pretty")):
+        return None
+
+    # Get the query
+    try:
+        params = get_graphql_params(data, request.args)
+    except HttpQueryError:
+        return None
+    if bool(params.query) is False:
+        return None
+
+    # Return
+    result = cache.digest(
+        params.query,
+        variables=params.variables,
+        operation_name=params.operation_name,
+    )
+    return result
+
+
+def _cacheable(response):
+    """Determine whether a GraphQL response can be cached.
+
+    Args:
+        response: Response object
+
+    Returns:
+        result: True if the response has data and no errors
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Check
+    if response.status_code == 200:
+        try:
+            data = json.loads(response.get_data())
+        except ValueError:
+            return result
+        result = "errors" not in data
+    return result
+
+
 # Create the base GraphQL route
 API_GRAPHQL.add_url_rule(
     "/graphql",
-    view_func=GraphQLView.as_view(
+    view_func=CachedGraphQLView.as_view(
         "graphql", schema=SCHEMA.graphql_schema, graphiql=False
     ),
 )
@@ -21,7 +179,7 @@ API_GRAPHQL.add_url_rule(
 # Create the base iGraphQL route
 API_GRAPHQL.add_url_rule(
     "/igraphql",
-    view_func=GraphQLView.as_view(
+    view_func=LimitedGraphQLView.as_view(
         "igraphql", schema=SCHEMA.graphql_schema, graphiql=True
     ),
 )
@@ -0,0 +1,69 @@
+"""Database server API. Prometheus metrics routes."""
+
+# PIP3 imports
+from flask import Blueprint, Response, request
+
+# Repository imports
+from switchmap.core import metrics
+from switchmap import AGENT_API
+
+# Define the API_METRICS global variable
+API_METRICS = Blueprint("API_METRICS", __name__)
+
+# Seconds between saves of the metrics of each server process
+_FLUSH_INTERVAL = 10
+
+
+@API_METRICS.route("/metrics", methods=["GET"])
+def get_metrics():
+    """Export the server metrics in the Prometheus text format.
+
+    Args:
+        None
+
+    Returns:
+        result: Response object
+
+    """
+    # Get the metrics of all server processes
+    _setup()
+    metrics.flush()
+    result = Response(
+        metrics.exposition(), mimetype="text/plain; version=0.0.4"
+    )
+    return result
+
+
+@API_METRICS.after_app_request
+def count_request(response):
+    """Count requests made to the server.
+
+    Args:
+        response: Response object
+
+    Returns:
+        response: Response object
+
+    """
+    # Update
+    _setup()
+    metrics.SERVER_REQUESTS.labels(
+        endpoint=request.endpoint, status=response.status_code
+    ).inc()
+    metrics.flush(interval=_FLUSH_INTERVAL)
+    return response
+
+
+def _setup():
+    """Save the metrics of the server processes.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Setup only once per server
+    if bool(metrics.directory()) is False:
+        metrics.setup(AGENT_API)
@@ -6,14 +6,18 @@ import hashlib
 
 # PIP3 imports
 from flask import Blueprint, request, jsonify
-import yaml
 
 # Repository imports
 from switchmap.core import log
+from switchmap.core import files
+from switchmap.core import delta
+from switchmap import AGENT_API
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_DELTA_URI
 from switchmap import API_POLLER_SEARCH_URI
 from switchmap.server.configuration import ConfigServer
 from switchmap.server.db.misc import search
+from switchmap.server.db.ingest.update import zone as update_zone
 
 
 # Define the API_POST global variable
@@ -46,35 +50,73 @@ def post_device_data():
         zone = None
 
     if bool(hostname):
-        # Only write data if file doesn't exist. This reduces the risk of
-        # duplicate data if data from a previously existing file is still
-        # being ingested.
-        filepath = "{}{}{}-{}.yaml".format(
-            config.cache_directory(),
-            os.sep,
-            hostname,
-            hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+        # Save the data as the base for future delta posts
+        files.write_json_file(
+            files.snapshot_file(AGENT_API, hostname, zone, config), data
         )
-        if os.path.exists(filepath) is False:
-            # Write data to file
-            # data_as_string = json.dumps(data)
-            with open(filepath, "w") as f_handle:
-                yaml.dump(data, f_handle)
-
-            # Log
-            log_message = "Successfully created data cache file {}.".format(
-                filepath
-            )
-            log.log2info(1043, log_message)
-
-        else:
-            # Log
-            log_message = (
-                "Cache file {} already exists. Will not update.".format(
-                    filepath
-                )
-            )
-            log.log2info(1042, log_message)
+
+        # Cache the data for ingestion
+        _cache(data, config)
+
+    # Return
+    return "OK"
+
+
+@API_POST.route(API_POLLER_DELTA_URI, methods=["POST"])
+def post_device_delta():
+    """Accept posts of changes in network device data from pollers.
+
+    Args:
+        None
+
+    Returns:
+        _response: OK message when successful, HTTP 409 if the poller needs
+            to post all its data instead
+
+    """
+    # Initialize key variables
+    config = ConfigServer()
+    conflict = ("RESYNC", 409)
+
+    # Get data
+    payload = request.json
+    try:
+        hostname = payload["hostname"]
+        zone = payload["zone"]
+        base = payload["base"]
+    except:
+        return conflict
+
+    # Get the data the delta is based on
+    filepath = files.snapshot_file(AGENT_API, hostname, zone, config)
+    previous = (
+        files.read_json_file(filepath, die=False)
+        if os.path.isfile(filepath)
+        else {}
+    )
+
+    # The poller must resync if the versions don't match
+    if bool(previous) is False or delta.version(previous) != base:
+        log_message = (
+            "Delta post for {} in zone {} doesn't match the last received "
+            "data. Requesting a full resync.".format(hostname, zone)
+        )
+        log.log2info(2010, log_message)
+        return conflict
+
+    # Reconstruct the data and verify its integrity
+    data = delta.apply(previous, payload)
+    if delta.version(data) != payload.get("version"):
+        log_message = (
+            "Delta post for {} in zone {} could not be reconstructed. "
+            "Requesting a full resync.".format(hostname, zone)
+        )
+        log.log2info(2011, log_message)
+        return conflict
+
+    # Save the data as the base for future delta posts, then cache it
+    files.write_json_file(filepath, data)
+    _cache(data, config)
 
     # Return
     return "OK"
@@ -109,3 +151,47 @@ def post_searchterm():
         return jsonify(result)
     else:
         return jsonify(result)
+
+
+def _cache(data, config):
+    """Write network device data to the cache directory for ingestion.
+
+    Args:
+        data: Network device data
+        config: ConfigServer object
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    hostname = data["misc"]["host"]
+    zone = data["misc"].get("zone")
+
+    # Only write data if file doesn't exist. This reduces the risk of
+    # duplicate data if data from a previously existing file is still
+    # being ingested.
+    filepath = "{}{}{}-{}.yaml".format(
+        config.cache_directory(),
+        os.sep,
+        hostname,
+        hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+    )
+    if os.path.exists(filepath) is False:
+        # Write data and its index to file
+        files.write_cache_file(
+            filepath, data, addresses=update_zone.addresses(data)
+        )
+
+        # Log
+        log_message = "Successfully created data cache file {}.".format(
+            filepath
+        )
+        log.log2info(1043, log_message)
+
+    else:
+        # Log
+        log_message = "Cache file {} already exists. Will not update.".format(
+            filepath
+        )
+        log.log2info(1042, log_message)
@@ -55,6 +55,76 @@ class ConfigServer(ConfigAPI):
         result = self._config_server.get("api_bind_port", 7000)
         return result
 
+    def api_cache_directory(self):
+        """Get api_cache_directory.
+
+        Args:
+            None
+
+        Returns:
+            result: Directory in which the GraphQL response cache is shared
+                by the API server processes. None if each process only
+                caches responses in memory.
+
+        """
+        # Get result
+        result = self._config_server.get("api_cache_directory")
+
+        # Create the directory if not found
+        if bool(result) is True and os.path.isdir(result) is False:
+            files.mkdir(result)
+
+        # Return
+        return result
+
+    def api_cache_megabytes(self):
+        """Get api_cache_megabytes.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum size of the GraphQL response cache in megabytes.
+                Zero disables the cache.
+
+        """
+        # Get result
+        result = int(self._config_server.get("api_cache_megabytes", 64))
+        result = max(0, result)
+        return result
+
+    def api_query_cost(self):
+        """Get api_query_cost.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum cost of GraphQL queries. Zero disables the
+                limit.
+
+        """
+        # Get result
+        result = int(self._config_server.get("api_query_cost", 200000))
+        result = max(0, result)
+        return result
+
+    def api_query_depth(self):
+        """Get api_query_depth.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum depth of the fields of GraphQL queries. Zero
+                disables the limit.
+
+        """
+        # Get result
+        result = int(self._config_server.get("api_query_depth", 20))
+        result = max(0, result)
+        return result
+
     def cache_directory(self):
         """Determine the cache_directory.
 
@@ -86,6 +156,46 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def db_backend(self):
+        """Get db_backend.
+
+        Args:
+            None
+
+        Returns:
+            result: Database backend, "mysql" or "sqlite"
+
+        """
+        # Get result
+        result = str(self._config_server.get("db_backend", "mysql")).lower()
+
+        # Check if value is valid
+        if result not in ["mysql", "sqlite"]:
+            log_message = (
+                f'db_backend: "{result}" '
+                'in the configuration file(s) must be "mysql" or "sqlite"'
+            )
+            log.log2die_safe(2094, log_message)
+
+        # Return
+        return result
+
+    def db_file(self):
+        """Get db_file.
+
+        Args:
+            None
+
+        Returns:
+            result: File of the SQLite database
+
+        """
+        # Get result
+        result = self._config_server.get(
+            "db_file", f"{self.system_directory()}{os.sep}switchmap.db"
+        )
+        return result
+
     def db_host(self):
         """Return db_host value.
 
@@ -174,6 +284,55 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def db_read_host(self):
+        """Return db_read_host value.
+
+        Args:
+            None
+
+        Returns:
+            result: Read replica used by the GraphQL API and searches. None
+                if reads use db_host.
+
+        """
+        # Get parameter
+        result = self._config_server.get("db_read_host")
+
+        # Return
+        return result
+
+    def db_slow_query_log_file(self):
+        """Get db_slow_query_log_file.
+
+        Args:
+            None
+
+        Returns:
+            result: File to which slow database statements are logged
+
+        """
+        # Get result
+        result = "{}{}switchmap-slow-query.log".format(
+            self.log_directory(), os.sep
+        )
+        return result
+
+    def db_slow_query_seconds(self):
+        """Get db_slow_query_seconds.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds after which database statements are logged to
+                the slow query log. Zero disables the log.
+
+        """
+        # Get result
+        result = float(self._config_server.get("db_slow_query_seconds", 1))
+        result = max(0, result)
+        return result
+
     def db_user(self):
         """Return db_user value.
 
@@ -190,6 +349,63 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def dns_concurrency(self):
+        """Get dns_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of concurrent reverse DNS lookups
+
+        """
+        # Get result
+        result = int(self._config_server.get("dns_concurrency", 64))
+        result = max(1, result)
+        return result
+
+    def dns_negative_ttl(self):
+        """Get dns_negative_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds to cache IP addresses without hostnames
+
+        """
+        # Get result
+        result = int(self._config_server.get("dns_negative_ttl", 3600))
+        return result
+
+    def dns_timeout(self):
+        """Get dns_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds to wait for each reverse DNS lookup
+
+        """
+        # Get result
+        result = float(self._config_server.get("dns_timeout", 2))
+        return result
+
+    def dns_ttl(self):
+        """Get dns_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds to cache hostnames
+
+        """
+        # Get result
+        result = int(self._config_server.get("dns_ttl", 86400))
+        return result
+
     def ingest_directory(self):
         """Determine the ingest_directory.
 
@@ -218,6 +434,22 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def incremental_ingest(self):
+        """Get incremental_ingest.
+
+        Args:
+            None
+
+        Returns:
+            result: True if only changes are written to a copy of the
+                current event
+
+        """
+        # Get result
+        result = self._config_server.get("incremental_ingest", False)
+        result = general.make_bool(result)
+        return result
+
     def ingest_interval(self):
         """Get ingest_interval.
 
@@ -232,6 +464,36 @@ class ConfigServer(ConfigAPI):
         result = self._config_server.get("ingest_interval", 86400)
         return result
 
+    def ingest_worker_memory(self):
+        """Get ingest_worker_memory.
+
+        Args:
+            None
+
+        Returns:
+            result: Megabytes of memory after which ingest workers are
+                replaced
+
+        """
+        # Get result
+        result = int(self._config_server.get("ingest_worker_memory", 1024))
+        return result
+
+    def ingest_worker_tasks(self):
+        """Get ingest_worker_tasks.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of tasks after which ingest workers are replaced
+
+        """
+        # Get result
+        result = int(self._config_server.get("ingest_worker_tasks", 100))
+        result = max(1, result)
+        return result
+
     def purge_after_ingest(self):
         """Return purge_after_ingest value.
 
@@ -249,6 +511,22 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def summary_idle_days(self):
+        """Get summary_idle_days.
+
+        Args:
+            None
+
+        Returns:
+            result: Days after which ports without link are counted as idle
+                in the summary tables
+
+        """
+        # Get result
+        result = int(self._config_server.get("summary_idle_days", 30))
+        result = max(0, result)
+        return result
+
     def username(self):
         """Get username.
 
@@ -12,11 +12,27 @@ from sqlalchemy.pool import QueuePool
 # Project libraries
 from switchmap.server.configuration import ConfigServer
 from switchmap.core import log
+from switchmap.core import metrics
+from switchmap.server.db import timing
+
+# Pragmas of SQLite connections. Writes are made to a write-ahead log so that
+# readers don't block the single writer, and bulk loads aren't slowed by
+# syncing every transaction to disk.
+SQLITE_PRAGMAS = [
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "foreign_keys=ON",
+    "busy_timeout=60000",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+]
 
 #############################################################################
 # Setup a global pool for database connections
 #############################################################################
 ENGINE = None
+READ_ENGINE = None
 SCOPED_SESSION = None
 
 
@@ -31,57 +47,272 @@ def main():
 
     """
     # Initialize constants
-    use_mysql = True
     global ENGINE
+    global READ_ENGINE
     global SCOPED_SESSION
 
-    # Initialize variables
-    pool_timeout = 30
-    pool_recycle = min(10, pool_timeout - 10)
-    db_url = None
-
     # Define SQLAlchemy parameters from configuration
     config = ConfigServer()
-    pool_size = config.db_pool_size()
-    max_overflow = config.db_max_overflow()
 
     # Create DB connection pool
-    if use_mysql is True:
-        db_url = "mysql+pymysql://{}:{}@{}/{}".format(
-            config.db_user(),
-            config.db_pass(),
-            config.db_host(),
-            config.db_name(),
-        )
-
+    if config.db_backend() == "mysql":
         # Fix for multiprocessing on pools
         _add_engine_pidguard(QueuePool)
 
         # Add MySQL to the pool
-        ENGINE = create_engine(
-            db_url,
-            echo=False,
-            echo_pool=False,
-            max_overflow=max_overflow,
-            poolclass=QueuePool,
-            pool_pre_ping=True,
-            pool_recycle=pool_recycle,
-            pool_size=pool_size,
-            pool_timeout=pool_timeout,
-            pool_use_lifo=True,
-            future=True,
-        )
-
-        # Fix for multiprocessing on engines
-        _add_engine_pidguard(ENGINE)
-
-        # Create a scoped session for GRAPHQL and ORM operations
-        session = sessionmaker(autoflush=True, autocommit=False, bind=ENGINE)
-        SCOPED_SESSION = scoped_session(session)
+        ENGINE = _engine(config, config.db_host())
+
+        # Reads for the GraphQL API and searches use a separate pool on the
+        # read replica when one is configured
+        if bool(config.db_read_host()) is True:
+            READ_ENGINE = _engine(config, config.db_read_host())
+            _add_engine_readonly(READ_ENGINE)
+        else:
+            READ_ENGINE = ENGINE
 
     else:
-        ENGINE = None
-        SCOPED_SESSION = None
+        # Fix for multiprocessing on pools
+        _add_engine_pidguard(QueuePool)
+
+        # Use the embedded SQLite database
+        ENGINE = _sqlite_engine(config)
+        READ_ENGINE = ENGINE
+
+    # Create a scoped session for GRAPHQL and ORM operations
+    session = sessionmaker(autoflush=True, autocommit=False, bind=ENGINE)
+    SCOPED_SESSION = scoped_session(session)
+
+
+def _engine(config, host):
+    """Create a MySQL engine with its own connection pool.
+
+    Args:
+        config: ConfigServer object
+        host: Database server
+
+    Returns:
+        result: SQLalchemy engine instance
+
+    """
+    # Initialize variables
+    pool_timeout = 30
+    pool_recycle = min(10, pool_timeout - 10)
+    db_url = "mysql+pymysql://{}:{}@{}/{}".format(
+        config.db_user(),
+        config.db_pass(),
+        host,
+        config.db_name(),
+    )
+
+    # Add MySQL to the pool
+    result = create_engine(
+        db_url,
+        echo=False,
+        echo_pool=False,
+        max_overflow=config.db_max_overflow(),
+        poolclass=QueuePool,
+        pool_pre_ping=True,
+        pool_recycle=pool_recycle,
+        pool_size=config.db_pool_size(),
+        pool_timeout=pool_timeout,
+        pool_use_lifo=True,
+        future=True,
+    )
+
+    # Fix for multiprocessing on engines
+    _add_engine_pidguard(result)
+
+    # Count connection pool usage
+    _add_engine_metrics(result)
+
+    # Time statements by the error codes of their callers
+    timing.add_listeners(
+        result,
+        threshold=config.db_slow_query_seconds(),
+        filename=config.db_slow_query_log_file(),
+    )
+
+    # Return
+    return result
+
+
+def _sqlite_engine(config):
+    """Create a SQLite engine.
+
+    Args:
+        config: ConfigServer object
+
+    Returns:
+        result: SQLalchemy engine instance
+
+    """
+    # Create the engine. Connections are pooled so that the pragmas are
+    # only set once per connection. The pool hands connections to one
+    # thread at a time so they can be shared between threads.
+    result = create_engine(
+        "sqlite:///{}".format(config.db_file()),
+        connect_args={"check_same_thread": False},
+        echo=False,
+        max_overflow=config.db_max_overflow(),
+        poolclass=QueuePool,
+        pool_size=config.db_pool_size(),
+        pool_timeout=30,
+        pool_use_lifo=True,
+        future=True,
+    )
+
+    # Fix for multiprocessing on engines
+    _add_engine_pidguard(result)
+
+    # Setup connections
+    _add_engine_pragmas(result)
+
+    # Count connection pool usage
+    _add_engine_metrics(result)
+
+    # Time statements by the error codes of their callers
+    timing.add_listeners(
+        result,
+        threshold=config.db_slow_query_seconds(),
+        filename=config.db_slow_query_log_file(),
+    )
+
+    # Return
+    return result
+
+
+def _add_engine_pragmas(engine):
+    """Set up the connections of a SQLite engine.
+
+    SQLite only allows a single writer at a time. Transactions of
+    connections with the "writer" execution option, such as those of
+    db.db_transaction(), take the write lock when they start. They wait for
+    other writers to finish instead of failing when they later need to
+    write.
+
+    Args:
+        engine: SQLalchemy engine instance
+
+    Returns:
+        None
+
+    """
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        """Set the pragmas of new connections.
+
+        Args:
+            dbapi_connection: A SqlALchemy DBAPI connection.
+            connection_record: The SqlALchemy _ConnectionRecord managing the
+                DBAPI connection.
+
+        Returns:
+            None
+
+        """
+        # Let SQLAlchemy start transactions instead of the sqlite3 module
+        dbapi_connection.isolation_level = None
+
+        # Update
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute("PRAGMA {}".format(pragma))
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def begin(conn):
+        """Start a transaction.
+
+        Args:
+            conn: SqlALchemy Connection object
+
+        Returns:
+            None
+
+        """
+        # Update
+        if bool(conn.get_execution_options().get("writer")) is True:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
+
+
+def _add_engine_readonly(engine):
+    """Make the connections of an engine read only.
+
+    Args:
+        engine: SQLalchemy engine instance
+
+    Returns:
+        None
+
+    """
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        """Make the transactions of new connections read only.
+
+        Args:
+            dbapi_connection: A SqlALchemy DBAPI connection.
+            connection_record: The SqlALchemy _ConnectionRecord managing the
+                DBAPI connection.
+
+        Returns:
+            None
+
+        """
+        # Update
+        cursor = dbapi_connection.cursor()
+        cursor.execute("SET SESSION TRANSACTION READ ONLY")
+        cursor.close()
+
+
+def _add_engine_metrics(engine):
+    """Add connection pool metrics.
+
+    Args:
+        engine: SQLalchemy engine instance
+
+    Returns:
+        None
+
+    """
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        """Count connections retrieved from the Pool.
+
+        Args:
+            dbapi_connection: A SqlALchemy DBAPI connection.
+            connection_record: The SqlALchemy _ConnectionRecord managing the
+                DBAPI connection.
+            connection_proxy: The SqlALchemy _ConnectionFairy object which
+                will proxy the public interface of the DBAPI connection for the
+                lifespan of the checkout.
+
+        Returns:
+            None
+
+        """
+        # Update
+        metrics.DB_CHECKOUTS.inc()
+
+    @event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        """Count connections returned to the Pool.
+
+        Args:
+            dbapi_connection: A SqlALchemy DBAPI connection.
+            connection_record: The SqlALchemy _ConnectionRecord managing the
+                DBAPI connection.
+
+        Returns:
+            None
+
+        """
+        # Update
+        metrics.DB_CHECKINS.inc()
 
 
 def _add_engine_pidguard(engine):
@@ -12,6 +12,9 @@ Based on the pages at:
 # PIP3 imports
 import graphene
 
+# Switchmap-NG imports
+from switchmap.core import general
+
 
 ###############################################################################
 # Define Resolvers
@@ -28,7 +31,7 @@ def resolve_address(obj, _):
     Returns:
         str: Decoded address string or empty string
     """
-    return obj.address.decode() if bool(obj.address) else ""
+    return general.packed_2_ip(obj.address) if bool(obj.address) else ""
 
 
 def resolve_cdpcachedeviceid(obj, _):
@@ -190,7 +193,7 @@ def resolve_mac(obj, _):
     Returns:
         str: Decoded mac string or empty string
     """
-    return obj.mac.decode() if bool(obj.mac) else ""
+    return general.integer_2_mac(obj.mac) if obj.mac is not None else ""
 
 
 def resolve_organization(obj, _):
@@ -573,3 +576,61 @@ class IpPortAttribute:
     idx_ipport = graphene.Int(description="IpPort index foreign key")
     idx_ip = graphene.Int(description="Ip index foreign key")
     idx_l1interface = graphene.Int(description="L1interface index foreign key")
+
+
+class ZoneSummaryAttribute:
+    """Descriptive attributes of the ZoneSummary table.
+
+    A generic class to mutualize description of attributes for both queries
+    and mutations.
+
+    """
+
+    idx_zonesummary = graphene.Int(description="Primary key index")
+    idx_event = graphene.Int(description="Event index foreign key")
+    idx_zone = graphene.Int(description="Zone index foreign key")
+    devices = graphene.Int(description="Number of devices")
+    ports = graphene.Int(description="Number of ethernet ports")
+    ports_active = graphene.Int(description="Enabled ports with link")
+    ports_inactive = graphene.Int(description="Enabled ports without link")
+    ports_disabled = graphene.Int(description="Disabled ports")
+    ports_idle = graphene.Int(
+        description="Ports without link for more than idle_days"
+    )
+    trunks = graphene.Int(description="Number of trunk ports")
+    vlans = graphene.Int(description="Number of distinct VLANs")
+    macs = graphene.Int(description="Number of MAC addresses")
+    ips = graphene.Int(description="Number of IP addresses")
+    arp_entries = graphene.Int(description="Number of ARP table entries")
+    idle_days = graphene.Int(description="Days after which ports are idle")
+    enabled = graphene.Boolean(description="Enabled")
+    ts_modified = graphene.DateTime(description="Row Modification Timestamp")
+    ts_created = graphene.DateTime(description="Row Creation Timestamp")
+
+
+class DeviceSummaryAttribute:
+    """Descriptive attributes of the DeviceSummary table.
+
+    A generic class to mutualize description of attributes for both queries
+    and mutations.
+
+    """
+
+    idx_devicesummary = graphene.Int(description="Primary key index")
+    idx_zone = graphene.Int(description="Zone index foreign key")
+    idx_device = graphene.Int(description="Device index foreign key")
+    ports = graphene.Int(description="Number of ethernet ports")
+    ports_active = graphene.Int(description="Enabled ports with link")
+    ports_inactive = graphene.Int(description="Enabled ports without link")
+    ports_disabled = graphene.Int(description="Disabled ports")
+    ports_idle = graphene.Int(
+        description="Ports without link for more than idle_days"
+    )
+    trunks = graphene.Int(description="Number of trunk ports")
+    vlans = graphene.Int(description="Number of VLANs")
+    macs = graphene.Int(description="Number of MAC addresses on ports")
+    ips = graphene.Int(description="Number of IP addresses on ports")
+    idle_days = graphene.Int(description="Days after which ports are idle")
+    enabled = graphene.Boolean(description="Enabled")
+    ts_modified = graphene.DateTime(description="Row Modification Timestamp")
+    ts_created = graphene.DateTime(description="Row Creation Timestamp")
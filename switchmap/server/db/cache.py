@@ -0,0 +1,382 @@
+"""GraphQL response cache library.
+
+The data of an event doesn't change once it has been ingested, so the
+responses to GraphQL queries can be reused until the ingester updates the
+Root table. Responses are cached by:
+
+    1) The query as printed by the GraphQL parser, so that whitespace and
+       comments don't matter, its variables and its operation name
+    2) A snapshot of the Root table and the events it points to. The
+       snapshot changes when the ingester creates, updates or purges an
+       event, so responses made before then are no longer used.
+
+Responses are kept in the memory of each API server process, with the least
+recently used responses evicted first. They can also be saved to a
+directory shared by all the API server processes. The files of the
+directory are removed when events are purged.
+
+"""
+
+# Standard imports
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import functools
+import threading
+from collections import OrderedDict, namedtuple
+
+# PIP3 imports
+from graphql import parse, print_ast
+from graphql.error import GraphQLError
+from sqlalchemy import select, func
+
+# Application imports
+from switchmap.core import log
+from switchmap.server.configuration import ConfigServer
+from switchmap.server.db import db
+from switchmap.server.db.models import Event
+from switchmap.server.db.models import Root
+
+# A cached response body and its strong ETag
+Response = namedtuple("Response", "body etag")
+
+# Store of this process, created when first used
+_STORE = {"store": None}
+
+
+class _Store:
+    """A size bounded store of responses."""
+
+    def __init__(self, megabytes, directory=None):
+        """Initialize the class.
+
+        Args:
+            megabytes: Maximum size of the store in megabytes
+            directory: Directory in which responses are shared with other
+                processes. Responses are only kept in memory if None.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.limit = megabytes * 1024 * 1024
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._responses = OrderedDict()
+        self._size = 0
+
+    def lookup(self, digest):
+        """Get a response.
+
+        Args:
+            digest: Key of the response
+
+        Returns:
+            result: Response object, None if not found
+
+        """
+        # Get the response from memory
+        with self._lock:
+            result = self._responses.get(digest)
+            if result is not None:
+                self._responses.move_to_end(digest)
+                return result
+
+        # Get the response from the shared directory
+        if bool(self.directory) is True:
+            body = _read(os.path.join(self.directory, digest))
+            if body is not None:
+                result = self._remember(digest, body)
+
+        # Return
+        return result
+
+    def save(self, digest, body):
+        """Save a response.
+
+        Args:
+            digest: Key of the response
+            body: Response body bytes
+
+        Returns:
+            result: Response object
+
+        """
+        # Save
+        result = self._remember(digest, body)
+        if bool(self.directory) is True:
+            _write(self.directory, digest, body, self.limit)
+        return result
+
+    def purge(self):
+        """Remove all responses.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Remove the responses of this process
+        with self._lock:
+            self._responses.clear()
+            self._size = 0
+
+        # Remove the responses of all processes
+        if bool(self.directory) is True:
+            _evict(self.directory, 0)
+
+    def _remember(self, digest, body):
+        """Keep a response in memory.
+
+        Args:
+            digest: Key of the response
+            body: Response body bytes
+
+        Returns:
+            result: Response object
+
+        """
+        # Initialize key variables
+        result = Response(body=body, etag=etag(body))
+
+        # Don't keep responses that would evict everything else
+        if len(body) > self.limit:
+            return result
+
+        # Save, evicting the least recently used responses
+        with self._lock:
+            previous = self._responses.pop(digest, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._responses[digest] = result
+            self._size += len(body)
+            while self._size > self.limit:
+                _, evicted = self._responses.popitem(last=False)
+                self._size -= len(evicted.body)
+
+        # Return
+        return result
+
+
+def store():
+    """Get the response store of the API server process.
+
+    Args:
+        None
+
+    Returns:
+        result: _Store object, None if the cache is disabled
+
+    """
+    # Create the store
+    if _STORE["store"] is None:
+        config = ConfigServer()
+        megabytes = config.api_cache_megabytes()
+        _STORE["store"] = (
+            _Store(megabytes, directory=config.api_cache_directory())
+            if bool(megabytes) is True
+            else False
+        )
+
+    # Return
+    result = _STORE["store"] or None
+    return result
+
+
+def digest(query, variables=None, operation_name=None):
+    """Create the key of the response to a GraphQL query.
+
+    Args:
+        query: GraphQL query string
+        variables: Dict of the variables of the query
+        operation_name: Name of the operation of the query to run
+
+    Returns:
+        result: Key string, None if the query can't be parsed
+
+    """
+    # Normalize the query
+    try:
+        document = _normalize(query)
+    except (GraphQLError, TypeError):
+        return None
+
+    # Create the key
+    text = json.dumps(
+        [document, variables or {}, operation_name, snapshot()],
+        sort_keys=True,
+        default=str,
+    )
+    result = hashlib.sha256(text.encode()).hexdigest()
+    return result
+
+
+def etag(body):
+    """Create the strong ETag of a response body.
+
+    Args:
+        body: Response body bytes
+
+    Returns:
+        result: ETag string
+
+    """
+    # Return
+    result = hashlib.sha256(body).hexdigest()
+    return result
+
+
+def snapshot():
+    """Get the state of the Root table and the events it points to.
+
+    Args:
+        None
+
+    Returns:
+        result: Tuple of strings that changes whenever an event is created,
+            updated or purged
+
+    """
+    # Initialize key variables
+    statement = select(
+        func.count(Root.idx_root),
+        func.max(Root.idx_root),
+        func.sum(Root.idx_event),
+        func.max(Root.ts_modified),
+        func.max(Event.ts_modified),
+    ).join(Event, Root.idx_event == Event.idx_event)
+
+    # Get the state from the database the queries will use
+    with db.db_read():
+        rows = db.db_select(2113, statement)
+
+    # Return
+    result = tuple(str(_) for _ in rows[0].values())
+    return result
+
+
+def purge():
+    """Remove the responses of all processes after events are purged.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Purge
+    store_ = store()
+    if store_ is not None:
+        store_.purge()
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize(query):
+    """Print a GraphQL query in its standard form.
+
+    Args:
+        query: GraphQL query string
+
+    Returns:
+        result: GraphQL query string
+
+    """
+    # Return
+    result = print_ast(parse(query))
+    return result
+
+
+def _read(filepath):
+    """Read a response saved in the shared directory.
+
+    Args:
+        filepath: Response file
+
+    Returns:
+        result: Response body bytes, None if the file can't be read
+
+    """
+    # Read, marking the response as recently used
+    try:
+        with open(filepath, "rb") as f_handle:
+            result = f_handle.read()
+        os.utime(filepath)
+    except OSError:
+        result = None
+    return result
+
+
+def _write(directory, digest, body, limit):
+    """Save a response in the shared directory.
+
+    Args:
+        directory: Shared directory
+        digest: Key of the response
+        body: Response body bytes
+        limit: Maximum size of the directory contents in bytes
+
+    Returns:
+        None
+
+    """
+    # Write to a temporary file first, then rename it to prevent other
+    # processes from reading partially written data. Temporary files are
+    # hidden from eviction.
+    try:
+        f_descriptor, tmp_filepath = tempfile.mkstemp(
+            dir=directory, prefix="."
+        )
+        with os.fdopen(f_descriptor, "wb") as f_handle:
+            f_handle.write(body)
+        os.replace(tmp_filepath, os.path.join(directory, digest))
+    except OSError:
+        log_message = "Cannot save GraphQL response in {}".format(directory)
+        log.log2warning(2114, log_message)
+        log.log2exception(2115, sys.exc_info())
+        return
+
+    # Evict the least recently used responses
+    _evict(directory, limit)
+
+
+def _evict(directory, limit):
+    """Remove the least recently used responses of the shared directory.
+
+    Args:
+        directory: Shared directory
+        limit: Maximum size of the directory contents in bytes
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    entries = []
+    size = 0
+
+    # Get the responses
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                if entry.name.startswith(".") is False:
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    size += stat.st_size
+    except OSError:
+        return
+
+    # Remove the oldest responses, ignoring those removed by other processes
+    for _, bytes_, filepath in sorted(entries):
+        if size <= limit:
+            break
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass
+        size -= bytes_
@@ -1,15 +1,43 @@
 """Class to process connection."""
 
 import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 
+from sqlalchemy import delete, insert, select, func
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql import Select, Update, Delete
 from sqlalchemy.orm import Session
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.core import log
+from switchmap.core import metrics
 from switchmap.server.db import ENGINE
+from switchmap.server.db import READ_ENGINE
+from switchmap.server.db import timing
+from switchmap.server.db.models import Event
+from switchmap.server.db.models import Root
 
+# Maximum number of values in the "IN" clause of bulk lookups
+CHUNK_SIZE = 1000
 
+# Connection of the db_transaction() active in the current context
+_TRANSACTION = ContextVar("transaction", default=None)
+
+# Engine of the db_read() active in the current context
+_ENGINE = ContextVar("engine", default=None)
+
+# Seconds for which read_engine() reuses its choice of engine
+_READ_INTERVAL = 5
+
+# The engine chosen by read_engine() and when it was chosen
+_READ = {"engine": None, "checked": 0}
+
+
+@timing.call_site
 def db_select_row(error_code, statement):
     """Support 'Select' actions for __ENTIRE__ row.
 
@@ -36,7 +64,7 @@ Only the "Select" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
+    with _connect() as connection:
         with Session(bind=connection, future=True) as session:
             try:
                 result = session.execute(statement).scalars().all()
@@ -50,12 +78,15 @@ Only the "Select" ORM expression is supported. Not "{}"'''.format(
     return result
 
 
-def db_select(error_code, statement):
+@timing.call_site
+def db_select(error_code, statement, connection=None):
     """Provide a transactional support for Select actions.
 
     Args:
         error_code: Error code to use in messages
         statement: SqlALchemy statement to execute
+        connection: Connection of a db_transaction() to use. A new
+            connection is used if None.
 
     Returns:
         result: List of objects resulting from Select
@@ -76,8 +107,13 @@ Only the "Select" ORM expression is supported. Not "{}"\
         )
         log.log2die(error_code, log_message)
 
+    # Use the transaction of the connection
+    if connection is not None:
+        result = list(connection.execute(statement).mappings())
+        return result
+
     # Process transaction
-    with ENGINE.connect() as connection:
+    with _connect() as connection:
         with Session(bind=connection, future=True) as session:
             try:
                 iterator_ = session.execute(statement)
@@ -87,14 +123,16 @@ Only the "Select" ORM expression is supported. Not "{}"\
                 log.log2exception(error_code, sys.exc_info())
                 raise
 
-    # Get named tuple equivalents
-    for row in iterator_.mappings():
-        result.append(row)
+            # Get named tuple equivalents. Rows are fetched before the
+            # connection is closed as not all drivers buffer results.
+            for row in iterator_.mappings():
+                result.append(row)
 
     # Return
     return result
 
 
+@timing.call_site
 def db_update(error_code, statement, values=None):
     """Provide a transactional support for Update actions.
 
@@ -121,7 +159,7 @@ Only the "Update" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
+    with _connect() as connection:
         with Session(bind=connection, future=True) as session:
             try:
                 if bool(values):
@@ -150,6 +188,7 @@ Only the "Update" ORM expression is supported. Not "{}"'''.format(
     return result
 
 
+@timing.call_site
 def db_delete_row(error_code, statement):
     """Support 'Delete' actions for __ENTIRE__ row.
 
@@ -173,7 +212,7 @@ Only the "Delete" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
+    with _connect() as connection:
         with Session(bind=connection, future=True) as session:
             try:
                 session.execute(statement).scalars().all()
@@ -193,12 +232,15 @@ Only the "Delete" ORM expression is supported. Not "{}"'''.format(
                 raise
 
 
-def db_delete(error_code, statement):
+@timing.call_site
+def db_delete(error_code, statement, connection=None):
     """Provide a transactional support for Delete actions.
 
     Args:
         error_code: Error code to use in messages
         statement: SqlALchemy statement to execute
+        connection: Connection of a db_transaction() to use. A new
+            connection is used if None.
 
     Returns:
         result: Number of affected rows
@@ -215,8 +257,13 @@ Only the "Delete" ORM expression is supported. Not "{}"'''.format(
         )
         log.log2die(error_code, log_message)
 
+    # Use the transaction of the connection
+    if connection is not None:
+        result = connection.execute(statement).rowcount
+        return result
+
     # Process transaction
-    with ENGINE.connect() as connection:
+    with _connect() as connection:
         with Session(bind=connection, future=True) as session:
             try:
                 result_ = session.execute(statement)
@@ -241,13 +288,314 @@ Only the "Delete" ORM expression is supported. Not "{}"'''.format(
     return result
 
 
+@timing.call_site
+def db_delete_in(error_code, column, values, connection=None):
+    """Delete the rows whose column value is in a list.
+
+    The rows are deleted in chunks of CHUNK_SIZE values to limit the size of
+    each statement.
+
+    Args:
+        error_code: Error code to use in messages
+        column: ORM column to match, such as Mac.idx_mac
+        values: List of column values
+        connection: Connection of a db_transaction() to use. A new
+            connection is used for each chunk if None.
+
+    Returns:
+        result: Number of affected rows
+
+    """
+    # Initialize key variables
+    result = 0
+
+    # Delete in chunks
+    for chunk in mit.chunked(sorted(set(values)), CHUNK_SIZE):
+        statement = delete(column.class_).where(column.in_(chunk))
+        result += db_delete(error_code, statement, connection=connection)
+
+    # Return
+    return result
+
+
+@contextmanager
+def db_transaction(error_code):
+    """Provide a single transaction on a single connection.
+
+    All the db_* functions called in the context use the connection and its
+    transaction, so that a unit of work such as the ingest of a device
+    doesn't need a new connection and session for each statement. The
+    transaction is committed when the context is left and rolled back if an
+    exception is raised. Nested contexts use the transaction of the
+    outermost context.
+
+    Args:
+        error_code: Error code to use in messages
+
+    Returns:
+        connection: SqlALchemy Connection object
+
+    """
+    # Use the transaction of the outer context
+    connection = _TRANSACTION.get()
+    if connection is not None:
+        yield connection
+        return
+
+    # Process transaction
+    with ENGINE.connect() as connection:
+        # SQLite transactions take the write lock when they start
+        connection.execution_options(writer=True)
+        token = _TRANSACTION.set(connection)
+        transaction = connection.begin()
+        try:
+            yield connection
+        except:
+            # Recover and log error. Failed sessions may have already rolled
+            # back the transaction.
+            if transaction.is_active is True:
+                transaction.rollback()
+            log.log2info(error_code, 'DB "Transaction" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+        else:
+            transaction.commit()
+        finally:
+            _TRANSACTION.reset(token)
+
+
+@contextmanager
+def _connect():
+    """Get the connection of the active db_transaction() or a new one.
+
+    Args:
+        None
+
+    Returns:
+        connection: SqlALchemy Connection object
+
+    """
+    # Use the connection of the active transaction. Sessions bound to it
+    # don't commit or close it.
+    connection = _TRANSACTION.get()
+    if connection is not None:
+        yield connection
+        return
+
+    # Use a new connection
+    engine = _ENGINE.get()
+    with (ENGINE if engine is None else engine).connect() as connection:
+        yield connection
+
+
+@contextmanager
+def db_read():
+    """Use the engine returned by read_engine() for reads.
+
+    The db_* functions called in the context use the read engine unless
+    they are part of a db_transaction().
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Process
+    token = _ENGINE.set(read_engine())
+    try:
+        yield
+    finally:
+        _ENGINE.reset(token)
+
+
+def read_engine():
+    """Get the engine to use for reads.
+
+    The read replica is only used when it has the same Root table rows and
+    most recent Event as the primary database. This prevents newly ingested
+    events from being served before replication has caught up. The databases
+    are only compared every _READ_INTERVAL seconds, so the replica can serve
+    the previous event for that long after an ingest.
+
+    Args:
+        None
+
+    Returns:
+        result: SqlALchemy Engine object
+
+    """
+    # Initialize key variables
+    result = ENGINE
+
+    # Reads use the primary database
+    if READ_ENGINE is ENGINE:
+        return result
+
+    # Reuse the recent choice of engine
+    now = time.monotonic()
+    if (
+        _READ["engine"] is not None
+        and now - _READ["checked"] < _READ_INTERVAL
+    ):
+        result = _READ["engine"]
+    else:
+        # Use the replica if it is up to date
+        try:
+            if _freshness(READ_ENGINE) == _freshness(ENGINE):
+                result = READ_ENGINE
+        except:
+            log.log2warning(2092, "Cannot check the freshness of the replica.")
+            log.log2exception(2093, sys.exc_info())
+        _READ.update({"engine": result, "checked": now})
+
+    # Count reads from the primary database
+    if result is ENGINE:
+        metrics.DB_READ_FALLBACKS.inc()
+
+    # Return
+    return result
+
+
+def _freshness(engine):
+    """Get the state of the Root and Event tables of a database.
+
+    Args:
+        engine: SqlALchemy Engine object
+
+    Returns:
+        result: Tuple of the (idx_root, idx_event) values of the Root table
+            and the most recent idx_event of the Event table
+
+    """
+    # Get the state
+    with engine.connect() as connection:
+        roots = connection.execute(
+            select(Root.idx_root, Root.idx_event).order_by(Root.idx_root)
+        ).all()
+        idx_event = connection.execute(
+            select(func.max(Event.idx_event))
+        ).scalar()
+
+    # Return
+    result = (tuple(tuple(_) for _ in roots), idx_event)
+    return result
+
+
+@timing.call_site
+def db_upsert(error_code, connection, model, rows):
+    """Insert rows, updating the rows that already exist.
+
+    Rows are written with INSERT ... ON DUPLICATE KEY UPDATE statements, or
+    INSERT ... ON CONFLICT DO UPDATE statements on SQLite, of up to
+    CHUNK_SIZE rows each. Existing rows with the same unique key are
+    updated with the values of all the columns of the rows.
+
+    Args:
+        error_code: Error code to use in messages
+        connection: Connection of a db_transaction()
+        model: ORM model class of the table
+        rows: List of dicts of column values keyed by column name. All dicts
+            must have the same keys.
+
+    Returns:
+        result: Number of affected rows
+
+    """
+    # Initialize key variables
+    result = 0
+
+    # Nothing to do
+    if bool(rows) is False:
+        return result
+
+    # Create the statement
+    if connection.dialect.name == "sqlite":
+        statement = sqlite.insert(model.__table__)
+        statement = statement.on_conflict_do_update(
+            set_={_: statement.excluded[_] for _ in rows[0]}
+        )
+    else:
+        statement = mysql.insert(model.__table__)
+        statement = statement.on_duplicate_key_update(
+            {_: statement.inserted[_] for _ in rows[0]}
+        )
+
+    # Write in chunks
+    for chunk in mit.chunked(rows, CHUNK_SIZE):
+        try:
+            result += connection.execute(statement, chunk).rowcount
+        except:
+            log.log2info(error_code, 'DB "Upsert" error.')
+            raise
+        metrics.DB_ROWS.labels(table=model.__tablename__).inc(len(chunk))
+
+    # Return
+    return result
+
+
+@timing.call_site
+def db_insert_select(error_code, connection, model, columns, statement):
+    """Copy rows into a table with an INSERT ... SELECT statement.
+
+    The rows are created by the database server without being read by the
+    application. Selected rows with the same unique key as existing rows are
+    ignored.
+
+    Args:
+        error_code: Error code to use in messages
+        connection: Connection of a db_transaction()
+        model: ORM model class of the table
+        columns: List of the names of the table columns to insert
+        statement: SqlALchemy Select statement returning a value for each
+            column in the same order
+
+    Returns:
+        result: Number of affected rows
+
+    """
+    # Initialize key variables
+    result = 0
+
+    # Check to ensure the function executes the correct type of statement
+    if isinstance(statement, Select) is False:
+        log_message = """\
+Only the "Select" ORM expression is supported. Not "{}"\
+""".format(
+            type(statement)
+        )
+        log.log2die(error_code, log_message)
+
+    # Create the statement
+    insert_ = (
+        insert(model.__table__)
+        .from_select(columns, statement)
+        .prefix_with(
+            "OR IGNORE" if connection.dialect.name == "sqlite" else "IGNORE"
+        )
+    )
+
+    # Copy
+    try:
+        result = connection.execute(insert_).rowcount
+    except:
+        log.log2info(error_code, 'DB "Insert select" error.')
+        raise
+    metrics.DB_ROWS.labels(table=model.__tablename__).inc(max(result, 0))
+
+    # Return
+    return result
+
+
+@timing.call_site
 def db_add_all(error_code, instances, die=True):
     """Provide a transactional support for Delete actions.
 
     Args:
         error_code: Error code to use in messages
         instances: List of instances
-        die: Die if True
+        die: Die if True. Errors always end an active db_transaction().
 
     Returns:
         result: True if successful
@@ -256,7 +604,7 @@ def db_add_all(error_code, instances, die=True):
     # Initialize key variables
     result = False
 
-    with ENGINE.connect() as connection:
+    with _connect() as connection:
         with Session(bind=connection, future=True) as session:
             try:
                 session.add_all(instances)
@@ -265,7 +613,7 @@ def db_add_all(error_code, instances, die=True):
                 session.rollback()
                 log.log2info(error_code, 'DB "add_all" error.')
                 log.log2exception(error_code, sys.exc_info())
-                if bool(die):
+                if bool(die) or _TRANSACTION.get() is not None:
                     raise
                 log.log2debug(error_code, "Continuing processing.")
 
@@ -277,11 +625,17 @@ def db_add_all(error_code, instances, die=True):
                 session.rollback()
                 log.log2info(error_code, 'DB "add_all" commit error.')
                 log.log2exception(error_code, sys.exc_info())
-                if bool(die):
+                if bool(die) or _TRANSACTION.get() is not None:
                     raise
                 log.log2debug(error_code, "Continuing processing.")
             else:
                 result = True
 
+                # Count the rows inserted into each table
+                for instance in instances:
+                    metrics.DB_ROWS.labels(
+                        table=instance.__tablename__
+                    ).inc()
+
     # Return
     return result
@@ -4,19 +4,35 @@ import os.path
 import os
 import tempfile
 from operator import attrgetter
+from contextlib import contextmanager
+from collections import defaultdict
+
+# PIP3 imports
+import more_itertools as mit
 
 # Import project libraries
 from multiprocessing import get_context
 from switchmap.core import log
 from switchmap.core import files
 from switchmap.core import general
+from switchmap.core import profiler
+from switchmap.core import metrics
 from switchmap import AGENT_INGESTER, AGENT_POLLER
+from switchmap.server.db import db as _db
+from switchmap.server.db import timing
+from switchmap.server.db.models import Device as _Device
+from switchmap.server.db.models import Ip as _Ip
+from switchmap.server.db.models import IpPort as _IpPort
+from switchmap.server.db.models import Mac as _Mac
+from switchmap.server.db.models import MacIp as _MacIp
+from switchmap.server.db.models import Zone as _Zone
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IRoot
 from switchmap.server.db.table import IMacIp
 from switchmap.server.db.table import IIpPort
 from switchmap.server.db.table import event as _event
 from switchmap.server.db.table import zone as _zone
+from switchmap.server.db.table import device as _device
 from switchmap.server.db.table import root as _root
 from switchmap.server.db.table import ip as _ip
 from switchmap.server.db.table import ipport as _ipport
@@ -26,6 +42,11 @@ from switchmap.server.db.table import macport as _macport
 from switchmap.server import ZoneData, ZoneDevice, EventObjects
 from switchmap.server.db.ingest.update import device as update_device
 from switchmap.server.db.ingest.update import zone as update_zone
+from switchmap.server.db.ingest import resolver
+from switchmap.server.db.ingest.update import summary as update_summary
+
+# Number of error codes in the summary of database statements of each cycle
+STATEMENTS_TOP_N = 25
 
 
 class Ingest:
@@ -37,6 +58,7 @@ class Ingest:
         test=False,
         test_cache_directory=None,
         multiprocessing=False,
+        pool=None,
     ):
         """Initialize class.
 
@@ -45,6 +67,8 @@ class Ingest:
             test: True if testing
             test_cache_directory: Ingest directory. Only used when testing.
             multiprocessing: True if multiprocessing is enabled
+            pool: Long lived pool.Pool of worker processes to use when
+                multiprocessing. A pool is created for each step if None.
 
         Returns:
             None
@@ -55,6 +79,7 @@ class Ingest:
         self._test = test
         self._test_cache_directory = test_cache_directory
         self._multiprocessing = bool(multiprocessing)
+        self._pool = pool
 
     def process(self):
         """Process files in the cache.
@@ -75,6 +100,10 @@ class Ingest:
         poller_lock_file = files.lock_file(AGENT_POLLER, self._config)
         arguments = []
 
+        # Group profiling data by ingest cycle
+        profiler.cycle(AGENT_INGESTER)
+        statements = metrics.collect()
+
         # Process files
         with tempfile.TemporaryDirectory(
             dir=self._config.ingest_directory()
@@ -88,29 +117,59 @@ class Ingest:
                 files.move_yaml_files(cache_directory, tmpdir)
 
                 # Parallel process the files
-                setup_success = setup(tmpdir, self._config)
+                with _step("setup"):
+                    setup_success = setup(tmpdir, self._config)
 
                 if bool(setup_success) is True:
                     # Populate the arguments
                     arguments = [
-                        [item.idx_zone, item.data, item.filepath, item.config]
+                        [item.idx_zone, item.filepath, item.config]
                         for item in setup_success.zones
                     ]
 
+                    # Resolve the hostnames of the IP addresses of all zones
+                    # at once and give each zone process its own
+                    if bool(arguments) is True:
+                        with _step("dns"):
+                            hostnames = self.hostnames(setup_success.zones)
+
                     # Process the device independent zone data in the
                     # database first
                     if bool(arguments) is True:
-                        pairmacips = self.zone(arguments)
+                        with _step("zone"):
+                            pairmacips = self.zone(
+                                [
+                                    argument + [_hostnames]
+                                    for argument, _hostnames in zip(
+                                        arguments, hostnames
+                                    )
+                                ]
+                            )
 
                     # Process the device dependent in the database second
                     if bool(pairmacips):
-                        self.device(arguments)
-
-                    # Update the IpPort table
-                    insert_ipports(pairmacips)
+                        with _step("device"):
+                            self.device(arguments)
+
+                    # Update the IpPort table in a single transaction
+                    with _step("insert_ipports"):
+                        with _db.db_transaction(2084):
+                            insert_ipports(
+                                pairmacips,
+                                incremental=self._config.incremental_ingest(),
+                                zones=[_[0] for _ in arguments],
+                            )
+
+                    # Update the summary tables of the event
+                    with _step("summary"):
+                        update_summary.process(
+                            setup_success.event.idx_event,
+                            idle_days=self._config.summary_idle_days(),
+                        )
 
                     # Cleanup
-                    self.cleanup(setup_success.event)
+                    with _step("cleanup"):
+                        self.cleanup(setup_success.event)
             else:
                 log_message = (
                     "Poller lock file {} exists. Skipping processing of cache "
@@ -119,12 +178,47 @@ class Ingest:
                 )
                 log.log2info(1077, log_message)
 
+        # Summarize the database statements of the cycle
+        _statements(statements)
+
+        # Export the metrics of the cycle
+        metrics.write_textfile(AGENT_INGESTER)
+
+    def hostnames(self, zones):
+        """Get the hostnames of the IP addresses of the files' zone data.
+
+        The IP addresses are read from the indexes of the files, so the
+        files don't have to be parsed.
+
+        Args:
+            zones: List of ZoneDevice objects
+
+        Returns:
+            result: List of dicts of hostnames keyed by IP address, one for
+                each ZoneDevice object
+
+        """
+        # Initialize key variables
+        addresses = [_.addresses for _ in zones]
+
+        # Don't do DNS lookups when testing
+        if bool(self._test) is True:
+            result = [{} for _ in zones]
+            return result
+
+        # Resolve the unique IP addresses of all zones once
+        found = resolver.resolve(
+            [address for _ in addresses for address in _], self._config
+        )
+        result = [{_: found.get(_) for _ in items} for items in addresses]
+        return result
+
     def zone(self, arguments):
         """Ingest the files' zone data.
 
         Args:
             arguments: List of arguments for the processing the zone
-                [[item.idx_zone, item.data, item.filepath, item.config]]
+                [[item.idx_zone, item.filepath, item.config, hostnames]]
 
         Returns:
             success: True if successful
@@ -155,10 +249,16 @@ class Ingest:
                 # Process files in parallel
                 ############################
 
-                # Create a pool of sub process resources
-                with get_context("spawn").Pool(processes=pool_size) as pool:
-                    # Create sub processes from the pool
-                    rows = pool.starmap(process_zone, arguments)
+                if self._pool is not None:
+                    # Use the long lived pool of workers
+                    rows = self._pool.starmap(process_zone, arguments)
+                else:
+                    # Create a pool of sub process resources
+                    with get_context("spawn").Pool(
+                        processes=pool_size
+                    ) as pool:
+                        # Create sub processes from the pool
+                        rows = pool.starmap(process_zone, arguments)
 
         else:
             ############################
@@ -167,8 +267,14 @@ class Ingest:
             for argument in arguments:
                 rows.append(process_zone(*argument))
 
-        # Insert ARP table
-        pairmacips = insert_arptable(rows)
+        # Insert ARP table in a single transaction
+        with _step("zone.insert_arptable"):
+            with _db.db_transaction(2083):
+                pairmacips = insert_arptable(
+                    rows,
+                    incremental=self._config.incremental_ingest(),
+                    zones=[_[0] for _ in arguments],
+                )
 
         # Return
         success = True
@@ -179,7 +285,7 @@ class Ingest:
 
         Args:
             arguments: List of arguments for the processing the zone
-                [[item.idx_zone, item.data, item.filepath, item.config]]
+                [[item.idx_zone, item.filepath, item.config]]
 
         Returns:
             success: True if successful
@@ -209,10 +315,16 @@ class Ingest:
                 # Process files in parallel
                 ############################
 
-                # Create a pool of sub process resources
-                with get_context("spawn").Pool(processes=pool_size) as pool:
-                    # Create sub processes from the pool
-                    pool.starmap(process_device, arguments)
+                if self._pool is not None:
+                    # Use the long lived pool of workers
+                    self._pool.starmap(process_device, arguments)
+                else:
+                    # Create a pool of sub process resources
+                    with get_context("spawn").Pool(
+                        processes=pool_size
+                    ) as pool:
+                        # Create sub processes from the pool
+                        pool.starmap(process_device, arguments)
 
         else:
             ############################
@@ -261,7 +373,8 @@ class Ingest:
                     "Purging database based on configuration parameters."
                 )
                 log.log2debug(1058, log_message)
-                _event.purge()
+                with metrics.INGESTER_PURGE_SECONDS.time():
+                    _event.purge()
 
         else:
             # Delete all DB records related to the event.
@@ -269,14 +382,68 @@ class Ingest:
             _event.delete(event.idx_event)
 
 
-def process_zone(idx_zone, data, filepath, config):
+@contextmanager
+def _step(name):
+    """Profile and time a step of the ingest.
+
+    Args:
+        name: Dotted name of the step without the "ingest." prefix
+
+    Returns:
+        None
+
+    """
+    # Process the step
+    with profiler.stage("ingest.{}".format(name)):
+        with metrics.INGESTER_STEP_SECONDS.labels(step=name).time():
+            yield
+
+
+def _statements(before):
+    """Log the durations of the database statements of an ingest cycle.
+
+    Args:
+        before: metrics.collect() result at the start of the cycle
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    rows = timing.summary(before, metrics.collect())
+
+    # Nothing to do
+    if bool(rows) is False:
+        return
+
+    # Log the call sites taking the most time
+    lines = [
+        "{:>8} {:>8} {:>10} {:>9} {:>9} {:>9}".format(
+            "code", "count", "seconds", "p50", "p95", "p99"
+        )
+    ]
+    for row in rows[:STATEMENTS_TOP_N]:
+        lines.append(
+            "{:>8} {:>8} {:>10.3f} {:>9.4f} {:>9.4f} {:>9.4f}".format(
+                row.code, row.count, row.seconds, row.p50, row.p95, row.p99
+            )
+        )
+    log_message = """\
+Database statements of the ingest cycle by error code:
+{}""".format(
+        "\n".join(lines)
+    )
+    log.log2info(2089, log_message)
+
+
+def process_zone(idx_zone, filepath, config, hostnames=None):
     """Ingest a single file for device updates.
 
     Args:
         idx_zone: Zone index to be used for the data
-        data: Cache file containing data
         filepath: Cache file filepath that contains the data
         config: Daemon configuration
+        hostnames: Dict of hostnames keyed by IP address
 
     Returns:
         rows: ZoneObjects object
@@ -293,17 +460,21 @@ shutdown request was probably requested""".format(
         log.log2debug(1075, log_message)
         return
 
+    # Read the data
+    data = files.read_cache_file(filepath)
+
     # Process the ingested data
-    rows = update_zone.process(data, idx_zone)
+    with profiler.stage("ingest.zone.{}".format(data["misc"]["host"])):
+        rows = update_zone.process(data, idx_zone, hostnames=hostnames)
+    metrics.flush()
     return rows
 
 
-def process_device(idx_zone, data, filepath, config):
+def process_device(idx_zone, filepath, config):
     """Ingest a single file for device updates.
 
     Args:
         idx_zone: Zone index to be used for the data
-        data: Cache file containing data
         filepath: Cache file filepath that contains the data
         config: Daemon configuration
 
@@ -322,8 +493,16 @@ shutdown request was probably requested""".format(
         log.log2debug(1049, log_message)
         return
 
-    # Process the ingested data
-    update_device.process(data, idx_zone)
+    # Read the data
+    data = files.read_cache_file(filepath)
+
+    # Process the ingested data in a single transaction
+    with profiler.stage("ingest.device.{}".format(data["misc"]["host"])):
+        with _db.db_transaction(2082):
+            update_device.process(
+                data, idx_zone, incremental=config.incremental_ingest()
+            )
+    metrics.flush()
 
 
 def setup(src, config):
@@ -343,29 +522,110 @@ def setup(src, config):
 
     # Create a list of files to process
     filepaths = _filepaths(src)
+    metrics.INGESTER_QUEUE.set(len(filepaths))
 
     # Parallel processing
     if bool(filepaths) is True:
-        # Create an event
+        # Create an event. It is only served once the ingest is completed.
         event = _event.create()
 
-        # Get the _zone data from each file
+        # Start from a copy of the current event when only writing changes
+        if bool(config.incremental_ingest()) is True:
+            _copy_event(event)
+
+        # Get the _zone data from the index of each file. The workers read
+        # the files themselves.
         for filepath in filepaths:
             _zone = _get_zone(event, filepath)
             _zones.append(
                 ZoneDevice(
                     idx_zone=_zone.idx_zone,
-                    data=_zone.data,
                     filepath=filepath,
                     config=config,
+                    hostname=_zone.data["hostname"],
+                    addresses=_zone.data.get("addresses", []),
                 )
             )
         result = EventObjects(event=event, zones=_zones)
 
+        # Remove the zones and devices of the copied event that were not
+        # polled during this cycle
+        if bool(config.incremental_ingest()) is True:
+            _prune(event, _zones)
+
     # Return
     return result
 
 
+def _copy_event(event):
+    """Copy the data of the current event to a new event.
+
+    The current event stays unchanged and is served until the root table
+    points to the new event at the end of the ingest.
+
+    Args:
+        event: REvent object of the new event
+
+    Returns:
+        None
+
+    """
+    # Get the event the root table points to. The first event is reserved.
+    root = _root.idx_exists(1)
+    if bool(root) is False or root.idx_event in [1, event.idx_event]:
+        return
+    current = _event.idx_exists(root.idx_event)
+    if bool(current) is False:
+        return
+
+    # Copy the event
+    log_message = (
+        "Copying event {} to event {} as incremental_ingest is enabled"
+        "".format(current.name, event.name)
+    )
+    log.log2debug(2029, log_message)
+    _event.copy(current.idx_event, event.idx_event)
+
+
+def _prune(event, zones):
+    """Delete the zones and devices of an event missing from a cycle.
+
+    Args:
+        event: REvent object
+        zones: List of ZoneDevice objects of the cycle
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    hostnames = defaultdict(set)
+    devices = []
+
+    # Get the hostnames of the devices in each zone of the cycle
+    for item in zones:
+        hostnames[item.idx_zone].add(item.hostname)
+
+    # Delete zones that were not polled. Their devices are deleted with them
+    stale = [
+        _.idx_zone
+        for _ in _zone.zones(event.idx_event)
+        if _.idx_zone not in hostnames
+    ]
+    if bool(stale) is True:
+        _db.db_delete_in(2030, _Zone.idx_zone, stale)
+
+    # Delete devices that were not polled
+    for idx_zone, _hostnames in sorted(hostnames.items()):
+        devices.extend(
+            _.idx_device
+            for _ in _device.devices(idx_zone)
+            if _.hostname not in _hostnames
+        )
+    if bool(devices) is True:
+        _db.db_delete_in(2031, _Device.idx_device, devices)
+
+
 def _filepaths(src):
     """Get and _event ID for the next polling cycle.
 
@@ -400,14 +660,22 @@ def _get_zone(event, filepath):
         filepath: YAML filepath
 
     Returns:
-        result: ZoneData object
+        result: ZoneData object. Its data is the index of the file.
 
     """
-    # Read the yaml file
-    data = files.read_yaml_file(filepath)
+    # Read the index of the file. Only files written without an index are
+    # read in full.
+    data = files.read_cache_index(filepath)
+    if bool(data) is False:
+        _data = files.read_cache_file(filepath)
+        data = {
+            "zone": _data["misc"]["zone"],
+            "hostname": _data["misc"]["host"],
+            "addresses": update_zone.addresses(_data),
+        }
 
     # Get the zone information
-    name = data["misc"]["zone"]
+    name = data["zone"]
     exists = _zone.exists(event.idx_event, name)
 
     if bool(exists) is False:
@@ -434,7 +702,7 @@ def _get_zone(event, filepath):
     return result
 
 
-def insert_arptable(data, test=False):
+def insert_arptable(data, test=False, incremental=False, zones=None):
     """Insert values from ARP tables.
 
     Args:
@@ -442,6 +710,9 @@ def insert_arptable(data, test=False):
             OR a single ZoneObjects from testing
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        incremental: Only write the changes to the existing zone data if True
+        zones: List of the idx_zone values of the ingested zones. The zones
+            of the addresses in the data are used if None.
 
     Returns:
         pairmacips: List of PairMacIp objects
@@ -463,6 +734,10 @@ def insert_arptable(data, test=False):
     ips = list(set(ips))
     pairmacips = list(set(pairmacips))
 
+    # Only keep new addresses when writing changes
+    if bool(incremental) is True:
+        macs, ips = _changes(macs, ips, zones=zones)
+
     # Insert MAC addresses for all zones
     log_message = (
         "Updating MAC addresses in the DB for all "
@@ -490,19 +765,26 @@ def insert_arptable(data, test=False):
     # Insert ARP entries for all zones
     log_message = "Updating MAC to IP address mapping in the database."
     log.log2debug(1089, log_message)
-    insert_macips(pairmacips, test=test)
+    insert_macips(pairmacips, test=test, incremental=incremental, zones=zones)
 
     # Return
     return pairmacips
 
 
-def insert_macips(items, test=False):
+def insert_macips(items, test=False, incremental=False, zones=None):
     """Update the mac DB table.
 
+    The Mac, Ip and MacIp rows of all items are found with a few bulk
+    queries per zone instead of separate queries for each item.
+
     Args:
         items: List of PairMacIp objects
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        incremental: Delete the stale MacIp rows of the zones of the items
+            if True
+        zones: List of the idx_zone values of the ingested zones. The zones
+            of the items are used if None.
 
     Returns:
         None
@@ -515,40 +797,54 @@ def insert_macips(items, test=False):
     if isinstance(items, list) is False:
         items = [items]
 
-    # Process data
-    for item in items:
-        # Update the database
-        mac_exists = _mac.exists(item.idx_zone, item.mac)
-        ip_exists = _ip.exists(item.idx_zone, item.ip)
+    # Get the database indexes of the MAC and IP addresses of the items
+    with _step("insert_macips.lookup"):
+        pairs = _resolve(items)
+        macips = {
+            (_.idx_mac, _.idx_ip): _
+            for _ in _macip.find_idx_macs(
+                [_.idx_mac for _ in _zone_macs(items, zones)]
+                if bool(incremental) is True
+                else [_[0] for _ in pairs]
+            )
+        }
+        existing = set(macips)
 
-        # Insert
-        if bool(mac_exists) and bool(ip_exists):
-            macip_exists = _macip.exists(mac_exists.idx_mac, ip_exists.idx_ip)
-            if bool(macip_exists) is False:
-                # Create a DB record
-                rows.append(
-                    IMacIp(
-                        idx_ip=ip_exists.idx_ip,
-                        idx_mac=mac_exists.idx_mac,
-                        enabled=1,
-                    )
-                )
+    # Delete the stale pairs when writing changes
+    if bool(incremental) is True:
+        found = set(pairs)
+        stale = [_.idx_macip for key, _ in macips.items() if key not in found]
+        if bool(stale) is True:
+            _db.db_delete_in(2032, _MacIp.idx_macip, stale)
+
+    # Create DB records for the pairs that don't exist
+    for idx_mac, idx_ip in sorted(set(pairs) - existing):
+        rows.append(IMacIp(idx_ip=idx_ip, idx_mac=idx_mac, enabled=1))
 
     # Insert the values
-    if bool(test) is False:
-        _macip.insert_row(rows)
-    else:
-        for row in sorted(rows, key=attrgetter("idx_mac", "idx_ip")):
-            _macip.insert_row(row)
+    with _step("insert_macips.insert"):
+        if bool(test) is False:
+            for chunk in mit.chunked(rows, _db.CHUNK_SIZE):
+                _macip.insert_row(chunk)
+        else:
+            for row in sorted(rows, key=attrgetter("idx_mac", "idx_ip")):
+                _macip.insert_row(row)
 
 
-def insert_ipports(items, test=False):
+def insert_ipports(items, test=False, incremental=False, zones=None):
     """Update the mac DB table.
 
+    The Mac, Ip, MacPort and IpPort rows of all items are found with a few
+    bulk queries per zone instead of separate queries for each item.
+
     Args:
         items: PairMacIp objects list
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        incremental: Delete the stale IpPort rows of the zones of the items
+            if True
+        zones: List of the idx_zone values of the ingested zones. The zones
+            of the items are used if None.
 
     Returns:
         None
@@ -556,8 +852,76 @@ def insert_ipports(items, test=False):
     """
     # Initialize key variables
     rows = []
+    interfaces = defaultdict(list)
+
+    # Get the database indexes of the MAC and IP addresses of the items
+    with _step("insert_ipports.lookup"):
+        pairs = _resolve(items)
+
+        # Get the ports on which the MAC addresses reside
+        for macport in _macport.find_idx_macs([_[0] for _ in pairs]):
+            interfaces[macport.idx_mac].append(macport.idx_l1interface)
+
+        # Get the IP addresses already assigned to ports
+        ipports = {
+            (_.idx_l1interface, _.idx_ip): _
+            for _ in _ipport.find_idx_ips(
+                [_.idx_ip for _ in _zone_ips(items, zones)]
+                if bool(incremental) is True
+                else [_[1] for _ in pairs]
+            )
+        }
+        existing = set(ipports)
+
+    # Assign the IP addresses to the ports of their MAC addresses
+    assignments = set(
+        (idx_l1interface, idx_ip)
+        for idx_mac, idx_ip in pairs
+        for idx_l1interface in interfaces[idx_mac]
+    )
+
+    # Delete the stale assignments when writing changes
+    if bool(incremental) is True:
+        stale = [
+            _.idx_ipport
+            for key, _ in ipports.items()
+            if key not in assignments
+        ]
+        if bool(stale) is True:
+            _db.db_delete_in(2033, _IpPort.idx_ipport, stale)
+    for idx_l1interface, idx_ip in sorted(assignments - existing):
+        rows.append(
+            IIpPort(idx_l1interface=idx_l1interface, idx_ip=idx_ip, enabled=1)
+        )
+
+    # Do the inserts
+    with _step("insert_ipports.insert"):
+        if bool(test) is False:
+            for chunk in mit.chunked(rows, _db.CHUNK_SIZE):
+                _ipport.insert_row(chunk)
+        else:
+            for row in sorted(
+                rows, key=attrgetter("idx_ip", "idx_l1interface")
+            ):
+                _ipport.insert_row(row)
+
 
-    # Process data
+def _resolve(items):
+    """Get the database indexes of the addresses in PairMacIp objects.
+
+    Args:
+        items: PairMacIp objects list
+
+    Returns:
+        result: List of unique (idx_mac, idx_ip) tuples of the items whose
+            MAC and IP addresses are both in the database
+
+    """
+    # Initialize key variables
+    result = []
+    zones = defaultdict(set)
+
+    # Group the valid addresses by zone
     for item in items:
         # Create expanded lower case versions of the IP address
         myp = general.ipaddress(item.ip)
@@ -568,41 +932,129 @@ def insert_ipports(items, test=False):
         mactest = general.mac(item.mac)
         if bool(mactest.valid) is False:
             continue
-        else:
-            next_mac = mactest.mac
 
-        # Verify prerequisites
-        mac_exists = _mac.exists(item.idx_zone, next_mac)
-        ip_exists = _ip.exists(item.idx_zone, myp.address)
+        zones[item.idx_zone].add((mactest.mac, myp.address))
+
+    # Get the indexes of all the addresses of each zone
+    for idx_zone, addresses in sorted(zones.items()):
+        macs = _mac.idx_macs(idx_zone, sorted({_[0] for _ in addresses}))
+        ips = {
+            _.address: _.idx_ip
+            for _ in _ip.findip(idx_zone, sorted({_[1] for _ in addresses}))
+        }
+
+        # Skip pairs whose MAC or IP address doesn't exist
+        result.extend(
+            (macs[mac], ips[address])
+            for mac, address in sorted(addresses)
+            if mac in macs and address in ips
+        )
 
-        # Skip if the IP doesn't exist, or else the following logic will crash
-        if bool(ip_exists) is False:
-            continue
+    # Return
+    return result
 
-        # Iterate over existing MAC entries
-        if bool(mac_exists) is True:
-            # Get the ports on which the MAC address resides
-            macports = _macport.find_idx_mac(mac_exists.idx_mac)
 
-            # Iterate over the MAC assignments to interfaces
-            for macport in macports:
-                ipport_exists = _ipport.exists(
-                    macport.idx_l1interface, ip_exists.idx_ip
-                )
+def _changes(macs, ips, zones=None):
+    """Get the changes to the MAC and IP addresses of zones.
 
-                # Assign the IP to this port
-                if bool(ipport_exists) is False:
-                    rows.append(
-                        IIpPort(
-                            idx_l1interface=macport.idx_l1interface,
-                            idx_ip=ip_exists.idx_ip,
-                            enabled=1,
-                        )
-                    )
+    Stale MAC and IP addresses of the zones are deleted together with the
+    rows that depend on them. IP addresses whose hostnames changed are
+    updated.
 
-    # Do the inserts
-    if bool(test) is False:
-        _ipport.insert_row(rows)
-    else:
-        for row in sorted(rows, key=attrgetter("idx_ip", "idx_l1interface")):
-            _ipport.insert_row(row)
+    Args:
+        macs: List of IMac objects
+        ips: List of IIp objects
+        zones: List of the idx_zone values of the ingested zones. All the
+            addresses of the zones without any in the lists are stale. The
+            zones of the addresses are used if None.
+
+    Returns:
+        result: Tuple of the IMac and IIp object lists that must be inserted
+
+    """
+    # Initialize key variables
+    stale = defaultdict(list)
+    grouped = defaultdict(lambda: ([], []))
+    inserts = ([], [])
+
+    # Group the addresses by zone. Zones without any addresses are kept,
+    # so that all their addresses in the database are found to be stale
+    for idx_zone in zones or []:
+        grouped.setdefault(idx_zone, ([], []))
+    for item in macs:
+        grouped[item.idx_zone][0].append(item)
+    for item in ips:
+        grouped[item.idx_zone][1].append(item)
+
+    # Compare the addresses with those in the database
+    for idx_zone, (_macs, _ips) in sorted(grouped.items()):
+        # Process MAC addresses
+        existing = {_.mac: _ for _ in _mac.macs(idx_zone)}
+        found = set(_.mac for _ in _macs)
+        inserts[0].extend(_ for _ in _macs if _.mac not in existing)
+        stale["mac"].extend(
+            _.idx_mac for key, _ in existing.items() if key not in found
+        )
+
+        # Process IP addresses
+        existing = {_.address: _ for _ in _ip.ips(idx_zone)}
+        found = set(_.address for _ in _ips)
+        for item in _ips:
+            current = existing.get(item.address)
+            if bool(current) is False:
+                inserts[1].append(item)
+            elif item.hostname != current.hostname:
+                _ip.update_row(current.idx_ip, item)
+        stale["ip"].extend(
+            _.idx_ip for key, _ in existing.items() if key not in found
+        )
+
+    # Delete stale addresses
+    if bool(stale["mac"]) is True:
+        _db.db_delete_in(2034, _Mac.idx_mac, stale["mac"])
+    if bool(stale["ip"]) is True:
+        _db.db_delete_in(2035, _Ip.idx_ip, stale["ip"])
+
+    # Return
+    result = inserts
+    return result
+
+
+def _zone_macs(items, zones=None):
+    """Get all the MAC addresses of the zones of PairMacIp objects.
+
+    Args:
+        items: PairMacIp objects list
+        zones: List of idx_zone values to use instead of the zones of the
+            items if not None
+
+    Returns:
+        result: List of RMac objects
+
+    """
+    # Initialize key variables
+    zones = set(_.idx_zone for _ in items) if zones is None else set(zones)
+
+    # Return
+    result = [_ for idx_zone in sorted(zones) for _ in _mac.macs(idx_zone)]
+    return result
+
+
+def _zone_ips(items, zones=None):
+    """Get all the IP addresses of the zones of PairMacIp objects.
+
+    Args:
+        items: PairMacIp objects list
+        zones: List of idx_zone values to use instead of the zones of the
+            items if not None
+
+    Returns:
+        result: List of RIp objects
+
+    """
+    # Initialize key variables
+    zones = set(_.idx_zone for _ in items) if zones is None else set(zones)
+
+    # Return
+    result = [_ for idx_zone in sorted(zones) for _ in _ip.ips(idx_zone)]
+    return result
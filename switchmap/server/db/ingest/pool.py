@@ -0,0 +1,191 @@
+"""Long lived pool of ingest worker processes.
+
+Creating a pool of spawned processes for each step of each ingest cycle
+makes every child import SQLAlchemy, graphene and the switchmap models,
+read the configuration and open new database connections before doing any
+work. The Pool class creates its workers once and reuses them in all the
+ingest cycles of the ingester daemon. Workers are replaced after
+completing "ingest_worker_tasks" tasks, or when any of them uses more than
+"ingest_worker_memory" megabytes of memory.
+
+"""
+
+# Standard imports
+import os
+import importlib
+from multiprocessing import get_context
+
+# Application imports
+from switchmap.core import log
+
+
+class Pool:
+    """Long lived pool of ingest worker processes."""
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigServer object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._config = config
+        self._pool = None
+
+    def __enter__(self):
+        """Use the pool as a context manager.
+
+        Args:
+            None
+
+        Returns:
+            self: Pool object
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the workers when leaving the context.
+
+        Args:
+            exc_type: Exception type
+            exc_value: Exception value
+            traceback: Exception traceback
+
+        Returns:
+            None
+
+        """
+        self.close()
+
+    def starmap(self, func, arguments):
+        """Run a function with each list of arguments in the workers.
+
+        Args:
+            func: Function to run. It must be importable by the workers.
+            arguments: List of argument lists
+
+        Returns:
+            result: List of the values returned by each function call
+
+        """
+        # Start the workers if required
+        if self._pool is None:
+            log_message = "Starting {} ingest worker processes".format(
+                self._config.agent_subprocesses()
+            )
+            log.log2debug(2051, log_message)
+            self._pool = get_context("spawn").Pool(
+                processes=self._config.agent_subprocesses(),
+                initializer=_initialize,
+                maxtasksperchild=self._config.ingest_worker_tasks(),
+            )
+
+        # Submit each call as a separate task so that the workers are
+        # replaced after the expected number of calls
+        result = self._pool.starmap(func, arguments, chunksize=1)
+
+        # Replace the workers if they use too much memory
+        self._recycle()
+        return result
+
+    def close(self):
+        """Stop the workers.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Stop
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _recycle(self):
+        """Stop the workers if any of them uses too much memory.
+
+        New workers are started by the next call to starmap().
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        limit = self._config.ingest_worker_memory() * 1024 * 1024
+
+        # Get the memory used by the workers
+        usage = max([rss(_.pid) for _ in self._pool._pool] + [0])
+
+        # Stop the workers
+        if usage > limit:
+            log_message = """\
+Restarting ingest worker processes. A worker uses {} MB of memory, which \
+exceeds the ingest_worker_memory limit of {} MB""".format(
+                usage // (1024 * 1024), limit // (1024 * 1024)
+            )
+            log.log2info(2052, log_message)
+            self.close()
+
+
+def rss(pid):
+    """Get the resident memory used by a process.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        result: Resident memory in bytes, zero if it can't be determined
+
+    """
+    # Initialize key variables
+    result = 0
+    filepath = "/proc/{}/statm".format(pid)
+
+    # Read the number of resident pages. This only works on Linux
+    try:
+        with open(filepath, "r") as fh_:
+            result = int(fh_.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        pass
+
+    # Return
+    return result
+
+
+def _initialize():
+    """Prepare an ingest worker process before it runs any tasks.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Import the ingest modules. This creates the database connection pool
+    # of the worker
+    importlib.import_module("switchmap.server.db.ingest.ingest")
+    from switchmap.server.db import ENGINE
+
+    # Open the first database connection
+    try:
+        with ENGINE.connect():
+            pass
+    except Exception as exception_error:
+        log_message = """\
+Ingest worker process {} cannot connect to the database. Error: {}\
+""".format(
+            os.getpid(), exception_error
+        )
+        log.log2warning(2053, log_message)
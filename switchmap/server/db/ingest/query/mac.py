@@ -5,6 +5,7 @@ from sqlalchemy import select, and_
 
 # Switchmap-NG imports
 from switchmap import MacDetail
+from switchmap.core import general
 from switchmap.server.db.table import macport
 
 from switchmap.server.db import db
@@ -42,7 +43,7 @@ def by_idx_mac(idx_mac):
         rows = db.db_select(1198, statement)
         for row in rows:
             organization = row.organization.decode()
-            mac = row.mac.decode()
+            mac = general.integer_2_mac(row.mac)
             break
 
         # Get MacIp and MacPort information
@@ -73,7 +74,9 @@ def by_idx_mac(idx_mac):
             ipdetails = db.db_select(1202, statement)
             for row in ipdetails:
                 hostname = row.hostname.decode() if row.hostname else ""
-                ipaddress = row.address.decode() if row.address else ""
+                ipaddress = (
+                    general.packed_2_ip(row.address) if row.address else ""
+                )
                 break
 
             # Details found
@@ -0,0 +1,231 @@
+"""Reverse DNS resolution of ARP table IP addresses for the ingester.
+
+Lookups are made concurrently in a bounded pool of threads, as the system
+resolver only has a blocking interface. Each lookup has its own timeout.
+
+Answers are kept in a persistent cache that is shared by all ingest
+processes and cycles. IP addresses without hostnames are also cached, but
+for a shorter time. IP addresses whose lookups time out or fail get the
+expired cached hostname, or the hostname recorded in the database for the
+previous event, and are retried in the next cycle.
+
+"""
+
+# Standard imports
+import os
+import time
+import fcntl
+import socket
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Application imports
+from switchmap.core import log
+from switchmap.core import files
+from switchmap.server.configuration import ConfigServer
+from switchmap.server.db.table import ip as _ip
+
+# Seconds between checks for completed lookups
+_POLL_INTERVAL = 0.1
+
+# Returned by lookups that did not get an answer
+_FAILED = object()
+
+# Cache of the persistent cache file contents for this process
+_CACHE = {"mtime": None, "entries": {}}
+
+
+def resolve(ips, config=None):
+    """Get the hostnames of IP addresses.
+
+    Args:
+        ips: List of IP addresses. Duplicates are resolved only once.
+        config: ConfigServer object
+
+    Returns:
+        result: Dict of hostnames keyed by IP address. The hostname is None
+            if the IP address doesn't have one.
+
+    """
+    # Initialize key variables
+    result = {}
+    pending = []
+    config = ConfigServer() if config is None else config
+    filepath = files.dns_cache_file(config)
+    entries = _load(filepath)
+    now = time.time()
+
+    # Use the cached answers that haven't expired
+    for address in sorted(set(ips)):
+        entry = entries.get(address)
+        if bool(entry) is True and entry[1] > now:
+            result[address] = entry[0]
+        else:
+            pending.append(address)
+
+    # Do nothing more if everything is cached
+    if bool(pending) is False:
+        return result
+
+    # Resolve the rest
+    answers = _lookup(pending, config.dns_concurrency(), config.dns_timeout())
+    for address, hostname in answers.items():
+        ttl = config.dns_ttl() if bool(hostname) else config.dns_negative_ttl()
+        entries[address] = [hostname, now + ttl]
+        result[address] = hostname
+
+    # Use the previous hostnames of addresses without answers
+    failures = [_ for _ in pending if _ not in answers]
+    if bool(failures) is True:
+        log_message = (
+            "Reverse DNS lookups of {} IP addresses timed out or failed. "
+            "Using their previous hostnames.".format(len(failures))
+        )
+        log.log2debug(2021, log_message)
+        previous = _ip.hostnames(
+            [_ for _ in failures if bool(entries.get(_)) is False]
+        )
+        for address in failures:
+            entry = entries.get(address)
+            result[address] = (
+                entry[0] if bool(entry) is True else previous.get(address)
+            )
+
+    # Save the cache
+    _save(filepath, entries)
+    return result
+
+
+def _lookup(ips, concurrency, timeout):
+    """Do concurrent reverse DNS lookups.
+
+    Args:
+        ips: List of IP addresses
+        concurrency: Maximum number of concurrent lookups
+        timeout: Seconds to wait for each lookup
+
+    Returns:
+        result: Dict of hostnames keyed by IP address. The hostname is None
+            if the IP address doesn't have one. IP addresses whose lookups
+            timed out or failed are not included.
+
+    """
+    # Initialize key variables
+    result = {}
+    started = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = {executor.submit(_ptr, _, started): _ for _ in ips}
+    pending = set(futures)
+
+    try:
+        while bool(pending) is True:
+            done, pending = wait(
+                pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED
+            )
+
+            # Save answers
+            for future in done:
+                hostname = future.result()
+                if hostname is not _FAILED:
+                    result[futures[future]] = hostname
+
+            # Abandon lookups that have timed out
+            now = time.monotonic()
+            pending = set(
+                _
+                for _ in pending
+                if now - started.get(futures[_], now) < timeout
+            )
+    finally:
+        # Lookups that timed out can't be interrupted. Don't wait for them
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Return
+    return result
+
+
+def _ptr(address, started):
+    """Do a reverse DNS lookup.
+
+    Args:
+        address: IP address
+        started: Dict of lookup start times keyed by IP address
+
+    Returns:
+        result: Hostname, None if there is none, _FAILED if the lookup
+            failed
+
+    """
+    # Record the start of the lookup for the timeout
+    started[address] = time.monotonic()
+
+    # Do the lookup
+    try:
+        result = socket.gethostbyaddr(address)[0]
+    except socket.herror as exception_error:
+        # Only "host not found" is an answer
+        result = None if exception_error.errno == 1 else _FAILED
+    except (OSError, UnicodeError):
+        result = _FAILED
+    return result
+
+
+def _load(filepath):
+    """Read the persistent cache.
+
+    Args:
+        filepath: Cache file
+
+    Returns:
+        result: Dict of [hostname, expiry timestamp] lists keyed by
+            IP address
+
+    """
+    # Only read the file if it has changed
+    mtime = os.path.getmtime(filepath) if os.path.isfile(filepath) else None
+    if mtime != _CACHE["mtime"]:
+        _CACHE["entries"] = (
+            files.read_json_file(filepath, die=False)
+            if bool(mtime) is True
+            else {}
+        )
+        _CACHE["mtime"] = mtime
+
+    # Return
+    result = _CACHE["entries"]
+    return result
+
+
+def _save(filepath, entries):
+    """Write the persistent cache.
+
+    Entries saved by other processes since the cache was read are kept. The
+    cache is locked while it is merged and saved.
+
+    Args:
+        filepath: Cache file
+        entries: Dict of cache entries. Expired entries are kept for use
+            when lookups fail
+
+    Returns:
+        None
+
+    """
+    # Prevent other processes from saving until the merged entries are saved
+    with open("{}.lock".format(filepath), "a") as f_handle:
+        fcntl.flock(f_handle, fcntl.LOCK_EX)
+        try:
+            # Merge the entries of other processes
+            if os.path.isfile(filepath) is True:
+                if os.path.getmtime(filepath) != _CACHE["mtime"]:
+                    for address, entry in files.read_json_file(
+                        filepath, die=False
+                    ).items():
+                        if entry[1] > entries.get(address, [None, 0])[1]:
+                            entries[address] = entry
+
+            # Save
+            files.write_json_file(filepath, entries)
+            _CACHE["entries"] = entries
+            _CACHE["mtime"] = os.path.getmtime(filepath)
+        finally:
+            fcntl.flock(f_handle, fcntl.LOCK_UN)
@@ -1,36 +1,59 @@
 """Module for updating the database with topology data."""
 
 import time
-from collections import namedtuple
+import json
+import hashlib
 from copy import deepcopy
-from operator import attrgetter
+
+# PIP3 imports
+from sqlalchemy import select, and_, literal
+from sqlalchemy.orm import aliased
 
 # Application imports
 from switchmap.core import log
-from switchmap.server.db.ingest.query import device as _misc_device
+from switchmap.core import general
+from switchmap.core import profiler
 from switchmap.server.db.misc import interface as _historical
+from switchmap.server.db import db as _db
+from switchmap.server.db.models import DeviceHash as _DeviceHash
+from switchmap.server.db.models import InterfaceState as _InterfaceState
+from switchmap.server.db.models import L1Interface as _L1Interface
+from switchmap.server.db.models import Mac as _Mac
+from switchmap.server.db.models import MacPort as _MacPort
+from switchmap.server.db.models import Vlan as _Vlan
+from switchmap.server.db.models import VlanPort as _VlanPort
 from switchmap.server.db.table import device as _device
+from switchmap.server.db.table import devicehash as _devicehash
+from switchmap.server.db.table import interfacestate as _interfacestate
 from switchmap.server.db.table import l1interface as _l1interface
 from switchmap.server.db.table import vlan as _vlan
 from switchmap.server.db.table import macport as _macport
 from switchmap.server.db.table import vlanport as _vlanport
 from switchmap.server.db.table import mac as _mac
+from switchmap.server.db.table import zone as _zone
 from switchmap.server.db.table import (
     IVlan,
     IDevice,
+    IDeviceHash,
+    IInterfaceState,
     IMacPort,
     IVlanPort,
     IL1Interface,
 )
 
+# Sections of the device data used to create the device DB table rows
+_SECTIONS = ["layer1"]
+
 
-def process(data, idx_zone, dns=True):
+def process(data, idx_zone, dns=True, incremental=False):
     """Process data received from a device.
 
     Args:
         data: Device data (dict)
         idx_zone: Zone index to which the data belongs
         dns: Do DNS lookups if True
+        incremental: Only write the changes to the existing device data if
+            True
 
     Returns:
         None
@@ -38,7 +61,7 @@ def process(data, idx_zone, dns=True):
     """
     # Process the device
     meta = device(idx_zone, data)
-    _topology = Topology(meta, data, dns=dns)
+    _topology = Topology(meta, data, dns=dns, incremental=incremental)
     _topology.process()
 
 
@@ -88,27 +111,6 @@ def device(idx_zone, data):
     return exists
 
 
-def _lookup(idx_device):
-    """Create in memory lookup data for the device.
-
-    Args:
-        idx_device: device index
-
-    Returns:
-        result: Lookup object
-
-    """
-    # Initialize key variables
-    Lookup = namedtuple("Lookup", "ifindexes vlans")
-
-    # Return
-    result = Lookup(
-        ifindexes=_l1interface.ifindexes(idx_device),
-        vlans=_vlan.vlans(idx_device),
-    )
-    return result
-
-
 class Status:
     """Tracks the status of various Topology methods."""
 
@@ -171,13 +173,15 @@ class Status:
 class Topology:
     """Update Device data in the database."""
 
-    def __init__(self, exists, data, dns=True):
+    def __init__(self, exists, data, dns=True, incremental=False):
         """Initialize class.
 
         Args:
             exists: RDevice object
             data: Dict of device data
             dns: Do DNS lookups if True
+            incremental: Only write the changes to the existing device data
+                if True
 
         Returns:
             None
@@ -187,6 +191,7 @@ class Topology:
         self._data = deepcopy(data)
         self._device = exists
         self._dns = dns
+        self._incremental = bool(incremental)
         self._valid = False not in [
             bool(_device.idx_exists(exists.idx_device)),
             bool(data),
@@ -205,17 +210,19 @@ class Topology:
             None
 
         """
-        self.l1interface()
-        self.vlan()
-        self.vlanport()
-        self.macport()
+        # Update all tables in one transaction
+        self.write()
+
+    def write(self):
+        """Update all the device DB tables in a single transaction.
 
-    def l1interface(self, test=False):
-        """Update the L1interface DB table.
+        Rows are written with bulk upserts on a single connection. The
+        primary keys required by the rows of the child tables are read in
+        the same transaction. The rows are copied from the previous event
+        instead when the content hashes of the device data are unchanged.
 
         Args:
-            test: Sequentially insert values into the database if True.
-                Bulk inserts don't insert data with predictable primary keys.
+            None
 
         Returns:
             None
@@ -227,17 +234,404 @@ class Topology:
             log_message = "No interfaces detected for for host {}".format(
                 self._device.hostname
             )
-            log.log2debug(1021, log_message)
+            log.log2debug(2054, log_message)
             return
 
-        # Initialize more key variables
-        data = self._data
-        interfaces = data.get("layer1")
-        historical = {_.ifname: _ for _ in _historical.interfaces(self._device)}
-        rows = []
+        # Initialize key variables
+        idx_device = self._device.idx_device
+        hashes = _hashes(self._data)
+        previous = False
+
+        if bool(self._incremental) is True:
+            # The device rows are only written when the data changes
+            if _devicehash.hashes(idx_device) == hashes:
+                log_message = """\
+Data for host {} is unchanged. Skipping the update of its tables\
+""".format(
+                    self._device.hostname
+                )
+                log.log2debug(2070, log_message)
+                self._completed()
+                return
+        else:
+            # Copy the rows of the device from the previous event if its
+            # data is unchanged
+            previous = _historical.previous(self._device)
+            if bool(previous) is True:
+                if _devicehash.hashes(previous.idx_device) != hashes:
+                    previous = False
 
         # Log
-        self.log("L1Interface")
+        self.log("Device")
+
+        with _db.db_transaction(2055) as connection:
+            # Update the device tables
+            if bool(previous) is True:
+                with profiler.stage(
+                    "ingest.device.{}.copy".format(self._device.hostname)
+                ):
+                    self._copy(connection, previous.idx_device)
+            else:
+                self._upsert(connection)
+
+            # Update the content hashes
+            _db.db_upsert(
+                2071,
+                connection,
+                _DeviceHash,
+                [
+                    _devicehash.values(
+                        IDeviceHash(
+                            idx_device=idx_device,
+                            section=section,
+                            hash=value,
+                            enabled=1,
+                        )
+                    )
+                    for section, value in sorted(hashes.items())
+                ],
+            )
+
+        # Log
+        self.log("Device", updated=True)
+
+        # Everything is completed
+        self._completed()
+
+    def _completed(self):
+        """Record the completion of the updates of all the device tables.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Everything is completed
+        self._status.l1interface = True
+        self._status.vlan = True
+        self._status.vlanport = True
+        self._status.macport = True
+
+    def _upsert(self, connection):
+        """Write the device DB table rows created from the device data.
+
+        Args:
+            connection: Connection of a db_transaction()
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        idx_device = self._device.idx_device
+        zone = _zone.idx_exists(self._device.idx_zone).name
+        states = _interfacestate.states(zone, self._device.hostname)
+        stage = "ingest.device.{}".format(self._device.hostname)
+
+        # Update the L1Interface table
+        with profiler.stage("{}.l1interface".format(stage)):
+            rows = self._interfaces(states)
+            _db.db_upsert(
+                2056,
+                connection,
+                _L1Interface,
+                [_l1interface.values(_) for _ in rows],
+            )
+            self._states(connection, zone, states, rows)
+            ifindexes = self._keys(
+                2057,
+                connection,
+                _L1Interface.ifindex,
+                _L1Interface.idx_l1interface,
+                [_.ifindex for _ in rows],
+            )
+
+        # Update the Vlan table
+        with profiler.stage("{}.vlan".format(stage)):
+            rows = self._vlans()
+            _db.db_upsert(
+                2058,
+                connection,
+                _Vlan,
+                [_vlan.values(_) for _ in rows],
+            )
+            vlans = self._keys(
+                2059,
+                connection,
+                _Vlan.vlan,
+                _Vlan.idx_vlan,
+                [_.vlan for _ in rows],
+            )
+
+        # Update the VlanPort table
+        with profiler.stage("{}.vlanport".format(stage)):
+            rows = self._vlanports(ifindexes, vlans)
+            _db.db_upsert(
+                2060,
+                connection,
+                _VlanPort,
+                [_vlanport.values(_) for _ in rows],
+            )
+            if bool(self._incremental) is True:
+                statement = select(
+                    _VlanPort.idx_vlanport,
+                    _VlanPort.idx_l1interface,
+                    _VlanPort.idx_vlan,
+                ).where(
+                    and_(
+                        _Vlan.idx_device == idx_device,
+                        _Vlan.idx_vlan == _VlanPort.idx_vlan,
+                    )
+                )
+                found = set((_.idx_l1interface, _.idx_vlan) for _ in rows)
+                _db.db_delete_in(
+                    2061,
+                    _VlanPort.idx_vlanport,
+                    [
+                        _.idx_vlanport
+                        for _ in _db.db_select(
+                            2062, statement, connection=connection
+                        )
+                        if (_.idx_l1interface, _.idx_vlan) not in found
+                    ],
+                    connection=connection,
+                )
+
+        # Update the MacPort table
+        with profiler.stage("{}.macport".format(stage)):
+            rows = self._macports(ifindexes)
+            _db.db_upsert(
+                2063,
+                connection,
+                _MacPort,
+                [_macport.values(_) for _ in rows],
+            )
+            if bool(self._incremental) is True:
+                statement = select(
+                    _MacPort.idx_macport,
+                    _MacPort.idx_l1interface,
+                    _MacPort.idx_mac,
+                ).where(
+                    and_(
+                        _L1Interface.idx_device == idx_device,
+                        _L1Interface.idx_l1interface
+                        == _MacPort.idx_l1interface,
+                    )
+                )
+                found = set((_.idx_l1interface, _.idx_mac) for _ in rows)
+                _db.db_delete_in(
+                    2064,
+                    _MacPort.idx_macport,
+                    [
+                        _.idx_macport
+                        for _ in _db.db_select(
+                            2065, statement, connection=connection
+                        )
+                        if (_.idx_l1interface, _.idx_mac) not in found
+                    ],
+                    connection=connection,
+                )
+
+    def _states(self, connection, zone, states, rows):
+        """Update the carried forward state of the interfaces of the device.
+
+        Args:
+            connection: Connection of a db_transaction()
+            zone: Zone name
+            states: Dict of the existing RInterfaceState objects of the
+                device keyed by ifname
+            rows: List of the current IL1Interface objects of the device
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        inserts = [
+            IInterfaceState(
+                zone=zone,
+                hostname=self._device.hostname,
+                ifname=_.ifname,
+                ts_idle=_.ts_idle,
+                enabled=1,
+            )
+            for _ in rows
+            if bool(_.ifname) is True
+        ]
+        found = set(_.ifname for _ in inserts)
+
+        # Only write the states that have changed
+        _db.db_upsert(
+            2078,
+            connection,
+            _InterfaceState,
+            [
+                _interfacestate.values(_)
+                for _ in inserts
+                if bool(states.get(_.ifname)) is False
+                or states[_.ifname].ts_idle != _.ts_idle
+            ],
+        )
+
+        # Delete the states of interfaces that no longer exist
+        _db.db_delete_in(
+            2079,
+            _InterfaceState.idx_interfacestate,
+            [
+                _.idx_interfacestate
+                for ifname, _ in states.items()
+                if ifname not in found
+            ],
+            connection=connection,
+        )
+
+    def _copy(self, connection, idx_previous):
+        """Copy the device DB table rows of the device from a previous event.
+
+        The rows are copied by the database server with INSERT ... SELECT
+        statements. Their foreign keys are remapped to the rows of the
+        device, and to the MAC addresses of its zone, in the current event.
+
+        Args:
+            connection: Connection of a db_transaction()
+            idx_previous: idx_device of the device in the previous event
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        idx_device = self._device.idx_device
+        old_l1interface = aliased(_L1Interface)
+        new_l1interface = aliased(_L1Interface)
+        old_vlan = aliased(_Vlan)
+        new_vlan = aliased(_Vlan)
+        old_mac = aliased(_Mac)
+        new_mac = aliased(_Mac)
+
+        # Copy the L1Interface table rows
+        columns = list(IL1Interface._fields)
+        statement = select(
+            *[
+                (
+                    literal(idx_device)
+                    if _ == "idx_device"
+                    else getattr(_L1Interface, _)
+                )
+                for _ in columns
+            ]
+        ).where(_L1Interface.idx_device == idx_previous)
+        _db.db_insert_select(
+            2072, connection, _L1Interface, columns, statement
+        )
+
+        # Copy the Vlan table rows
+        columns = list(IVlan._fields)
+        statement = select(
+            *[
+                literal(idx_device) if _ == "idx_device" else getattr(_Vlan, _)
+                for _ in columns
+            ]
+        ).where(_Vlan.idx_device == idx_previous)
+        _db.db_insert_select(2073, connection, _Vlan, columns, statement)
+
+        # Copy the VlanPort table rows
+        statement = select(
+            new_l1interface.idx_l1interface,
+            new_vlan.idx_vlan,
+            _VlanPort.enabled,
+        ).where(
+            and_(
+                old_l1interface.idx_device == idx_previous,
+                old_l1interface.idx_l1interface == _VlanPort.idx_l1interface,
+                new_l1interface.idx_device == idx_device,
+                new_l1interface.ifindex == old_l1interface.ifindex,
+                old_vlan.idx_vlan == _VlanPort.idx_vlan,
+                new_vlan.idx_device == idx_device,
+                new_vlan.vlan == old_vlan.vlan,
+            )
+        )
+        _db.db_insert_select(
+            2074, connection, _VlanPort, list(IVlanPort._fields), statement
+        )
+
+        # Copy the MacPort table rows
+        statement = select(
+            new_l1interface.idx_l1interface,
+            new_mac.idx_mac,
+            _MacPort.enabled,
+        ).where(
+            and_(
+                old_l1interface.idx_device == idx_previous,
+                old_l1interface.idx_l1interface == _MacPort.idx_l1interface,
+                new_l1interface.idx_device == idx_device,
+                new_l1interface.ifindex == old_l1interface.ifindex,
+                old_mac.idx_mac == _MacPort.idx_mac,
+                new_mac.idx_zone == self._device.idx_zone,
+                new_mac.mac == old_mac.mac,
+            )
+        )
+        _db.db_insert_select(
+            2075, connection, _MacPort, list(IMacPort._fields), statement
+        )
+
+    def _keys(self, error_code, connection, column, primary_key, values):
+        """Get the primary keys of the device's rows in a table.
+
+        Rows of the device whose column values are not in the list are
+        deleted when only writing changes.
+
+        Args:
+            error_code: Error code to use in messages
+            connection: Connection of a db_transaction()
+            column: ORM column of the device's table to match
+            primary_key: ORM primary key column of the table
+            values: List of the current column values of the device
+
+        Returns:
+            result: Dict of primary keys keyed by column value
+
+        """
+        # Initialize key variables
+        result = {}
+        stale = []
+        values = set(values)
+
+        # Get the rows of the device
+        statement = select(column, primary_key).where(
+            column.class_.idx_device == self._device.idx_device
+        )
+        for row in _db.db_select(error_code, statement, connection=connection):
+            if row[column.key] in values:
+                result[row[column.key]] = row[primary_key.key]
+            else:
+                stale.append(row[primary_key.key])
+
+        # Delete the stale rows
+        if bool(self._incremental) is True and bool(stale) is True:
+            _db.db_delete_in(
+                error_code, primary_key, stale, connection=connection
+            )
+
+        # Return
+        return result
+
+    def _interfaces(self, historical):
+        """Get the L1Interface rows of the device.
+
+        Args:
+            historical: Dict of objects with the previous ts_idle value of
+                each interface of the device keyed by ifname
+
+        Returns:
+            rows: List of IL1Interface objects
+
+        """
+        # Initialize key variables
+        interfaces = self._data.get("layer1")
+        rows = []
 
         # Process each interface
         for ifindex, interface in sorted(interfaces.items()):
@@ -255,10 +649,12 @@ class Topology:
                 # Port disabled
                 ts_idle = 0
             else:
-                # Port enabled without link. Eet ts_idle to the timestamp
+                # Port enabled without link. Set ts_idle to the timestamp
                 # when the interface was first detected as being idle.
                 ts_idle = (
-                    previous.ts_idle if bool(previous) else int(time.time())
+                    previous.ts_idle
+                    if bool(previous) and bool(previous.ts_idle)
+                    else int(time.time())
                 )
 
             # Add new row to the database table
@@ -289,43 +685,22 @@ class Topology:
                 )
             )
 
-        # Insert rows
-        if bool(rows):
-            if bool(test) is False:
-                _l1interface.insert_row(rows)
-            else:
-                for row in sorted(rows, key=attrgetter("ifindex")):
-                    _l1interface.insert_row(row)
+        # Return
+        return rows
 
-        # Log
-        self.log("L1Interface", updated=True)
-
-        # Everything is completed
-        self._status.l1interface = True
-
-    def vlan(self, test=False):
-        """Update the Vlan DB table.
+    def _vlans(self):
+        """Get the Vlan rows of the device.
 
         Args:
-            test: Sequentially insert values into the database if True.
-                Bulk inserts don't insert data with predictable primary keys.
+            None
 
         Returns:
-            None
+            rows: List of unique IVlan objects
 
         """
-        # Test prerequisite
-        if bool(self._status.l1interface) is False:
-            self.log_invalid("Vlan")
-            return
-
         # Initialize key variables
         interfaces = self._data.get("layer1")
         rows = []
-        inserts = []
-
-        # Log
-        self.log("Vlan")
 
         # Process each interface
         for ifindex, interface in sorted(interfaces.items()):
@@ -343,182 +718,106 @@ class Topology:
                         )
                     )
 
-        # Remove duplicates
-        inserts = list(set(rows))
-
-        # Insert if required
-        if bool(inserts) is True:
-            if bool(test) is False:
-                _vlan.insert_row(inserts)
-            else:
-                for insert in sorted(
-                    inserts, key=attrgetter("vlan", "idx_device")
-                ):
-                    _vlan.insert_row(insert)
-
-        # Log
-        self.log("Vlan", updated=True)
+        # Remove duplicates. Sort to insert them in a predictable order
+        rows = sorted(set(rows), key=lambda _: _.vlan)
+        return rows
 
-        # Everything is completed
-        self._status.vlan = True
-
-    def vlanport(self, test=False):
-        """Update the VlanPort DB table.
+    def _vlanports(self, ifindexes, vlans):
+        """Get the VlanPort rows of the device.
 
         Args:
-            test: Sequentially insert values into the database if True.
-                Bulk inserts don't insert data with predictable primary keys.
+            ifindexes: Dict of idx_l1interface values keyed by ifindex
+            vlans: Dict of idx_vlan values keyed by VLAN number
 
         Returns:
-            None
+            rows: List of unique IVlanPort objects
 
         """
-        # Test prerequisite
-        if bool(self._status.vlan) is False:
-            self.log_invalid("VlanPort")
-            return
-
         # Initialize key variables
-        VlanInterface = namedtuple("VlanInterface", "idx_l1interface idx_vlan")
         interfaces = self._data.get("layer1")
-        lookup = _lookup(self._device.idx_device)
-        inserts = []
+        rows = []
 
-        # Log
-        self.log("VlanPort")
-
-        # Get all the existing ifindexes, VLANs and VlanPorts
-        db_ifindexes = {_.ifindex: _ for _ in lookup.ifindexes}
-        db_vlans = {_.vlan: _ for _ in lookup.vlans}
-        db_vlanports = {
-            VlanInterface(
-                idx_l1interface=_.idx_l1interface, idx_vlan=_.idx_vlan
-            ): _
-            for _ in _misc_device.vlanports(self._device.idx_device)
-        }
         # Process each interface
         for ifindex, interface in sorted(interfaces.items()):
-            if_exists = db_ifindexes.get(ifindex)
-
-            # Check for VLANs on the interface
-            if bool(if_exists) is True:
-                # Get the vlans
-                _vlans = interface.get("l1_vlans")
-
-                # Process found VLANs
-                if bool(_vlans) is True:
-                    for item in sorted(_vlans):
-                        # Ensure the Vlan exists in the database
-                        vlan_exists = db_vlans.get(item)
-
-                        if bool(vlan_exists) is True:
-                            row = IVlanPort(
-                                idx_l1interface=if_exists.idx_l1interface,
-                                idx_vlan=vlan_exists.idx_vlan,
+            idx_l1interface = ifindexes.get(ifindex)
+
+            # Process the VLANs of interfaces in the database
+            if bool(idx_l1interface) is True:
+                for item in sorted(interface.get("l1_vlans") or []):
+                    if bool(vlans.get(item)) is True:
+                        rows.append(
+                            IVlanPort(
+                                idx_l1interface=idx_l1interface,
+                                idx_vlan=vlans[item],
                                 enabled=1,
                             )
+                        )
 
-                            # Verify that a VLAN / Port mapping exists
-                            vlanport_exists = db_vlanports.get(
-                                VlanInterface(
-                                    idx_l1interface=if_exists.idx_l1interface,
-                                    idx_vlan=vlan_exists.idx_vlan,
-                                )
-                            )
-
-                            # Update the VLAN / Port mapping
-                            if bool(vlanport_exists) is False:
-                                inserts.append(row)
-
-        # Insert rows
-        if bool(inserts) is True:
-            if bool(test) is False:
-                _vlanport.insert_row(inserts)
-            else:
-                for insert in sorted(
-                    inserts, key=attrgetter("idx_vlan", "idx_l1interface")
-                ):
-                    _vlanport.insert_row(insert)
+        # Remove duplicates. Sort to insert them in a predictable order
+        rows = sorted(set(rows), key=lambda _: (_.idx_vlan, _.idx_l1interface))
+        return rows
 
-        # Log
-        self.log("VlanPort", updated=True)
-
-        # Everything is completed
-        self._status.vlanport = True
-
-    def macport(self, test=False):
-        """Update the MacPort DB table.
+    def _macports(self, ifindexes):
+        """Get the MacPort rows of the device.
 
         Args:
-            test: Sequentially insert values into the database if True.
-                Bulk inserts don't insert data with predictable primary keys.
+            ifindexes: Dict of idx_l1interface values keyed by ifindex
 
         Returns:
-            None
+            rows: List of IMacPort objects
 
         """
-        # Test prerequisite
-        if bool(self._status.vlanport) is False:
-            self.log_invalid("MacPort")
-            return
-
         # Initialize key variables
         interfaces = self._data.get("layer1")
-        lookup = _lookup(self._device.idx_device)
-        inserts = []
-
-        # Log
-        self.log("MacPort")
-
-        # Get all the existing ifindexes
-        db_ifindexes = {_.ifindex: _ for _ in lookup.ifindexes}
+        rows = []
+        idx_macs = {}
 
-        # Process each interface
+        # Get the valid MAC addresses found on each interface
+        ports = {}
         for ifindex, interface in sorted(interfaces.items()):
-            if_exists = db_ifindexes.get(ifindex)
-
-            # Process each Mac
             _macs = interface.get("l1_macs")
             if bool(_macs) is True:
-                # Update MAC addresses for all zones
-                log_message = (
-                    "Updating MAC addresses in the DB for device {}"
-                    "based on SNMP MIB-BRIDGE entries".format(
-                        self._device.hostname
+                ports[ifindex] = sorted(
+                    set(
+                        _.mac
+                        for _ in [general.mac(item) for item in _macs]
+                        if bool(_.valid) is True
                     )
                 )
-                log.log2debug(1094, log_message)
-
-                # Iterate over the MACs found
-                for item in sorted(_macs):
-                    # Ensure the MAC exists in the database
-                    mac_exists = _mac.exists(self._device.idx_zone, item)
-
-                    # If True update the port to MAC address mapping
-                    if bool(mac_exists) is True:
-                        inserts.append(
-                            IMacPort(
-                                idx_l1interface=if_exists.idx_l1interface,
-                                idx_mac=mac_exists.idx_mac,
-                                enabled=1,
-                            )
-                        )
 
-        # Insert rows
-        if bool(inserts) is True:
-            if bool(test) is False:
-                _macport.insert_row(inserts)
-            else:
-                for insert in sorted(
-                    inserts, key=attrgetter("idx_mac", "idx_l1interface")
-                ):
-                    _macport.insert_row(insert)
+        if bool(ports) is True:
+            # Update MAC addresses for all zones
+            log_message = (
+                "Updating MAC addresses in the DB for device {}"
+                "based on SNMP MIB-BRIDGE entries".format(
+                    self._device.hostname
+                )
+            )
+            log.log2debug(1094, log_message)
 
-        # Log
-        self.log("MacPort", updated=True)
+            # Get the indexes of all the MAC addresses with bulk queries
+            idx_macs = _mac.idx_macs(
+                self._device.idx_zone,
+                sorted(set(_ for _macs in ports.values() for _ in _macs)),
+            )
 
-        # Everything is completed
-        self._status.macport = True
+        # Map the MAC addresses in the database to the ports
+        for ifindex, _macs in sorted(ports.items()):
+            idx_l1interface = ifindexes.get(ifindex)
+            if bool(idx_l1interface) is False:
+                continue
+            for item in _macs:
+                if item in idx_macs:
+                    rows.append(
+                        IMacPort(
+                            idx_l1interface=idx_l1interface,
+                            idx_mac=idx_macs[item],
+                            enabled=1,
+                        )
+                    )
+
+        # Return
+        return rows
 
     def log(self, table, updated=False):
         """Create standardized log messaging.
@@ -541,26 +840,6 @@ class Topology:
         )
         log.log2debug(1028, log_message)
 
-    def log_invalid(self, table):
-        """Create standardized log messaging for invalid states.
-
-        Args:
-            table: Name of table being updated
-
-        Returns:
-            None
-
-        """
-        # Initialize key variables
-        log_message = "\
-Invalid update sequence for table {} when processing host {}, {} seconds\
-after starting".format(
-            table,
-            self._device.hostname,
-            int(time.time()) - self._start,
-        )
-        log.log2debug(1029, log_message)
-
 
 def _ifspeed(interface):
     """Get the speed of an interface.
@@ -577,3 +856,25 @@ def _ifspeed(interface):
         result = interface.get("ifSpeed")
         result = result / 1000000 if bool(result) else 0
     return result
+
+
+def _hashes(data):
+    """Get the content hashes of the sections of the device data.
+
+    Only the sections used to create the device DB table rows are hashed.
+
+    Args:
+        data: Device data (dict)
+
+    Returns:
+        result: Dict of hashes keyed by section
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Hash a canonical representation of each section
+    for section in _SECTIONS:
+        content = json.dumps(data.get(section), sort_keys=True, default=str)
+        result[section] = hashlib.md5(content.encode()).hexdigest()
+    return result
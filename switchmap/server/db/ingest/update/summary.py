@@ -0,0 +1,333 @@
+"""Module for updating the summary tables of an event.
+
+The ZoneSummary and DeviceSummary tables hold the counts of ports and
+addresses shown in summary views. They are updated at the end of each
+ingest so that the views don't read the large tables of the event.
+
+Ports are counted the same way as in the dashboard:
+
+    1) Ports are interfaces of the ethernetCsmacd (6) IANA ifType
+    2) Active ports are enabled with link, inactive ports are enabled
+       without link and disabled ports are administratively down
+    3) Idle ports have been without link for more than a number of days
+
+"""
+
+import time
+
+# PIP3 imports
+from sqlalchemy import select, and_, case, func, distinct
+
+# Application imports
+from switchmap.server.db import db as _db
+from switchmap.server.db.models import Device as _Device
+from switchmap.server.db.models import DeviceSummary as _DeviceSummary
+from switchmap.server.db.models import Ip as _Ip
+from switchmap.server.db.models import IpPort as _IpPort
+from switchmap.server.db.models import L1Interface as _L1Interface
+from switchmap.server.db.models import Mac as _Mac
+from switchmap.server.db.models import MacIp as _MacIp
+from switchmap.server.db.models import MacPort as _MacPort
+from switchmap.server.db.models import Vlan as _Vlan
+from switchmap.server.db.models import Zone as _Zone
+from switchmap.server.db.models import ZoneSummary as _ZoneSummary
+
+# IANA ifType of ethernet ports
+ETHERNET = 6
+
+# Port counts of the summary tables
+_PORTS = [
+    "ports",
+    "ports_active",
+    "ports_inactive",
+    "ports_disabled",
+    "ports_idle",
+    "trunks",
+]
+
+
+def process(idx_event, idle_days=0):
+    """Update the summary tables of an event.
+
+    Args:
+        idx_event: Event index
+        idle_days: Days after which ports without link are counted as idle
+
+    Returns:
+        result: Number of zones summarized
+
+    """
+    # Initialize key variables
+    idle = int(time.time()) - idle_days * 86400
+
+    # Update the tables in a single transaction
+    with _db.db_transaction(2095) as connection:
+        devices = _devices(connection, idx_event, idle, idle_days)
+        zones = _zones(connection, idx_event, devices, idle_days)
+        _db.db_upsert(2096, connection, _DeviceSummary, devices)
+        _db.db_upsert(2097, connection, _ZoneSummary, zones)
+
+    # Return
+    result = len(zones)
+    return result
+
+
+def _devices(connection, idx_event, idle, idle_days):
+    """Count the ports and addresses of the devices of an event.
+
+    Args:
+        connection: Connection of a db_transaction()
+        idx_event: Event index
+        idle: Timestamp before which ports without link are idle
+        idle_days: Days after which ports without link are counted as idle
+
+    Returns:
+        result: List of DeviceSummary column value dicts
+
+    """
+    # Initialize key variables
+    result = []
+    active = and_(
+        func.coalesce(_L1Interface.ifadminstatus, 0) == 1,
+        func.coalesce(_L1Interface.ifoperstatus, 0) == 1,
+    )
+    inactive = and_(
+        func.coalesce(_L1Interface.ifadminstatus, 0) == 1,
+        func.coalesce(_L1Interface.ifoperstatus, 0) != 1,
+    )
+
+    # Get the devices of the event
+    statement = (
+        select(_Device.idx_device, _Device.idx_zone)
+        .join(_Zone, _Device.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+    )
+    rows = _db.db_select(2098, statement, connection=connection)
+
+    # Count the ports
+    ports = _counts(
+        2099,
+        connection,
+        _event(
+            select(
+                _L1Interface.idx_device,
+                func.count(_L1Interface.idx_l1interface),
+                _sum(active),
+                _sum(inactive),
+                _sum(func.coalesce(_L1Interface.ifadminstatus, 0) != 1),
+                _sum(
+                    and_(
+                        _L1Interface.ts_idle > 0,
+                        _L1Interface.ts_idle <= idle,
+                    )
+                ),
+                _sum(_L1Interface.trunk == 1),
+            ).where(_L1Interface.iftype == ETHERNET),
+            idx_event,
+        ).group_by(_L1Interface.idx_device),
+    )
+
+    # Count the VLANs
+    vlans = _counts(
+        2100,
+        connection,
+        select(_Vlan.idx_device, func.count(_Vlan.idx_vlan))
+        .join(_Device, _Vlan.idx_device == _Device.idx_device)
+        .join(_Zone, _Device.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+        .group_by(_Vlan.idx_device),
+    )
+
+    # Count the MAC and IP addresses found on the ports
+    macs = _counts(
+        2101,
+        connection,
+        _event(
+            select(
+                _L1Interface.idx_device,
+                func.count(distinct(_MacPort.idx_mac)),
+            ).join(
+                _MacPort,
+                _MacPort.idx_l1interface == _L1Interface.idx_l1interface,
+            ),
+            idx_event,
+        ).group_by(_L1Interface.idx_device),
+    )
+    ips = _counts(
+        2102,
+        connection,
+        _event(
+            select(
+                _L1Interface.idx_device,
+                func.count(distinct(_IpPort.idx_ip)),
+            ).join(
+                _IpPort,
+                _IpPort.idx_l1interface == _L1Interface.idx_l1interface,
+            ),
+            idx_event,
+        ).group_by(_L1Interface.idx_device),
+    )
+
+    # Create the rows
+    for row in rows:
+        values = {
+            "idx_zone": row.idx_zone,
+            "idx_device": row.idx_device,
+            "vlans": vlans.get(row.idx_device, [0])[0],
+            "macs": macs.get(row.idx_device, [0])[0],
+            "ips": ips.get(row.idx_device, [0])[0],
+            "idle_days": idle_days,
+            "enabled": 1,
+        }
+        values.update(
+            zip(_PORTS, ports.get(row.idx_device, [0] * len(_PORTS)))
+        )
+        result.append(values)
+
+    # Return
+    return result
+
+
+def _zones(connection, idx_event, devices, idle_days):
+    """Count the devices, ports and addresses of the zones of an event.
+
+    Args:
+        connection: Connection of a db_transaction()
+        idx_event: Event index
+        devices: List of DeviceSummary column value dicts of the event
+        idle_days: Days after which ports without link are counted as idle
+
+    Returns:
+        result: List of ZoneSummary column value dicts
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Get the zones of the event
+    statement = select(_Zone.idx_zone).where(_Zone.idx_event == idx_event)
+    rows = _db.db_select(2103, statement, connection=connection)
+
+    # Count the distinct VLANs of the devices of each zone
+    vlans = _counts(
+        2104,
+        connection,
+        select(_Device.idx_zone, func.count(distinct(_Vlan.vlan)))
+        .join(_Device, _Vlan.idx_device == _Device.idx_device)
+        .join(_Zone, _Device.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+        .group_by(_Device.idx_zone),
+    )
+
+    # Count the MAC and IP addresses and ARP table entries of each zone
+    macs = _counts(
+        2105,
+        connection,
+        select(_Mac.idx_zone, func.count(_Mac.idx_mac))
+        .join(_Zone, _Mac.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+        .group_by(_Mac.idx_zone),
+    )
+    ips = _counts(
+        2106,
+        connection,
+        select(_Ip.idx_zone, func.count(_Ip.idx_ip))
+        .join(_Zone, _Ip.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+        .group_by(_Ip.idx_zone),
+    )
+    arp_entries = _counts(
+        2107,
+        connection,
+        select(_Mac.idx_zone, func.count(_MacIp.idx_macip))
+        .join(_Mac, _MacIp.idx_mac == _Mac.idx_mac)
+        .join(_Zone, _Mac.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+        .group_by(_Mac.idx_zone),
+    )
+
+    # Create the rows. Port counts are the totals of the devices.
+    for row in rows:
+        values = {
+            "idx_event": idx_event,
+            "idx_zone": row.idx_zone,
+            "devices": 0,
+            "vlans": vlans.get(row.idx_zone, [0])[0],
+            "macs": macs.get(row.idx_zone, [0])[0],
+            "ips": ips.get(row.idx_zone, [0])[0],
+            "arp_entries": arp_entries.get(row.idx_zone, [0])[0],
+            "idle_days": idle_days,
+            "enabled": 1,
+        }
+        values.update({_: 0 for _ in _PORTS})
+        for device in devices:
+            if device["idx_zone"] != row.idx_zone:
+                continue
+            values["devices"] += 1
+            for key in _PORTS:
+                values[key] += device[key]
+        result.append(values)
+
+    # Return
+    return result
+
+
+def _event(statement, idx_event):
+    """Limit a L1Interface table query to the interfaces of an event.
+
+    Args:
+        statement: SqlALchemy Select statement of the L1Interface table
+        idx_event: Event index
+
+    Returns:
+        result: SqlALchemy Select statement
+
+    """
+    # Return
+    result = (
+        statement.join(_Device, _L1Interface.idx_device == _Device.idx_device)
+        .join(_Zone, _Device.idx_zone == _Zone.idx_zone)
+        .where(_Zone.idx_event == idx_event)
+    )
+    return result
+
+
+def _sum(condition):
+    """Count the rows of a query meeting a condition.
+
+    Args:
+        condition: SqlALchemy boolean expression
+
+    Returns:
+        result: SqlALchemy SUM() expression
+
+    """
+    # Return
+    result = func.sum(case((condition, 1), else_=0))
+    return result
+
+
+def _counts(error_code, connection, statement):
+    """Get the counts of a grouped query.
+
+    Args:
+        error_code: Error code to use in messages
+        connection: Connection of a db_transaction()
+        statement: SqlALchemy Select statement whose first column is the
+            group key and the other columns are counts
+
+    Returns:
+        result: Dict of lists of integer counts keyed by group key
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Get the counts
+    rows = _db.db_select(error_code, statement, connection=connection)
+    for row in rows:
+        values = list(row.values())
+        result[values[0]] = [int(_ or 0) for _ in values[1:]]
+
+    # Return
+    return result
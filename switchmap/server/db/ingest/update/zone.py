@@ -1,12 +1,12 @@
 """Module for updating the database with topology data."""
 
 import time
-import socket
 from copy import deepcopy
 
 # Application imports
 from switchmap.core import log
 from switchmap.core import general
+from switchmap.core import profiler
 from switchmap.server.db.table import oui as _oui
 from switchmap.server import ZoneObjects
 from switchmap.server import PairMacIp
@@ -16,19 +16,19 @@ from switchmap.server.db.table import (
 )
 
 
-def process(data, idx_zone, dns=True):
+def process(data, idx_zone, hostnames=None):
     """Process data received from a device.
 
     Args:
         data: Device data (dict)
         idx_zone: Zone index to which the data belongs
-        dns: Do DNS lookups if True
+        hostnames: Dict of hostnames keyed by IP address
 
     Returns:
         results: ZoneObjects object
     """
     # Process the device
-    _topology = Topology(data, idx_zone, dns=dns)
+    _topology = Topology(data, idx_zone, hostnames=hostnames)
     result = _topology.process()
     return result
 
@@ -124,13 +124,14 @@ class Status:
 class Topology:
     """Update Device data in the database."""
 
-    def __init__(self, data, idx_zone, dns=True):
+    def __init__(self, data, idx_zone, hostnames=None):
         """Initialize class.
 
         Args:
             data: Dict of device data
             idx_zone: idx_zone of the Zone being processed
-            dns: Do DNS lookups if True
+            hostnames: Dict of hostnames keyed by IP address. IP addresses
+                that aren't keys have no hostname.
 
         Returns:
             None
@@ -138,7 +139,7 @@ class Topology:
         # Initialize key variables
         self._data = deepcopy(data)
         self._idx_zone = idx_zone
-        self._dns = dns
+        self._hostnames = {} if hostnames is None else hostnames
         self._valid = False not in [
             bool(data),
             isinstance(data, dict),
@@ -157,10 +158,16 @@ class Topology:
         Returns:
             None
         """
+        # Initialize key variables
+        stage = "ingest.zone.{}".format(self._data["misc"]["host"])
+
         # Process zone data
-        macs = self.mac()
-        ips = self.ip()
-        pairmacips = self.macip()
+        with profiler.stage("{}.mac".format(stage)):
+            macs = self.mac()
+        with profiler.stage("{}.ip".format(stage)):
+            ips = self.ip()
+        with profiler.stage("{}.macip".format(stage)):
+            pairmacips = self.macip()
         result = ZoneObjects(ips=ips, macs=macs, pairmacips=pairmacips)
         return result
 
@@ -176,8 +183,6 @@ class Topology:
         # Initialize key variables
         all_macs = []
         unique_macs = []
-        unique_ouis = []
-        lookup = {}
         rows = []
 
         # Test validity
@@ -205,21 +210,14 @@ class Topology:
         for item in self._arp_table:
             all_macs.append(item.mac)
 
-        # Get macs and ouis
+        # Get macs
         unique_macs = list(set(_.lower() for _ in all_macs))
-        unique_ouis = list(set([_[:6].lower() for _ in unique_macs]))
 
-        # Process ouis
-        for item in sorted(unique_ouis):
-            if bool(lookup.get(item)) is False:
-                exists = _oui.exists(item)
-                lookup[item] = exists.idx_oui if bool(exists) is True else 1
-
-        # Process macs
+        # Process macs. OUIs are found in the process-wide OUI cache
         for item in sorted(unique_macs):
             rows.append(
                 IMac(
-                    idx_oui=lookup.get(item[:6], 1),
+                    idx_oui=_oui.idx_oui(item),
                     idx_zone=self._idx_zone,
                     mac=item,
                     enabled=1,
@@ -246,7 +244,7 @@ class Topology:
             None
         """
         # Initialize key variables
-        dns = self._dns
+        hostnames = self._hostnames
         rows = []
 
         # Test prerequisite
@@ -259,21 +257,12 @@ class Topology:
 
         # Process the ARP Table
         for item in self._arp_table:
-            # Get hostname for DB
-            if bool(dns) is True:
-                try:
-                    hostname = socket.gethostbyaddr(item.ip)[0]
-                except:
-                    hostname = None
-            else:
-                hostname = None
-
             # Create a DB record
             rows.append(
                 IIp(
                     idx_zone=self._idx_zone,
                     address=item.ip,
-                    hostname=hostname,
+                    hostname=hostnames.get(item.ip),
                     version=item.ip_version,
                     enabled=1,
                 )
@@ -369,6 +358,21 @@ after starting".format(
         log.log2debug(1079, log_message)
 
 
+def addresses(data):
+    """Get the IP addresses in the ARP and NDP tables of device data.
+
+    Args:
+        data: YAML data
+
+    Returns:
+        result: List of unique IP addresses
+
+    """
+    # Return
+    result = sorted(set(_.ip for _ in _arp_table(None, data)))
+    return result
+
+
 def _process_pairmacips(idx_zone, table):
     """Update the mac DB table.
 
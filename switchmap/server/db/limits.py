@@ -0,0 +1,190 @@
+"""Limits on the size of GraphQL queries.
+
+Queries are rejected before they are run when they exceed:
+
+    1) A maximum depth of nested fields
+    2) A maximum cost. Each field costs one. The cost of the fields of a
+       connection is multiplied by its "first" or "last" argument, or by
+       LIST_SIZE if there is neither, as each is repeated for every node.
+
+Introspection fields, such as those used by GraphiQL, are not counted.
+
+"""
+
+# PIP3 imports
+from graphql import GraphQLError, ValidationRule, specified_rules
+from graphql.language import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+)
+
+# Application imports
+from switchmap.server.configuration import ConfigServer
+
+# Number of nodes assumed for connections without "first" or "last"
+LIST_SIZE = 10
+
+# Validation rules, created when first used
+_RULES = {"rules": None}
+
+
+def rules():
+    """Get the validation rules of GraphQL queries made to the server.
+
+    Args:
+        None
+
+    Returns:
+        result: List of ValidationRule classes
+
+    """
+    # Create the rules
+    if _RULES["rules"] is None:
+        config = ConfigServer()
+        _RULES["rules"] = list(specified_rules) + [
+            rule(config.api_query_depth(), config.api_query_cost())
+        ]
+
+    # Return
+    result = _RULES["rules"]
+    return result
+
+
+def rule(depth, cost):
+    """Create a validation rule limiting the depth and cost of queries.
+
+    Args:
+        depth: Maximum depth. Zero disables the limit.
+        cost: Maximum cost. Zero disables the limit.
+
+    Returns:
+        result: ValidationRule class
+
+    """
+
+    class QueryLimitRule(ValidationRule):
+        """Reject queries that are too deep or too costly."""
+
+        def enter_operation_definition(self, node, *_):
+            """Check the size of an operation.
+
+            Args:
+                node: OperationDefinitionNode object
+                _: Unused visitor arguments
+
+            Returns:
+                None
+
+            """
+            # Measure the operation
+            depth_, cost_ = measure(node.selection_set, self.context)
+
+            # Report the limits that are exceeded
+            if bool(depth) is True and depth_ > depth:
+                self.report_error(
+                    GraphQLError(
+                        "Query depth of {} exceeds the limit of {}.".format(
+                            depth_, depth
+                        ),
+                        node,
+                    )
+                )
+            if bool(cost) is True and cost_ > cost:
+                self.report_error(
+                    GraphQLError(
+                        "Query cost of {} exceeds the limit of {}.".format(
+                            cost_, cost
+                        ),
+                        node,
+                    )
+                )
+
+    # Return
+    result = QueryLimitRule
+    return result
+
+
+def measure(selection_set, context, fragments=()):
+    """Get the depth and cost of a selection set.
+
+    Args:
+        selection_set: SelectionSetNode object
+        context: ValidationContext object of the query
+        fragments: Names of the fragments being measured. These are not
+            measured again if they are spread within themselves.
+
+    Returns:
+        result: Tuple of (depth, cost)
+
+    """
+    # Initialize key variables
+    depth = 0
+    cost = 0
+
+    for selection in selection_set.selections:
+        # Measure the fields
+        if isinstance(selection, FieldNode):
+            if selection.name.value.startswith("__"):
+                continue
+            if selection.selection_set is None:
+                depth_, cost_ = (0, 0)
+            else:
+                depth_, cost_ = measure(
+                    selection.selection_set, context, fragments=fragments
+                )
+            depth = max(depth, depth_ + 1)
+            cost += 1 + _size(selection) * cost_
+            continue
+
+        # Measure the fragments as if their fields were in the selection set
+        names = fragments
+        if isinstance(selection, InlineFragmentNode):
+            selection_set_ = selection.selection_set
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = context.get_fragment(name)
+            if fragment is None or name in fragments:
+                continue
+            selection_set_ = fragment.selection_set
+            names = fragments + (name,)
+        else:
+            continue
+        depth_, cost_ = measure(selection_set_, context, fragments=names)
+        depth = max(depth, depth_)
+        cost += cost_
+
+    # Return
+    result = (depth, cost)
+    return result
+
+
+def _size(field):
+    """Get the number of nodes assumed for a field.
+
+    Args:
+        field: FieldNode object
+
+    Returns:
+        result: Number of nodes
+
+    """
+    # Initialize key variables
+    result = 1
+    selections = field.selection_set.selections if field.selection_set else []
+
+    # Only connections have many nodes
+    if "edges" not in [
+        _.name.value for _ in selections if isinstance(_, FieldNode)
+    ]:
+        return result
+
+    # Use the number of nodes requested
+    result = LIST_SIZE
+    for argument in field.arguments:
+        if argument.name.value in ["first", "last"] and isinstance(
+            argument.value, IntValueNode
+        ):
+            result = int(argument.value.value)
+    return result
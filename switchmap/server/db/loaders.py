@@ -0,0 +1,138 @@
+"""Batch loading of the relationships of GraphQL nodes.
+
+Resolving a relationship of each node of a list with its own SELECT makes
+one query per node at every level of a GraphQL query. The resolvers of this
+module load a relationship for all the nodes of the request instead:
+
+    1) GraphQL queries are resolved depth first, so when the relationship of
+       the first node of a list is resolved, all the nodes of the list have
+       already been loaded by the session of the request
+    2) The relationship is loaded for all the objects of the session that
+       don't have it yet, with one SELECT ... IN query
+    3) The other nodes of the list then find their relationship loaded
+
+The session of each request is new, so loaded relationships are not shared
+between requests.
+
+"""
+
+# Standard imports
+from collections import defaultdict
+
+# PIP3 imports
+import more_itertools as mit
+from sqlalchemy import inspect, select
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Application imports
+from switchmap.server.db import db
+
+
+def resolver(key):
+    """Create a GraphQL resolver that loads a relationship in batches.
+
+    Args:
+        key: Name of the relationship of the model
+
+    Returns:
+        resolve: Resolver function
+
+    """
+
+    def resolve(root, info, **kwargs):
+        """Resolve the relationship of a node.
+
+        Args:
+            root: SQLAlchemy object of the node
+            info: GraphQL ResolveInfo object
+            kwargs: Arguments of the GraphQL field
+
+        Returns:
+            result: Related object or list of objects
+
+        """
+        # Load the relationship of all the nodes of the request
+        if _batching(info) is True:
+            load(root, key)
+
+        # Return
+        result = getattr(root, key)
+        return result
+
+    return resolve
+
+
+def load(instance, key):
+    """Load a relationship for all the objects of a session that need it.
+
+    Args:
+        instance: SQLAlchemy object whose relationship is needed
+        key: Name of the relationship
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    state = inspect(instance)
+    session = state.session
+    prop = state.mapper.relationships[key]
+    children = defaultdict(list)
+
+    # Nothing to do
+    if key not in state.unloaded or session is None:
+        return
+
+    # Only relationships on a single foreign key are loaded in batches
+    if prop.secondary is not None or len(prop.local_remote_pairs) != 1:
+        return
+    parent_column, child_column = prop.local_remote_pairs[0]
+    parent_key = state.mapper.get_property_by_column(parent_column).key
+    child_key = prop.mapper.get_property_by_column(child_column).key
+
+    # Get the objects of the session without the relationship
+    parents = [
+        _
+        for _ in list(session.identity_map.values())
+        if isinstance(_, state.mapper.class_) and key in inspect(_).unloaded
+    ]
+    values = set(getattr(_, parent_key) for _ in parents)
+    values.discard(None)
+
+    # Get the related objects
+    for chunk in mit.chunked(sorted(values), db.CHUNK_SIZE):
+        statement = (
+            select(prop.mapper.class_)
+            .where(child_column.in_(chunk))
+            .order_by(*prop.mapper.primary_key)
+        )
+        for child in session.execute(statement).scalars():
+            children[getattr(child, child_key)].append(child)
+
+    # Set the relationships without marking the objects as changed
+    for parent in parents:
+        related = children.get(getattr(parent, parent_key), [])
+        if bool(prop.uselist) is True:
+            set_committed_value(parent, key, related)
+        else:
+            set_committed_value(
+                parent, key, related[0] if bool(related) else None
+            )
+
+
+def _batching(info):
+    """Determine whether relationships are loaded in batches.
+
+    Args:
+        info: GraphQL ResolveInfo object
+
+    Returns:
+        result: False if the context of the query has a False "batching"
+            value. Used to compare the query times with and without
+            batching.
+
+    """
+    # Return
+    context = info.context if isinstance(info.context, dict) else {}
+    result = bool(context.get("batching", True))
+    return result
@@ -1,9 +1,13 @@
 """Switchmap Interface library."""
 
+# PIP imports
+from sqlalchemy import select, and_
+
 # Module imports
+from switchmap.server.db import db
+from switchmap.server.db.models import Device, Zone
+from switchmap.server.db.misc import rows as _rows
 from switchmap.server.db.table import zone
-from switchmap.server.db.table import event
-from switchmap.server.db.table import device
 
 # from switchmap.server.db.table import device
 from switchmap.server.db.table import l1interface
@@ -22,23 +26,54 @@ def interfaces(rdevice):
     # Initialize key variables
     result = []
 
+    # Get the interfaces of the device from the previous event
+    device_exists = previous(rdevice)
+    if bool(device_exists) is True:
+        result = l1interface.ifindexes(device_exists.idx_device)
+
+    return result
+
+
+def previous(rdevice):
+    """Get the RDevice object of the device during the previous event.
+
+    The previous event is the most recent earlier event with a device of
+    the same hostname in a zone of the same name. Event indexes don't have
+    to be contiguous.
+
+    Args:
+        rdevice: RDevice object
+
+    Returns:
+        result: RDevice object, False if not found
+
+    """
+    # Initialize key variables
+    result = False
+
     # Determine whether the zone exists
     zone_exists = zone.idx_exists(rdevice.idx_zone)
 
     if bool(zone_exists) is True:
-        # Determine whether there was a previous event
-        idx_event = zone_exists.idx_event - 1
-        event_exists = event.idx_exists(idx_event)
-
         # Find the device from the previous event
-        if bool(event_exists) is True:
-            zones = zone.zones(idx_event)
-            for item in zones:
-                device_exists = device.exists(item.idx_zone, rdevice.hostname)
-
-                # Device found. Now get the interfaces
-                if bool(device_exists) is True:
-                    result = l1interface.ifindexes(device_exists.idx_device)
-                    break
+        statement = (
+            select(Device)
+            .where(
+                and_(
+                    Device.hostname == rdevice.hostname.encode(),
+                    Device.idx_zone == Zone.idx_zone,
+                    Zone.name == zone_exists.name.encode(),
+                    Zone.idx_event < zone_exists.idx_event,
+                )
+            )
+            .order_by(Zone.idx_event.desc())
+            .limit(1)
+        )
+        rows = db.db_select_row(2081, statement)
+
+        # Device found
+        for row in rows:
+            result = _rows.device(row)
+            break
 
     return result
@@ -1,8 +1,11 @@
 """Module to handle database table rows."""
 
+from switchmap.core import general
 from switchmap.server.db.table import RMacPort
 from switchmap.server.db.table import RL1Interface
+from switchmap.server.db.table import RInterfaceState
 from switchmap.server.db.table import RDevice
+from switchmap.server.db.table import RDeviceHash
 from switchmap.server.db.table import RMac
 from switchmap.server.db.table import RMacIp
 from switchmap.server.db.table import RIp
@@ -55,6 +58,29 @@ def device(row):
     return result
 
 
+def devicehash(row):
+    """Convert table row to tuple.
+
+    Args:
+        row: DeviceHash row
+
+    Returns:
+        result: RDeviceHash tuple
+
+    """
+    # Initialize key variables
+    result = RDeviceHash(
+        idx_devicehash=row.idx_devicehash,
+        idx_device=row.idx_device,
+        section=None if row.section is None else row.section.decode(),
+        hash=None if row.hash is None else row.hash.decode(),
+        enabled=int(bool(row.enabled) is True),
+        ts_created=row.ts_created,
+        ts_modified=row.ts_modified,
+    )
+    return result
+
+
 def root(row):
     """Convert table row to tuple.
 
@@ -164,6 +190,30 @@ def l1interface(row):
     return result
 
 
+def interfacestate(row):
+    """Convert table row to tuple.
+
+    Args:
+        row: InterfaceState row
+
+    Returns:
+        result: RInterfaceState tuple
+
+    """
+    # Initialize key variables
+    result = RInterfaceState(
+        idx_interfacestate=row.idx_interfacestate,
+        zone=None if row.zone is None else row.zone.decode(),
+        hostname=None if row.hostname is None else row.hostname.decode(),
+        ifname=None if row.ifname is None else row.ifname.decode(),
+        ts_idle=row.ts_idle,
+        enabled=int(bool(row.enabled) is True),
+        ts_created=row.ts_created,
+        ts_modified=row.ts_modified,
+    )
+    return result
+
+
 def mac(row):
     """Convert table row to tuple.
 
@@ -179,7 +229,7 @@ def mac(row):
         idx_mac=row.idx_mac,
         idx_oui=row.idx_oui,
         idx_zone=row.idx_zone,
-        mac=(None if bool(row.mac) is False else row.mac.decode()),
+        mac=general.integer_2_mac(row.mac),
         enabled=int(bool(row.enabled) is True),
         ts_created=row.ts_created,
         ts_modified=row.ts_modified,
@@ -340,7 +390,7 @@ def ip(row):
     result = RIp(
         idx_ip=row.idx_ip,
         idx_zone=row.idx_zone,
-        address=None if bool(row.address) is False else row.address.decode(),
+        address=general.packed_2_ip(row.address),
         hostname=(
             None if bool(row.hostname) is False else row.hostname.decode()
         ),
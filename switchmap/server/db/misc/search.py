@@ -279,12 +279,13 @@ def search(idx_root, searchstring):
     # Initialize key variables
     result = []
 
-    # Search
-    found = root.idx_exists(idx_root)
-    if bool(found):
-        _search = Search(found.idx_event, searchstring)
-        _result = _search.find()
-        result = sorted([_.idx_l1interface for _ in _result])
+    # Search on the read engine
+    with db.db_read():
+        found = root.idx_exists(idx_root)
+        if bool(found):
+            _search = Search(found.idx_event, searchstring)
+            _result = _search.find()
+            result = sorted([_.idx_l1interface for _ in _result])
 
     # Return
     return result
@@ -4,12 +4,14 @@
 import datetime
 
 # SQLalchemy imports
-from sqlalchemy import Column, DateTime, ForeignKey, text, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, text
+from sqlalchemy import UniqueConstraint
 from sqlalchemy.dialects.mysql import BIGINT, VARBINARY, BIT
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql.expression import Null
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.compiler import compiles
 
 # Project imports
 from switchmap.server.db import SCOPED_SESSION, ENGINE
@@ -30,6 +32,72 @@ BASE.query = SCOPED_SESSION.query_property()
 
 _METADATA = BASE.metadata
 
+###############################################################################
+# Store the MySQL column types in their SQLite equivalents. SQLite integers
+# are 64 bit and only INTEGER primary keys are autoincremented.
+###############################################################################
+
+
+@compiles(BIGINT, "sqlite")
+@compiles(BIT, "sqlite")
+def _sqlite_integer(type_, compiler, **kwargs):
+    """Create the SQLite column type of MySQL integer types.
+
+    Args:
+        type_: SqlALchemy type
+        compiler: SqlALchemy type compiler
+        kwargs: Compiler arguments
+
+    Returns:
+        result: SQLite column type
+
+    """
+    # Return
+    result = "INTEGER"
+    return result
+
+
+@compiles(VARBINARY, "sqlite")
+def _sqlite_blob(type_, compiler, **kwargs):
+    """Create the SQLite column type of MySQL binary types.
+
+    Args:
+        type_: SqlALchemy type
+        compiler: SqlALchemy type compiler
+        kwargs: Compiler arguments
+
+    Returns:
+        result: SQLite column type
+
+    """
+    # Return
+    result = "BLOB"
+    return result
+
+
+class Bit(BIT):
+    """BIT column type that is read as an integer from SQLite."""
+
+    cache_ok = True
+
+    def result_processor(self, dialect, coltype):
+        """Get the function converting values read from the database.
+
+        Args:
+            dialect: SqlALchemy dialect
+            coltype: DBAPI column type
+
+        Returns:
+            result: Function, None if values aren't converted
+
+        """
+        # SQLite returns integers
+        if dialect.name == "sqlite":
+            return None
+        result = BIT.result_processor(self, dialect, coltype)
+        return result
+
+
 ###############################################################################
 
 
@@ -44,7 +112,7 @@ class Oui(BASE):
     organization = Column(
         VARBINARY(256), nullable=True, default=Null, index=True
     )
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -65,7 +133,7 @@ class Event(BASE):
     idx_event = Column(BIGINT(20, unsigned=True), primary_key=True, unique=True)
     name = Column(VARBINARY(256), unique=True)
     epoch_utc = Column(BIGINT(20, unsigned=True))
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -92,7 +160,7 @@ class Root(BASE):
         server_default=text("1"),
     )
     name = Column(VARBINARY(256), unique=True)
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -119,7 +187,10 @@ class Zone(BASE):
     """Database table definition."""
 
     __tablename__ = "smap_zone"
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        Index("ix_smap_zone_idx_event_name", "idx_event", "name"),
+        {"mysql_engine": "InnoDB"},
+    )
 
     idx_zone = Column(BIGINT(20, unsigned=True), primary_key=True, unique=True)
     idx_event = Column(
@@ -131,7 +202,7 @@ class Zone(BASE):
     )
     name = Column(VARBINARY(256), index=True)
     notes = Column(VARBINARY(2048), nullable=True, default=Null)
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -158,7 +229,10 @@ class Device(BASE):
     """Database table definition."""
 
     __tablename__ = "smap_device"
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        Index("ix_smap_device_idx_zone_hostname", "idx_zone", "hostname"),
+        {"mysql_engine": "InnoDB"},
+    )
 
     idx_device = Column(
         BIGINT(20, unsigned=True), primary_key=True, unique=True
@@ -177,7 +251,7 @@ class Device(BASE):
     sys_objectid = Column(VARBINARY(256), nullable=True, default=Null)
     sys_uptime = Column(BIGINT(20, unsigned=True))
     last_polled = Column(BIGINT(20, unsigned=True))
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -200,12 +274,56 @@ class Device(BASE):
     )
 
 
+class DeviceHash(BASE):
+    """Database table definition."""
+
+    __tablename__ = "smap_devicehash"
+    __table_args__ = (
+        UniqueConstraint("section", "idx_device"),
+        {"mysql_engine": "InnoDB"},
+    )
+
+    idx_devicehash = Column(
+        BIGINT(20, unsigned=True), primary_key=True, unique=True
+    )
+    idx_device = Column(
+        ForeignKey(Device.idx_device, ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+        default=1,
+        server_default=text("1"),
+    )
+    section = Column(VARBINARY(256), nullable=True, default=Null)
+    hash = Column(VARBINARY(256), nullable=True, default=Null)
+    enabled = Column(Bit(1), default=1)
+    ts_modified = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.now,
+    )
+    ts_created = Column(
+        DateTime, nullable=False, default=datetime.datetime.utcnow
+    )
+
+    # Define relationships from child to parent
+    # (with backref to plural variable in parent table definition)
+    device = relationship(
+        "Device",
+        backref=backref(
+            "devicehashes",
+            cascade="all, delete, delete-orphan",
+            passive_deletes=True,
+        ),
+    )
+
+
 class L1Interface(BASE):
     """Database table definition."""
 
     __tablename__ = "smap_l1interface"
     __table_args__ = (
-        UniqueConstraint("ifindex", "idx_device"),
+        UniqueConstraint("idx_device", "ifindex"),
         {"mysql_engine": "InnoDB"},
     )
 
@@ -221,9 +339,9 @@ class L1Interface(BASE):
     )
     ifindex = Column(BIGINT(unsigned=True), nullable=True, default=Null)
     duplex = Column(BIGINT(unsigned=True), nullable=True, default=Null)
-    ethernet = Column(BIT(1), default=0)
+    ethernet = Column(Bit(1), default=0)
     nativevlan = Column(BIGINT(unsigned=True), nullable=True, default=Null)
-    trunk = Column(BIT(1), default=0)
+    trunk = Column(Bit(1), default=0)
     ifspeed = Column(BIGINT(unsigned=True), nullable=True, default=Null)
     iftype = Column(BIGINT(unsigned=True), nullable=True, default=Null)
     ifname = Column(VARBINARY(256), nullable=True, default=Null)
@@ -239,7 +357,7 @@ class L1Interface(BASE):
     lldpremsyscapenabled = Column(VARBINARY(256), nullable=True, default=Null)
     lldpremsysdesc = Column(VARBINARY(2048), nullable=True, default=Null)
     lldpremsysname = Column(VARBINARY(256), nullable=True, default=Null)
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -267,7 +385,7 @@ class Vlan(BASE):
 
     __tablename__ = "smap_vlan"
     __table_args__ = (
-        UniqueConstraint("vlan", "idx_device"),
+        UniqueConstraint("idx_device", "vlan"),
         {"mysql_engine": "InnoDB"},
     )
 
@@ -284,7 +402,7 @@ class Vlan(BASE):
     )
     name = Column(VARBINARY(256), nullable=True, default=Null)
     state = Column(BIGINT(unsigned=True), nullable=True, default=Null)
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -333,7 +451,7 @@ class VlanPort(BASE):
         default=1,
         server_default=text("1"),
     )
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -370,7 +488,7 @@ class Mac(BASE):
 
     __tablename__ = "smap_mac"
     __table_args__ = (
-        UniqueConstraint("mac", "idx_zone"),
+        UniqueConstraint("idx_zone", "mac"),
         {"mysql_engine": "InnoDB"},
     )
 
@@ -389,8 +507,8 @@ class Mac(BASE):
         default=1,
         server_default=text("1"),
     )
-    mac = Column(VARBINARY(256), nullable=True, default=Null, index=True)
-    enabled = Column(BIT(1), default=1)
+    mac = Column(BIGINT(unsigned=True), nullable=True, default=Null, index=True)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -422,7 +540,7 @@ class MacPort(BASE):
 
     __tablename__ = "smap_macport"
     __table_args__ = (
-        UniqueConstraint("idx_l1interface", "idx_mac"),
+        UniqueConstraint("idx_mac", "idx_l1interface"),
         {"mysql_engine": "InnoDB"},
     )
 
@@ -443,7 +561,7 @@ class MacPort(BASE):
         default=1,
         server_default=text("1"),
     )
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -492,10 +610,10 @@ class Ip(BASE):
         default=1,
         server_default=text("1"),
     )
-    address = Column(VARBINARY(256), nullable=True, default=Null, index=True)
+    address = Column(VARBINARY(16), nullable=True, default=Null, index=True)
     version = Column(BIGINT(unsigned=True), nullable=True, default=Null)
     hostname = Column(VARBINARY(256), nullable=True, default=Null, index=True)
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -544,7 +662,7 @@ class IpPort(BASE):
         default=1,
         server_default=text("1"),
     )
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -581,7 +699,7 @@ class MacIp(BASE):
 
     __tablename__ = "smap_macip"
     __table_args__ = (
-        UniqueConstraint("idx_ip", "idx_mac"),
+        UniqueConstraint("idx_mac", "idx_ip"),
         {"mysql_engine": "InnoDB"},
     )
 
@@ -600,7 +718,7 @@ class MacIp(BASE):
         default=1,
         server_default=text("1"),
     )
-    enabled = Column(BIT(1), default=1)
+    enabled = Column(Bit(1), default=1)
     ts_modified = Column(
         DateTime,
         nullable=False,
@@ -632,6 +750,182 @@ class MacIp(BASE):
     )
 
 
+class ZoneSummary(BASE):
+    """Database table definition.
+
+    Counts of the devices, ports and addresses of a zone. The rows are
+    updated at the end of each ingest.
+
+    """
+
+    __tablename__ = "smap_zonesummary"
+    __table_args__ = ({"mysql_engine": "InnoDB"},)
+
+    idx_zonesummary = Column(
+        BIGINT(20, unsigned=True), primary_key=True, unique=True
+    )
+    idx_event = Column(
+        ForeignKey(Event.idx_event, ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+        default=1,
+        server_default=text("1"),
+    )
+    idx_zone = Column(
+        ForeignKey(Zone.idx_zone, ondelete="CASCADE"),
+        nullable=True,
+        unique=True,
+        default=1,
+        server_default=text("1"),
+    )
+    devices = Column(BIGINT(unsigned=True), default=0)
+    ports = Column(BIGINT(unsigned=True), default=0)
+    ports_active = Column(BIGINT(unsigned=True), default=0)
+    ports_inactive = Column(BIGINT(unsigned=True), default=0)
+    ports_disabled = Column(BIGINT(unsigned=True), default=0)
+    ports_idle = Column(BIGINT(unsigned=True), default=0)
+    trunks = Column(BIGINT(unsigned=True), default=0)
+    vlans = Column(BIGINT(unsigned=True), default=0)
+    macs = Column(BIGINT(unsigned=True), default=0)
+    ips = Column(BIGINT(unsigned=True), default=0)
+    arp_entries = Column(BIGINT(unsigned=True), default=0)
+    idle_days = Column(BIGINT(unsigned=True), default=0)
+    enabled = Column(Bit(1), default=1)
+    ts_modified = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.now,
+    )
+    ts_created = Column(
+        DateTime, nullable=False, default=datetime.datetime.utcnow
+    )
+
+    # Define relationships from child to parent
+    # (with backref to plural variable in parent table definition)
+    event = relationship(
+        "Event",
+        backref=backref(
+            "zonesummaries",
+            cascade="all, delete, delete-orphan",
+            passive_deletes=True,
+        ),
+    )
+
+    zone = relationship(
+        "Zone",
+        backref=backref(
+            "summary",
+            uselist=False,
+            cascade="all, delete, delete-orphan",
+            passive_deletes=True,
+        ),
+    )
+
+
+class DeviceSummary(BASE):
+    """Database table definition.
+
+    Counts of the ports and addresses of a device. The rows are updated at
+    the end of each ingest.
+
+    """
+
+    __tablename__ = "smap_devicesummary"
+    __table_args__ = ({"mysql_engine": "InnoDB"},)
+
+    idx_devicesummary = Column(
+        BIGINT(20, unsigned=True), primary_key=True, unique=True
+    )
+    idx_zone = Column(
+        ForeignKey(Zone.idx_zone, ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+        default=1,
+        server_default=text("1"),
+    )
+    idx_device = Column(
+        ForeignKey(Device.idx_device, ondelete="CASCADE"),
+        nullable=True,
+        unique=True,
+        default=1,
+        server_default=text("1"),
+    )
+    ports = Column(BIGINT(unsigned=True), default=0)
+    ports_active = Column(BIGINT(unsigned=True), default=0)
+    ports_inactive = Column(BIGINT(unsigned=True), default=0)
+    ports_disabled = Column(BIGINT(unsigned=True), default=0)
+    ports_idle = Column(BIGINT(unsigned=True), default=0)
+    trunks = Column(BIGINT(unsigned=True), default=0)
+    vlans = Column(BIGINT(unsigned=True), default=0)
+    macs = Column(BIGINT(unsigned=True), default=0)
+    ips = Column(BIGINT(unsigned=True), default=0)
+    idle_days = Column(BIGINT(unsigned=True), default=0)
+    enabled = Column(Bit(1), default=1)
+    ts_modified = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.now,
+    )
+    ts_created = Column(
+        DateTime, nullable=False, default=datetime.datetime.utcnow
+    )
+
+    # Define relationships from child to parent
+    # (with backref to plural variable in parent table definition)
+    zone = relationship(
+        "Zone",
+        backref=backref(
+            "devicesummaries",
+            cascade="all, delete, delete-orphan",
+            passive_deletes=True,
+        ),
+    )
+
+    device = relationship(
+        "Device",
+        backref=backref(
+            "summary",
+            uselist=False,
+            cascade="all, delete, delete-orphan",
+            passive_deletes=True,
+        ),
+    )
+
+
+class InterfaceState(BASE):
+    """Database table definition.
+
+    State of interfaces carried forward between events.
+
+    """
+
+    __tablename__ = "smap_interfacestate"
+    __table_args__ = (
+        UniqueConstraint("zone", "hostname", "ifname"),
+        {"mysql_engine": "InnoDB"},
+    )
+
+    idx_interfacestate = Column(
+        BIGINT(20, unsigned=True), primary_key=True, unique=True
+    )
+    zone = Column(VARBINARY(256), nullable=True, default=Null)
+    hostname = Column(VARBINARY(256), nullable=True, default=Null)
+    ifname = Column(VARBINARY(256), nullable=True, default=Null)
+    ts_idle = Column(BIGINT(unsigned=True), nullable=True, default=Null)
+    enabled = Column(Bit(1), default=1)
+    ts_modified = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.now,
+    )
+    ts_created = Column(
+        DateTime, nullable=False, default=datetime.datetime.utcnow
+    )
+
+
 def create_all_tables():
     """Ensure all tables are created.
 
@@ -644,3 +938,4 @@ def create_all_tables():
     with ENGINE.connect() as connection:
         with Session(bind=connection) as session:
             BASE.metadata.create_all(session.get_bind(), checkfirst=True)
+        connection.commit()
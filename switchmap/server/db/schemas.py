@@ -15,6 +15,9 @@ from graphene import relay
 from graphene_sqlalchemy import SQLAlchemyObjectType
 from graphene_sqlalchemy.fields import BatchSQLAlchemyConnectionField
 
+# Import loaders
+from switchmap.server.db import loaders
+
 # Import models
 from switchmap.server.db.models import (
     Event as EventModel,
@@ -30,6 +33,8 @@ from switchmap.server.db.models import (
     VlanPort as VlanPortModel,
     Ip as IpModel,
     IpPort as IpPortModel,
+    ZoneSummary as ZoneSummaryModel,
+    DeviceSummary as DeviceSummaryModel,
 )
 
 # Import attributes
@@ -47,6 +52,8 @@ from switchmap.server.db.attributes import (
     ZoneAttribute,
     IpAttribute,
     IpPortAttribute,
+    ZoneSummaryAttribute,
+    DeviceSummaryAttribute,
 )
 
 ###############################################################################
@@ -83,6 +90,9 @@ class Device(SQLAlchemyObjectType, DeviceAttribute):
         model = DeviceModel
         interfaces = (graphene.relay.Node,)
 
+        # Section hashes are only used to skip unchanged ingest data
+        exclude_fields = ("devicehashes",)
+
 
 class Ip(SQLAlchemyObjectType, IpAttribute):
     """Ip node."""
@@ -113,6 +123,11 @@ class L1Interface(SQLAlchemyObjectType, L1InterfaceAttribute):
         model = L1InterfaceModel
         interfaces = (graphene.relay.Node,)
 
+    # Load the relationships of the nodes of the request in batches
+    resolve_device = loaders.resolver("device")
+    resolve_macports = loaders.resolver("macports")
+    resolve_vlanports = loaders.resolver("vlanports")
+
 
 class Mac(SQLAlchemyObjectType, MacAttribute):
     """Mac node."""
@@ -123,6 +138,10 @@ class Mac(SQLAlchemyObjectType, MacAttribute):
         model = MacModel
         interfaces = (graphene.relay.Node,)
 
+    # Load the relationships of the nodes of the request in batches
+    resolve_oui = loaders.resolver("oui")
+    resolve_macips = loaders.resolver("macips")
+
 
 class Zone(SQLAlchemyObjectType, ZoneAttribute):
     """Zone node."""
@@ -143,6 +162,9 @@ class MacIp(SQLAlchemyObjectType, MacIpAttribute):
         model = MacIpModel
         interfaces = (graphene.relay.Node,)
 
+    # Load the relationships of the nodes of the request in batches
+    resolve_ips = loaders.resolver("ips")
+
 
 class MacPort(SQLAlchemyObjectType, MacPortAttribute):
     """MacPort node."""
@@ -153,6 +175,9 @@ class MacPort(SQLAlchemyObjectType, MacPortAttribute):
         model = MacPortModel
         interfaces = (graphene.relay.Node,)
 
+    # Load the relationships of the nodes of the request in batches
+    resolve_macs = loaders.resolver("macs")
+
 
 class Oui(SQLAlchemyObjectType, OuiAttribute):
     """Oui node."""
@@ -183,6 +208,29 @@ class VlanPort(SQLAlchemyObjectType, VlanPortAttribute):
         model = VlanPortModel
         interfaces = (graphene.relay.Node,)
 
+    # Load the relationships of the nodes of the request in batches
+    resolve_vlans = loaders.resolver("vlans")
+
+
+class ZoneSummary(SQLAlchemyObjectType, ZoneSummaryAttribute):
+    """ZoneSummary node."""
+
+    class Meta:
+        """Define the metadata."""
+
+        model = ZoneSummaryModel
+        interfaces = (graphene.relay.Node,)
+
+
+class DeviceSummary(SQLAlchemyObjectType, DeviceSummaryAttribute):
+    """DeviceSummary node."""
+
+    class Meta:
+        """Define the metadata."""
+
+        model = DeviceSummaryModel
+        interfaces = (graphene.relay.Node,)
+
 
 class Query(graphene.ObjectType):
     """Define GraphQL queries."""
@@ -241,6 +289,16 @@ class Query(graphene.ObjectType):
     vlanport = graphene.relay.Node.Field(VlanPort)
     vlanports = BatchSQLAlchemyConnectionField(VlanPort.connection)
 
+    # Results as a single entry filtered by 'id' and as a list
+    zonesummary = graphene.relay.Node.Field(ZoneSummary)
+    zonesummaries = BatchSQLAlchemyConnectionField(ZoneSummary.connection)
+
+    # Results as a single entry filtered by 'id' and as a list
+    devicesummary = graphene.relay.Node.Field(DeviceSummary)
+    devicesummaries = BatchSQLAlchemyConnectionField(
+        DeviceSummary.connection
+    )
+
 
 # Make the schema global
 SCHEMA = graphene.Schema(query=Query)
@@ -43,6 +43,12 @@ IDevice = namedtuple(
 sys_description sys_objectid sys_uptime last_polled enabled""",
 )
 
+RDeviceHash = namedtuple(
+    "RDeviceHash",
+    "idx_devicehash idx_device section hash enabled ts_modified ts_created",
+)
+IDeviceHash = namedtuple("IDeviceHash", "idx_device section hash enabled")
+
 RL1Interface = namedtuple(
     "RL1Interface",
     """idx_l1interface idx_device ifindex duplex ethernet nativevlan trunk \
@@ -59,6 +65,15 @@ cdpcachedeviceport cdpcacheplatform lldpremportdesc lldpremsyscapenabled \
 lldpremsysdesc lldpremsysname enabled""",
 )
 
+RInterfaceState = namedtuple(
+    "RInterfaceState",
+    """idx_interfacestate zone hostname ifname ts_idle enabled ts_modified \
+ts_created""",
+)
+IInterfaceState = namedtuple(
+    "IInterfaceState", "zone hostname ifname ts_idle enabled"
+)
+
 RVlan = namedtuple(
     "RVlan",
     "idx_vlan idx_device vlan name state enabled ts_modified ts_created",
@@ -0,0 +1,82 @@
+"""Module for querying the DeviceHash table."""
+
+from sqlalchemy import select
+
+# Import project libraries
+from switchmap.server.db import db
+from switchmap.server.db.models import DeviceHash
+from switchmap.server.db.misc import rows as _rows
+
+
+def hashes(idx_device):
+    """Get the content hashes of the data sections of a device.
+
+    Args:
+        idx_device: Device index
+
+    Returns:
+        result: Dict of hashes keyed by section
+
+    """
+    # Initialize key variables
+    result = {}
+    rows = []
+
+    # Get the hashes from the database
+    statement = select(DeviceHash).where(DeviceHash.idx_device == idx_device)
+    rows = db.db_select_row(2067, statement)
+
+    # Return
+    for row in rows:
+        item = _rows.devicehash(row)
+        result[item.section] = item.hash
+    return result
+
+
+def insert_row(rows):
+    """Create a DeviceHash table entry.
+
+    Args:
+        rows: IDeviceHash objects
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    inserts = []
+
+    # Create list
+    if isinstance(rows, list) is False:
+        rows = [rows]
+
+    # Remove any duplicates
+    rows = list(set(rows))
+
+    # Create objects
+    for row in rows:
+        inserts.append(DeviceHash(**values(row)))
+
+    # Insert
+    if bool(inserts):
+        db.db_add_all(2068, inserts)
+
+
+def values(row):
+    """Get the DeviceHash table column values of a row.
+
+    Args:
+        row: IDeviceHash object
+
+    Returns:
+        result: Dict of column values keyed by column name
+
+    """
+    # Get values
+    result = {
+        "idx_device": row.idx_device,
+        "section": row.section.encode(),
+        "hash": row.hash.encode(),
+        "enabled": int(bool(row.enabled) is True),
+    }
+    return result
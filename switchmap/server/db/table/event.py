@@ -6,15 +6,43 @@ from operator import attrgetter
 
 # PIP imports
 from sqlalchemy import select, update, delete as _delete
+from sqlalchemy import and_, literal
+from sqlalchemy.orm import aliased
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
+from switchmap.server.db import cache
 from switchmap.server.db.models import Event
+from switchmap.server.db.models import Zone
+from switchmap.server.db.models import Device
+from switchmap.server.db.models import DeviceHash
+from switchmap.server.db.models import L1Interface
+from switchmap.server.db.models import Vlan
+from switchmap.server.db.models import VlanPort
+from switchmap.server.db.models import MacPort
+from switchmap.server.db.models import IpPort
+from switchmap.server.db.models import Mac
+from switchmap.server.db.models import MacIp
+from switchmap.server.db.models import Ip
+from switchmap.server.db.models import ZoneSummary
+from switchmap.server.db.models import DeviceSummary
 from switchmap.server.db.misc import rows as _rows
 
 from switchmap.server.db.models import Root
 from switchmap.server.db.table import IEvent
 from switchmap.server.db.table import IRoot
+from switchmap.server.db.table import IZone
+from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import IDeviceHash
+from switchmap.server.db.table import IL1Interface
+from switchmap.server.db.table import IVlan
+from switchmap.server.db.table import IVlanPort
+from switchmap.server.db.table import IMac
+from switchmap.server.db.table import IMacPort
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IIpPort
+from switchmap.server.db.table import IMacIp
 from switchmap.server.db.table import root
 from switchmap.core import general
 
@@ -122,6 +150,7 @@ def update_row(idx, row):
         .values(
             {
                 "name": row.name.encode(),
+                "epoch_utc": row.epoch_utc,
                 "enabled": int(bool(row.enabled) is True),
             }
         )
@@ -153,11 +182,14 @@ def events():
     return result
 
 
-def delete(idx):
+def delete(idx, chunked=True):
     """Delete event.
 
     Args:
         idx: idx_event
+        chunked: Delete the rows of the event from the bottom of the table
+            hierarchy upwards in chunks if True. A single cascading delete
+            of the Event row is made otherwise.
 
     Returns:
         None
@@ -171,6 +203,10 @@ def delete(idx):
     # Don't delete the very first record.
     # This must always exist for polling to work correctly
     if idx != 1:
+        # Delete the dependent rows in short transactions
+        if bool(chunked) is True:
+            _delete_children(idx)
+
         # Delete data
         statement = _delete(Event).where(Event.idx_event == idx)
         db.db_delete(1055, statement)
@@ -215,6 +251,76 @@ def create(name=None):
     return result
 
 
+def copy(idx_source, idx_target):
+    """Copy the rows that depend on an event to another event.
+
+    The rows are copied by the database server with INSERT ... SELECT
+    statements in a single transaction. Their foreign keys are remapped to
+    the copied parent rows, which are matched by the columns that identify
+    them within their parent.
+
+    Args:
+        idx_source: idx_event of the event to copy
+        idx_target: idx_event of the event to copy to
+
+    Returns:
+        None
+
+    """
+    # Map the primary keys of the source rows to those of their copies
+    _events = select(
+        literal(idx_source).label("old"), literal(idx_target).label("new")
+    ).subquery()
+    zones = _map(_events, Zone, "idx_zone", "idx_event", ["name"])
+    devices = _map(zones, Device, "idx_device", "idx_zone", ["hostname"])
+    l1interfaces = _map(
+        devices, L1Interface, "idx_l1interface", "idx_device", ["ifindex"]
+    )
+    vlans = _map(devices, Vlan, "idx_vlan", "idx_device", ["vlan"])
+    macs = _map(zones, Mac, "idx_mac", "idx_zone", ["mac"])
+    ips = _map(zones, Ip, "idx_ip", "idx_zone", ["address"])
+
+    # Copy the rows from the top of the table hierarchy downwards
+    with db.db_transaction(2116) as connection:
+        _copy(2117, connection, Zone, IZone, {"idx_event": _events})
+        _copy(2118, connection, Device, IDevice, {"idx_zone": zones})
+        _copy(
+            2119, connection, DeviceHash, IDeviceHash, {"idx_device": devices}
+        )
+        _copy(
+            2120,
+            connection,
+            L1Interface,
+            IL1Interface,
+            {"idx_device": devices},
+        )
+        _copy(2121, connection, Vlan, IVlan, {"idx_device": devices})
+        _copy(
+            2122,
+            connection,
+            VlanPort,
+            IVlanPort,
+            {"idx_l1interface": l1interfaces, "idx_vlan": vlans},
+        )
+        _copy(2123, connection, Mac, IMac, {"idx_zone": zones})
+        _copy(2124, connection, Ip, IIp, {"idx_zone": zones})
+        _copy(
+            2125,
+            connection,
+            MacPort,
+            IMacPort,
+            {"idx_l1interface": l1interfaces, "idx_mac": macs},
+        )
+        _copy(
+            2126,
+            connection,
+            IpPort,
+            IIpPort,
+            {"idx_l1interface": l1interfaces, "idx_ip": ips},
+        )
+        _copy(2127, connection, MacIp, IMacIp, {"idx_mac": macs, "idx_ip": ips})
+
+
 def purge():
     """Purge all events except the most recent two.
 
@@ -240,3 +346,137 @@ def purge():
             continue
         else:
             delete(item.idx_event)
+
+    # Remove the cached GraphQL responses of the purged events
+    cache.purge()
+
+
+def _delete_children(idx):
+    """Delete the rows that depend on an event in chunks.
+
+    Rows are deleted from the bottom of the table hierarchy upwards, so that
+    each statement only deletes a bounded number of rows in its own
+    transaction instead of cascading through all the tables at once.
+
+    Args:
+        idx: idx_event
+
+    Returns:
+        None
+
+    """
+    # Get the indexes of the parent rows
+    idx_zones = _indexes(2036, Zone.idx_zone, Zone.idx_event, [idx])
+    idx_devices = _indexes(2037, Device.idx_device, Device.idx_zone, idx_zones)
+    idx_l1interfaces = _indexes(
+        2038, L1Interface.idx_l1interface, L1Interface.idx_device, idx_devices
+    )
+    idx_macs = _indexes(2039, Mac.idx_mac, Mac.idx_zone, idx_zones)
+    idx_ips = _indexes(2040, Ip.idx_ip, Ip.idx_zone, idx_zones)
+
+    # Delete the rows of the event from the bottom up
+    db.db_delete_in(2041, MacPort.idx_l1interface, idx_l1interfaces)
+    db.db_delete_in(2042, VlanPort.idx_l1interface, idx_l1interfaces)
+    db.db_delete_in(2043, IpPort.idx_l1interface, idx_l1interfaces)
+    db.db_delete_in(2044, MacIp.idx_mac, idx_macs)
+    db.db_delete_in(2045, L1Interface.idx_l1interface, idx_l1interfaces)
+    db.db_delete_in(2046, Vlan.idx_device, idx_devices)
+    db.db_delete_in(2069, DeviceHash.idx_device, idx_devices)
+    db.db_delete_in(2111, DeviceSummary.idx_device, idx_devices)
+    db.db_delete_in(2047, Device.idx_device, idx_devices)
+    db.db_delete_in(2048, Mac.idx_mac, idx_macs)
+    db.db_delete_in(2049, Ip.idx_ip, idx_ips)
+    db.db_delete_in(2112, ZoneSummary.idx_zone, idx_zones)
+    db.db_delete_in(2050, Zone.idx_zone, idx_zones)
+
+
+def _indexes(error_code, column, parent, values):
+    """Get the primary keys of the rows that reference parent rows.
+
+    Args:
+        error_code: Error code to use in messages
+        column: ORM primary key column of the rows
+        parent: ORM foreign key column of the rows
+        values: List of primary keys of the parent rows
+
+    Returns:
+        result: List of primary keys
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Get data in chunks
+    for chunk in mit.chunked(sorted(set(values)), db.CHUNK_SIZE):
+        statement = select(column).where(parent.in_(chunk))
+        rows = db.db_select(error_code, statement)
+        result.extend(row[column.key] for row in rows)
+
+    # Return
+    return result
+
+
+def _map(parents, model, key, parent, columns):
+    """Create a subquery that maps the primary keys of copied rows.
+
+    Args:
+        parents: Subquery mapping the "old" primary keys of the parent rows
+            to the "new" primary keys of their copies
+        model: ORM model class of the table
+        key: Name of the primary key column of the table
+        parent: Name of the foreign key column of the parent rows
+        columns: Names of the columns that identify a row of the parent
+
+    Returns:
+        result: Subquery of "old" and "new" primary keys
+
+    """
+    # Initialize key variables
+    old = aliased(model)
+    new = aliased(model)
+
+    # Return
+    result = (
+        select(getattr(old, key).label("old"), getattr(new, key).label("new"))
+        .where(
+            and_(
+                getattr(old, parent) == parents.c.old,
+                getattr(new, parent) == parents.c.new,
+                *[getattr(new, _) == getattr(old, _) for _ in columns]
+            )
+        )
+        .subquery()
+    )
+    return result
+
+
+def _copy(error_code, connection, model, fields, parents):
+    """Copy the rows of a table to the copies of their parent rows.
+
+    Args:
+        error_code: Error code to use in messages
+        connection: Connection of a db_transaction()
+        model: ORM model class of the table
+        fields: Namedtuple class of the table columns to copy
+        parents: Dict of subqueries created by _map() keyed by the name of
+            the foreign key column they remap
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    columns = list(fields._fields)
+
+    # Copy
+    statement = select(
+        *[
+            parents[_].c.new if _ in parents else getattr(model, _)
+            for _ in columns
+        ]
+    ).where(
+        and_(
+            *[getattr(model, _) == value.c.old for _, value in parents.items()]
+        )
+    )
+    db.db_insert_select(error_code, connection, model, columns, statement)
@@ -0,0 +1,89 @@
+"""Module for querying the InterfaceState table."""
+
+from sqlalchemy import select, and_
+
+# Import project libraries
+from switchmap.server.db import db
+from switchmap.server.db.models import InterfaceState
+from switchmap.server.db.misc import rows as _rows
+
+
+def states(zone, hostname):
+    """Get the carried forward state of all the interfaces of a device.
+
+    Args:
+        zone: Zone name
+        hostname: Device hostname
+
+    Returns:
+        result: Dict of RInterfaceState tuples keyed by ifname
+
+    """
+    # Initialize key variables
+    result = {}
+    rows = []
+
+    # Get the states from the database
+    statement = select(InterfaceState).where(
+        and_(
+            InterfaceState.zone == zone.encode(),
+            InterfaceState.hostname == hostname.encode(),
+        )
+    )
+    rows = db.db_select_row(2076, statement)
+
+    # Return
+    for row in rows:
+        item = _rows.interfacestate(row)
+        result[item.ifname] = item
+    return result
+
+
+def insert_row(rows):
+    """Create an InterfaceState table entry.
+
+    Args:
+        rows: IInterfaceState objects
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    inserts = []
+
+    # Create list
+    if isinstance(rows, list) is False:
+        rows = [rows]
+
+    # Remove any duplicates
+    rows = list(set(rows))
+
+    # Create objects
+    for row in rows:
+        inserts.append(InterfaceState(**values(row)))
+
+    # Insert
+    if bool(inserts):
+        db.db_add_all(2077, inserts)
+
+
+def values(row):
+    """Get the InterfaceState table column values of a row.
+
+    Args:
+        row: IInterfaceState object
+
+    Returns:
+        result: Dict of column values keyed by column name
+
+    """
+    # Get values
+    result = {
+        "zone": row.zone.encode(),
+        "hostname": row.hostname.encode(),
+        "ifname": row.ifname.encode(),
+        "ts_idle": row.ts_idle,
+        "enabled": int(bool(row.enabled) is True),
+    }
+    return result
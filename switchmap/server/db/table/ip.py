@@ -1,10 +1,11 @@
 """Module for querying the Ip table."""
 
 from sqlalchemy import select, update, null, and_, func
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
-from switchmap.server.db.models import Ip
+from switchmap.server.db.models import Ip, Root, Zone
 from switchmap.server.db.misc import rows as _rows
 from switchmap.core import general
 
@@ -54,7 +55,10 @@ def exists(idx_zone, _ip):
 
     # Get row from dataase
     statement = select(Ip).where(
-        and_(Ip.address == ip.address.encode(), Ip.idx_zone == idx_zone)
+        and_(
+            Ip.address == general.ip_2_packed(ip.address),
+            Ip.idx_zone == idx_zone,
+        )
     )
     rows = db.db_select_row(1073, statement)
 
@@ -65,6 +69,30 @@ def exists(idx_zone, _ip):
     return result
 
 
+def ips(idx_zone):
+    """Get all the IP addresses of a zone.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: List of RIp tuples
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get rows from the database
+    statement = select(Ip).where(Ip.idx_zone == idx_zone)
+    rows = db.db_select_row(2023, statement)
+
+    # Return
+    for row in rows:
+        result.append(_rows.ip(row))
+    return result
+
+
 def findhostname(idx_zone, hostname):
     """Determine whether hostname exists in the Ip table.
 
@@ -83,9 +111,7 @@ def findhostname(idx_zone, hostname):
     # Get row from dataase
     statement = select(Ip).where(
         and_(
-            Ip.hostname.like(
-                func.concat(func.concat("%", hostname.encode(), "%"))
-            ),
+            func.instr(Ip.hostname, hostname.encode()) > 0,
             Ip.idx_zone == idx_zone,
         )
     )
@@ -121,14 +147,14 @@ def findip(idx_zone, ips):
         for item in ips:
             ip_ = general.ipaddress(item)
             if bool(ip_):
-                all_ips.append(general.ipaddress(item).address.encode())
+                all_ips.append(general.ip_2_packed(ip_.address))
 
-        # Get row from dataase
-        if bool(all_ips):
+        # Get rows from the database in chunks to limit the query size
+        for chunk in mit.chunked(sorted(set(all_ips)), db.CHUNK_SIZE):
             statement = select(Ip).where(
-                and_(Ip.address.in_(all_ips), Ip.idx_zone == idx_zone)
+                and_(Ip.address.in_(chunk), Ip.idx_zone == idx_zone)
             )
-            rows = db.db_select_row(1068, statement)
+            rows.extend(db.db_select_row(1068, statement))
 
     # Return
     for row in rows:
@@ -136,6 +162,53 @@ def findip(idx_zone, ips):
     return result
 
 
+def hostnames(addresses):
+    """Get the hostnames of IP addresses recorded in the current event.
+
+    Args:
+        addresses: List of IP addresses
+
+    Returns:
+        result: Dict of hostnames keyed by IP address. Addresses without a
+            recorded hostname are not included.
+
+    """
+    # Initialize key variables
+    result = {}
+    rows = []
+    all_ips = []
+    idx_event = (
+        select(Root.idx_event).where(Root.idx_root == 1).scalar_subquery()
+    )
+
+    # Fix the IP addresses
+    for item in addresses:
+        ip_ = general.ipaddress(item)
+        if bool(ip_):
+            all_ips.append(general.ip_2_packed(ip_.address))
+
+    # Get rows from the database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(all_ips)), db.CHUNK_SIZE):
+        statement = (
+            select(Ip.address, Ip.hostname)
+            .join(Zone, Ip.idx_zone == Zone.idx_zone)
+            .where(
+                and_(
+                    Zone.idx_event == idx_event,
+                    Ip.address.in_(chunk),
+                    Ip.hostname.isnot(None),
+                )
+            )
+            .order_by(Ip.idx_ip)
+        )
+        rows.extend(db.db_select(2020, statement))
+
+    # Return. Newer rows replace older ones
+    for row in rows:
+        result[general.packed_2_ip(row.address)] = row.hostname.decode()
+    return result
+
+
 def insert_row(rows):
     """Create a Ip table entry.
 
@@ -171,7 +244,11 @@ def insert_row(rows):
                     else row.hostname.encode()
                 ),
                 version=row.version,
-                address=(null() if bool(ip) is False else ip.address.encode()),
+                address=(
+                    null()
+                    if bool(ip) is False
+                    else general.ip_2_packed(ip.address)
+                ),
                 enabled=int(bool(row.enabled) is True),
             )
         )
@@ -203,7 +280,9 @@ def update_row(idx, row):
             {
                 "idx_zone": row.idx_zone,
                 "address": (
-                    null() if bool(ip) is False else ip.address.encode()
+                    null()
+                    if bool(ip) is False
+                    else general.ip_2_packed(ip.address)
                 ),
                 "version": row.version,
                 "hostname": (
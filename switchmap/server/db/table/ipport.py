@@ -1,6 +1,7 @@
 """Module for querying the IpPort table."""
 
 from sqlalchemy import select, update, and_
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -88,6 +89,31 @@ def find_idx_ip(idx_ip):
     return result
 
 
+def find_idx_ips(idx_ips):
+    """Find all ports on which a list of IP addresses have been found.
+
+    Args:
+        idx_ips: List of Ip.idx_ip values
+
+    Returns:
+        result: List of RIpPort tuples
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get rows from the database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(idx_ips)), db.CHUNK_SIZE):
+        statement = select(IpPort).where(IpPort.idx_ip.in_(chunk))
+        rows.extend(db.db_select_row(2017, statement))
+
+    # Return
+    for row in rows:
+        result.append(_rows.ipport(row))
+    return result
+
+
 def insert_row(rows):
     """Create a IpPort table entry.
 
@@ -109,9 +109,7 @@ def findifalias(idx_device, ifalias):
     # Get row from database (Contains)
     statement = select(L1Interface).where(
         and_(
-            L1Interface.ifalias.like(
-                func.concat(func.concat("%", ifalias.encode(), "%"))
-            ),
+            func.instr(L1Interface.ifalias, ifalias.encode()) > 0,
             L1Interface.idx_device == idx_device,
         )
     )
@@ -221,6 +219,39 @@ def insert_row(rows):
         db.db_add_all(1154, inserts)
 
 
+def values(row):
+    """Get the L1Interface table column values of a row.
+
+    Args:
+        row: IL1Interface object
+
+    Returns:
+        result: Dict of column values keyed by column name
+
+    """
+    # Initialize key variables
+    encoded = [
+        "ifalias",
+        "ifname",
+        "ifdescr",
+        "cdpcachedeviceid",
+        "cdpcachedeviceport",
+        "cdpcacheplatform",
+        "lldpremportdesc",
+        "lldpremsyscapenabled",
+        "lldpremsysdesc",
+        "lldpremsysname",
+    ]
+
+    # Get values
+    result = row._asdict()
+    for key in encoded:
+        result[key] = None if result[key] is None else result[key].encode()
+    result["ts_idle"] = 0 if not bool(row.ts_idle) else row.ts_idle
+    result["enabled"] = int(bool(row.enabled) is True)
+    return result
+
+
 def update_row(idx, row):
     """Upadate a L1Interface table entry.
 
@@ -1,6 +1,7 @@
 """Module for querying the Mac table."""
 
 from sqlalchemy import select, update, null, and_
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -59,7 +60,9 @@ def exists(idx_zone, _mac):
 
     # Get row from dataase
     statement = select(Mac).where(
-        and_(Mac.mac == mac.encode(), Mac.idx_zone == idx_zone)
+        and_(
+            Mac.mac == general.mac_2_integer(mac), Mac.idx_zone == idx_zone
+        )
     )
     rows = db.db_select_row(1178, statement)
 
@@ -70,6 +73,30 @@ def exists(idx_zone, _mac):
     return result
 
 
+def macs(idx_zone):
+    """Get all the MAC addresses of a zone.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: List of RMac tuples
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get rows from the database
+    statement = select(Mac).where(Mac.idx_zone == idx_zone)
+    rows = db.db_select_row(2022, statement)
+
+    # Return
+    for row in rows:
+        result.append(_rows.mac(row))
+    return result
+
+
 def findmac(idx_zone, macs):
     """Determine whether MAC exists in the Mac table.
 
@@ -97,13 +124,14 @@ def findmac(idx_zone, macs):
                 continue
             else:
                 _mac_ = mactest.mac
-            all_macs.append(_mac_.encode())
+            all_macs.append(general.mac_2_integer(_mac_))
 
-        # Get row from dataase
-        statement = select(Mac).where(
-            and_(Mac.mac.in_(all_macs), Mac.idx_zone == idx_zone)
-        )
-        rows = db.db_select_row(1193, statement)
+        # Get rows from the database in chunks to limit the query size
+        for chunk in mit.chunked(sorted(set(all_macs)), db.CHUNK_SIZE):
+            statement = select(Mac).where(
+                and_(Mac.mac.in_(chunk), Mac.idx_zone == idx_zone)
+            )
+            rows.extend(db.db_select_row(1193, statement))
 
     # Return
     for row in rows:
@@ -111,6 +139,23 @@ def findmac(idx_zone, macs):
     return result
 
 
+def idx_macs(idx_zone, macs):
+    """Map MAC addresses to their Mac table indexes.
+
+    Args:
+        idx_zone: Zone index
+        macs: List of MAC addresses
+
+    Returns:
+        result: Dict of Mac.idx_mac values keyed by lowercase MAC address.
+            MAC addresses not in the table are not included.
+
+    """
+    # Return
+    result = {_.mac: _.idx_mac for _ in findmac(idx_zone, macs)}
+    return result
+
+
 def insert_row(rows):
     """Create a Mac table entry.
 
@@ -150,7 +195,7 @@ def insert_row(rows):
             Mac(
                 idx_oui=idx_oui,
                 idx_zone=row.idx_zone,
-                mac=(null() if bool(mac) is False else mac.encode()),
+                mac=general.mac_2_integer(mac),
                 enabled=int(bool(row.enabled) is True),
             )
         )
@@ -174,6 +219,7 @@ def update_row(idx, row):
     # Fix the MAC address
     mactest = general.mac(row.mac)
     mac = mactest.mac
+    value = general.mac_2_integer(mac)
 
     # Find the true idx_oui
     idx_oui = oui.idx_oui(mac)
@@ -186,7 +232,7 @@ def update_row(idx, row):
             {
                 "idx_oui": idx_oui,
                 "idx_zone": row.idx_zone,
-                "mac": (null() if bool(mac) is False else mac.encode()),
+                "mac": (null() if value is None else value),
                 "enabled": int(bool(row.enabled) is True),
             }
         )
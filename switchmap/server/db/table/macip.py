@@ -1,6 +1,7 @@
 """Module for querying the MacIp table."""
 
 from sqlalchemy import select, update, and_
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -131,6 +132,31 @@ def exists(idx_mac, idx_ip):
 #     return result
 
 
+def find_idx_macs(idx_macs):
+    """Find all the MacIp entries of a list of MAC addresses.
+
+    Args:
+        idx_macs: List of Mac.idx_mac values
+
+    Returns:
+        result: List of RMacIp tuples
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get rows from the database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(idx_macs)), db.CHUNK_SIZE):
+        statement = select(MacIp).where(MacIp.idx_mac.in_(chunk))
+        rows.extend(db.db_select_row(2015, statement))
+
+    # Return
+    for row in rows:
+        result.append(_rows.macip(row))
+    return result
+
+
 def insert_row(rows):
     """Create a MacIp table entry.
 
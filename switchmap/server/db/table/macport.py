@@ -1,6 +1,7 @@
 """Module for querying the MacPort table."""
 
 from sqlalchemy import select, update, and_
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -88,6 +89,31 @@ def find_idx_mac(idx_mac):
     return result
 
 
+def find_idx_macs(idx_macs):
+    """Find all ports on which a list of MAC addresses have been found.
+
+    Args:
+        idx_macs: List of Mac.idx_mac values
+
+    Returns:
+        result: List of RMacPort tuples
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get rows from the database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(idx_macs)), db.CHUNK_SIZE):
+        statement = select(MacPort).where(MacPort.idx_mac.in_(chunk))
+        rows.extend(db.db_select_row(2016, statement))
+
+    # Return
+    for row in rows:
+        result.append(_rows.macport(row))
+    return result
+
+
 def insert_row(rows):
     """Create a MacPort table entry.
 
@@ -123,6 +149,25 @@ def insert_row(rows):
         db.db_add_all(1092, inserts)
 
 
+def values(row):
+    """Get the MacPort table column values of a row.
+
+    Args:
+        row: IMacPort object
+
+    Returns:
+        result: Dict of column values keyed by column name
+
+    """
+    # Get values
+    result = {
+        "idx_l1interface": row.idx_l1interface,
+        "idx_mac": row.idx_mac,
+        "enabled": int(bool(row.enabled) is True),
+    }
+    return result
+
+
 def update_row(idx, row):
     """Upadate a MacPort table entry.
 
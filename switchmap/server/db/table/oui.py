@@ -1,12 +1,21 @@
 """Module for querying the Oui table."""
 
-from sqlalchemy import select, update, null
+import re
+import time
+
+from sqlalchemy import select, update, null, func
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import Oui
 from switchmap.server.db.misc import rows as _rows
 
+# Seconds between checks for changes to the Oui table
+REFRESH_INTERVAL = 60
+
+# Process-wide cache of OUI prefixes
+_CACHE = {"checked": 0, "signature": None, "prefixes": {"lengths": []}}
+
 
 def idx_oui(mac):
     """Get the idx_oui value.
@@ -21,13 +30,19 @@ def idx_oui(mac):
     # Initialize key variables
     result = 1
 
-    # Find the true idx_oui
+    # Find the true idx_oui using the longest matching prefix
     if bool(mac) is True:
-        statement = select(Oui.idx_oui).where(Oui.oui == mac[:6].encode())
-        items = db.db_select(1177, statement)
-        for item in items:
-            result = item.idx_oui
-            break
+        prefixes = _prefixes()
+        try:
+            for length in prefixes["lengths"]:
+                if len(mac) < length:
+                    continue
+                result = prefixes[length].get(int(mac[:length], 16))
+                if bool(result) is True:
+                    break
+        except ValueError:
+            pass
+        result = result if bool(result) is True else 1
     return result
 
 
@@ -118,6 +133,7 @@ def insert_row(rows):
     # Insert
     if bool(inserts):
         db.db_add_all(1096, inserts)
+        _CACHE["signature"] = None
 
 
 def update_row(idx, row):
@@ -148,6 +164,7 @@ def update_row(idx, row):
         )
     )
     db.db_update(1118, statement)
+    _CACHE["signature"] = None
 
 
 def ouis():
@@ -172,3 +189,71 @@ def ouis():
     for row in rows:
         result.append(_rows.oui(row))
     return result
+
+
+def _prefixes():
+    """Get the process-wide cache of OUI prefixes.
+
+    The cache is loaded once per process and is reloaded if the Oui table
+    has changed. The table is checked for changes at most once every
+    REFRESH_INTERVAL seconds.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of {prefix: idx_oui} dicts keyed by the number of
+            hexadecimal digits in the prefix. Prefixes are stored as the
+            integer value of their hexadecimal digits. Six digit (24 bit)
+            OUI prefixes are keyed by 6, MA-M and MA-S prefixes by 7 and 9.
+            The "lengths" key lists the lengths in descending order.
+
+    """
+    # Check whether the Oui table has changed
+    now = time.time()
+    if now - _CACHE["checked"] >= REFRESH_INTERVAL or (
+        _CACHE["signature"] is None
+    ):
+        _CACHE["checked"] = now
+        statement = select(func.count(Oui.idx_oui), func.max(Oui.ts_modified))
+        signature = tuple(db.db_select(2018, statement)[0].values())
+        if signature != _CACHE["signature"]:
+            _CACHE["prefixes"] = _load()
+            _CACHE["signature"] = signature
+
+    # Return
+    result = _CACHE["prefixes"]
+    return result
+
+
+def _load():
+    """Load all OUI prefixes from the Oui table.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of prefixes as described in _prefixes()
+
+    """
+    # Initialize key variables
+    result = {"lengths": []}
+
+    # Get data
+    statement = select(Oui.idx_oui, Oui.oui)
+    rows = db.db_select(2019, statement)
+
+    # Convert the prefixes to integers keyed by the number of digits
+    for row in rows:
+        if bool(row.oui) is False:
+            continue
+        prefix = re.sub(r"[^0-9a-f]", "", row.oui.decode().lower())
+        if len(prefix) < 6:
+            continue
+        result.setdefault(len(prefix), {})[int(prefix, 16)] = row.idx_oui
+
+    # Check longer prefixes first
+    result["lengths"] = sorted(
+        [_ for _ in result.keys() if _ != "lengths"], reverse=True
+    )
+    return result
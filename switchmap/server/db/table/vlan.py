@@ -122,6 +122,27 @@ def insert_row(rows):
         db.db_add_all(1093, inserts)
 
 
+def values(row):
+    """Get the Vlan table column values of a row.
+
+    Args:
+        row: IVlan object
+
+    Returns:
+        result: Dict of column values keyed by column name
+
+    """
+    # Get values
+    result = {
+        "idx_device": row.idx_device,
+        "vlan": row.vlan,
+        "name": None if bool(row.name) is False else row.name.encode(),
+        "state": None if bool(row.state) is False else row.state,
+        "enabled": int(bool(row.enabled) is True),
+    }
+    return result
+
+
 def update_row(idx, row):
     """Upadate a Vlan table entry.
 
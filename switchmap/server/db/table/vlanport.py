@@ -123,6 +123,25 @@ def insert_row(rows):
         db.db_add_all(1185, inserts)
 
 
+def values(row):
+    """Get the VlanPort table column values of a row.
+
+    Args:
+        row: IVlanPort object
+
+    Returns:
+        result: Dict of column values keyed by column name
+
+    """
+    # Get values
+    result = {
+        "idx_l1interface": row.idx_l1interface,
+        "idx_vlan": row.idx_vlan,
+        "enabled": int(bool(row.enabled) is True),
+    }
+    return result
+
+
 def update_row(idx, row):
     """Upadate a VlanPort table entry.
 
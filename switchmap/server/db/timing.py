@@ -0,0 +1,277 @@
+"""Database statement timing library.
+
+Statements are timed with SQLAlchemy cursor execute events. Each statement
+is attributed to the error code of the db module function that ran it.
+Error codes are unique to each call site, so they identify the code that
+made the query.
+
+    1) Durations are added to the switchmap_db_statement_seconds metric
+       histogram labelled by error code
+    2) Statements taking longer than a threshold are written to a slow query
+       log file
+
+"""
+
+# Standard imports
+import os
+import time
+import functools
+from collections import namedtuple
+from contextvars import ContextVar
+
+# PIP3 imports
+from sqlalchemy import event
+
+# Application imports
+from switchmap.core import log
+from switchmap.core import metrics
+
+# Error code of the db module function running in the current context
+_CODE = ContextVar("code", default=None)
+
+# Label of statements not run by db module functions
+_UNKNOWN = "unknown"
+
+StatementSummary = namedtuple(
+    "StatementSummary", "code count seconds p50 p95 p99"
+)
+
+
+def call_site(function):
+    """Attribute the statements of a db module function to its error code.
+
+    The error code must be the first argument of the function.
+
+    Args:
+        function: Function to decorate
+
+    Returns:
+        wrapper: Decorated function
+
+    """
+
+    @functools.wraps(function)
+    def wrapper(error_code, *args, **kwargs):
+        """Run the function with its error code as the call site.
+
+        Args:
+            error_code: Error code to use in messages
+            args: Positional arguments of the function
+            kwargs: Keyword arguments of the function
+
+        Returns:
+            result: Result of the function
+
+        """
+        # Run
+        token = _CODE.set(error_code)
+        try:
+            result = function(error_code, *args, **kwargs)
+        finally:
+            _CODE.reset(token)
+        return result
+
+    return wrapper
+
+
+def add_listeners(engine, threshold=0, filename=None):
+    """Time the statements of an engine.
+
+    Args:
+        engine: SQLalchemy engine instance
+        threshold: Seconds after which statements are written to the slow
+            query log. Zero disables the log.
+        filename: Slow query log file
+
+    Returns:
+        None
+
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        """Record the start time of a statement.
+
+        Args:
+            conn: SqlALchemy Connection object
+            cursor: DBAPI cursor object
+            statement: SQL statement
+            parameters: Parameters of the statement
+            context: SqlALchemy ExecutionContext object
+            executemany: True if the statement is run with many parameters
+
+        Returns:
+            None
+
+        """
+        # Update
+        context.switchmap_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        """Record the duration of a statement.
+
+        Args:
+            conn: SqlALchemy Connection object
+            cursor: DBAPI cursor object
+            statement: SQL statement
+            parameters: Parameters of the statement
+            context: SqlALchemy ExecutionContext object
+            executemany: True if the statement is run with many parameters
+
+        Returns:
+            None
+
+        """
+        # Get the duration
+        start = getattr(context, "switchmap_start", None)
+        if start is None:
+            return
+        seconds = time.perf_counter() - start
+        code = _CODE.get()
+        code = _UNKNOWN if code is None else code
+
+        # Update
+        metrics.DB_STATEMENT_SECONDS.labels(code=code).observe(seconds)
+        if bool(threshold) and bool(filename) and seconds >= threshold:
+            _slow(
+                filename,
+                code,
+                seconds,
+                statement,
+                len(parameters) if bool(executemany) else 1,
+            )
+
+
+def summary(before, after):
+    """Summarize the durations of statements by error code.
+
+    Args:
+        before: metrics.collect() result at the start of the period
+        after: metrics.collect() result at the end of the period
+
+    Returns:
+        result: List of StatementSummary objects for the period, sorted by
+            decreasing total duration
+
+    """
+    # Initialize key variables
+    result = []
+    name = metrics.DB_STATEMENT_SECONDS.name
+    counts = {}
+    totals = {}
+    buckets = {}
+
+    # Get the values of the period
+    for (sample, labels), value in after.items():
+        value = value - before.get((sample, labels), 0)
+        labels_ = dict(labels)
+        code = labels_.get("code")
+        if sample == "{}_count".format(name):
+            counts[code] = value
+        elif sample == "{}_sum".format(name):
+            totals[code] = value
+        elif sample == "{}_bucket".format(name):
+            buckets.setdefault(code, []).append(
+                (float(labels_["le"]), value)
+            )
+
+    # Summarize
+    for code, count in counts.items():
+        if count <= 0:
+            continue
+        result.append(
+            StatementSummary(
+                code=code,
+                count=int(count),
+                seconds=totals.get(code, 0),
+                p50=_quantile(0.5, buckets.get(code, [])),
+                p95=_quantile(0.95, buckets.get(code, [])),
+                p99=_quantile(0.99, buckets.get(code, [])),
+            )
+        )
+
+    # Return
+    result.sort(key=lambda _: _.seconds, reverse=True)
+    return result
+
+
+def _quantile(quantile, buckets):
+    """Estimate a quantile from the cumulative buckets of a histogram.
+
+    Values are interpolated linearly within the bucket of the quantile, as
+    done by the histogram_quantile() function of Prometheus.
+
+    Args:
+        quantile: Quantile between 0 and 1
+        buckets: List of (upper bound, cumulative count) tuples
+
+    Returns:
+        result: Estimated value
+
+    """
+    # Initialize key variables
+    result = 0
+    lower = (0, 0)
+    buckets = sorted(buckets)
+
+    # Nothing to do
+    if bool(buckets) is False or buckets[-1][1] <= 0:
+        return result
+
+    # Find the bucket of the quantile
+    rank = quantile * buckets[-1][1]
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                result = lower[0]
+            elif count > lower[1]:
+                result = lower[0] + (bound - lower[0]) * (
+                    (rank - lower[1]) / (count - lower[1])
+                )
+            else:
+                result = bound
+            break
+        lower = (bound, count)
+
+    # Return
+    return result
+
+
+def _slow(filename, code, seconds, statement, rows):
+    """Write a statement to the slow query log.
+
+    Args:
+        filename: Slow query log file
+        code: Error code of the caller of the statement
+        seconds: Duration of the statement
+        statement: SQL statement
+        rows: Number of parameter sets of the statement
+
+    Returns:
+        None
+
+    """
+    # Create the entry
+    line = "{} pid={} code={} seconds={:.6f} rows={} {}\n".format(
+        time.strftime("%Y-%m-%d %H:%M:%S"),
+        os.getpid(),
+        code,
+        seconds,
+        rows,
+        " ".join(statement.split()),
+    )
+
+    # Write
+    try:
+        with open(filename, "a") as f_handle:
+            f_handle.write(line)
+    except OSError as exception_error:
+        log_message = "Cannot write to slow query log {}. Error: {}".format(
+            filename, exception_error
+        )
+        log.log2warning(2088, log_message)
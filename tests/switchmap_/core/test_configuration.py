@@ -113,6 +113,15 @@ class Test_ConfigCore(unittest.TestCase):
         result = self.config.log_level()
         self.assertEqual(result, expected)
 
+    def test_metrics_directory(self):
+        """Testing function metrics_directory."""
+        # Run test
+        expected = "{1}{0}metrics".format(
+            os.sep, self._config.metadata.system_directory
+        )
+        result = self.config.metrics_directory()
+        self.assertEqual(result, expected)
+
     def test_multiprocessing(self):
         """Testing function multiprocessing."""
         # Run test
@@ -120,6 +129,22 @@ class Test_ConfigCore(unittest.TestCase):
         result = self.config.multiprocessing()
         self.assertEqual(result, expected)
 
+    def test_profile_directory(self):
+        """Testing function profile_directory."""
+        # Run test
+        expected = "{1}{0}log{0}profile".format(
+            os.sep, self._config.metadata.system_directory
+        )
+        result = self.config.profile_directory()
+        self.assertEqual(result, expected)
+
+    def test_profiling(self):
+        """Testing function profiling."""
+        # Run test
+        expected = False
+        result = self.config.profiling()
+        self.assertEqual(result, expected)
+
     def test_system_directory(self):
         """Testing function system_directory."""
         # Run test
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Test the delta module."""
+
+import unittest
+import os
+import sys
+from copy import deepcopy
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import delta as testimport
+
+from tests.testlib_ import data
+
+
+def _documents():
+    """Create a pair of normalized documents for testing.
+
+    Args:
+        None
+
+    Returns:
+        result: Tuple of (previous, current) documents
+
+    """
+    # Create the previous document
+    previous = testimport.normalize(data.polled_data(strip=False))
+    current = deepcopy(previous)
+
+    # Change the timestamp and an interface status
+    current["misc"]["timestamp"] += 300
+    ifindex = sorted(current["layer1"].keys())[0]
+    current["layer1"][ifindex]["ifOperStatus"] = 99
+
+    # Remove an interface and add another
+    removed = sorted(current["layer1"].keys())[-1]
+    current["layer1"].pop(removed)
+    current["layer1"]["999999"] = {"ifName": "test", "ifType": 6}
+
+    # Add an ARP entry
+    current["layer3"]["ipNetToMediaTable"]["192.0.2.1"] = "0123456789ab"
+    return (previous, current)
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_normalize(self):
+        """Testing function normalize."""
+        # Test
+        result = testimport.normalize({1: {2: [3]}, "a": None})
+        self.assertEqual(result, {"1": {"2": [3]}, "a": None})
+
+    def test_version(self):
+        """Testing function version."""
+        # Key order must not affect the version
+        one = testimport.version({"a": 1, "b": {"c": 2, "d": 3}})
+        two = testimport.version({"b": {"d": 3, "c": 2}, "a": 1})
+        self.assertEqual(one, two)
+
+        # Different data must have different versions
+        three = testimport.version({"a": 1, "b": {"c": 2, "d": 4}})
+        self.assertNotEqual(one, three)
+
+        # Documents must have the same version as their normalized copies
+        value = data.polled_data(strip=False)
+        self.assertEqual(
+            testimport.version(value),
+            testimport.version(testimport.normalize(value)),
+        )
+
+    def test_digests(self):
+        """Testing function digests."""
+        # Test
+        (previous, current) = _documents()
+        before = testimport.digests(previous)
+        after = testimport.digests(current)
+        self.assertEqual(before["layer2"], after["layer2"])
+        self.assertEqual(before["system"], after["system"])
+        self.assertNotEqual(before["layer1"], after["layer1"])
+        self.assertNotEqual(before["layer3"], after["layer3"])
+
+    def test_diff(self):
+        """Testing function diff."""
+        # Test
+        (previous, current) = _documents()
+        result = testimport.diff(previous, current)
+        self.assertEqual(result["base"], testimport.version(previous))
+        self.assertEqual(result["version"], testimport.version(current))
+        self.assertEqual(result["hostname"], current["misc"]["host"])
+
+        # Unchanged sections must not be sent
+        self.assertNotIn("layer2", result["sections"])
+        self.assertNotIn("system", result["sections"])
+
+        # Only the changes must be sent
+        ifindex = sorted(previous["layer1"].keys())[0]
+        removed = sorted(previous["layer1"].keys())[-1]
+        layer1 = result["sections"]["layer1"]
+        self.assertEqual(layer1["merge"], {ifindex: {"ifOperStatus": 99}})
+        self.assertEqual(layer1["remove"], [removed])
+        self.assertEqual(
+            layer1["set"], {"999999": {"ifName": "test", "ifType": 6}}
+        )
+        self.assertEqual(
+            result["sections"]["layer3"]["merge"],
+            {"ipNetToMediaTable": {"192.0.2.1": "0123456789ab"}},
+        )
+
+        # Documents that haven't been normalized must give the same result
+        value = data.polled_data(strip=False)
+        value["misc"]["timestamp"] += 300
+        self.assertEqual(
+            testimport.diff(previous, value),
+            testimport.diff(previous, testimport.normalize(value)),
+        )
+
+    def test_apply(self):
+        """Testing function apply."""
+        # Test reconstruction
+        (previous, current) = _documents()
+        payload = testimport.normalize(testimport.diff(previous, current))
+        result = testimport.apply(previous, payload)
+        self.assertEqual(result, current)
+        self.assertEqual(testimport.version(result), payload["version"])
+
+        # Test removed sections and subkeys
+        current.pop("layer2")
+        current["layer1"][sorted(current["layer1"].keys())[0]].pop("ifName")
+        payload = testimport.diff(previous, current)
+        result = testimport.apply(previous, payload)
+        self.assertEqual(result, current)
+
+        # The previous document must not be modified
+        self.assertIn("layer2", previous)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
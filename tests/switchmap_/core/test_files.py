@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Test the files module."""
+
+import unittest
+import tempfile
+import os
+import sys
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import files as testimport
+
+# Cache file data
+_DATA = {
+    "misc": {"zone": "zone_1", "host": "switch_1", "timestamp": 1234},
+    "layer1": {1: {"ifName": "port_1"}},
+}
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_cache_index_file(self):
+        """Testing function cache_index_file."""
+        # Test
+        self.assertEqual(
+            testimport.cache_index_file("/tmp/abc.yaml"), "/tmp/abc.json"
+        )
+
+    def test_write_cache_file(self):
+        """Testing function write_cache_file."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "switch_1.yaml")
+            testimport.write_cache_file(filepath, _DATA)
+            self.assertTrue(os.path.isfile(filepath))
+            self.assertTrue(
+                os.path.isfile(os.path.join(directory, "switch_1.json"))
+            )
+
+    def test_read_cache_index(self):
+        """Testing function read_cache_index."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "switch_1.yaml")
+            testimport.write_cache_file(
+                filepath, _DATA, addresses=["10.0.0.2", "10.0.0.1"]
+            )
+            result = testimport.read_cache_index(filepath)
+            self.assertEqual(result["zone"], "zone_1")
+            self.assertEqual(result["hostname"], "switch_1")
+            self.assertEqual(result["timestamp"], 1234)
+            self.assertEqual(result["size"], os.path.getsize(filepath))
+            self.assertEqual(result["addresses"], ["10.0.0.1", "10.0.0.2"])
+
+            # Indexes of other versions of the file are ignored
+            with open(filepath, "a") as f_handle:
+                f_handle.write("extra: 1\n")
+            self.assertEqual(testimport.read_cache_index(filepath), {})
+
+            # Files without indexes
+            os.remove(testimport.cache_index_file(filepath))
+            self.assertEqual(testimport.read_cache_index(filepath), {})
+
+    def test_read_cache_file(self):
+        """Testing function read_cache_file."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "switch_1.yaml")
+            testimport.write_cache_file(filepath, _DATA)
+            self.assertEqual(testimport.read_cache_file(filepath), _DATA)
+
+            # Files without indexes
+            os.remove(testimport.cache_index_file(filepath))
+            self.assertEqual(testimport.read_cache_file(filepath), _DATA)
+
+    def test_move_yaml_files(self):
+        """Testing function move_yaml_files."""
+        # Test
+        with tempfile.TemporaryDirectory() as src:
+            with tempfile.TemporaryDirectory() as dst:
+                filepath = os.path.join(src, "switch_1.yaml")
+                testimport.write_cache_file(filepath, _DATA)
+                testimport.move_yaml_files(src, dst)
+                self.assertEqual(os.listdir(src), [])
+                self.assertEqual(
+                    sorted(os.listdir(dst)), ["switch_1.json", "switch_1.yaml"]
+                )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
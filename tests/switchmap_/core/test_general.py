@@ -196,6 +196,44 @@ class TestFunctions(unittest.TestCase):
             result = general.ipaddress(item)
             self.assertEqual(expected[index], result)
 
+    def test_mac_2_integer(self):
+        """Testing function mac_2_integer."""
+        # Test
+        self.assertEqual(
+            general.mac_2_integer("01ee.8eca.d7c5"), 0x01EE8ECAD7C5
+        )
+        self.assertEqual(general.mac_2_integer("000000000000"), 0)
+        self.assertIsNone(general.mac_2_integer("zyxwvut"))
+        self.assertIsNone(general.mac_2_integer(None))
+
+    def test_integer_2_mac(self):
+        """Testing function integer_2_mac."""
+        # Test
+        self.assertEqual(general.integer_2_mac(0x01EE8ECAD7C5), "01ee8ecad7c5")
+        self.assertEqual(general.integer_2_mac(0), "000000000000")
+        self.assertIsNone(general.integer_2_mac(None))
+
+    def test_ip_2_packed(self):
+        """Testing function ip_2_packed."""
+        # Test
+        self.assertEqual(
+            general.ip_2_packed("192.168.1.1"), b"\xc0\xa8\x01\x01"
+        )
+        self.assertEqual(len(general.ip_2_packed("::abc:7:def")), 16)
+        self.assertIsNone(general.ip_2_packed("abcdefghijklmnopqrstuvwxyz"))
+
+    def test_packed_2_ip(self):
+        """Testing function packed_2_ip."""
+        # Test
+        self.assertEqual(
+            general.packed_2_ip(b"\xc0\xa8\x01\x01"), "192.168.1.1"
+        )
+        self.assertEqual(
+            general.packed_2_ip(general.ip_2_packed("::abc:7:def")),
+            "0000:0000:0000:0000:0000:0abc:0007:0def",
+        )
+        self.assertIsNone(general.packed_2_ip(None))
+
     def test_make_bool(self):
         """Testing function make_bool."""
         # Initializing key variables
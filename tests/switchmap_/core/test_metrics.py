@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Test the metrics module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import metrics as testimport
+from switchmap.core import files
+from switchmap.core.configuration import ConfigCore
+
+# Metrics used for testing
+_COUNTER = testimport.counter(
+    "switchmap_test_total", "Test counter.", labelnames=("zone",)
+)
+_GAUGE = testimport.gauge("switchmap_test_gauge", "Test gauge.")
+_HISTOGRAM = testimport.histogram(
+    "switchmap_test_seconds", "Test histogram.", buckets=(1, 5)
+)
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Save the metrics state
+        self._directory = os.environ.pop(testimport._DIRECTORY, None)
+        testimport._values().clear()
+
+    def tearDown(self):
+        """Execute these steps after each test."""
+        # Restore the metrics state
+        if self._directory is None:
+            os.environ.pop(testimport._DIRECTORY, None)
+        else:
+            os.environ[testimport._DIRECTORY] = self._directory
+        testimport._values().clear()
+
+    def test_counter(self):
+        """Testing function counter."""
+        # Test
+        _COUNTER.labels(zone="a").inc()
+        _COUNTER.labels(zone="a").inc(2)
+        _COUNTER.labels(zone="b").inc()
+        values = testimport._values()
+        self.assertEqual(values[("switchmap_test_total", (("zone", "a"),))], 3)
+        self.assertEqual(values[("switchmap_test_total", (("zone", "b"),))], 1)
+
+    def test_gauge(self):
+        """Testing function gauge."""
+        # Test
+        _GAUGE.set(7)
+        _GAUGE.set(3)
+        self.assertEqual(testimport._values()[("switchmap_test_gauge", ())], 3)
+
+    def test_histogram(self):
+        """Testing function histogram."""
+        # Test
+        for value in (0.5, 2, 10):
+            _HISTOGRAM.observe(value)
+        values = testimport._values()
+        for bucket, expected in (("1", 1), ("5", 2), ("+Inf", 3)):
+            self.assertEqual(
+                values[("switchmap_test_seconds_bucket", (("le", bucket),))],
+                expected,
+            )
+        self.assertEqual(values[("switchmap_test_seconds_sum", ())], 12.5)
+        self.assertEqual(values[("switchmap_test_seconds_count", ())], 3)
+
+        # Test the timer
+        with _HISTOGRAM.time():
+            pass
+        self.assertEqual(values[("switchmap_test_seconds_count", ())], 4)
+        self.assertEqual(
+            values[("switchmap_test_seconds_bucket", (("le", "1"),))], 2
+        )
+
+    def test_setup(self):
+        """Testing function setup."""
+        # Test
+        expected = os.path.join(ConfigCore().metrics_directory(), "Test")
+        testimport.setup("Test")
+        self.assertEqual(testimport.directory(), expected)
+        self.assertTrue(os.path.isdir(expected))
+
+        # Previously saved values must be deleted on a reset
+        filepath = os.path.join(expected, "old.json")
+        files.write_json_file(filepath, [])
+        testimport.setup("Test", reset=True)
+        self.assertFalse(os.path.isfile(filepath))
+
+    def test_directory(self):
+        """Testing function directory."""
+        # Test
+        self.assertIsNone(testimport.directory())
+        testimport.setup("Test")
+        self.assertEqual(
+            testimport.directory(),
+            os.path.join(ConfigCore().metrics_directory(), "Test"),
+        )
+
+    def test_flush(self):
+        """Testing function flush."""
+        # Nothing is saved without a setup
+        _COUNTER.labels(zone="a").inc()
+        testimport.flush()
+
+        # Test
+        testimport.setup("Test", reset=True)
+        testimport.flush()
+        filepath = os.path.join(
+            testimport.directory(),
+            "{}.json".format(testimport._STATE["token"]),
+        )
+        self.assertEqual(
+            files.read_json_file(filepath),
+            [["switchmap_test_total", [["zone", "a"]], 1]],
+        )
+
+        # Saves are skipped within the interval
+        _COUNTER.labels(zone="a").inc()
+        testimport.flush(interval=3600)
+        self.assertEqual(files.read_json_file(filepath)[0][2], 1)
+
+    def test_collect(self):
+        """Testing function collect."""
+        # Test values of another process
+        testimport.setup("Test", reset=True)
+        files.write_json_file(
+            os.path.join(testimport.directory(), "other.json"),
+            [["switchmap_test_total", [["zone", "a"]], 5]],
+        )
+        _COUNTER.labels(zone="a").inc()
+        testimport.flush()
+        self.assertEqual(
+            testimport.collect(),
+            {("switchmap_test_total", (("zone", "a"),)): 6},
+        )
+
+    def test_compact(self):
+        """Testing function compact."""
+        # Test
+        testimport.setup("Test", reset=True)
+        files.write_json_file(
+            os.path.join(testimport.directory(), "other.json"),
+            [
+                ["switchmap_test_total", [["zone", "a"]], 5],
+                ["switchmap_test_gauge", [], 9],
+            ],
+        )
+        _COUNTER.labels(zone="a").inc()
+        _GAUGE.set(2)
+        testimport.compact()
+
+        # Only the archive is left
+        self.assertEqual(
+            sorted(os.listdir(testimport.directory())),
+            [testimport._ARCHIVE, testimport._LOCK],
+        )
+
+        # Gauges of this process are kept
+        self.assertEqual(
+            testimport._values(), {("switchmap_test_gauge", ()): 2}
+        )
+        self.assertEqual(
+            testimport.collect(),
+            {
+                ("switchmap_test_total", (("zone", "a"),)): 6,
+                ("switchmap_test_gauge", ()): 2,
+            },
+        )
+
+    def test_retire(self):
+        """Testing function retire."""
+        # Test
+        testimport.setup("Test", reset=True)
+        files.write_json_file(
+            os.path.join(testimport.directory(), testimport._ARCHIVE),
+            [["switchmap_test_total", [["zone", "a"]], 5]],
+        )
+        _COUNTER.labels(zone="a").inc()
+        _COUNTER.labels(zone="b").inc()
+        _GAUGE.set(2)
+        testimport.flush()
+        testimport.retire()
+
+        # Only the archive is left
+        self.assertEqual(
+            sorted(
+                _
+                for _ in os.listdir(testimport.directory())
+                if _.endswith(".json")
+            ),
+            [testimport._ARCHIVE],
+        )
+
+        # Values of this process are added to the archive except gauges
+        self.assertEqual(testimport._values(), {})
+        self.assertEqual(
+            testimport.collect(),
+            {
+                ("switchmap_test_total", (("zone", "a"),)): 6,
+                ("switchmap_test_total", (("zone", "b"),)): 1,
+            },
+        )
+
+    def test_exposition(self):
+        """Testing function exposition."""
+        # Test
+        self.assertEqual(testimport.exposition(), "")
+        _COUNTER.labels(zone='a"b').inc()
+        _HISTOGRAM.observe(2)
+        expected = """\
+# HELP switchmap_test_seconds Test histogram.
+# TYPE switchmap_test_seconds histogram
+switchmap_test_seconds_bucket{le="+Inf"} 1
+switchmap_test_seconds_bucket{le="5"} 1
+switchmap_test_seconds_count 1
+switchmap_test_seconds_sum 2
+# HELP switchmap_test_total Test counter.
+# TYPE switchmap_test_total counter
+switchmap_test_total{zone="a\\"b"} 1
+"""
+        self.assertEqual(testimport.exposition(), expected)
+
+    def test_write_textfile(self):
+        """Testing function write_textfile."""
+        # Test
+        testimport.setup("Test", reset=True)
+        _COUNTER.labels(zone="a").inc()
+        testimport.write_textfile("test")
+        filepath = os.path.join(
+            ConfigCore().metrics_directory(), "switchmap_test.prom"
+        )
+        with open(filepath) as f_handle:
+            result = f_handle.read()
+        self.assertEqual(result, testimport.exposition())
+        self.assertIn('switchmap_test_total{zone="a"} 1\n', result)
+
+    def test__values(self):
+        """Testing function _values."""
+        # Values are reset in new processes
+        _COUNTER.labels(zone="a").inc()
+        testimport._STATE["pid"] = None
+        self.assertEqual(testimport._values(), {})
+        self.assertEqual(testimport._STATE["pid"], os.getpid())
+
+    def test__serialize(self):
+        """Testing function _serialize."""
+        # Test
+        result = testimport._serialize({("name", (("a", "b"),)): 1})
+        self.assertEqual(result, [["name", [["a", "b"]], 1]])
+
+    def test__metric_name(self):
+        """Testing function _metric_name."""
+        # Test
+        self.assertEqual(
+            testimport._metric_name("switchmap_test_seconds_bucket"),
+            "switchmap_test_seconds",
+        )
+        self.assertEqual(
+            testimport._metric_name("switchmap_test_total"),
+            "switchmap_test_total",
+        )
+
+    def test__labels(self):
+        """Testing function _labels."""
+        # Test
+        self.assertEqual(testimport._labels(()), "")
+        self.assertEqual(
+            testimport._labels((("a", "1"), ("b", "2"))), '{a="1",b="2"}'
+        )
+
+    def test__escape(self):
+        """Testing function _escape."""
+        # Test
+        self.assertEqual(testimport._escape('a"\\\n', True), 'a\\"\\\\\\n')
+        self.assertEqual(testimport._escape('a"', False), 'a"')
+
+    def test__number(self):
+        """Testing function _number."""
+        # Test
+        self.assertEqual(testimport._number(float("inf")), "+Inf")
+        self.assertEqual(testimport._number(2.0), "2")
+        self.assertEqual(testimport._number(0.25), "0.25")
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
+
+    # Cleanup the config
+    CONFIG.cleanup()
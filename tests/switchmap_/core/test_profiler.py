@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Test the profiler module."""
+
+import unittest
+import os
+import sys
+import glob
+import pstats
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import profiler as testimport
+from switchmap.core.configuration import ConfigCore
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Save the profiling state
+        self._environ = {
+            key: os.environ.get(key)
+            for key in (testimport._ENABLED, testimport._CYCLE)
+        }
+
+    def tearDown(self):
+        """Execute these steps after each test."""
+        # Restore the profiling state
+        for key, value in self._environ.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_enable(self):
+        """Testing function enable."""
+        # Test
+        os.environ[testimport._ENABLED] = "0"
+        self.assertFalse(testimport.enabled())
+        testimport.enable()
+        self.assertTrue(testimport.enabled())
+
+    def test_enabled(self):
+        """Testing function enabled."""
+        # Test reading the configuration
+        os.environ.pop(testimport._ENABLED, None)
+        self.assertEqual(testimport.enabled(), ConfigCore().profiling())
+
+    def test_cycle(self):
+        """Testing function cycle."""
+        # Test
+        testimport.cycle("test")
+        self.assertTrue(os.environ[testimport._CYCLE].startswith("test-"))
+
+    def test_stage(self):
+        """Testing function stage."""
+        # Nothing is saved when disabled
+        os.environ[testimport._ENABLED] = "0"
+        os.environ[testimport._CYCLE] = "disabled"
+        with testimport.stage("outer"):
+            pass
+        directory = os.path.join(ConfigCore().profile_directory(), "disabled")
+        self.assertFalse(os.path.isdir(directory))
+
+        # Test nested stages
+        testimport.enable()
+        os.environ[testimport._CYCLE] = "enabled"
+        with testimport.stage("outer"):
+            with testimport.stage("outer.inner"):
+                _ = [str(_) for _ in range(1000)]
+        directory = os.path.join(ConfigCore().profile_directory(), "enabled")
+        for name in ("outer", "outer.inner"):
+            filepaths = glob.glob(
+                os.path.join(directory, "{}-*.pstats".format(name))
+            )
+            self.assertEqual(len(filepaths), 1)
+            self.assertTrue(bool(pstats.Stats(filepaths[0]).stats))
+            filepaths = glob.glob(
+                os.path.join(directory, "{}-*.txt".format(name))
+            )
+            self.assertEqual(len(filepaths), 1)
+        self.assertEqual(testimport._STACK, [])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
+
+    # Cleanup the config
+    CONFIG.cleanup()
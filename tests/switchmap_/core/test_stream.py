@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Test the stream module."""
+
+import unittest
+import os
+import sys
+import json
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import stream as testimport
+from switchmap.poller.update.columnar import MacTable
+
+from tests.testlib_ import data
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_iterencode(self):
+        """Testing function iterencode."""
+        # Test polled data
+        value = data.polled_data(strip=False)
+        result = "".join(testimport.iterencode(value))
+        self.assertEqual(result, json.dumps(value))
+
+        # Test unusual keys and nesting
+        value = {1: {True: [1, {"a": None}], None: 1.5, 2.5: "x"}, "b": ()}
+        result = "".join(testimport.iterencode(value))
+        self.assertEqual(result, json.dumps(value))
+
+        # Test compact tables
+        table = MacTable()
+        table.append("192.0.2.1", "0123456789ab")
+        result = "".join(testimport.iterencode({"table": table}))
+        self.assertEqual(result, json.dumps({"table": dict(table)}))
+
+        # Test invalid keys
+        with self.assertRaises(TypeError):
+            _ = "".join(testimport.iterencode({(1, 2): 3}))
+
+        # Test canonical JSON
+        value = {"b": {2: [1, 2], 10: table}, "a": ({"d": 1, "c": 2},)}
+        result = "".join(testimport.iterencode(value, canonical=True))
+        self.assertEqual(
+            result,
+            json.dumps(
+                testimport.normalize(value),
+                sort_keys=True,
+                separators=(",", ":"),
+            ),
+        )
+
+    def test_spool(self):
+        """Testing function spool."""
+        # Test
+        value = data.polled_data()
+        with testimport.spool(value) as body:
+            result = body.read()
+        self.assertEqual(result, json.dumps(value).encode())
+
+    def test_normalize(self):
+        """Testing function normalize."""
+        # Test
+        table = MacTable()
+        table.append("192.0.2.1", "0123456789ab")
+        result = testimport.normalize({1: {2: [3]}, "a": table})
+        self.assertEqual(
+            result, {"1": {"2": [3]}, "a": {"192.0.2.1": "0123456789ab"}}
+        )
+
+    def test__key(self):
+        """Testing function _key."""
+        # Test
+        self.assertEqual(testimport._key("a"), "a")
+        self.assertEqual(testimport._key(1), "1")
+        self.assertEqual(testimport._key(False), "false")
+        self.assertEqual(testimport._key(None), "null")
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -105,6 +105,17 @@ class Query:
         """
         pass
 
+    def iwalk(self):
+        """Do a failsafe SNMPwalk that yields results.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
     def walk(self):
         """Do a failable SNMPwalk.
 
@@ -183,6 +194,9 @@ class TestMibIp(unittest.TestCase):
     snmpobj_ipv4_binary = Mock(spec=Query)
     mock_spec_ipv4_binary = {
         "swalk.return_value": walk_results_ipv4_binary,
+        "iwalk.side_effect": lambda *args, **kwargs: iter(
+            TestMibIp.walk_results_ipv4_binary.items()
+        ),
         "walk.return_value": walk_results_ipv4_binary,
     }
     snmpobj_ipv4_binary.configure_mock(**mock_spec_ipv4_binary)
@@ -190,6 +204,9 @@ class TestMibIp(unittest.TestCase):
     snmpobj_ipv6_binary = Mock(spec=Query)
     mock_spec_ipv6_binary = {
         "swalk.return_value": walk_results_ipv6_binary,
+        "iwalk.side_effect": lambda *args, **kwargs: iter(
+            TestMibIp.walk_results_ipv6_binary.items()
+        ),
         "walk.return_value": walk_results_ipv6_binary,
     }
     snmpobj_ipv6_binary.configure_mock(**mock_spec_ipv6_binary)
@@ -255,6 +272,7 @@ class TestMibIp(unittest.TestCase):
         for key, value in results.items():
             self.assertEqual(isinstance(key, str), True)
             self.assertEqual(value, self.ipv4_expected_dict[key])
+        self.assertEqual(dict(results), self.ipv4_expected_dict)
 
         # Test that we are getting the correct OID
         results = testobj.ipnettomediatable(oidonly=True)
@@ -273,6 +291,7 @@ class TestMibIp(unittest.TestCase):
         for key, value in results.items():
             self.assertEqual(isinstance(key, str), True)
             self.assertEqual(value, self.ipv6_expected_dict[key])
+        self.assertEqual(dict(results), self.ipv6_expected_dict)
 
         # Test that we are getting the correct OID
         results = testobj.ipnettophysicalphysaddress(oidonly=True)
@@ -4,6 +4,7 @@
 import unittest
 import os
 import sys
+from collections import defaultdict
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -31,12 +32,8 @@ if EXEC_DIR.endswith(_EXPECTED) is True:
     # elsewhere on the system using PIP. This could corrupt expected results
     sys.path.insert(0, ROOT_DIR)
 else:
-    print(
-        """This script is not installed in the "{0}" directory. Please fix.\
-""".format(
-            _EXPECTED
-        )
-    )
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
     sys.exit(2)
 
 # Create the necessary configuration to load the module
@@ -46,6 +43,8 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp import snmp_info as testimport
+from switchmap.poller.update.columnar import MacTable
 
 
 class TestSnmpInfo(unittest.TestCase):
@@ -105,7 +104,28 @@ class TestSnmpInfo(unittest.TestCase):
 
     def test__add_data(self):
         """Testing function _add_data."""
-        pass
+        # Initialize key variables
+        first = MacTable()
+        first.append("10.0.0.1", "00169c155000")
+        second = MacTable()
+        second.append("10.0.0.1", "98eecb5625b6")
+        second.append("10.0.0.2", "d485649fdc7f")
+        target = defaultdict(lambda: defaultdict(dict))
+
+        # Compact tables are added as is
+        result = testimport._add_data({"ipNetToMediaTable": first}, target)
+        self.assertIs(result["ipNetToMediaTable"], first)
+
+        # Entries are added to existing compact tables
+        result = testimport._add_data(
+            {"ipNetToMediaTable": second, "other": {1: 2}}, result
+        )
+        self.assertIs(result["ipNetToMediaTable"], first)
+        self.assertEqual(
+            result["ipNetToMediaTable"],
+            {"10.0.0.1": "98eecb5625b6", "10.0.0.2": "d485649fdc7f"},
+        )
+        self.assertEqual(result["other"], {1: 2})
 
     def test__add_layer1(self):
         """Testing function _add_layer1."""
@@ -151,6 +151,10 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function swalk."""
         pass
 
+    def test_iwalk(self):
+        """Testing function iwalk."""
+        pass
+
     def test_walk(self):
         """Testing function walk."""
         pass
@@ -247,6 +251,10 @@ class TestSnmpManagerFunctions(unittest.TestCase):
         """Testing function _format_results."""
         pass
 
+    def test__iterate_results(self):
+        """Testing function _iterate_results."""
+        pass
+
     def test__convert(self):
         """Testing function _convert."""
         pass
@@ -63,6 +63,13 @@ class Test_ConfigPoller(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test_delta_posts(self):
+        """Testing function delta_posts."""
+        # Run test
+        expected = True
+        result = self.config.delta_posts()
+        self.assertEqual(result, expected)
+
     def test_polling_interval(self):
         """Testing function polling_interval."""
         # Run test
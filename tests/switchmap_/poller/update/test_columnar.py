@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""Test the columnar module."""
+
+import os
+import pickle
+import sys
+import unittest
+
+# PIP imports
+import numpy as np
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}update\
+""".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller.update import columnar as testimport
+
+from tests.testlib_ import data
+
+
+class TestTable(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    polled_data = data.polled_data()
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above.
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_from_dict(self):
+        """Testing function from_dict."""
+        # Test a mix of types
+        value = {
+            1: {"ifType": 6, "ifName": "Gi1/0/1", "l1_trunk": False},
+            2: {"ifType": 24, "l1_trunk": True, "vlans": [1, 2]},
+        }
+        table = testimport.Table.from_dict(value)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.column("ifType").dtype, np.int64)
+        self.assertEqual(table.column("l1_trunk").dtype, bool)
+        self.assertEqual(table.column("ifName").dtype, object)
+        self.assertEqual(table.column("ifName").present.tolist(), [True, False])
+        self.assertEqual(table.position(2), 1)
+        self.assertIsNone(table.position(3))
+
+        # Test missing columns
+        self.assertEqual(table.column("missing").present.tolist(), [False] * 2)
+
+        # Test bad data
+        self.assertEqual(len(testimport.Table.from_dict(None)), 0)
+
+    def test___getitem__(self):
+        """Testing function __getitem__."""
+        # Test
+        value = self.polled_data["layer1"]
+        table = testimport.Table.from_dict(value)
+        self.assertEqual(list(table), list(value))
+        self.assertEqual(dict(table.items()), value)
+        self.assertEqual(table[10101], value[10101])
+        self.assertEqual(table, value)
+        with self.assertRaises(KeyError):
+            _ = table[-1]
+
+        # Values are not numpy types
+        self.assertIs(type(table[10101]["ifType"]), int)
+
+        # Tables can be pickled
+        self.assertEqual(pickle.loads(pickle.dumps(table)), value)
+
+    def test_merge(self):
+        """Testing function merge."""
+        # Initialize key variables
+        first = testimport.Table.from_dict(
+            {1: {"ifType": 6, "ifName": "Gi1/0/1"}, 2: {"ifType": 24}}
+        )
+        second = testimport.Table.from_dict(
+            {2: {"ifType": "other", "vmVlan": 4}, 3: {"vmVlan": 5}}
+        )
+
+        # Later values replace earlier ones
+        result = first.merge(second)
+        self.assertEqual(
+            result,
+            {
+                1: {"ifType": 6, "ifName": "Gi1/0/1"},
+                2: {"ifType": "other", "vmVlan": 4},
+                3: {"vmVlan": 5},
+            },
+        )
+        self.assertEqual(list(result), [1, 2, 3])
+        self.assertEqual(result.column("ifType").dtype, object)
+        self.assertEqual(result.column("vmVlan").dtype, np.int64)
+
+        # The original tables are unchanged
+        self.assertEqual(first[2], {"ifType": 24})
+
+    def test_assign(self):
+        """Testing function assign."""
+        # Initialize key variables
+        table = testimport.Table.from_dict({1: {"a": 1}, 2: {"a": 2}})
+        column = testimport.Column(
+            np.array([None, [3]], dtype=object), np.array([False, True])
+        )
+
+        # Test
+        result = table.assign({"a": column, "b": column})
+        self.assertEqual(result, {1: {"a": 1}, 2: {"a": [3], "b": [3]}})
+        self.assertEqual(table, {1: {"a": 1}, 2: {"a": 2}})
+
+    def test_to_dict(self):
+        """Testing function to_dict."""
+        # Test all layers of the polled data
+        for layer in ("layer1", "layer2", "layer3"):
+            for value in self.polled_data[layer].values():
+                if isinstance(value, dict) is False:
+                    continue
+                rows = {
+                    key: item
+                    for key, item in value.items()
+                    if isinstance(item, dict)
+                }
+                if bool(rows) is False:
+                    continue
+                table = testimport.Table.from_dict(rows)
+                self.assertEqual(table.to_dict(), rows)
+
+        # Test layer1 data
+        value = self.polled_data["layer1"]
+        table = testimport.Table.from_dict(value)
+        self.assertEqual(table.to_dict(), value)
+
+
+class TestMacTable(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_append(self):
+        """Testing function append."""
+        # Test IPv4 with duplicate and non standard values
+        table = testimport.MacTable(version=4)
+        entries = [
+            ("10.0.0.1", "00169c155000"),
+            ("10.0.0.2", "0016"),
+            ("10.0.0.1", "98eecb5625b6"),
+            ("10.0.0.300", "98eecb5625b6"),
+            ("10.0.0.0", "000000000000"),
+        ]
+        expected = {}
+        for ip_address, mac_address in entries:
+            table.append(ip_address, mac_address)
+            expected[ip_address] = mac_address
+        self.assertEqual(dict(table.items()), expected)
+        self.assertEqual(sorted(table), sorted(expected))
+        self.assertEqual(len(table), len(expected))
+        self.assertEqual(table["10.0.0.1"], "98eecb5625b6")
+        self.assertEqual(table, expected)
+        with self.assertRaises(KeyError):
+            _ = table["10.0.0.3"]
+        with self.assertRaises(KeyError):
+            _ = table["fe80::1"]
+        self.assertIn("10.0.0.300", table)
+        self.assertNotIn("10.0.0.4", table)
+
+        # Lookups find entries added after earlier lookups
+        table.append("10.0.0.1", "d485649fdc7f")
+        self.assertEqual(table["10.0.0.1"], "d485649fdc7f")
+        self.assertEqual(table["10.0.0.2"], "0016")
+
+        # Test IPv6
+        table = testimport.MacTable(version=6)
+        ip_address = "fe80:0000:0000:0000:356f:6da8:7d2a:5458"
+        table.append(ip_address, "d485649fdc7f")
+        self.assertEqual(dict(table), {ip_address: "d485649fdc7f"})
+
+    def test___len__(self):
+        """Testing function __len__."""
+        # Test
+        self.assertEqual(len(testimport.MacTable()), 0)
+
+
+class TestSuite(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    l1_data = data.polled_data().get("layer1")
+    table = testimport.Table.from_dict(l1_data)
+
+    # IfIndexes
+    # 18 = Layer3 VLAN interface (Enabled)
+    # 10103 = Layer1 interface. (Disabled)
+    # 10101 = Layer1 interface with a server on it. (Enabled)
+    # 1 = Layer2 VLAN (Disabled)
+    # 18 = Layer2 VLAN (Enabled)
+    # 10102 = Layer2 Trunk interface (Enabled)
+    ifindexes = [18, 10103, 10101, 1, 18, 10102]
+    positions = list(map(table.position, ifindexes))
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Do nothing
+        pass
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Do nothing
+
+    def test_trunk(self):
+        """Testing function trunk."""
+        # Test
+        results = testimport.trunk(self.table)[self.positions].tolist()
+        expecteds = [False, False, False, False, False, True]
+        self.assertEqual(results, expecteds)
+
+    def test_nativevlan(self):
+        """Testing function nativevlan."""
+        # Test
+        results = testimport.nativevlan(self.table)[self.positions].tolist()
+        expecteds = [None, 1, 1, None, None, 98]
+        self.assertEqual(results, expecteds)
+
+        # Juniper values take precedence
+        table = testimport.Table.from_dict(
+            {1: {"vlanTrunkPortNativeVlan": "4", "dot1qPvid": 5}, 2: {}}
+        )
+        self.assertEqual(testimport.nativevlan(table).tolist(), [5, None])
+
+    def test_vlans(self):
+        """Testing function vlans."""
+        # Test
+        results = testimport.vlans(self.table)[self.positions].tolist()
+        expecteds = [
+            [18],
+            [99],
+            [4],
+            [1],
+            [18],
+            self.l1_data[10102]["vlanTrunkPortVlansEnabled"],
+        ]
+        self.assertEqual(results, expecteds)
+
+        # Test vendor specific OIDs
+        value = {
+            1: {"vlanTrunkPortVlansEnabled": 7},
+            2: {"vmVlan": 3, "jnxExVlanTag": []},
+            3: {"vmVlan": 3, "jnxExVlanTag": [8, 9]},
+            4: {},
+        }
+        table = testimport.Table.from_dict(value)
+        self.assertEqual(
+            testimport.vlans(table).tolist(), [[7], [3], [8, 9], None]
+        )
+
+    def test_ethernet(self):
+        """Testing function ethernet."""
+        # Test
+        results = testimport.ethernet(self.table)[self.positions].tolist()
+        expecteds = [False, True, True, False, False, True]
+        self.assertEqual(results, expecteds)
+
+    def test_duplex(self):
+        """Testing function duplex."""
+        # Test
+        results = testimport.duplex(self.table)[self.positions].tolist()
+        expecteds = [0, 0, 2, 0, 0, 2]
+        self.assertEqual(results, expecteds)
+
+        # Test vendor specific OIDs
+        value = {
+            1: {"swPortDuplexStatus": 1},
+            2: {"swPortDuplexStatus": 3},
+            3: {"dot3StatsDuplexStatus": 2},
+            4: {"portDuplex": 2},
+            5: {"c2900PortLinkbeatStatus": 3, "c2900PortDuplexStatus": 1},
+            6: {"c2900PortLinkbeatStatus": 1, "c2900PortDuplexStatus": 2},
+            7: {"dot3StatsDuplexStatus": 1, "portDuplex": 2},
+        }
+        table = testimport.Table.from_dict(value)
+        results = testimport.duplex(table).tolist()
+        self.assertEqual(results, [2, 1, 1, 2, 2, 3, 0])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
+
+    # Cleanup the config
+    CONFIG.cleanup()
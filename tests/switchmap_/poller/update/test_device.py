@@ -25,20 +25,14 @@ ROOT_DIR = os.path.abspath(
     )
 )
 _EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}update\
-""".format(
-    os.sep
-)
+""".format(os.sep)
 if EXEC_DIR.endswith(_EXPECTED) is True:
     # We need to prepend the path in case the repo has been installed
     # elsewhere on the system using PIP. This could corrupt expected results
     sys.path.insert(0, ROOT_DIR)
 else:
-    print(
-        """This script is not installed in the "{0}" directory. Please fix.\
-""".format(
-            _EXPECTED
-        )
-    )
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
     sys.exit(2)
 
 
@@ -49,7 +43,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 from switchmap.poller.update import device as testimport
-from switchmap import TrunkInterface
+from switchmap.poller.update import columnar
 
 from tests.testlib_ import data
 
@@ -108,139 +102,16 @@ class TestPollUpdateDevice(unittest.TestCase):
         result = self.test_object.process()
         expected = data.polled_data(strip=False)
         self.assertEqual(result, expected)
-
-
-class TestSuite(unittest.TestCase):
-    """Checks all functions and methods."""
-
-    #########################################################################
-    # General object setup
-    #########################################################################
-
-    polled_data = _prerequisites()
-    l1_data = polled_data.get("layer1")
-
-    # IfIndexes
-    # 18 = Layer3 VLAN interface (Enabled)
-    # 10103 = Layer1 interface. (Disabled)
-    # 10101 = Layer1 interface with a server on it. (Enabled)
-    # 1 = Layer2 VLAN (Disabled)
-    # 18 = Layer2 VLAN (Enabled)
-    # 10102 = Layer2 Trunk interface (Enabled)
-    ifindexes = [18, 10103, 10101, 1, 18, 10102]
-
-    @classmethod
-    def setUpClass(cls):
-        """Execute these steps before starting tests."""
-        # Do nothing
-        pass
-
-    @classmethod
-    def tearDownClass(cls):
-        """Execute these steps when all tests are completed."""
-        # Do nothing
-
-    def test__process_non_trunk(self):
-        """Testing function _process_non_trunk."""
-        # Initialize key variables
-        results = []
-        expecteds = [
-            TrunkInterface(vlan=None, nativevlan=None, trunk=False),
-            TrunkInterface(vlan=[99], nativevlan=1, trunk=False),
-            TrunkInterface(vlan=list(range(2039)), nativevlan=98, trunk=True),
-        ]
-
-        # Process data
-        for ifindex in self.ifindexes:
-            value = self.l1_data.get(ifindex)
-            results.append(testimport._process_non_trunk(value))
-
-        # Test
-        return
-        self.assertEqual(results, expecteds)
-
-    def test__process_trunk(self):
-        """Testing function _process_trunk."""
-        pass
-
-    def test__juniper_fix(self):
-        """Testing function _juniper_fix."""
-        pass
-
-    def test__is_ethernet(self):
-        """Testing function _is_ethernet."""
-        # Initialize key variables
-        results = []
-        expecteds = [False, True, True, False, False, True]
-
-        # Process data
-        for ifindex in self.ifindexes:
-            value = self.l1_data.get(ifindex)
-            results.append(testimport._is_ethernet(value))
-
-        # Test
-        self.assertEqual(results, expecteds)
-
-    def test__vlan(self):
-        """Testing function _vlan."""
-        # Initialize key variables
-        results = []
-        expecteds = [True, True, True, False]
-
-        # Process data
-        for ifindex in self.ifindexes:
-            value = self.l1_data.get(ifindex)
-            results.append(testimport._vlan(value))
-
-        # Test
-        return
-        self.assertEqual(results, expecteds)
-
-    def test__nativevlan(self):
-        """Testing function _nativevlan."""
-        # Initialize key variables
-        results = []
-        expecteds = [None, 1, 1, None, None, 98]
-
-        # Process data
-        for ifindex in self.ifindexes:
-            value = self.l1_data.get(ifindex)
-            results.append(testimport._nativevlan(value))
-
-        # Test
-        self.assertEqual(results, expecteds)
-
-    def test__duplex(self):
-        """Testing function _duplex."""
-        # Initialize key variables
-        results = []
-        expecteds = [0, 0, 2, 0, 0, 2]
-
-        # Process data
-        for ifindex in self.ifindexes:
-            value = self.l1_data.get(ifindex)
-            results.append(testimport._duplex(value))
-
-        # Test
-        self.assertEqual(results, expecteds)
-
-    def test_get_duplex_value(self):
-        """Testing function get_duplex_value."""
-        pass
-
-    def test__trunk(self):
-        """Testing function _trunk."""
-        # Initialize key variables
-        results = []
-        expecteds = [False, False, False, False, False, True]
-
-        # Process data
-        for ifindex in self.ifindexes:
-            value = self.l1_data.get(ifindex)
-            results.append(testimport._trunk(value))
-
-        # Test
-        self.assertEqual(results, expecteds)
+        self.assertIsInstance(result["layer1"], columnar.Table)
+
+        # Ports whose higher layer interfaces weren't polled get empty values
+        polled_data = _prerequisites()
+        polled_data["system"]["IF-MIB"]["ifStackStatus"][10101] = [999999]
+        result = testimport.Device(polled_data).process()
+        self.assertEqual(result["layer1"][10101]["l1_vlans"], None)
+        self.assertEqual(result["layer1"][10101]["l1_nativevlan"], None)
+        self.assertEqual(result["layer1"][10101]["l1_trunk"], False)
+        self.assertEqual(result["layer1"][10102], expected["layer1"][10102])
 
 
 if __name__ == "__main__":
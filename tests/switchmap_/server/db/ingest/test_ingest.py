@@ -190,11 +190,7 @@ class TestFunctions(unittest.TestCase):
 
         # Test transaction
         setup = device_update.Topology(exists, data, dns=False)
-        setup.l1interface(test=True)
-        setup.vlan(test=True)
-        setup.vlanport(test=True)
-        setup.mac(test=True)
-        setup.macport(test=True)
+        setup.write()
 
         # Setup stuff
         testimport.ipport(self.pairmacips, test=True)
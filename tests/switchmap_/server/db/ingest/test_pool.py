@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Test the pool module."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}ingest""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db.ingest import pool as testimport
+from switchmap.server.configuration import ConfigServer
+
+
+class TestPool(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_starmap(self):
+        """Testing function starmap."""
+        # Workers are reused by every call
+        with testimport.Pool(ConfigServer()) as _pool:
+            result = _pool.starmap(pow, [[2, 3], [3, 2]])
+            self.assertEqual(result, [8, 9])
+            workers = [_.pid for _ in _pool._pool._pool]
+            result = _pool.starmap(pow, [[2, 2]])
+            self.assertEqual(result, [4])
+            self.assertEqual([_.pid for _ in _pool._pool._pool], workers)
+
+        # Workers are stopped when leaving the context
+        self.assertIsNone(_pool._pool)
+
+    def test__recycle(self):
+        """Testing function _recycle."""
+        # Workers are replaced when they use too much memory
+        with testimport.Pool(ConfigServer()) as _pool:
+            with patch.object(
+                _pool._config, "ingest_worker_memory", return_value=0
+            ):
+                result = _pool.starmap(pow, [[2, 3]])
+                self.assertEqual(result, [8])
+                self.assertIsNone(_pool._pool)
+
+    def test_rss(self):
+        """Testing function rss."""
+        # Test
+        if os.path.isdir("/proc") is True:
+            self.assertTrue(testimport.rss(os.getpid()) > 0)
+        self.assertEqual(testimport.rss(-1), 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
+
+    # Cleanup the config
+    CONFIG.cleanup()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Test the resolver module."""
+
+import os
+import sys
+import time
+import fcntl
+import socket
+import threading
+import unittest
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}ingest""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db.ingest import resolver as testimport
+from switchmap.server.configuration import ConfigServer
+from switchmap.core import files
+
+
+def _gethostbyaddr(address):
+    """Mock socket.gethostbyaddr.
+
+    Args:
+        address: IP address
+
+    Returns:
+        result: (hostname, aliases, addresses) tuple
+
+    """
+    # Simulate each type of answer
+    if address.endswith(".1"):
+        return ("host-{}.example.org".format(address), [], [address])
+    if address.endswith(".2"):
+        raise socket.herror(1, "Unknown host")
+    if address.endswith(".3"):
+        raise socket.herror(2, "Host name lookup failure")
+    time.sleep(0.5)
+    return ("slow.example.org", [], [address])
+
+
+class TestResolver(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Start with an empty cache
+        self.config = ConfigServer()
+        self.filepath = files.dns_cache_file(self.config)
+        if os.path.isfile(self.filepath) is True:
+            os.remove(self.filepath)
+        testimport._CACHE.update({"mtime": None, "entries": {}})
+
+    @patch("socket.gethostbyaddr", side_effect=_gethostbyaddr)
+    def test_resolve(self, mock_gethostbyaddr):
+        """Testing function resolve."""
+        # Test
+        with patch.object(testimport.ConfigServer, "dns_timeout") as timeout:
+            timeout.return_value = 0.2
+            with patch.object(
+                testimport._ip, "hostnames", return_value={"10.0.0.4": "old"}
+            ):
+                result = testimport.resolve(
+                    ["10.0.0.1", "10.0.0.1", "10.0.0.2", "10.0.0.4"]
+                )
+        self.assertEqual(
+            result,
+            {
+                "10.0.0.1": "host-10.0.0.1.example.org",
+                "10.0.0.2": None,
+                "10.0.0.4": "old",
+            },
+        )
+
+        # Duplicates are only resolved once
+        self.assertEqual(mock_gethostbyaddr.call_count, 3)
+
+        # Answers are cached, failures are not
+        entries = files.read_json_file(self.filepath)
+        self.assertEqual(sorted(entries.keys()), ["10.0.0.1", "10.0.0.2"])
+        self.assertEqual(entries["10.0.0.2"][0], None)
+
+        # Cached answers are not looked up again
+        mock_gethostbyaddr.reset_mock()
+        result = testimport.resolve(["10.0.0.1", "10.0.0.2"])
+        self.assertEqual(result["10.0.0.1"], "host-10.0.0.1.example.org")
+        self.assertEqual(mock_gethostbyaddr.call_count, 0)
+
+    @patch("socket.gethostbyaddr", side_effect=_gethostbyaddr)
+    def test_resolve_stale(self, _):
+        """Testing function resolve with expired cache entries."""
+        # Failed lookups use the expired cache entry
+        files.write_json_file(self.filepath, {"10.0.0.3": ["stale", 0]})
+        with patch.object(testimport._ip, "hostnames", return_value={}):
+            result = testimport.resolve(["10.0.0.3"])
+        self.assertEqual(result, {"10.0.0.3": "stale"})
+
+    @patch("socket.gethostbyaddr", side_effect=_gethostbyaddr)
+    def test__lookup(self, _):
+        """Testing function _lookup."""
+        # Test
+        result = testimport._lookup(
+            ["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"], 2, 0.2
+        )
+        self.assertEqual(
+            result,
+            {"10.0.0.1": "host-10.0.0.1.example.org", "10.0.0.2": None},
+        )
+
+    @patch("socket.gethostbyaddr", side_effect=_gethostbyaddr)
+    def test__ptr(self, _):
+        """Testing function _ptr."""
+        # Test
+        started = {}
+        self.assertEqual(
+            testimport._ptr("10.0.0.1", started), "host-10.0.0.1.example.org"
+        )
+        self.assertIsNone(testimport._ptr("10.0.0.2", started))
+        self.assertIs(testimport._ptr("10.0.0.3", started), testimport._FAILED)
+        self.assertIn("10.0.0.1", started)
+
+    def test__load(self):
+        """Testing function _load."""
+        # Test
+        self.assertEqual(testimport._load(self.filepath), {})
+        files.write_json_file(self.filepath, {"10.0.0.1": ["a", 1]})
+        self.assertEqual(
+            testimport._load(self.filepath), {"10.0.0.1": ["a", 1]}
+        )
+
+    def test__save(self):
+        """Testing function _save."""
+        # Entries saved by other processes are merged
+        testimport._load(self.filepath)
+        files.write_json_file(
+            self.filepath, {"10.0.0.1": ["a", 10], "10.0.0.2": ["b", 10]}
+        )
+        testimport._save(self.filepath, {"10.0.0.1": ["c", 20]})
+        self.assertEqual(
+            files.read_json_file(self.filepath),
+            {"10.0.0.1": ["c", 20], "10.0.0.2": ["b", 10]},
+        )
+
+        # Saves wait for other processes to finish theirs
+        with open("{}.lock".format(self.filepath), "a") as f_handle:
+            fcntl.flock(f_handle, fcntl.LOCK_EX)
+            thread = threading.Thread(
+                target=testimport._save,
+                args=(self.filepath, {"10.0.0.3": ["d", 30]}),
+            )
+            thread.start()
+            thread.join(0.2)
+            self.assertTrue(thread.is_alive())
+            self.assertNotIn("10.0.0.3", files.read_json_file(self.filepath))
+            fcntl.flock(f_handle, fcntl.LOCK_UN)
+        thread.join()
+        self.assertIn("10.0.0.3", files.read_json_file(self.filepath))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
+
+    # Cleanup the config
+    CONFIG.cleanup()
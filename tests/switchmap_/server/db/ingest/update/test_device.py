@@ -260,6 +260,30 @@ class TestPollUpdateTopologyFunctions(unittest.TestCase):
             )
         self.assertEqual(result[: self.max_loops], expected)
 
+    def test__hashes(self):
+        """Testing function _hashes."""
+        # Initialize key variables
+        data_ = _polled_data()
+
+        # Test
+        result = testimport._hashes(data_)
+        self.assertEqual(sorted(result), ["layer1"])
+        self.assertEqual(len(result["layer1"]), 32)
+
+        # Hashes don't depend on the order of the data
+        reordered = deepcopy(data_)
+        reordered["layer1"] = dict(reversed(list(data_["layer1"].items())))
+        self.assertEqual(testimport._hashes(reordered), result)
+
+        # Hashes only depend on the hashed sections
+        reordered["misc"] = {}
+        self.assertEqual(testimport._hashes(reordered), result)
+
+        # Changes are detected
+        ifindex = sorted(reordered["layer1"])[0]
+        reordered["layer1"][ifindex]["ifOperStatus"] = 99
+        self.assertNotEqual(testimport._hashes(reordered), result)
+
 
 class TestPollUpdateTopologyClasses(unittest.TestCase):
     """Checks all functions and methods."""
@@ -291,8 +315,8 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
         """Testing function process."""
         pass
 
-    def test_l1interface(self):
-        """Testing function l1interface."""
+    def test_write_l1interface(self):
+        """Testing function write with the L1Interface table."""
         # Initialize key variables
         result = []
         expected = [
@@ -1117,7 +1141,7 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
 
         # Test transaction
         tester = testimport.Topology(exists, data)
-        tester.l1interface(test=True)
+        tester.write()
 
         # Verify macport data
         statement = select(L1Interface)
@@ -1196,8 +1220,8 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
         for key, result in enumerate(results[: self.max_loops * 3]):
             self.assertEqual(result, expected[key])
 
-    def test_vlan(self):
-        """Testing function vlan."""
+    def test_write_vlan(self):
+        """Testing function write with the Vlan table."""
         # Initialize key variables
         result = []
         expected = [
@@ -1312,8 +1336,7 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
 
         # Test transaction
         tester = testimport.Topology(exists, data)
-        tester.l1interface(test=True)
-        tester.vlan(test=True)
+        tester.write()
 
         # Verify macport data
         statement = select(Vlan)
@@ -1338,8 +1361,8 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
         result.sort(key=lambda x: (x.vlan, x.name, x.idx_device))
         self.assertEqual(result[: self.max_loops], expected)
 
-    def test_vlanport(self):
-        """Testing function vlanport."""
+    def test_write_vlanport(self):
+        """Testing function write with the VlanPort table."""
         # Initialize key variables
         result = []
         expected = [
@@ -1434,9 +1457,7 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
 
         # Test transaction
         tester = testimport.Topology(exists, data)
-        tester.l1interface(test=True)
-        tester.vlan(test=True)
-        tester.vlanport(test=True)
+        tester.write()
 
         # Verify vlanport data
         statement = select(VlanPort)
@@ -1459,8 +1480,8 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
         result.sort(key=lambda x: (x.idx_vlanport))
         self.assertEqual(result[: self.max_loops], expected)
 
-    def test_macport(self):
-        """Testing function macport."""
+    def test_write_macport(self):
+        """Testing function write with the MacPort table."""
         # Initialize key variables
         result = []
         expected = [
@@ -1555,10 +1576,7 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
 
         # Test transaction
         tester = testimport.Topology(exists, data)
-        tester.l1interface(test=True)
-        tester.vlan(test=True)
-        tester.vlanport(test=True)
-        tester.macport(test=True)
+        tester.write()
 
         # Verify macport data
         statement = select(MacPort)
@@ -1576,9 +1594,13 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
                     ts_modified=None,
                 )
             )
-        # Sort by idx_vlanport
-        result.sort(key=lambda x: (x.idx_macport))
-        self.assertEqual(result[: self.max_loops], expected)
+        # Sort by MAC. The primary keys depend on the order of the bulk
+        # insert and aren't compared
+        result.sort(key=attrgetter("idx_mac", "idx_l1interface"))
+        self.assertEqual(
+            [_._replace(idx_macport=None) for _ in result[: self.max_loops]],
+            [_._replace(idx_macport=None) for _ in expected],
+        )
 
 
 if __name__ == "__main__":
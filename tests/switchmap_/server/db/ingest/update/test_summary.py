@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""Test the summary module."""
+
+import os
+import sys
+import unittest
+from copy import deepcopy
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(
+                                        os.path.abspath(
+                                            os.path.join(EXEC_DIR, os.pardir)
+                                        ),
+                                        os.pardir,
+                                    )
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}ingest{0}update""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+import time
+
+from sqlalchemy import select
+
+from switchmap.server.db.ingest.update import summary as testimport
+from switchmap.server.db import db
+from switchmap.server.db import models
+from switchmap.server.db.models import ZoneSummary
+from switchmap.server.db.models import DeviceSummary
+from switchmap.server.db.schemas import SCHEMA
+from switchmap.server.db.table import event
+from switchmap.server.db.table import zone
+from switchmap.server.db.table import device
+from switchmap.server.db.table import l1interface
+from switchmap.server.db.table import vlan
+from switchmap.server.db.table import oui
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import ipport
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import IZone
+from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import IL1Interface
+from switchmap.server.db.table import IVlan
+from switchmap.server.db.table import IOui
+from switchmap.server.db.table import IMac
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMacPort
+from switchmap.server.db.table import IIpPort
+from switchmap.server.db.table import IMacIp
+
+from tests.testlib_ import db as dblib
+from tests.testlib_ import data
+
+
+def _reset_db():
+    """Reset the database.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Load the configuration in case it's been deleted after loading the
+    # configuration above. Sometimes this happens when running
+    # `python3 -m unittest discover` where another the tearDownClass of
+    # another test module prematurely deletes the configuration required
+    # for this module
+    config = setup.config()
+    config.save()
+
+    # Drop tables
+    database = dblib.Database()
+    database.drop()
+
+    # Create database tables
+    models.create_all_tables()
+
+    # Create an OUI entry
+    oui.insert_row(IOui(oui="testing", organization="testing", enabled=1))
+
+
+def _interface(idx_device, ifindex, **kwargs):
+    """Create an IL1Interface object.
+
+    Args:
+        idx_device: Device index
+        ifindex: Interface ifIndex
+        kwargs: Values of the other fields
+
+    Returns:
+        result: IL1Interface object
+
+    """
+    # Initialize key variables
+    values = {_: None for _ in IL1Interface._fields}
+    values.update(
+        idx_device=idx_device,
+        ifindex=ifindex,
+        ethernet=1,
+        trunk=0,
+        iftype=6,
+        ifname="IfName_{}".format(ifindex),
+        ifadminstatus=1,
+        ifoperstatus=1,
+        ts_idle=0,
+        enabled=1,
+    )
+    values.update(kwargs)
+
+    # Return
+    result = IL1Interface(**values)
+    return result
+
+
+class TestSummary(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Reset the database
+        _reset_db()
+
+        # Create the zones and devices of an event
+        now = int(time.time())
+        cls.idx_event = event.create().idx_event
+        names = [data.random_string() for _ in range(2)]
+        zone.insert_row(
+            [
+                IZone(
+                    idx_event=cls.idx_event,
+                    name=_,
+                    notes=data.random_string(),
+                    enabled=1,
+                )
+                for _ in names
+            ]
+        )
+        cls.idx_zone = zone.exists(cls.idx_event, names[0]).idx_zone
+        cls.idx_empty = zone.exists(cls.idx_event, names[1]).idx_zone
+        hostnames = [data.random_string() for _ in range(2)]
+        device.insert_row(
+            [
+                IDevice(
+                    idx_zone=cls.idx_zone,
+                    sys_name=None,
+                    hostname=_,
+                    name=None,
+                    sys_description=None,
+                    sys_objectid=None,
+                    sys_uptime=0,
+                    last_polled=0,
+                    enabled=1,
+                )
+                for _ in hostnames
+            ]
+        )
+        cls.idx_device = device.exists(cls.idx_zone, hostnames[0]).idx_device
+        cls.idx_other = device.exists(cls.idx_zone, hostnames[1]).idx_device
+
+        # Create an active trunk, an idle port, a recently idle port, a
+        # disabled port and an active non ethernet interface
+        l1interface.insert_row(
+            [
+                _interface(cls.idx_device, 1, trunk=1),
+                _interface(
+                    cls.idx_device,
+                    2,
+                    ifoperstatus=2,
+                    ts_idle=now - 40 * 86400,
+                ),
+                _interface(
+                    cls.idx_device, 3, ifoperstatus=2, ts_idle=now - 86400
+                ),
+                _interface(
+                    cls.idx_device, 4, ifadminstatus=2, ifoperstatus=2
+                ),
+                _interface(cls.idx_device, 5, ethernet=0, iftype=24),
+            ]
+        )
+        ports = [
+            l1interface.exists(cls.idx_device, _).idx_l1interface
+            for _ in range(1, 3)
+        ]
+
+        # Create VLANs. The second device shares a VLAN with the first.
+        vlan.insert_row(
+            [
+                IVlan(
+                    idx_device=idx_device,
+                    vlan=number,
+                    name=None,
+                    state=1,
+                    enabled=1,
+                )
+                for idx_device, number in [
+                    (cls.idx_device, 10),
+                    (cls.idx_device, 20),
+                    (cls.idx_other, 10),
+                ]
+            ]
+        )
+
+        # Create the addresses of the zone
+        macs = ["00005e0001{:02x}".format(_) for _ in range(3)]
+        ips = ["192.0.2.{}".format(_) for _ in range(1, 3)]
+        mac.insert_row(
+            [
+                IMac(idx_oui=1, idx_zone=cls.idx_zone, mac=_, enabled=1)
+                for _ in macs
+            ]
+        )
+        ip.insert_row(
+            [
+                IIp(
+                    idx_zone=cls.idx_zone,
+                    address=_,
+                    version=4,
+                    hostname=None,
+                    enabled=1,
+                )
+                for _ in ips
+            ]
+        )
+        idx_macs = [mac.exists(cls.idx_zone, _).idx_mac for _ in macs]
+        idx_ips = [ip.exists(cls.idx_zone, _).idx_ip for _ in ips]
+
+        # Place two MAC addresses on the first port and one on the second.
+        # Place an IP address on the first port.
+        macport.insert_row(
+            [
+                IMacPort(idx_l1interface=port, idx_mac=idx_mac, enabled=1)
+                for port, idx_mac in [
+                    (ports[0], idx_macs[0]),
+                    (ports[0], idx_macs[1]),
+                    (ports[1], idx_macs[0]),
+                ]
+            ]
+        )
+        ipport.insert_row(
+            IIpPort(idx_l1interface=ports[0], idx_ip=idx_ips[0], enabled=1)
+        )
+        macip.insert_row(
+            [
+                IMacIp(idx_mac=idx_macs[_], idx_ip=idx_ips[_], enabled=1)
+                for _ in range(2)
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = dblib.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_process(self):
+        """Testing function process."""
+        # Rows are updated, not added, when processing again
+        for _ in range(2):
+            result = testimport.process(self.idx_event, idle_days=30)
+            self.assertEqual(result, 2)
+
+        # Test the device summaries
+        rows = {
+            _.idx_device: _
+            for _ in db.db_select_row(2108, select(DeviceSummary))
+        }
+        self.assertEqual(len(rows), 2)
+        row = rows[self.idx_device]
+        self.assertEqual(row.idx_zone, self.idx_zone)
+        self.assertEqual(row.ports, 4)
+        self.assertEqual(row.ports_active, 1)
+        self.assertEqual(row.ports_inactive, 2)
+        self.assertEqual(row.ports_disabled, 1)
+        self.assertEqual(row.ports_idle, 1)
+        self.assertEqual(row.trunks, 1)
+        self.assertEqual(row.vlans, 2)
+        self.assertEqual(row.macs, 2)
+        self.assertEqual(row.ips, 1)
+        self.assertEqual(row.idle_days, 30)
+        row = rows[self.idx_other]
+        self.assertEqual(row.ports, 0)
+        self.assertEqual(row.vlans, 1)
+        self.assertEqual(row.macs, 0)
+
+        # Test the zone summaries
+        rows = {
+            _.idx_zone: _
+            for _ in db.db_select_row(2109, select(ZoneSummary))
+        }
+        self.assertEqual(len(rows), 2)
+        row = rows[self.idx_zone]
+        self.assertEqual(row.idx_event, self.idx_event)
+        self.assertEqual(row.devices, 2)
+        self.assertEqual(row.ports, 4)
+        self.assertEqual(row.ports_active, 1)
+        self.assertEqual(row.ports_inactive, 2)
+        self.assertEqual(row.ports_disabled, 1)
+        self.assertEqual(row.ports_idle, 1)
+        self.assertEqual(row.trunks, 1)
+        self.assertEqual(row.vlans, 2)
+        self.assertEqual(row.macs, 3)
+        self.assertEqual(row.ips, 2)
+        self.assertEqual(row.arp_entries, 2)
+        row = rows[self.idx_empty]
+        self.assertEqual(row.devices, 0)
+        self.assertEqual(row.ports, 0)
+        self.assertEqual(row.macs, 0)
+
+        # Idle ports depend on the number of days
+        testimport.process(self.idx_event, idle_days=0)
+        rows = db.db_select_row(
+            2110,
+            select(DeviceSummary).where(
+                DeviceSummary.idx_device == self.idx_device
+            ),
+        )
+        self.assertEqual(rows[0].ports_idle, 2)
+
+    def test_graphql(self):
+        """Testing the GraphQL summary nodes."""
+        # Create the summaries
+        testimport.process(self.idx_event, idle_days=30)
+
+        # Get the summaries of the zones and devices of the event
+        query = """
+{
+  events(filter: {idxEvent: {eq: EVENT}}) {
+    edges {
+      node {
+        zonesummaries {
+          edges {
+            node {
+              idxZone
+              devices
+              ports
+            }
+          }
+        }
+        zones {
+          edges {
+            node {
+              devicesummaries {
+                edges {
+                  node {
+                    idxDevice
+                    portsActive
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""".replace(
+            "EVENT", str(self.idx_event)
+        )
+        result = SCHEMA.execute(query, context_value={})
+        self.assertIsNone(result.errors)
+
+        # Test
+        node = result.data["events"]["edges"][0]["node"]
+        zones = {
+            _["node"]["idxZone"]: _["node"]
+            for _ in node["zonesummaries"]["edges"]
+        }
+        self.assertEqual(zones[self.idx_zone]["devices"], 2)
+        self.assertEqual(zones[self.idx_zone]["ports"], 4)
+        self.assertEqual(zones[self.idx_empty]["ports"], 0)
+        devices = {
+            _["node"]["idxDevice"]: _["node"]
+            for zone_ in node["zones"]["edges"]
+            for _ in zone_["node"]["devicesummaries"]["edges"]
+        }
+        self.assertEqual(devices[self.idx_device]["portsActive"], 1)
+        self.assertEqual(devices[self.idx_other]["portsActive"], 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -394,12 +394,21 @@ class TestZoneTopology(unittest.TestCase):
         data = _device.process()
 
         # Test transaction
-        tester = testimport.Topology(data, self.idx_zone, dns=False)
+        tester = testimport.Topology(data, self.idx_zone)
         tester.mac()
         result = tester.ip()
         result.sort(key=lambda x: (x.address))
         self.assertEqual(result[: self.max_loops], expected)
 
+        # Test with the hostnames of the IP addresses
+        tester = testimport.Topology(
+            data, self.idx_zone, hostnames={"192.168.0.156": "test"}
+        )
+        tester.mac()
+        result = {_.address: _.hostname for _ in tester.ip()}
+        self.assertEqual(result["192.168.0.156"], "test")
+        self.assertIsNone(result["192.168.0.1"])
+
     def test_macip(self):
         """Testing function macip."""
         # Initialize key variables
@@ -559,7 +568,7 @@ class TestZoneTopology(unittest.TestCase):
         data = _device.process()
 
         # Test transaction
-        tester = testimport.Topology(data, self.idx_zone, dns=False)
+        tester = testimport.Topology(data, self.idx_zone)
         tester.mac()
         tester.ip()
         result = tester.macip()
@@ -567,6 +576,24 @@ class TestZoneTopology(unittest.TestCase):
         result.sort(key=lambda x: (x.ip, x.mac))
         self.assertEqual(result[: self.max_loops], expected)
 
+    def test_addresses(self):
+        """Testing function addresses."""
+        # Process the device
+        _device = device.Device(_polled_data())
+        data = _device.process()
+
+        # Test
+        result = testimport.addresses(data)
+        self.assertEqual(result, sorted(set(result)))
+        self.assertIn("192.168.0.156", result)
+        self.assertEqual(
+            sorted(
+                _.address
+                for _ in testimport.Topology(data, self.idx_zone).process().ips
+            ),
+            result,
+        )
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Test the devicehash module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}table""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db.table import devicehash as testimport
+from switchmap.server.db.table import IDeviceHash
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+from tests.testlib_ import data
+
+
+class TestDbTableDeviceHash(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+        # Pollinate db with prerequisites
+        db.populate()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_hashes(self):
+        """Testing function hashes."""
+        # Create records
+        rows = [_row() for _ in range(3)]
+
+        # Test before insertion
+        start = testimport.hashes(1)
+        for row in rows:
+            self.assertNotIn(row.section, start)
+
+        # Test after insertion
+        testimport.insert_row(rows)
+        result = testimport.hashes(1)
+        for row in rows:
+            self.assertEqual(result[row.section], row.hash)
+        self.assertEqual(len(result), len(start) + len(rows))
+
+    def test_insert_row(self):
+        """Testing function insert_row."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        self.assertNotIn(row.section, testimport.hashes(row.idx_device))
+
+        # Test after insertion of an initial row
+        testimport.insert_row(row)
+        result = testimport.hashes(row.idx_device)
+        self.assertEqual(result[row.section], row.hash)
+
+    def test_values(self):
+        """Testing function values."""
+        # Create record
+        row = _row()
+
+        # Test
+        result = testimport.values(row)
+        self.assertEqual(set(result), set(row._fields))
+        self.assertEqual(result["section"], row.section.encode())
+        self.assertEqual(result["hash"], row.hash.encode())
+        self.assertEqual(result["enabled"], 1)
+
+
+def _row():
+    """Create an IDeviceHash record.
+
+    Args:
+        None
+
+    Returns:
+        result: IDeviceHash object
+
+    """
+    # Create result
+    result = IDeviceHash(
+        idx_device=1,
+        section=data.random_string(),
+        hash=data.random_string(),
+        enabled=1,
+    )
+    return result
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
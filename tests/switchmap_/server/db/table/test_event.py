@@ -59,6 +59,28 @@ CONFIG.save()
 from switchmap.server.db.table import event as testimport
 from switchmap.server.db.table import IEvent
 from switchmap.server.db.table import root
+from switchmap.server.db.table import zone
+from switchmap.server.db.table import device
+from switchmap.server.db.table import l1interface
+from switchmap.server.db.table import vlan
+from switchmap.server.db.table import vlanport
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import ipport
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import devicehash
+from switchmap.server.db.table import IZone
+from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import IDeviceHash
+from switchmap.server.db.table import IL1Interface
+from switchmap.server.db.table import IVlan
+from switchmap.server.db.table import IVlanPort
+from switchmap.server.db.table import IMac
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMacPort
+from switchmap.server.db.table import IIpPort
+from switchmap.server.db.table import IMacIp
 from switchmap.server.db import models
 
 from tests.testlib_ import db
@@ -300,6 +322,141 @@ class TestDbTableEvent(unittest.TestCase):
                 result = testimport.idx_exists(item.idx_event)
                 self.assertTrue(result)
 
+    def test__delete_children(self):
+        """Testing function _delete_children."""
+        # Create an event with a zone and device
+        event = testimport.create()
+        zone.insert_row(
+            IZone(
+                idx_event=event.idx_event,
+                name=data.random_string(),
+                notes=None,
+                enabled=1,
+            )
+        )
+        zone_row = zone.zones(event.idx_event)[0]
+        hostname = data.random_string()
+        device.insert_row(
+            IDevice(
+                idx_zone=zone_row.idx_zone,
+                sys_name=data.random_string(),
+                hostname=hostname,
+                name=data.random_string(),
+                sys_description=data.random_string(),
+                sys_objectid=data.random_string(),
+                sys_uptime=0,
+                last_polled=0,
+                enabled=1,
+            )
+        )
+        self.assertTrue(device.exists(zone_row.idx_zone, hostname))
+
+        # Delete the rows of the event. The event must remain.
+        testimport._delete_children(event.idx_event)
+        self.assertFalse(device.exists(zone_row.idx_zone, hostname))
+        self.assertFalse(zone.zones(event.idx_event))
+        self.assertTrue(testimport.idx_exists(event.idx_event))
+
+        # Delete the event
+        testimport.delete(event.idx_event)
+        self.assertFalse(testimport.idx_exists(event.idx_event))
+
+    def test_copy(self):
+        """Testing function copy."""
+        # Create an event with a row in every table of the event
+        source = testimport.create()
+        zone.insert_row(
+            IZone(
+                idx_event=source.idx_event,
+                name=data.random_string(),
+                notes=None,
+                enabled=1,
+            )
+        )
+        idx_zone = zone.zones(source.idx_event)[0].idx_zone
+        hostname = data.random_string()
+        device.insert_row(
+            IDevice(
+                idx_zone=idx_zone,
+                sys_name=data.random_string(),
+                hostname=hostname,
+                name=data.random_string(),
+                sys_description=data.random_string(),
+                sys_objectid=data.random_string(),
+                sys_uptime=0,
+                last_polled=0,
+                enabled=1,
+            )
+        )
+        idx_device = device.exists(idx_zone, hostname).idx_device
+        devicehash.insert_row(
+            IDeviceHash(
+                idx_device=idx_device, section="layer1", hash="abc", enabled=1
+            )
+        )
+        l1interface.insert_row(_l1interface(idx_device, 7))
+        idx_l1interface = l1interface.exists(idx_device, 7).idx_l1interface
+        vlan.insert_row(
+            IVlan(idx_device=idx_device, vlan=5, name="v5", state=1, enabled=1)
+        )
+        idx_vlan = vlan.exists(idx_device, 5).idx_vlan
+        vlanport.insert_row(
+            IVlanPort(
+                idx_l1interface=idx_l1interface, idx_vlan=idx_vlan, enabled=1
+            )
+        )
+        address = data.mac()
+        mac.insert_row(
+            IMac(idx_oui=1, idx_zone=idx_zone, mac=address, enabled=1)
+        )
+        idx_mac = mac.exists(idx_zone, address).idx_mac
+        ip.insert_row(
+            IIp(
+                idx_zone=idx_zone,
+                address="192.168.1.1",
+                version=4,
+                hostname="host",
+                enabled=1,
+            )
+        )
+        idx_ip = ip.exists(idx_zone, "192.168.1.1").idx_ip
+        macport.insert_row(
+            IMacPort(
+                idx_l1interface=idx_l1interface, idx_mac=idx_mac, enabled=1
+            )
+        )
+        ipport.insert_row(
+            IIpPort(idx_l1interface=idx_l1interface, idx_ip=idx_ip, enabled=1)
+        )
+        macip.insert_row(IMacIp(idx_ip=idx_ip, idx_mac=idx_mac, enabled=1))
+
+        # Test
+        target = testimport.create()
+        testimport.copy(source.idx_event, target.idx_event)
+        zones = zone.zones(target.idx_event)
+        self.assertEqual(len(zones), 1)
+        new_zone = zones[0].idx_zone
+        self.assertNotEqual(new_zone, idx_zone)
+        new_device = device.exists(new_zone, hostname).idx_device
+        self.assertEqual(devicehash.hashes(new_device), {"layer1": "abc"})
+        new_l1interface = l1interface.exists(new_device, 7).idx_l1interface
+        new_vlan = vlan.exists(new_device, 5).idx_vlan
+        self.assertTrue(vlanport.exists(new_l1interface, new_vlan))
+        new_mac = mac.exists(new_zone, address).idx_mac
+        new_ip = ip.exists(new_zone, "192.168.1.1")
+        self.assertEqual(new_ip.hostname, "host")
+        self.assertTrue(macport.exists(new_l1interface, new_mac))
+        self.assertTrue(ipport.exists(new_l1interface, new_ip.idx_ip))
+        self.assertTrue(macip.exists(new_mac, new_ip.idx_ip))
+
+        # The source event is unchanged
+        self.assertEqual(len(zone.zones(source.idx_event)), 1)
+        self.assertTrue(macip.exists(idx_mac, idx_ip))
+
+        # Cleanup
+        testimport.delete(source.idx_event)
+        testimport.delete(target.idx_event)
+
     def test_purge(self):
         """Testing function purge."""
         # Create additional events
@@ -343,6 +500,45 @@ def _convert(row):
     return result
 
 
+def _l1interface(idx_device, ifindex):
+    """Create an IL1Interface record.
+
+    Args:
+        idx_device: Device index
+        ifindex: Interface index
+
+    Returns:
+        result: IL1Interface object
+
+    """
+    # Create result
+    result = IL1Interface(
+        idx_device=idx_device,
+        ifindex=ifindex,
+        duplex=1,
+        ethernet=1,
+        nativevlan=1,
+        trunk=0,
+        ifspeed=1000,
+        iftype=6,
+        ifalias=data.random_string(),
+        ifname=data.random_string(),
+        ifdescr=data.random_string(),
+        ifadminstatus=1,
+        ifoperstatus=1,
+        ts_idle=0,
+        cdpcachedeviceid=None,
+        cdpcachedeviceport=None,
+        cdpcacheplatform=None,
+        lldpremportdesc=None,
+        lldpremsyscapenabled=None,
+        lldpremsysdesc=None,
+        lldpremsysname=None,
+        enabled=1,
+    )
+    return result
+
+
 def _row():
     """Create an IEvent record.
 
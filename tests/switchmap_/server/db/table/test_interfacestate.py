@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Test the interfacestate module."""
+
+import os
+import sys
+import unittest
+import random
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}table""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db.table import interfacestate as testimport
+from switchmap.server.db.table import IInterfaceState
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+from tests.testlib_ import data
+
+
+class TestDbTableInterfaceState(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_states(self):
+        """Testing function states."""
+        # Create records
+        zone = data.random_string()
+        hostname = data.random_string()
+        rows = [_row(zone=zone, hostname=hostname) for _ in range(3)]
+
+        # Test before insertion
+        self.assertEqual(testimport.states(zone, hostname), {})
+
+        # Test after insertion
+        testimport.insert_row(rows + [_row(zone=zone)])
+        result = testimport.states(zone, hostname)
+        self.assertEqual(len(result), len(rows))
+        for row in rows:
+            self.assertEqual(_convert(result[row.ifname]), row)
+
+    def test_insert_row(self):
+        """Testing function insert_row."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        self.assertEqual(testimport.states(row.zone, row.hostname), {})
+
+        # Test after insertion of an initial row
+        testimport.insert_row(row)
+        result = testimport.states(row.zone, row.hostname)
+        self.assertEqual(_convert(result[row.ifname]), row)
+
+    def test_values(self):
+        """Testing function values."""
+        # Create record
+        row = _row()
+
+        # Test
+        result = testimport.values(row)
+        self.assertEqual(set(result), set(row._fields))
+        self.assertEqual(result["zone"], row.zone.encode())
+        self.assertEqual(result["hostname"], row.hostname.encode())
+        self.assertEqual(result["ifname"], row.ifname.encode())
+        self.assertEqual(result["ts_idle"], row.ts_idle)
+
+
+def _convert(row):
+    """Convert RInterfaceState to IInterfaceState record.
+
+    Args:
+        row: RInterfaceState/IInterfaceState record
+
+    Returns:
+        result: IInterfaceState result
+
+    """
+    # Do conversion
+    result = IInterfaceState(
+        zone=row.zone,
+        hostname=row.hostname,
+        ifname=row.ifname,
+        ts_idle=row.ts_idle,
+        enabled=row.enabled,
+    )
+    return result
+
+
+def _row(zone=None, hostname=None):
+    """Create an IInterfaceState record.
+
+    Args:
+        zone: Zone name. A random name is used if None.
+        hostname: Device hostname. A random hostname is used if None.
+
+    Returns:
+        result: IInterfaceState object
+
+    """
+    # Create result
+    result = IInterfaceState(
+        zone=data.random_string() if zone is None else zone,
+        hostname=data.random_string() if hostname is None else hostname,
+        ifname=data.random_string(),
+        ts_idle=random.randint(0, 1000000),
+        enabled=1,
+    )
+    return result
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -56,7 +56,9 @@ CONFIG.save()
 
 from switchmap.server.db.table import ip as testimport
 from switchmap.server.db.models import Ip
-from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IIp, IRoot
+from switchmap.server.db.table import root
+from switchmap.server.db.table import zone
 from switchmap.server.db import models
 
 from tests.testlib_ import db
@@ -166,6 +168,25 @@ class TestDbTableIp(unittest.TestCase):
             self.assertTrue(isinstance(result, list))
             self.assertEqual(len(result), 0)
 
+    def test_ips(self):
+        """Testing function ips."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        result = testimport.ips(row.idx_zone)
+        self.assertFalse(row.address in [_.address for _ in result])
+
+        # Test after insertion of an initial row
+        testimport.insert_row(row)
+        result = testimport.ips(row.idx_zone)
+        self.assertTrue(isinstance(result, list))
+        self.assertTrue(row.address in [_.address for _ in result])
+        self.assertEqual(
+            [_convert(_) for _ in result if _.address == row.address],
+            [_convert(row)],
+        )
+
     def test_findhostname(self):
         """Testing function findhostname."""
         # Repeat test
@@ -193,6 +214,22 @@ class TestDbTableIp(unittest.TestCase):
             self.assertTrue(isinstance(result, list))
             self.assertEqual(len(result), 0)
 
+    def test_hostnames(self):
+        """Testing function hostnames."""
+        # Initialize key variables
+        row = _row()
+        testimport.insert_row(row)
+        idx_event = zone.idx_exists(row.idx_zone).idx_event
+
+        # Only hostnames of the event the root points to are returned
+        root.update_row(1, IRoot(idx_event=1, name="root", enabled=1))
+        self.assertEqual(testimport.hostnames([row.address]), {})
+        root.update_row(1, IRoot(idx_event=idx_event, name="root", enabled=1))
+        self.assertEqual(
+            testimport.hostnames([row.address, "TEST_IP"]),
+            {row.address: row.hostname},
+        )
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Repeat test
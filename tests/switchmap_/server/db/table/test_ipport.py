@@ -191,6 +191,27 @@ class TestDbTableIpPort(unittest.TestCase):
                 if exists.idx_ip not in finds:
                     finds.append(exists.idx_ip)
 
+    def test_find_idx_ips(self):
+        """Testing function find_idx_ips."""
+        # Initialize key variables
+        rows = [_row() for _ in range(0, 3)]
+        idx_ips = [_.idx_ip for _ in rows]
+
+        # Insert the rows if they don't exist
+        for row in rows:
+            if bool(testimport.exists(row.idx_l1interface, row.idx_ip)):
+                continue
+            testimport.insert_row(row)
+
+        # Test
+        result = testimport.find_idx_ips(idx_ips)
+        found = [(_.idx_l1interface, _.idx_ip) for _ in result]
+        for row in rows:
+            self.assertIn((row.idx_l1interface, row.idx_ip), found)
+        for item in result:
+            self.assertIn(item.idx_ip, idx_ips)
+        self.assertEqual(testimport.find_idx_ips([]), [])
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Start iterative tests
@@ -222,6 +222,23 @@ class TestDbTableL1interface(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(_convert(result), _convert(row))
 
+    def test_values(self):
+        """Testing function values."""
+        # Create record
+        row = _row()
+
+        # Test
+        result = testimport.values(row)
+        self.assertEqual(set(result), set(row._fields))
+        self.assertEqual(result["ifname"], row.ifname.encode())
+        self.assertEqual(result["ifindex"], row.ifindex)
+        self.assertEqual(result["enabled"], int(bool(row.enabled)))
+
+        # Test NULL values
+        result = testimport.values(row._replace(ifalias=None, ts_idle=None))
+        self.assertIsNone(result["ifalias"])
+        self.assertEqual(result["ts_idle"], 0)
+
     def test_update_row(self):
         """Testing function update_row."""
         # Create record
@@ -137,6 +137,24 @@ class TestDbTableMac(unittest.TestCase):
         self.assertEqual(_convert(result), _convert(row))
         self.assertTrue(row.idx_oui != 1)
 
+    def test_macs(self):
+        """Testing function macs."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        result = testimport.macs(row.idx_zone)
+        self.assertFalse(row.mac in [_.mac for _ in result])
+
+        # Test after insertion of an initial row
+        testimport.insert_row(row)
+        result = testimport.macs(row.idx_zone)
+        self.assertTrue(isinstance(result, list))
+        self.assertTrue(row.mac in [_.mac for _ in result])
+        self.assertEqual(
+            [_convert(_) for _ in result if _.mac == row.mac], [_convert(row)]
+        )
+
     def test_findmac(self):
         """Testing function findmac."""
         # Create record
@@ -156,6 +174,22 @@ class TestDbTableMac(unittest.TestCase):
         self.assertEqual(_convert(result[0]), _convert(row))
         self.assertTrue(row.idx_oui != 1)
 
+    def test_idx_macs(self):
+        """Testing function idx_macs."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        idx_zone = row.idx_zone
+        result = testimport.idx_macs(idx_zone, [row.mac])
+        self.assertEqual(result, {})
+
+        # Test after insertion of an initial row
+        testimport.insert_row(row)
+        exists = testimport.exists(idx_zone, row.mac)
+        result = testimport.idx_macs(idx_zone, [row.mac.upper()])
+        self.assertEqual(result, {exists.mac: exists.idx_mac})
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Create record
@@ -187,6 +187,27 @@ class TestDbTableMacPort(unittest.TestCase):
                 if exists.idx_mac not in finds:
                     finds.append(exists.idx_mac)
 
+    def test_find_idx_macs(self):
+        """Testing function find_idx_macs."""
+        # Initialize key variables
+        rows = [_row() for _ in range(0, 3)]
+        idx_macs = [_.idx_mac for _ in rows]
+
+        # Insert the rows if they don't exist
+        for row in rows:
+            if bool(testimport.exists(row.idx_l1interface, row.idx_mac)):
+                continue
+            testimport.insert_row(row)
+
+        # Test
+        result = testimport.find_idx_macs(idx_macs)
+        found = [(_.idx_l1interface, _.idx_mac) for _ in result]
+        for row in rows:
+            self.assertIn((row.idx_l1interface, row.idx_mac), found)
+        for item in result:
+            self.assertIn(item.idx_mac, idx_macs)
+        self.assertEqual(testimport.find_idx_macs([]), [])
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Find a row combination that does not exist
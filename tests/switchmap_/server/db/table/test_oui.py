@@ -113,6 +113,38 @@ class TestDbTableOui(unittest.TestCase):
         result = testimport.idx_oui(mac)
         self.assertEqual(result, preliminary_result.idx_oui)
 
+    def test_idx_oui_longest_prefix(self):
+        """Testing function idx_oui with MA-M and MA-S prefixes."""
+        # Create MA-L, MA-M and MA-S records sharing the same prefix
+        while True:
+            mac = data.mac()
+            if bool(testimport.exists(mac[:6])) is False:
+                break
+        rows = [
+            IOui(oui=mac[:_], organization=data.random_string(), enabled=1)
+            for _ in (6, 7, 9)
+        ]
+        testimport.insert_row(rows)
+
+        # The longest matching prefix must be found. Each MAC differs from
+        # the longer prefixes in the digit after the prefix it must match.
+        for row in rows:
+            length = len(row.oui)
+            other = "{}{}{}".format(
+                mac[:length],
+                "0" if mac[length] != "0" else "1",
+                mac[length + 1 :],
+            )
+            if length == 9:
+                other = mac
+            expected = testimport.exists(row.oui).idx_oui
+            result = testimport.idx_oui(other)
+            self.assertEqual(result, expected)
+
+        # Unknown and invalid MACs
+        self.assertEqual(testimport.idx_oui("zzzzzzzzzzzz"), 1)
+        self.assertEqual(testimport.idx_oui(None), 1)
+
     def test_idx_exists(self):
         """Testing function idx_exists."""
         # Create record
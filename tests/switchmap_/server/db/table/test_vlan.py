@@ -194,6 +194,22 @@ class TestDbTableVlan(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(_convert(result), _convert(row))
 
+    def test_values(self):
+        """Testing function values."""
+        # Create record
+        row = _row()
+
+        # Test
+        result = testimport.values(row)
+        self.assertEqual(set(result), set(row._fields))
+        self.assertEqual(result["vlan"], row.vlan)
+        self.assertEqual(result["name"], row.name.encode())
+
+        # Test NULL values
+        result = testimport.values(row._replace(name=None, state=0))
+        self.assertIsNone(result["name"])
+        self.assertIsNone(result["state"])
+
     def test_update_row(self):
         """Testing function update_row."""
         # Create record
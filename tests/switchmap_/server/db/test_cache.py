@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Test the GraphQL response cache module."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db\
+""".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db import cache as testimport
+from switchmap.server.db import models
+from switchmap.server.db.table import event
+from switchmap.server.api import API
+from switchmap import API_PREFIX
+
+from tests.testlib_ import db as dblib
+
+# GraphQL query of the events
+_QUERY = """
+{
+  events {
+    edges {
+      node {
+        idxEvent
+      }
+    }
+  }
+}
+"""
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables with an event
+        database = dblib.Database()
+        database.drop()
+        models.create_all_tables()
+        event.create()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = dblib.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_digest(self):
+        """Testing function digest."""
+        # Initialize key variables
+        result = testimport.digest(_QUERY)
+
+        # Whitespace and comments don't matter
+        self.assertEqual(
+            testimport.digest("# Events\n{events{edges{node{idxEvent}}}}"),
+            result,
+        )
+
+        # Variables and operation names do
+        self.assertNotEqual(
+            testimport.digest(_QUERY, variables={"idx": 1}), result
+        )
+        self.assertNotEqual(
+            testimport.digest(_QUERY, operation_name="Events"), result
+        )
+
+        # Queries that can't be parsed aren't cached
+        self.assertIsNone(testimport.digest("{events"))
+        self.assertIsNone(testimport.digest(None))
+
+    def test_snapshot(self):
+        """Testing function snapshot."""
+        # Initialize key variables
+        result = testimport.snapshot()
+        self.assertEqual(testimport.snapshot(), result)
+
+        # The snapshot changes when events are created and deleted
+        idx_event = event.create().idx_event
+        created = testimport.snapshot()
+        self.assertNotEqual(created, result)
+        event.delete(idx_event)
+        self.assertNotEqual(testimport.snapshot(), created)
+
+    def test_etag(self):
+        """Testing function etag."""
+        # Test
+        self.assertEqual(testimport.etag(b"test"), testimport.etag(b"test"))
+        self.assertNotEqual(
+            testimport.etag(b"test"), testimport.etag(b"test2")
+        )
+
+    def test__store(self):
+        """Testing class _Store."""
+        # Initialize key variables
+        store = testimport._Store(1)
+        body = b"x" * 400 * 1024
+
+        # Test saving and getting responses
+        result = store.save("one", body)
+        self.assertEqual(result.body, body)
+        self.assertEqual(result.etag, testimport.etag(body))
+        self.assertEqual(store.lookup("one"), result)
+        self.assertIsNone(store.lookup("two"))
+
+        # The least recently used responses are evicted
+        store.save("two", body)
+        store.lookup("one")
+        store.save("three", body)
+        self.assertIsNone(store.lookup("two"))
+        self.assertIsNotNone(store.lookup("one"))
+        self.assertIsNotNone(store.lookup("three"))
+
+        # Responses larger than the store are not kept
+        store.save("four", b"x" * 2 * 1024 * 1024)
+        self.assertIsNone(store.lookup("four"))
+        self.assertIsNotNone(store.lookup("one"))
+
+        # Test purging
+        store.purge()
+        self.assertIsNone(store.lookup("one"))
+
+    def test__store_directory(self):
+        """Testing class _Store with a shared directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            # Responses saved by one process are found by others
+            body = b"x" * 400 * 1024
+            testimport._Store(1, directory=directory).save("one", body)
+            store = testimport._Store(1, directory=directory)
+            self.assertEqual(store.lookup("one").body, body)
+
+            # The least recently used responses are evicted
+            store.save("two", body)
+            os.utime(os.path.join(directory, "one"), (0, 0))
+            store.save("three", body)
+            self.assertEqual(sorted(os.listdir(directory)), ["three", "two"])
+
+            # Test purging
+            store.purge()
+            self.assertEqual(os.listdir(directory), [])
+            self.assertIsNone(store.lookup("three"))
+
+    def test_graphql_route(self):
+        """Testing the caching of responses to the GraphQL route."""
+        # Initialize key variables
+        client = API.test_client()
+        url = "{}/graphql".format(API_PREFIX)
+
+        # Test
+        response = client.get(url, query_string={"query": _QUERY})
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        self.assertIn(b"idxEvent", response.data)
+
+        # Unchanged responses aren't sent again
+        response = client.get(
+            url,
+            query_string={"query": _QUERY},
+            headers={"If-None-Match": etag},
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+        # Responses change with the events
+        idx_event = event.create().idx_event
+        response = client.get(
+            url,
+            query_string={"query": _QUERY},
+            headers={"If-None-Match": etag},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers.get("ETag"), etag)
+        event.delete(idx_event)
+
+        # Responses with errors aren't cached
+        response = client.get(url, query_string={"query": "{unknown}"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(response.headers.get("ETag"))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
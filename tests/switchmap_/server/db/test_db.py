@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Test the db module."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db\
+""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from sqlalchemy import select
+
+from switchmap.server.db import ENGINE
+from switchmap.server.db import db as testimport
+from switchmap.server.db.models import Oui
+from switchmap.server.db.table import oui
+from switchmap.server.db.table import IOui
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+from tests.testlib_ import data
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_db_transaction(self):
+        """Testing function db_transaction."""
+        # Initialize key variables
+        row = _row()
+
+        # Rows are visible in the transaction and committed afterwards
+        with testimport.db_transaction(2087) as connection:
+            oui.insert_row(row)
+            self.assertTrue(oui.exists(row.oui))
+
+            # Nested transactions use the same connection
+            with testimport.db_transaction(2087) as nested:
+                self.assertIs(nested, connection)
+
+        self.assertTrue(oui.exists(row.oui))
+
+        # Rows are rolled back after errors
+        row = _row()
+        with self.assertRaises(ValueError):
+            with testimport.db_transaction(2087):
+                oui.insert_row(row)
+                raise ValueError
+        self.assertFalse(oui.exists(row.oui))
+
+    def test_db_select(self):
+        """Testing function db_select."""
+        # Initialize key variables
+        row = _row()
+        oui.insert_row(row)
+        statement = select(Oui.organization).where(
+            Oui.oui == row.oui.encode()
+        )
+
+        # Test with and without a transaction
+        result = testimport.db_select(2085, statement)
+        self.assertEqual(result[0].organization, row.organization.encode())
+        with testimport.db_transaction(2087):
+            self.assertEqual(testimport.db_select(2086, statement), result)
+
+    def test_db_read(self):
+        """Testing function db_read."""
+        # Initialize key variables
+        row = _row()
+        oui.insert_row(row)
+
+        # Test
+        with testimport.db_read():
+            self.assertTrue(oui.exists(row.oui))
+
+    def test_read_engine(self):
+        """Testing function read_engine."""
+        # Reads use the primary database without a read replica
+        self.assertIs(testimport.read_engine(), ENGINE)
+
+        # The replica is only used when it is up to date
+        replica = object()
+        testimport._READ.update({"engine": None, "checked": 0})
+        with patch.object(testimport, "READ_ENGINE", replica), patch.object(
+            testimport, "_freshness", side_effect=[1, 1, 1, 2]
+        ) as freshness:
+            self.assertIs(testimport.read_engine(), replica)
+
+            # The choice is reused within the interval
+            self.assertIs(testimport.read_engine(), replica)
+            self.assertEqual(freshness.call_count, 2)
+
+            # The databases are compared again after the interval
+            testimport._READ["checked"] -= testimport._READ_INTERVAL
+            self.assertIs(testimport.read_engine(), ENGINE)
+            self.assertEqual(freshness.call_count, 4)
+        testimport._READ.update({"engine": None, "checked": 0})
+
+
+def _row():
+    """Create an IOui record.
+
+    Args:
+        None
+
+    Returns:
+        result: IOui object
+
+    """
+    # Create result
+    result = IOui(
+        oui=data.mac()[:6], organization=data.random_string(), enabled=1
+    )
+    return result
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Test the GraphQL query limits module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db\
+""".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from graphql import parse, validate, specified_rules
+
+from switchmap.server.db import limits as testimport
+from switchmap.server.db.schemas import SCHEMA
+
+# GraphQL query with a depth of 7 and a cost of
+# 1 + 10 * (1 + 1 + 1 + (1 + 20 * 3))
+_QUERY = """
+{
+  devices {
+    edges {
+      node {
+        hostname
+        l1interfaces(first: 20) {
+          edges {
+            node {
+              ifname
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL query with fragments and introspection fields
+_FRAGMENTS = """
+{
+  devices {
+    edges {
+      node {
+        __typename
+        ...Device
+        ... on Device {
+          sysName
+        }
+      }
+    }
+  }
+}
+
+fragment Device on Device {
+  hostname
+  l1interfaces(last: 2) {
+    edges {
+      node {
+        ifname
+      }
+    }
+  }
+}
+"""
+
+
+def _errors(query, depth=0, cost=0):
+    """Validate a query with limits.
+
+    Args:
+        query: GraphQL query string
+        depth: Maximum depth
+        cost: Maximum cost
+
+    Returns:
+        result: List of error messages
+
+    """
+    # Return
+    result = [
+        _.message
+        for _ in validate(
+            SCHEMA.graphql_schema,
+            parse(query),
+            list(specified_rules) + [testimport.rule(depth, cost)],
+        )
+    ]
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_rules(self):
+        """Testing function rules."""
+        # Test
+        result = testimport.rules()
+        self.assertEqual(len(result), len(specified_rules) + 1)
+        self.assertIs(testimport.rules(), result)
+
+    def test_rule(self):
+        """Testing function rule."""
+        # Queries within the limits are valid
+        self.assertEqual(_errors(_QUERY), [])
+        self.assertEqual(_errors(_QUERY, depth=7, cost=641), [])
+
+        # Queries exceeding the limits are not
+        self.assertEqual(
+            _errors(_QUERY, depth=6),
+            ["Query depth of 7 exceeds the limit of 6."],
+        )
+        self.assertEqual(
+            _errors(_QUERY, cost=640),
+            ["Query cost of 641 exceeds the limit of 640."],
+        )
+
+    def test_measure(self):
+        """Testing function measure."""
+
+        class Context:
+            """ValidationContext with fragments."""
+
+            def __init__(self, document):
+                """Initialize the class.
+
+                Args:
+                    document: DocumentNode object
+
+                Returns:
+                    None
+
+                """
+                # Initialize key variables
+                self._fragments = {
+                    _.name.value: _
+                    for _ in document.definitions
+                    if hasattr(_, "type_condition")
+                }
+
+            def get_fragment(self, name):
+                """Get a fragment.
+
+                Args:
+                    name: Name of the fragment
+
+                Returns:
+                    result: FragmentDefinitionNode object
+
+                """
+                # Return
+                result = self._fragments.get(name)
+                return result
+
+        # Test
+        document = parse(_QUERY)
+        self.assertEqual(
+            testimport.measure(
+                document.definitions[0].selection_set, Context(document)
+            ),
+            (7, 641),
+        )
+
+        # Fragments count as if their fields were in the query. Fields
+        # starting with "__" are not counted.
+        document = parse(_FRAGMENTS)
+        self.assertEqual(
+            testimport.measure(
+                document.definitions[0].selection_set, Context(document)
+            ),
+            (7, 1 + 10 * (1 + 1 + 1 + 1 + 1 + 2 * 3)),
+        )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Test the GraphQL relationship loaders module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db\
+""".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from sqlalchemy import event as _event, inspect, select
+
+from switchmap.server.db import loaders as testimport
+from switchmap.server.db import ENGINE
+from switchmap.server.db import SCOPED_SESSION
+from switchmap.server.db import models
+from switchmap.server.db.models import L1Interface
+from switchmap.server.db.schemas import SCHEMA
+from switchmap.server.db.table import event
+from switchmap.server.db.table import zone
+from switchmap.server.db.table import device
+from switchmap.server.db.table import l1interface
+from switchmap.server.db.table import vlan
+from switchmap.server.db.table import vlanport
+from switchmap.server.db.table import oui
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import IZone
+from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import IL1Interface
+from switchmap.server.db.table import IVlan
+from switchmap.server.db.table import IVlanPort
+from switchmap.server.db.table import IOui
+from switchmap.server.db.table import IMac
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMacPort
+from switchmap.server.db.table import IMacIp
+
+from tests.testlib_ import db as dblib
+from tests.testlib_ import data
+
+# GraphQL query of the interfaces of a device and their addresses
+_QUERY = """
+{
+  devices(filter: {idxDevice: {eq: DEVICE}}) {
+    edges {
+      node {
+        l1interfaces {
+          edges {
+            node {
+              ifname
+              macports {
+                edges {
+                  node {
+                    macs {
+                      mac
+                      oui {
+                        organization
+                      }
+                      macips {
+                        edges {
+                          node {
+                            ips {
+                              address
+                            }
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+              vlanports {
+                edges {
+                  node {
+                    vlans {
+                      vlan
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _execute(query, batching=True):
+    """Run a GraphQL query in a new session.
+
+    Args:
+        query: GraphQL query string
+        batching: Load relationships in batches if True
+
+    Returns:
+        result: Tuple of the query data and the number of SELECT
+            statements made
+
+    """
+    # Initialize key variables
+    statements = []
+
+    def count(conn, cursor, statement, *_):
+        """Count a SELECT statement.
+
+        Args:
+            conn: SqlALchemy Connection object
+            cursor: DBAPI cursor object
+            statement: SQL statement
+            _: Unused event arguments
+
+        Returns:
+            None
+
+        """
+        # Update
+        if statement.lstrip().upper().startswith("SELECT") is True:
+            statements.append(statement)
+
+    # Run the query
+    SCOPED_SESSION.remove()
+    _event.listen(ENGINE, "before_cursor_execute", count)
+    try:
+        response = SCHEMA.execute(query, context_value={"batching": batching})
+    finally:
+        _event.remove(ENGINE, "before_cursor_execute", count)
+        SCOPED_SESSION.remove()
+
+    # Return
+    result = (response.data, len(statements))
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        database = dblib.Database()
+        database.drop()
+        models.create_all_tables()
+        oui.insert_row(IOui(oui="testing", organization="testing", enabled=1))
+
+        # Create a device with a VLAN
+        idx_event = event.create().idx_event
+        name = data.random_string()
+        zone.insert_row(
+            IZone(idx_event=idx_event, name=name, notes=None, enabled=1)
+        )
+        idx_zone = zone.exists(idx_event, name).idx_zone
+        hostname = data.random_string()
+        device.insert_row(
+            IDevice(
+                idx_zone=idx_zone,
+                sys_name=None,
+                hostname=hostname,
+                name=None,
+                sys_description=None,
+                sys_objectid=None,
+                sys_uptime=0,
+                last_polled=0,
+                enabled=1,
+            )
+        )
+        cls.idx_device = device.exists(idx_zone, hostname).idx_device
+        vlan.insert_row(
+            IVlan(
+                idx_device=cls.idx_device,
+                vlan=10,
+                name=None,
+                state=1,
+                enabled=1,
+            )
+        )
+        idx_vlan = vlan.exists(cls.idx_device, 10).idx_vlan
+
+        # Create interfaces. The last one has no addresses or VLANs.
+        values = {_: None for _ in IL1Interface._fields}
+        values.update(idx_device=cls.idx_device, enabled=1)
+        l1interface.insert_row(
+            [
+                IL1Interface(
+                    **dict(values, ifindex=_, ifname="port{}".format(_))
+                )
+                for _ in range(1, 5)
+            ]
+        )
+        ports = [
+            l1interface.exists(cls.idx_device, _).idx_l1interface
+            for _ in range(1, 5)
+        ]
+
+        # Place two MAC addresses with IP addresses on each port except
+        # the last, and the VLAN on all of them except the last
+        for index, port in enumerate(ports[:-1]):
+            addresses = [
+                ("00005e00{:02x}{:02x}".format(index, _), index * 2 + _)
+                for _ in range(2)
+            ]
+            mac.insert_row(
+                [
+                    IMac(idx_oui=1, idx_zone=idx_zone, mac=_[0], enabled=1)
+                    for _ in addresses
+                ]
+            )
+            ip.insert_row(
+                [
+                    IIp(
+                        idx_zone=idx_zone,
+                        address="192.0.2.{}".format(_[1] + 1),
+                        version=4,
+                        hostname=None,
+                        enabled=1,
+                    )
+                    for _ in addresses
+                ]
+            )
+            for _mac, number in addresses:
+                idx_mac = mac.exists(idx_zone, _mac).idx_mac
+                idx_ip = ip.exists(
+                    idx_zone, "192.0.2.{}".format(number + 1)
+                ).idx_ip
+                macport.insert_row(
+                    IMacPort(idx_l1interface=port, idx_mac=idx_mac, enabled=1)
+                )
+                macip.insert_row(
+                    IMacIp(idx_mac=idx_mac, idx_ip=idx_ip, enabled=1)
+                )
+            vlanport.insert_row(
+                IVlanPort(idx_l1interface=port, idx_vlan=idx_vlan, enabled=1)
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = dblib.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_resolver(self):
+        """Testing function resolver."""
+        # Initialize key variables
+        query = _QUERY.replace("DEVICE", str(self.idx_device))
+
+        # The results are the same with and without batching
+        expected, unbatched = _execute(query, batching=False)
+        result, batched = _execute(query)
+        self.assertEqual(result, expected)
+
+        # There is a query per level of the query instead of per node
+        self.assertLess(batched, unbatched)
+        self.assertLessEqual(batched, 10)
+
+        # Test the results
+        interfaces = {
+            _["node"]["ifname"]: _["node"]
+            for _ in result["devices"]["edges"][0]["node"]["l1interfaces"][
+                "edges"
+            ]
+        }
+        self.assertEqual(len(interfaces), 4)
+        for ifindex in range(1, 4):
+            node = interfaces["port{}".format(ifindex)]
+            macports = node["macports"]["edges"]
+            self.assertEqual(len(macports), 2)
+            for macport_ in macports:
+                macs = macport_["node"]["macs"]
+                self.assertEqual(macs["oui"]["organization"], "testing")
+                self.assertEqual(len(macs["macips"]["edges"]), 1)
+            self.assertEqual(
+                node["vlanports"]["edges"][0]["node"]["vlans"]["vlan"], 10
+            )
+        self.assertEqual(interfaces["port4"]["macports"]["edges"], [])
+        self.assertEqual(interfaces["port4"]["vlanports"]["edges"], [])
+
+    def test_load(self):
+        """Testing function load."""
+        # Initialize key variables
+        session = SCOPED_SESSION()
+        statement = (
+            select(L1Interface)
+            .where(L1Interface.idx_device == self.idx_device)
+            .order_by(L1Interface.ifindex)
+        )
+        rows = session.execute(statement).scalars().all()
+
+        # Loading the relationship of one object loads it for all of them
+        self.assertTrue(all("macports" in inspect(_).unloaded for _ in rows))
+        testimport.load(rows[0], "macports")
+        self.assertFalse(any("macports" in inspect(_).unloaded for _ in rows))
+        self.assertEqual([len(_.macports) for _ in rows], [2, 2, 2, 0])
+
+        # Many to one relationships are loaded too
+        testimport.load(rows[0], "device")
+        self.assertEqual(rows[-1].device.idx_device, self.idx_device)
+
+        # Loaded relationships are not changes to be saved
+        self.assertFalse(session.dirty)
+        SCOPED_SESSION.remove()
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
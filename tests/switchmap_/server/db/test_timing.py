@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Test the timing module."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db\
+""".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print("""This script is not installed in the "{0}" directory. Please fix.\
+""".format(_EXPECTED))
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from sqlalchemy import create_engine, text
+
+from switchmap.core import metrics
+from switchmap.server.db import timing as testimport
+
+
+@testimport.call_site
+def _code(error_code):
+    """Get the error code of the call site.
+
+    Args:
+        error_code: Error code to use in messages
+
+    Returns:
+        result: Error code of the call site
+
+    """
+    # Return
+    result = testimport._CODE.get()
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_call_site(self):
+        """Testing function call_site."""
+        # Test
+        self.assertEqual(_code(2090), 2090)
+        self.assertIsNone(testimport._CODE.get())
+
+    def test_add_listeners(self):
+        """Testing function add_listeners."""
+        # Initialize key variables
+        engine = create_engine("sqlite://", future=True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "slow.log")
+            testimport.add_listeners(
+                engine, threshold=0.0000001, filename=filename
+            )
+
+            # Statements are counted and logged
+            before = metrics.collect()
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            result = testimport.summary(before, metrics.collect())
+            self.assertEqual(len(result), 1)
+            self.assertEqual(result[0].code, "unknown")
+            self.assertEqual(result[0].count, 1)
+            with open(filename) as f_handle:
+                self.assertIn("code=unknown", f_handle.read())
+
+    def test_summary(self):
+        """Testing function summary."""
+        # Initialize key variables
+        metric = metrics.DB_STATEMENT_SECONDS.labels(code=2091)
+        before = metrics.collect()
+        for value in [0.001] * 98 + [2, 20]:
+            metric.observe(value)
+
+        # Test
+        result = testimport.summary(before, metrics.collect())
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].code, "2091")
+        self.assertEqual(result[0].count, 100)
+        self.assertAlmostEqual(result[0].seconds, 22.098)
+        self.assertLessEqual(result[0].p50, 0.001)
+        self.assertLessEqual(result[0].p95, 0.001)
+        self.assertGreater(result[0].p99, 1)
+        self.assertLessEqual(result[0].p99, 2.5)
+
+    def test__quantile(self):
+        """Testing function _quantile."""
+        # Initialize key variables
+        buckets = [(1, 50), (2, 100), (float("inf"), 100)]
+
+        # Test
+        self.assertEqual(testimport._quantile(0.5, buckets), 1)
+        self.assertEqual(testimport._quantile(0.75, buckets), 1.5)
+        self.assertEqual(testimport._quantile(0.5, []), 0)
+        self.assertEqual(
+            testimport._quantile(0.99, [(1, 0), (float("inf"), 10)]), 1
+        )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -69,6 +69,33 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.api_bind_port()
         self.assertEqual(result, expected)
 
+    def test_api_cache_directory(self):
+        """Testing function api_cache_directory."""
+        # Run test
+        result = self.config.api_cache_directory()
+        self.assertIsNone(result)
+
+    def test_api_cache_megabytes(self):
+        """Testing function api_cache_megabytes."""
+        # Run test
+        expected = 64
+        result = self.config.api_cache_megabytes()
+        self.assertEqual(result, expected)
+
+    def test_api_query_cost(self):
+        """Testing function api_query_cost."""
+        # Run test
+        expected = 200000
+        result = self.config.api_query_cost()
+        self.assertEqual(result, expected)
+
+    def test_api_query_depth(self):
+        """Testing function api_query_depth."""
+        # Run test
+        expected = 20
+        result = self.config.api_query_depth()
+        self.assertEqual(result, expected)
+
     def test_cache_directory(self):
         """Testing function cache_directory."""
         # Run test
@@ -76,6 +103,24 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.cache_directory()
         self.assertEqual(result, expected)
 
+    def test_db_backend(self):
+        """Testing function db_backend."""
+        # Run test
+        expected = os.environ.get("SWITCHMAP_TEST_DB_BACKEND", "mysql")
+        result = self.config.db_backend()
+        self.assertEqual(result, expected)
+
+    def test_db_file(self):
+        """Testing function db_file."""
+        # Run test
+        expected = (
+            "switchmap_unittests.db"
+            if bool(os.environ.get("SWITCHMAP_TEST_DB_BACKEND"))
+            else "switchmap.db"
+        )
+        result = self.config.db_file()
+        self.assertTrue(result.endswith("{}{}".format(os.sep, expected)))
+
     def test_db_host(self):
         """Testing function db_host."""
         # Run test
@@ -111,6 +156,27 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.db_pool_size()
         self.assertEqual(result, expected)
 
+    def test_db_read_host(self):
+        """Testing function db_read_host."""
+        # Run test
+        result = self.config.db_read_host()
+        self.assertIsNone(result)
+
+    def test_db_slow_query_log_file(self):
+        """Testing function db_slow_query_log_file."""
+        # Run test
+        result = self.config.db_slow_query_log_file()
+        self.assertTrue(
+            result.endswith("{}switchmap-slow-query.log".format(os.sep))
+        )
+
+    def test_db_slow_query_seconds(self):
+        """Testing function db_slow_query_seconds."""
+        # Run test
+        expected = 1
+        result = self.config.db_slow_query_seconds()
+        self.assertEqual(result, expected)
+
     def test_db_user(self):
         """Testing function db_user."""
         # Run test
@@ -118,6 +184,55 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.db_user()
         self.assertEqual(result, expected)
 
+    def test_dns_concurrency(self):
+        """Testing function dns_concurrency."""
+        # Run test
+        expected = 64
+        result = self.config.dns_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_dns_negative_ttl(self):
+        """Testing function dns_negative_ttl."""
+        # Run test
+        expected = 3600
+        result = self.config.dns_negative_ttl()
+        self.assertEqual(result, expected)
+
+    def test_dns_timeout(self):
+        """Testing function dns_timeout."""
+        # Run test
+        expected = 2
+        result = self.config.dns_timeout()
+        self.assertEqual(result, expected)
+
+    def test_dns_ttl(self):
+        """Testing function dns_ttl."""
+        # Run test
+        expected = 86400
+        result = self.config.dns_ttl()
+        self.assertEqual(result, expected)
+
+    def test_incremental_ingest(self):
+        """Testing function incremental_ingest."""
+        # Run test
+        expected = False
+        result = self.config.incremental_ingest()
+        self.assertEqual(result, expected)
+
+    def test_ingest_worker_memory(self):
+        """Testing function ingest_worker_memory."""
+        # Run test
+        expected = 1024
+        result = self.config.ingest_worker_memory()
+        self.assertEqual(result, expected)
+
+    def test_ingest_worker_tasks(self):
+        """Testing function ingest_worker_tasks."""
+        # Run test
+        expected = 100
+        result = self.config.ingest_worker_tasks()
+        self.assertEqual(result, expected)
+
     def test_ingest_directory(self):
         """Testing function ingest_directory."""
         # Run test
@@ -141,6 +256,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.purge_after_ingest()
         self.assertEqual(result, expected)
 
+    def test_summary_idle_days(self):
+        """Testing function summary_idle_days."""
+        # Run test
+        expected = 30
+        result = self.config.summary_idle_days()
+        self.assertEqual(result, expected)
+
     def test_username(self):
         """Testing function username."""
         # Run test
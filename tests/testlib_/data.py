@@ -85,6 +85,7 @@ dashboard:
 poller:
   username: nv2Mwx7gu9AbLGyz
   polling_interval: 21600
+  delta_posts: True
   server_address: bwSeAzPmAygg8rcJ
   server_bind_port: 9876
   server_username: null
@@ -83,6 +83,7 @@ The database under test must be named {}""".format(
         with ENGINE.connect() as connection:
             with Session(bind=connection) as session:
                 models.BASE.metadata.drop_all(session.get_bind())
+            connection.commit()
 
     def create(self):
         """Create database.
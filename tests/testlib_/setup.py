@@ -15,6 +15,7 @@ import string
 from collections import namedtuple
 from copy import deepcopy
 import shutil
+import tempfile
 
 import yaml
 
@@ -74,6 +75,16 @@ class Config:
         config_["core"]["system_directory"] = _metadata.system_directory
         config_["core"]["log_directory"] = log_directory
 
+        # Use the database backend requested for the test run. The SQLite
+        # file is kept out of the directories removed by cleanup() as all
+        # test modules share the same database engine.
+        backend = os.environ.get("SWITCHMAP_TEST_DB_BACKEND")
+        if bool(backend) is True:
+            config_["server"]["db_backend"] = backend
+            config_["server"]["db_file"] = os.path.join(
+                tempfile.gettempdir(), "{}.db".format(_UNITTEST_STRING)
+            )
+
         # Create the metadata object
         self.metadata = Metadata(
             config=config_,